@@ -41,6 +41,8 @@ from o2sclpy.eos import *
 from o2sclpy.hdf import *
 from o2sclpy.other import *
 from o2sclpy.cap_cout import *
+from o2sclpy.parallel import *
+from o2sclpy.pool import *
 
 """
 The version number string
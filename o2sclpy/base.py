@@ -22,6 +22,9 @@
 """
 
 import ctypes
+import pickle
+import json
+import struct
 from abc import abstractmethod
 from o2sclpy.utils import force_bytes
 import numpy
@@ -35,6 +38,217 @@ itp_monotonic=6
 itp_steffen=7
 itp_nearest_neigh=8
 
+def _ptr_view(obj,ptr,n,ctype):
+    """
+    Return a one-dimensional ``numpy`` array which views the ``n``
+    elements of type ``ctype`` at the ``ctypes`` pointer ``ptr``.
+
+    The view holds a reference to ``obj`` so the wrapper (and thus the
+    C++ object if ``obj`` owns it) is not deleted while the view is
+    alive. However, the view is invalidated if the C++ object is
+    resized.
+    """
+    if n==0:
+        return numpy.zeros((0),dtype=ctype)
+    arr=(ctype*n).from_address(ctypes.addressof(ptr.contents))
+    arr._o2sclpy_owner=obj
+    return numpy.ctypeslib.as_array(arr)
+
+def _data_view(obj,name,ctype,copy=False,owner=None,elements=None):
+    """
+    Call the C function ``name``, which returns the data pointer and
+    the size of the object ``obj``, and return a one-dimensional
+    ``numpy`` array with elements of type ``ctype`` which views that
+    data (see :func:`_ptr_view()`). If ``copy`` is true, a copy of
+    the data is returned instead. The view keeps ``owner`` alive, or
+    ``obj`` if ``owner`` is ``None``.
+
+    Older O\ :sub:`2`\ scl libraries do not export ``name``. In that
+    case, if ``copy`` is true, the data is copied one element at a
+    time from the list returned by ``elements()``, or by
+    ``obj.__getitem__()`` if ``elements`` is ``None``. A view cannot
+    be created without ``name``, so if ``copy`` is false, a
+    ``ValueError`` is raised.
+    """
+    if not obj._link.has_func('o2scl',name):
+        if copy==False:
+            raise ValueError('Function '+name+' is not in the O2scl '+
+                             'library, so a view cannot be created. '+
+                             'Use copy=True instead.')
+        if elements is None:
+            return numpy.array([obj[i] for i in range(0,len(obj))],
+                               dtype=ctype)
+        return numpy.array(elements(),dtype=ctype)
+    if owner is None:
+        owner=obj
+    func=obj._link.get_func('o2scl',name,None,
+                            [ctypes.c_void_p,
+                             ctypes.POINTER(ctypes.POINTER(ctype)),
+                             ctypes.POINTER(ctypes.c_int)])
+    n_=ctypes.c_int(0)
+    ptr_=ctypes.POINTER(ctype)()
+    func(obj._ptr,ctypes.byref(ptr_),ctypes.byref(n_))
+    ret=_ptr_view(owner,ptr_,n_.value,ctype)
+    if copy:
+        return ret.copy()
+    return ret
+
+def _copy_from_numpy(obj,name,ctype,arr,setitem=None):
+    """
+    Copy the contiguous ``numpy`` array ``arr``, which must have
+    elements of type ``ctype``, to the data of the object ``obj`` with
+    a single memory copy, using the C function ``name`` to obtain the
+    data pointer (see :func:`_data_view()`). The C++ object must
+    already have been resized to hold ``arr.size`` elements.
+
+    If the library does not export ``name``, the elements are set
+    one at a time with ``setitem(i,value)``, where ``i`` is the index
+    in the flattened array, or with ``obj.__setitem__()`` if
+    ``setitem`` is ``None``.
+    """
+    if arr.size>0 and not obj._link.has_func('o2scl',name):
+        if setitem is None:
+            setitem=obj.__setitem__
+        for i,value in enumerate(arr.ravel().tolist()):
+            setitem(i,value)
+    elif arr.size>0:
+        view=_data_view(obj,name,ctype)
+        if view.size!=arr.size:
+            raise ValueError('Size mismatch ('+str(view.size)+' and '+
+                             str(arr.size)+') in _copy_from_numpy().')
+        ctypes.memmove(view.ctypes.data,arr.ctypes.data,arr.nbytes)
+    return
+
+def _array_call(obj,lib,name,args,ctype=ctypes.c_double,out=None,
+                out_ctype=ctypes.c_double):
+    """
+    Broadcast the arrays in ``args`` against each other, convert them
+    to C-contiguous arrays of type ``ctype``, and call the C function
+    ``name`` in the library ``lib`` with the pointer of ``obj``, the
+    number of points, a pointer to each array, and a pointer to the
+    output array. The C function loops over the points and stores
+    one result of type ``out_ctype`` for each. If ``out`` is
+    ``None``, a new output array is created, otherwise ``out`` must
+    be a writeable, C-contiguous array of type ``out_ctype`` with the
+    broadcast shape.
+
+    Returns: the output array
+    """
+    args=numpy.broadcast_arrays(*[numpy.asarray(a,dtype=ctype)
+                                  for a in args])
+    args=[numpy.ascontiguousarray(a) for a in args]
+    shape=args[0].shape
+    if out is None:
+        out=numpy.empty(shape,dtype=out_ctype)
+    elif (out.shape!=shape or out.dtype!=numpy.dtype(out_ctype) or
+          not out.flags['C_CONTIGUOUS'] or not out.flags['WRITEABLE']):
+        raise ValueError('Output array must be writeable, C-contiguous '+
+                         'and have shape '+str(shape)+' and type '+
+                         str(numpy.dtype(out_ctype))+' for '+name+'().')
+    ip=ctypes.POINTER(ctype)
+    op=ctypes.POINTER(out_ctype)
+    func=obj._link.get_func(lib,name,None,[ctypes.c_void_p,ctypes.c_size_t]+
+                            [ip]*len(args)+[op])
+    func(obj._ptr,out.size,*[a.ctypes.data_as(ip) for a in args],
+         out.ctypes.data_as(op))
+    return out
+
+def _tensor_view(obj,data,copy=False):
+    """
+    Reshape the one-dimensional array ``data``, which views the data
+    of the tensor ``obj``, to the shape of the tensor. The C++ tensor
+    classes store the data with the last index varying fastest, so
+    the result has C ordering. If ``copy`` is true, a copy of the data
+    is returned instead. A tensor with rank zero has no data, so an
+    empty array is returned if ``copy`` is true and a ``ValueError``
+    is raised otherwise.
+    """
+    rank=obj.get_rank()
+    if rank==0:
+        # A tensor with rank zero has no data, so there is nothing
+        # to view and writes could not reach the tensor
+        if copy:
+            return numpy.zeros((0),dtype=data.dtype)
+        raise ValueError('Tensor has rank zero, so a view cannot be '+
+                         'created in as_ndarray().')
+    shape=tuple(obj.get_size(i) for i in range(0,rank))
+    ret=data.reshape(shape)
+    if copy:
+        return ret.copy()
+    return ret
+
+def _pickle_buffer(arr,protocol):
+    """
+    Return the ``numpy`` array ``arr`` as a contiguous buffer for
+    pickling with ``protocol``. For protocol 5 and later this is a
+    ``pickle.PickleBuffer`` object, so that the data is not copied
+    into the pickle stream if a ``buffer_callback`` is given.
+    """
+    arr=numpy.ascontiguousarray(arr,dtype=numpy.double)
+    if protocol>=5:
+        return pickle.PickleBuffer(arr)
+    return arr
+
+def _unpickle_array(buf,shape):
+    """
+    Return the buffer ``buf`` created by :func:`_pickle_buffer()` as
+    a ``numpy`` array with shape ``shape``
+    """
+    if isinstance(buf,numpy.ndarray):
+        return buf.reshape(shape)
+    return numpy.frombuffer(buf,dtype=numpy.double).reshape(shape)
+
+def _unpickle_table(cls,names,units,nlines,data,interp_type):
+    """
+    Create a :class:`table` or :class:`table_units` object from the
+    data pickled by :meth:`table.__reduce_ex__()`
+    """
+    from o2sclpy.link_o2scl import default_linker
+    link=default_linker()
+    tab=cls(link)
+    data=_unpickle_array(data,(len(names),nlines))
+    for i in range(0,len(names)):
+        tab.set_column(names[i],data[i])
+        if units is not None and len(units[i])>0:
+            tab.set_unit(names[i],units[i])
+    tab.set_interp_type(interp_type)
+    return tab
+
+def _unpickle_table3d(x_name,y_name,nx,ny,grid,names,data):
+    """
+    Create a :class:`table3d` object from the data pickled by
+    :meth:`table3d.__reduce_ex__()`
+    """
+    from o2sclpy.link_o2scl import default_linker
+    link=default_linker()
+    t3d=table3d(link)
+    if nx>0 and ny>0:
+        grid=_unpickle_array(grid,(nx+ny,))
+        t3d.set_xy(x_name,nx,std_vector.from_numpy(link,grid[0:nx]),
+                   y_name,ny,std_vector.from_numpy(link,grid[nx:]))
+        data=_unpickle_array(data,(len(names),nx,ny))
+        for i in range(0,len(names)):
+            t3d.set_slice_numpy(names[i],data[i])
+    return t3d
+
+def _unpickle_tensor_grid(sizes,grid,data):
+    """
+    Create a :class:`tensor_grid` object from the data pickled by
+    :meth:`tensor_grid.__reduce_ex__()`
+    """
+    from o2sclpy.link_o2scl import default_linker
+    link=default_linker()
+    tg=tensor_grid(link)
+    if len(sizes)>0:
+        # Use the tensor_grid version, which keeps the grid consistent
+        # with the new sizes
+        tg.resize_vector(len(sizes),std_vector_size_t.from_numpy(link,sizes))
+        tg.as_ndarray()[...]=_unpickle_array(data,tuple(sizes))
+        if grid is not None:
+            grid=_unpickle_array(grid,(sum(sizes),))
+            tg.set_grid_packed(std_vector.from_numpy(link,grid))
+    return tg
+
 class std_string:
     """
     Python interface for C++ class ``std::string``.
@@ -55,9 +269,8 @@ class std_string:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_std_string
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_std_string',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -71,8 +284,8 @@ class std_string:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_std_string
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_std_string',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -92,9 +305,8 @@ class std_string:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_std_string_length
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_std_string_length',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -103,9 +315,8 @@ class std_string:
         | Parameters:
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_std_string_getitem
-        func.restype=ctypes.c_char
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_std_string_getitem',
+                                 ctypes.c_char,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,n)
         return ret
 
@@ -115,8 +326,8 @@ class std_string:
         | *i*: ``size_t``
         | *value*: char
         """
-        func=self._link.o2scl.o2scl_std_string_setitem
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_char]
+        func=self._link.get_func('o2scl','o2scl_std_string_setitem',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_char])
         func(self._ptr,i,value)
         return
 
@@ -125,8 +336,8 @@ class std_string:
         | Parameters:
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_std_string_resize
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_std_string_resize',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,n)
         return
 
@@ -138,27 +349,66 @@ class std_string:
         """
         return self.length()
      
+    def _data(self):
+        """
+        Return a ``ctypes`` pointer to the string data and the length
+        of the string, or ``None`` if the library does not export
+        ``o2scl_std_string_data``
+        """
+        if not self._link.has_func('o2scl','o2scl_std_string_data'):
+            return None
+        func=self._link.get_func('o2scl','o2scl_std_string_data',
+                                 None,[ctypes.c_void_p,ctypes.POINTER(ctypes.POINTER(ctypes.c_char)),ctypes.POINTER(ctypes.c_int)])
+        n_=ctypes.c_int(0)
+        ptr_=ctypes.POINTER(ctypes.c_char)()
+        func(self._ptr,ctypes.byref(ptr_),ctypes.byref(n_))
+        return ptr_,n_.value
+    
     def init_bytes(self,s):
         """
-        Initialize the string from a Python bytes object
+        Initialize the string from a Python bytes object with a
+        single memory copy
     
         | Parameters:
         | *s* a Python bytes string
         """
+        s=force_bytes(s)
         self.resize(len(s))
-        for i in range(0,len(s)):
-            self.__setitem__(i,s[i])
+        if len(s)>0:
+            data=self._data()
+            if data is None:
+                for i in range(0,len(s)):
+                    self.__setitem__(i,s[i])
+            else:
+                ctypes.memmove(data[0],s,len(s))
         return
     
     def to_bytes(self):
         """
-        Copy the string to a Python bytes object
+        Copy the string to a Python bytes object with a single
+        memory copy
     
         Returns: a Python bytes string
         """
-        ret=b''
-        for i in range(0,self.length()):
-            ret=ret+self.__getitem__(i)
+        data=self._data()
+        if data is None:
+            return b''.join([self.__getitem__(i)
+                             for i in range(0,self.length())])
+        ptr,n=data
+        if n==0:
+            return b''
+        return ctypes.string_at(ptr,n)
+
+    @classmethod
+    def from_bytes(cls,link,s):
+        """
+        Create a new string from the Python bytes object ``s``
+        (see :meth:`init_bytes()`)
+
+        Returns: a std_string object
+        """
+        ret=cls(link)
+        ret.init_bytes(s)
         return ret
 
 class std_vector:
@@ -181,9 +431,8 @@ class std_vector:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_std_vector_double_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_std_vector_double_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -197,8 +446,8 @@ class std_vector:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_std_vector_double_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_std_vector_double_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -219,8 +468,8 @@ class std_vector:
         | Parameters:
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_std_vector_double__resize
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_std_vector_double__resize',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,n)
         return
 
@@ -228,9 +477,8 @@ class std_vector:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_std_vector_double__size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_std_vector_double__size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -239,9 +487,8 @@ class std_vector:
         | Parameters:
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_std_vector_double__getitem
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_std_vector_double__getitem',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,n)
         return ret
 
@@ -251,8 +498,8 @@ class std_vector:
         | *i*: ``size_t``
         | *value*: double
         """
-        func=self._link.o2scl.o2scl_std_vector_double__setitem
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_std_vector_double__setitem',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double])
         func(self._ptr,i,value)
         return
 
@@ -264,15 +511,41 @@ class std_vector:
         """
         return self.size()
     
-    def to_numpy(self):
+    def to_numpy(self,copy=True):
         """
-        Copy the vector to a numpy array
+        Copy the vector to a numpy array. If ``copy`` is false, then
+        return a ``numpy`` array which views the vector data
+        instead. The view keeps this object alive, but it is
+        invalidated if the vector is resized.
     
         Returns: a one-dimensional ``numpy`` array
         """
-        ret=numpy.zeros((self.size()))
-        for i in range(0,self.size()):
-            ret[i]=self.__getitem__(i)
+        return _data_view(self,'o2scl_std_vector_double__data',ctypes.c_double,copy)
+
+    def assign(self,arr):
+        """
+        Resize the vector to the length of ``arr``, a one-dimensional
+        ``numpy`` array or Python list, and copy ``arr`` to the vector
+        with a single memory copy
+        """
+        arr=numpy.ascontiguousarray(arr,dtype=ctypes.c_double)
+        if arr.ndim!=1:
+            raise ValueError('Function std_vector.assign() requires a '+
+                             'one-dimensional array.')
+        self.resize(len(arr))
+        _copy_from_numpy(self,'o2scl_std_vector_double__data',ctypes.c_double,arr)
+        return
+
+    @classmethod
+    def from_numpy(cls,link,arr):
+        """
+        Create a new vector from ``arr``, a one-dimensional ``numpy``
+        array or Python list (see :meth:`assign()`)
+
+        Returns: a std_vector object
+        """
+        ret=cls(link)
+        ret.assign(arr)
         return ret
 
 class std_vector_int:
@@ -295,9 +568,8 @@ class std_vector_int:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_std_vector_int_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_std_vector_int_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -311,8 +583,8 @@ class std_vector_int:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_std_vector_int_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_std_vector_int_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -333,8 +605,8 @@ class std_vector_int:
         | Parameters:
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_std_vector_int__resize
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_std_vector_int__resize',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,n)
         return
 
@@ -342,9 +614,8 @@ class std_vector_int:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_std_vector_int__size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_std_vector_int__size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -353,9 +624,8 @@ class std_vector_int:
         | Parameters:
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_std_vector_int__getitem
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_std_vector_int__getitem',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,n)
         return ret
 
@@ -365,8 +635,8 @@ class std_vector_int:
         | *i*: ``size_t``
         | *value*: int
         """
-        func=self._link.o2scl.o2scl_std_vector_int__setitem
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_std_vector_int__setitem',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_int])
         func(self._ptr,i,value)
         return
 
@@ -378,15 +648,41 @@ class std_vector_int:
         """
         return self.size()
     
-    def to_numpy(self):
+    def to_numpy(self,copy=True):
         """
-        Copy the vector to a numpy array
+        Copy the vector to a numpy array. If ``copy`` is false, then
+        return a ``numpy`` array which views the vector data
+        instead. The view keeps this object alive, but it is
+        invalidated if the vector is resized.
     
         Returns: a one-dimensional ``numpy`` array with dtype ``int32``
         """
-        ret=numpy.zeros((self.size()),dtype=numpy.int32)
-        for i in range(0,self.size()):
-            ret[i]=self.__getitem__(i)
+        return _data_view(self,'o2scl_std_vector_int__data',ctypes.c_int,copy)
+
+    def assign(self,arr):
+        """
+        Resize the vector to the length of ``arr``, a one-dimensional
+        ``numpy`` array or Python list, and copy ``arr`` to the vector
+        with a single memory copy
+        """
+        arr=numpy.ascontiguousarray(arr,dtype=ctypes.c_int)
+        if arr.ndim!=1:
+            raise ValueError('Function std_vector_int.assign() requires a '+
+                             'one-dimensional array.')
+        self.resize(len(arr))
+        _copy_from_numpy(self,'o2scl_std_vector_int__data',ctypes.c_int,arr)
+        return
+
+    @classmethod
+    def from_numpy(cls,link,arr):
+        """
+        Create a new vector from ``arr``, a one-dimensional ``numpy``
+        array or Python list (see :meth:`assign()`)
+
+        Returns: a std_vector_int object
+        """
+        ret=cls(link)
+        ret.assign(arr)
         return ret
 
 class std_vector_size_t:
@@ -409,9 +705,8 @@ class std_vector_size_t:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_std_vector_size_t_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_std_vector_size_t_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -425,8 +720,8 @@ class std_vector_size_t:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_std_vector_size_t_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_std_vector_size_t_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -447,8 +742,8 @@ class std_vector_size_t:
         | Parameters:
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_std_vector_size_t__resize
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_std_vector_size_t__resize',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,n)
         return
 
@@ -456,9 +751,8 @@ class std_vector_size_t:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_std_vector_size_t__size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_std_vector_size_t__size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -467,9 +761,8 @@ class std_vector_size_t:
         | Parameters:
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_std_vector_size_t__getitem
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_std_vector_size_t__getitem',
+                                 ctypes.c_size_t,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,n)
         return ret
 
@@ -479,8 +772,8 @@ class std_vector_size_t:
         | *i*: ``size_t``
         | *value*: size_t
         """
-        func=self._link.o2scl.o2scl_std_vector_size_t__setitem
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_std_vector_size_t__setitem',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t])
         func(self._ptr,i,value)
         return
 
@@ -492,26 +785,50 @@ class std_vector_size_t:
         """
         return self.size()
     
-    def to_numpy(self):
+    def to_numpy(self,copy=True):
         """
-        Copy the vector to a numpy array
+        Copy the vector to a numpy array. If ``copy`` is false, then
+        return a ``numpy`` array which views the vector data
+        instead. The view keeps this object alive, but it is
+        invalidated if the vector is resized.
     
         Returns: a one-dimensional ``numpy`` array with dtype ``uint64``
         """
-        ret=numpy.zeros((self.size()),dtype=numpy.uint64)
-        for i in range(0,self.size()):
-            ret[i]=self.__getitem__(i)
-        return ret
+        return _data_view(self,'o2scl_std_vector_size_t__data',ctypes.c_size_t,copy)
      
     def init_py(self,v):
         """
         Initialize the vector from a python array
         """
-        self.resize(len(v))
-        for i in range(0,len(v)):
-            self.__setitem__(i,v[i])
+        self.assign(v)
+        return
+
+    def assign(self,arr):
+        """
+        Resize the vector to the length of ``arr``, a one-dimensional
+        ``numpy`` array or Python list, and copy ``arr`` to the vector
+        with a single memory copy
+        """
+        arr=numpy.ascontiguousarray(arr,dtype=ctypes.c_size_t)
+        if arr.ndim!=1:
+            raise ValueError('Function std_vector_size_t.assign() requires a '+
+                             'one-dimensional array.')
+        self.resize(len(arr))
+        _copy_from_numpy(self,'o2scl_std_vector_size_t__data',ctypes.c_size_t,arr)
         return
 
+    @classmethod
+    def from_numpy(cls,link,arr):
+        """
+        Create a new vector from ``arr``, a one-dimensional ``numpy``
+        array or Python list (see :meth:`assign()`)
+
+        Returns: a std_vector_size_t object
+        """
+        ret=cls(link)
+        ret.assign(arr)
+        return ret
+
 class std_vector_string:
     """
     Python interface for C++ class ``std::vector<std::string>``.
@@ -532,9 +849,8 @@ class std_vector_string:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_std_vector_std_string_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_std_vector_std_string_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -548,8 +864,8 @@ class std_vector_string:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_std_vector_std_string_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_std_vector_std_string_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -570,8 +886,8 @@ class std_vector_string:
         | Parameters:
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_std_vector_std_string__resize
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_std_vector_std_string__resize',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,n)
         return
 
@@ -579,9 +895,8 @@ class std_vector_string:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_std_vector_std_string__size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_std_vector_std_string__size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -591,9 +906,8 @@ class std_vector_string:
         | *n*: ``size_t``
         | Returns: std_string object
         """
-        func=self._link.o2scl.o2scl_std_vector_std_string__getitem
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_std_vector_std_string__getitem',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,n)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -605,8 +919,8 @@ class std_vector_string:
         | *i*: ``size_t``
         | *value*: Python bytes string
         """
-        func=self._link.o2scl.o2scl_std_vector_std_string__setitem
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_std_vector_std_string__setitem',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_char_p])
         func(self._ptr,i,value)
         return
 
@@ -618,6 +932,36 @@ class std_vector_string:
         """
         return self.size()
 
+    def to_list(self):
+        """
+        Copy the vector to a list of Python bytes objects. All of the
+        strings are packed into one buffer by a single foreign call,
+        rather than transferring each string separately, if the
+        library exports ``o2scl_std_vector_std_string__pack``.
+
+        Returns: a Python list of bytes strings
+        """
+        n=self.size()
+        if n==0:
+            return []
+        if not self._link.has_func('o2scl','o2scl_std_vector_std_string__pack'):
+            return [self.__getitem__(i) for i in range(0,n)]
+        func=self._link.get_func('o2scl','o2scl_std_vector_std_string__packed_size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
+        nchar=func(self._ptr)
+        buf=ctypes.create_string_buffer(nchar+1)
+        lens=(ctypes.c_size_t*n)()
+        func=self._link.get_func('o2scl','o2scl_std_vector_std_string__pack',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.c_size_t)])
+        func(self._ptr,buf,lens)
+        raw=buf.raw
+        ret=[]
+        start=0
+        for i in range(0,n):
+            ret.append(raw[start:start+lens[i]])
+            start=start+lens[i]
+        return ret
+
 class ublas_vector:
     """
     Python interface for C++ class ``boost::numeric::ublas::vector<double>``.
@@ -638,9 +982,8 @@ class ublas_vector:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_boost_numeric_ublas_vector_double_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_boost_numeric_ublas_vector_double_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -654,8 +997,8 @@ class ublas_vector:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_boost_numeric_ublas_vector_double_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_boost_numeric_ublas_vector_double_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -675,9 +1018,8 @@ class ublas_vector:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_vector_double__size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_vector_double__size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -686,8 +1028,8 @@ class ublas_vector:
         | Parameters:
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_vector_double__resize
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_vector_double__resize',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,n)
         return
 
@@ -696,9 +1038,8 @@ class ublas_vector:
         | Parameters:
         | *i*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_vector_double__getitem
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_vector_double__getitem',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,i)
         return ret
 
@@ -708,8 +1049,8 @@ class ublas_vector:
         | *i*: ``size_t``
         | *value*: double
         """
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_vector_double__setitem
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_vector_double__setitem',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double])
         func(self._ptr,i,value)
         return
 
@@ -721,15 +1062,41 @@ class ublas_vector:
         """
         return self.size()
     
-    def to_numpy(self):
+    def to_numpy(self,copy=True):
         """
-        Copy the vector to a numpy array
+        Copy the vector to a numpy array. If ``copy`` is false, then
+        return a ``numpy`` array which views the vector data
+        instead. The view keeps this object alive, but it is
+        invalidated if the vector is resized.
     
         Returns: a one-dimensional ``numpy`` array
         """
-        ret=numpy.zeros((self.size()))
-        for i in range(0,self.size()):
-            ret[i]=self.__getitem__(i)
+        return _data_view(self,'o2scl_boost_numeric_ublas_vector_double__data',ctypes.c_double,copy)
+
+    def assign(self,arr):
+        """
+        Resize the vector to the length of ``arr``, a one-dimensional
+        ``numpy`` array or Python list, and copy ``arr`` to the vector
+        with a single memory copy
+        """
+        arr=numpy.ascontiguousarray(arr,dtype=ctypes.c_double)
+        if arr.ndim!=1:
+            raise ValueError('Function ublas_vector.assign() requires a '+
+                             'one-dimensional array.')
+        self.resize(len(arr))
+        _copy_from_numpy(self,'o2scl_boost_numeric_ublas_vector_double__data',ctypes.c_double,arr)
+        return
+
+    @classmethod
+    def from_numpy(cls,link,arr):
+        """
+        Create a new vector from ``arr``, a one-dimensional ``numpy``
+        array or Python list (see :meth:`assign()`)
+
+        Returns: a ublas_vector object
+        """
+        ret=cls(link)
+        ret.assign(arr)
         return ret
 
 class ublas_matrix:
@@ -752,9 +1119,8 @@ class ublas_matrix:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_boost_numeric_ublas_matrix_double_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_boost_numeric_ublas_matrix_double_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -768,8 +1134,8 @@ class ublas_matrix:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_boost_numeric_ublas_matrix_double_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_boost_numeric_ublas_matrix_double_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -789,9 +1155,8 @@ class ublas_matrix:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_matrix_double__size1
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_matrix_double__size1',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -799,9 +1164,8 @@ class ublas_matrix:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_matrix_double__size2
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_matrix_double__size2',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -811,8 +1175,8 @@ class ublas_matrix:
         | *m*: ``size_t``
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_matrix_double__resize
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_matrix_double__resize',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t])
         func(self._ptr,m,n)
         return
 
@@ -822,31 +1186,66 @@ class ublas_matrix:
         | *m*: ``size_t``
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_matrix_double__getitem
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_matrix_double__getitem',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t])
         m,n=tup
         ret=func(self._ptr,m,n)
         return ret
 
     def __setitem__(self,tup,value):
         m,n=tup
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_matrix_double__setitem
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_matrix_double__setitem',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_double])
         func(self._ptr,m,n,value)
         return
 
-    def to_numpy(self):
+    def to_numpy(self,copy=True,owner=None):
         """
-        Copy the vector to a numpy matrix
+        Copy the matrix to a numpy matrix. If ``copy`` is false, then
+        return a ``numpy`` array which views the matrix data instead.
+        The view keeps ``owner`` alive, or this object if ``owner`` is
+        ``None``, but it is invalidated if the matrix is resized.
+        Views require a library which exports the data accessor (see
+        :func:`_data_view()`).
     
         Returns: a two-dimensional ``numpy`` array, with dimension
         ``size1(),size2()``.
         """
-        ret=numpy.zeros((self.size1(),self.size2()))
-        for i in range(0,self.size1()):
-            for j in range(0,self.size2()):
-                ret[i,j]=self.__getitem__((i,j))
+        m=self.size1()
+        n=self.size2()
+        ret=_data_view(self,'o2scl_boost_numeric_ublas_matrix_double__data',
+                       ctypes.c_double,copy,owner,
+                       lambda: [self.__getitem__((i,j)) for i in range(0,m)
+                                for j in range(0,n)])
+        return ret.reshape((m,n))
+
+    def assign(self,arr):
+        """
+        Resize the matrix to the shape of ``arr``, a two-dimensional
+        ``numpy`` array or list of lists, and copy ``arr`` to the
+        matrix with a single memory copy
+        """
+        arr=numpy.ascontiguousarray(arr,dtype=ctypes.c_double)
+        if arr.ndim!=2:
+            raise ValueError('Function ublas_matrix.assign() requires a '+
+                             'two-dimensional array.')
+        self.resize(arr.shape[0],arr.shape[1])
+        n=arr.shape[1]
+        _copy_from_numpy(self,'o2scl_boost_numeric_ublas_matrix_double__data',
+                         ctypes.c_double,arr,
+                         lambda k,value: self.__setitem__(divmod(k,n),value))
+        return
+
+    @classmethod
+    def from_numpy(cls,link,arr):
+        """
+        Create a new matrix from ``arr``, a two-dimensional ``numpy``
+        array or list of lists (see :meth:`assign()`)
+
+        Returns: a ublas_matrix object
+        """
+        ret=cls(link)
+        ret.assign(arr)
         return ret
 
 class ublas_matrix_int:
@@ -869,9 +1268,8 @@ class ublas_matrix_int:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_boost_numeric_ublas_matrix_int_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_boost_numeric_ublas_matrix_int_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -885,8 +1283,8 @@ class ublas_matrix_int:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_boost_numeric_ublas_matrix_int_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_boost_numeric_ublas_matrix_int_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -906,9 +1304,8 @@ class ublas_matrix_int:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_matrix_int__size1
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_matrix_int__size1',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -916,9 +1313,8 @@ class ublas_matrix_int:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_matrix_int__size2
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_matrix_int__size2',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -928,8 +1324,8 @@ class ublas_matrix_int:
         | *m*: ``size_t``
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_matrix_int__resize
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_matrix_int__resize',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t])
         func(self._ptr,m,n)
         return
 
@@ -939,17 +1335,16 @@ class ublas_matrix_int:
         | *m*: ``size_t``
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_matrix_int__getitem
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_matrix_int__getitem',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t])
         m,n=tup
         ret=func(self._ptr,m,n)
         return ret
 
     def __setitem__(self,tup,value):
         m,n=tup
-        func=self._link.o2scl.o2scl_boost_numeric_ublas_matrix_int__setitem
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_boost_numeric_ublas_matrix_int__setitem',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_int])
         func(self._ptr,m,n,value)
         return
 
@@ -986,9 +1381,8 @@ class std_vector_vector:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_std_vector_std_vector_double_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_std_vector_std_vector_double_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1002,8 +1396,8 @@ class std_vector_vector:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_std_vector_std_vector_double_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_std_vector_std_vector_double_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1024,8 +1418,8 @@ class std_vector_vector:
         | Parameters:
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_std_vector_std_vector_double__resize
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_std_vector_std_vector_double__resize',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,n)
         return
 
@@ -1033,9 +1427,8 @@ class std_vector_vector:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_std_vector_std_vector_double__size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_std_vector_std_vector_double__size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1045,11 +1438,10 @@ class std_vector_vector:
         | *n*: ``size_t``
         | Returns: :class:`std_vector` object
         """
-        func=self._link.o2scl.o2scl_std_vector_std_vector_double__getitem
+        func=self._link.get_func('o2scl','o2scl_std_vector_std_vector_double__getitem',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_size_t,ctypes.POINTER(ctypes.POINTER(ctypes.c_double)),ctypes.POINTER(ctypes.c_int)])
         n_=ctypes.c_int(0)
         ptr_=ctypes.POINTER(ctypes.c_double)()
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.POINTER(ctypes.POINTER(ctypes.c_double)),ctypes.POINTER(ctypes.c_int)]
         func(self._ptr,n,ctypes.byref(ptr_),ctypes.byref(n_))
         ret=numpy.ctypeslib.as_array(ptr_,shape=(n_.value,))
         return ret
@@ -1060,12 +1452,9 @@ class std_vector_vector:
         | *i*: ``size_t``
         | *value*: Python array
         """
-        func=self._link.o2scl.o2scl_std_vector_std_vector_double__setitem
-        sv=std_vector(self._link)
-        sv.resize(len(value))
-        for j in range(0,len(value)):
-            sv[j]=value[j]
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_std_vector_std_vector_double__setitem',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p])
+        sv=std_vector.from_numpy(self._link,value)
         func(self._ptr,i,sv._ptr)
         return
 
@@ -1104,9 +1493,8 @@ class std_complex:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_std_complex_double_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_std_complex_double_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1120,8 +1508,8 @@ class std_complex:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_std_complex_double_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_std_complex_double_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1141,9 +1529,8 @@ class std_complex:
         """
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_std_complex_double__real
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_std_complex_double__real',
+                                 ctypes.c_double,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1152,8 +1539,8 @@ class std_complex:
         | Parameters:
         | *value*: ``double``
         """
-        func=self._link.o2scl.o2scl_std_complex_double__real_set
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_std_complex_double__real_set',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1161,9 +1548,8 @@ class std_complex:
         """
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_std_complex_double__imag
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_std_complex_double__imag',
+                                 ctypes.c_double,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1172,8 +1558,8 @@ class std_complex:
         | Parameters:
         | *value*: ``double``
         """
-        func=self._link.o2scl.o2scl_std_complex_double__imag_set
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_std_complex_double__imag_set',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1186,9 +1572,8 @@ class std_complex:
 
         """
 
-        f=link.o2scl.o2scl_std_complex_double__init
-        f.restype=ctypes.c_void_p
-        f.argtypes=[ctypes.c_double,ctypes.c_double]
+        f=link.get_func('o2scl','o2scl_std_complex_double__init',
+                        ctypes.c_void_p,[ctypes.c_double,ctypes.c_double])
         return cls(link,f(re,im))
 
     def to_python(self):
@@ -1227,9 +1612,8 @@ class lib_settings_class:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_lib_settings_class
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_lib_settings_class',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1243,8 +1627,8 @@ class lib_settings_class:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_lib_settings_class
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_lib_settings_class',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1264,9 +1648,8 @@ class lib_settings_class:
         """
         | Returns: Python bytes object
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_get_data_dir
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_get_data_dir',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
         ret=func(self._ptr)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -1279,9 +1662,8 @@ class lib_settings_class:
         | Returns: a Python int
         """
         dir_=ctypes.c_char_p(force_bytes(dir))
-        func=self._link.o2scl.o2scl_lib_settings_class_set_data_dir
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_set_data_dir',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,dir_)
         return ret
 
@@ -1289,9 +1671,8 @@ class lib_settings_class:
         """
         | Returns: Python bytes object
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_get_doc_dir
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_get_doc_dir',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
         ret=func(self._ptr)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -1304,9 +1685,8 @@ class lib_settings_class:
         | Returns: a Python int
         """
         dir_=ctypes.c_char_p(force_bytes(dir))
-        func=self._link.o2scl.o2scl_lib_settings_class_set_doc_dir
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_set_doc_dir',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,dir_)
         return ret
 
@@ -1314,9 +1694,8 @@ class lib_settings_class:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_eos_installed
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_eos_installed',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1324,9 +1703,8 @@ class lib_settings_class:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_part_installed
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_part_installed',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1334,9 +1712,8 @@ class lib_settings_class:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_hdf_support
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_hdf_support',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1344,9 +1721,8 @@ class lib_settings_class:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_openmp_support
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_openmp_support',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1354,9 +1730,8 @@ class lib_settings_class:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_readline_support
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_readline_support',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1364,9 +1739,8 @@ class lib_settings_class:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_ncurses_support
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_ncurses_support',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1374,9 +1748,8 @@ class lib_settings_class:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_gsl2_support
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_gsl2_support',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1384,9 +1757,8 @@ class lib_settings_class:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_armadillo_support
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_armadillo_support',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1394,9 +1766,8 @@ class lib_settings_class:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_eigen_support
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_eigen_support',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1404,9 +1775,8 @@ class lib_settings_class:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_fftw_support
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_fftw_support',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1414,9 +1784,8 @@ class lib_settings_class:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_hdf5_compression_support
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_hdf5_compression_support',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1424,9 +1793,8 @@ class lib_settings_class:
         """
         | Returns: Python bytes object
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_system_type
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_system_type',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
         ret=func(self._ptr)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -1436,9 +1804,8 @@ class lib_settings_class:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_range_check
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_range_check',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1446,9 +1813,8 @@ class lib_settings_class:
         """
         | Returns: Python bytes object
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_time_compiled
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_time_compiled',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
         ret=func(self._ptr)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -1458,9 +1824,8 @@ class lib_settings_class:
         """
         | Returns: Python bytes object
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_date_compiled
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_date_compiled',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
         ret=func(self._ptr)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -1470,9 +1835,8 @@ class lib_settings_class:
         """
         | Returns: Python bytes object
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_o2scl_version
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_o2scl_version',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
         ret=func(self._ptr)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -1481,8 +1845,8 @@ class lib_settings_class:
     def config_h_report(self):
         """
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_config_h_report
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_config_h_report',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -1490,9 +1854,8 @@ class lib_settings_class:
         """
         | Returns: :class:`convert_units` object
         """
-        func=self._link.o2scl.o2scl_lib_settings_class_get_convert_units
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_lib_settings_class_get_convert_units',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
         ret=func(self._ptr)
         ret2=convert_units(self._link,ret)
         return ret2
@@ -1508,6 +1871,7 @@ class table:
     _ptr=0
     _link=0
     _owner=True
+    _interp_cache=None
 
     def __init__(self,link,pointer=0):
         """
@@ -1520,9 +1884,8 @@ class table:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_table_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_table_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1536,8 +1899,8 @@ class table:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_table_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_table_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1561,8 +1924,8 @@ class table:
         """
 
         new_obj=type(self)(self._link)
-        f2=self._link.o2scl.o2scl_copy_table_
-        f2.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        f2=self._link.get_func('o2scl','o2scl_copy_table_',
+                               None,[ctypes.c_void_p,ctypes.c_void_p])
         f2(self._ptr,new_obj._ptr)
         return new_obj
 
@@ -1573,13 +1936,12 @@ class table:
         | Returns: :class:`std_vector` object
         """
         col_=ctypes.c_char_p(force_bytes(col))
-        func=self._link.o2scl.o2scl_table__getitem
+        func=self._link.get_func('o2scl','o2scl_table__getitem',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.POINTER(ctypes.c_double)),ctypes.POINTER(ctypes.c_int)])
         n_=ctypes.c_int(0)
         ptr_=ctypes.POINTER(ctypes.c_double)()
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.POINTER(ctypes.c_double)),ctypes.POINTER(ctypes.c_int)]
         func(self._ptr,col_,ctypes.byref(ptr_),ctypes.byref(n_))
-        ret=numpy.ctypeslib.as_array(ptr_,shape=(n_.value,))
+        ret=_ptr_view(self,ptr_,n_.value,ctypes.c_double)
         return ret
 
     def set(self,col,row,val):
@@ -1590,8 +1952,8 @@ class table:
         | *val*: ``double``
         """
         col_=ctypes.c_char_p(force_bytes(col))
-        func=self._link.o2scl.o2scl_table__set
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_table__set',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t,ctypes.c_double])
         func(self._ptr,col_,row,val)
         return
 
@@ -1603,9 +1965,8 @@ class table:
         | Returns: a Python float
         """
         col_=ctypes.c_char_p(force_bytes(col))
-        func=self._link.o2scl.o2scl_table__get
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__get',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t])
         ret=func(self._ptr,col_,row)
         return ret
 
@@ -1613,9 +1974,8 @@ class table:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_table__get_ncolumns
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table__get_ncolumns',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1623,9 +1983,8 @@ class table:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_table__get_nlines
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table__get_nlines',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1634,8 +1993,8 @@ class table:
         | Parameters:
         | *lines*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_table__set_nlines
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__set_nlines',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,lines)
         return
 
@@ -1643,9 +2002,8 @@ class table:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_table__get_maxlines
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table__get_maxlines',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1654,8 +2012,8 @@ class table:
         | Parameters:
         | *llines*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_table__set_maxlines
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__set_maxlines',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,llines)
         return
 
@@ -1664,8 +2022,8 @@ class table:
         | Parameters:
         | *il*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_table__set_nlines_auto
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__set_nlines_auto',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,il)
         return
 
@@ -1674,8 +2032,8 @@ class table:
         | Parameters:
         | *llines*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_table__inc_maxlines
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__inc_maxlines',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,llines)
         return
 
@@ -1685,8 +2043,8 @@ class table:
         | *col*: string
         """
         col_=ctypes.c_char_p(force_bytes(col))
-        func=self._link.o2scl.o2scl_table__new_column
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__new_column',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p])
         func(self._ptr,col_)
         return
 
@@ -1696,9 +2054,8 @@ class table:
         | *icol*: ``size_t``
         | Returns: Python bytes object
         """
-        func=self._link.o2scl.o2scl_table__get_column_name
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__get_column_name',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,icol)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -1712,8 +2069,8 @@ class table:
         """
         src_=ctypes.c_char_p(force_bytes(src))
         dest_=ctypes.c_char_p(force_bytes(dest))
-        func=self._link.o2scl.o2scl_table__rename_column
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__rename_column',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,src_,dest_)
         return
 
@@ -1723,8 +2080,8 @@ class table:
         | *col*: string
         """
         col_=ctypes.c_char_p(force_bytes(col))
-        func=self._link.o2scl.o2scl_table__delete_column
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__delete_column',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p])
         func(self._ptr,col_)
         return
 
@@ -1734,9 +2091,8 @@ class table:
         | *icol*: ``size_t``
         | Returns: Python bytes object
         """
-        func=self._link.o2scl.o2scl_table__get_sorted_name
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__get_sorted_name',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,icol)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -1749,8 +2105,8 @@ class table:
         | *val*: ``double``
         """
         scol_=ctypes.c_char_p(force_bytes(scol))
-        func=self._link.o2scl.o2scl_table__init_column
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_table__init_column',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double])
         func(self._ptr,scol_,val)
         return
 
@@ -1761,9 +2117,8 @@ class table:
         | Returns: a Python boolean
         """
         scol_=ctypes.c_char_p(force_bytes(scol))
-        func=self._link.o2scl.o2scl_table__is_column
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__is_column',
+                                 ctypes.c_bool,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,scol_)
         return ret
 
@@ -1774,9 +2129,8 @@ class table:
         | Returns: a Python int
         """
         scol_=ctypes.c_char_p(force_bytes(scol))
-        func=self._link.o2scl.o2scl_table__lookup_column
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__lookup_column',
+                                 ctypes.c_size_t,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,scol_)
         return ret
 
@@ -1788,8 +2142,8 @@ class table:
         """
         src_=ctypes.c_char_p(force_bytes(src))
         dest_=ctypes.c_char_p(force_bytes(dest))
-        func=self._link.o2scl.o2scl_table__copy_column
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__copy_column',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,src_,dest_)
         return
 
@@ -1806,8 +2160,8 @@ class table:
         src_col_=ctypes.c_char_p(force_bytes(src_col))
         dest_index_=ctypes.c_char_p(force_bytes(dest_index))
         dest_col_=ctypes.c_char_p(force_bytes(dest_col))
-        func=self._link.o2scl.o2scl_table__add_col_from_table
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__add_col_from_table',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,source._ptr,src_index_,src_col_,dest_index_,dest_col_)
         return
 
@@ -1821,8 +2175,8 @@ class table:
         """
         src_index_=ctypes.c_char_p(force_bytes(src_index))
         dest_index_=ctypes.c_char_p(force_bytes(dest_index))
-        func=self._link.o2scl.o2scl_table__insert_table
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__insert_table',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool,ctypes.c_char_p])
         func(self._ptr,source._ptr,src_index_,allow_extrap,dest_index_)
         return
 
@@ -1831,8 +2185,8 @@ class table:
         | Parameters:
         | *source*: :class:`table<>` object
         """
-        func=self._link.o2scl.o2scl_table__add_table
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table__add_table',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,source._ptr)
         return
 
@@ -1841,8 +2195,8 @@ class table:
         | Parameters:
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_table__new_row
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__new_row',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,n)
         return
 
@@ -1852,8 +2206,8 @@ class table:
         | *src*: ``size_t``
         | *dest*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_table__copy_row
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__copy_row',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t])
         func(self._ptr,src,dest)
         return
 
@@ -1864,8 +2218,8 @@ class table:
         | *val*: ``double``
         """
         scol_=ctypes.c_char_p(force_bytes(scol))
-        func=self._link.o2scl.o2scl_table__delete_row
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_table__delete_row',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double])
         func(self._ptr,scol_,val)
         return
 
@@ -1875,8 +2229,8 @@ class table:
         | *func*: string
         """
         func_=ctypes.c_char_p(force_bytes(func))
-        func=self._link.o2scl.o2scl_table__delete_rows_func
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__delete_rows_func',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p])
         func(self._ptr,func_)
         return
 
@@ -1886,8 +2240,8 @@ class table:
         | *names*: string
         """
         names_=ctypes.c_char_p(force_bytes(names))
-        func=self._link.o2scl.o2scl_table__line_of_names
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__line_of_names',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p])
         func(self._ptr,names_)
         return
 
@@ -1896,8 +2250,8 @@ class table:
         | Parameters:
         | *data*: :class:`std_vector` object
         """
-        func=self._link.o2scl.o2scl_table__line_of_data
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table__line_of_data',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,data._ptr)
         return
 
@@ -1909,9 +2263,8 @@ class table:
         | Returns: a Python int
         """
         scol_=ctypes.c_char_p(force_bytes(scol))
-        func=self._link.o2scl.o2scl_table__ordered_lookup
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_table__ordered_lookup',
+                                 ctypes.c_size_t,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double])
         ret=func(self._ptr,scol_,val)
         return ret
 
@@ -1923,9 +2276,8 @@ class table:
         | Returns: a Python int
         """
         scol_=ctypes.c_char_p(force_bytes(scol))
-        func=self._link.o2scl.o2scl_table__lookup
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_table__lookup',
+                                 ctypes.c_size_t,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double])
         ret=func(self._ptr,scol_,val)
         return ret
 
@@ -1939,9 +2291,8 @@ class table:
         """
         scol_=ctypes.c_char_p(force_bytes(scol))
         scol2_=ctypes.c_char_p(force_bytes(scol2))
-        func=self._link.o2scl.o2scl_table__lookup_val
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__lookup_val',
+                                 ctypes.c_size_t,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double,ctypes.c_char_p])
         ret=func(self._ptr,scol_,val,scol2_)
         return ret
 
@@ -1950,8 +2301,8 @@ class table:
         | Parameters:
         | *interp_type*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_table__set_interp_type
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__set_interp_type',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,interp_type)
         return
 
@@ -1959,9 +2310,8 @@ class table:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_table__get_interp_type
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table__get_interp_type',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1975,9 +2325,8 @@ class table:
         """
         sx_=ctypes.c_char_p(force_bytes(sx))
         sy_=ctypes.c_char_p(force_bytes(sy))
-        func=self._link.o2scl.o2scl_table__interp
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__interp',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double,ctypes.c_char_p])
         ret=func(self._ptr,sx_,x0,sy_)
         return ret
 
@@ -1989,9 +2338,8 @@ class table:
         | *iy*: ``size_t``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_table__interp_index
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__interp_index',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double,ctypes.c_size_t])
         ret=func(self._ptr,ix,x0,iy)
         return ret
 
@@ -2005,8 +2353,8 @@ class table:
         x_=ctypes.c_char_p(force_bytes(x))
         y_=ctypes.c_char_p(force_bytes(y))
         yp_=ctypes.c_char_p(force_bytes(yp))
-        func=self._link.o2scl.o2scl_table__deriv_col
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__deriv_col',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,x_,y_,yp_)
         return
 
@@ -2020,9 +2368,8 @@ class table:
         """
         sx_=ctypes.c_char_p(force_bytes(sx))
         sy_=ctypes.c_char_p(force_bytes(sy))
-        func=self._link.o2scl.o2scl_table__deriv
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__deriv',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double,ctypes.c_char_p])
         ret=func(self._ptr,sx_,x0,sy_)
         return ret
 
@@ -2034,9 +2381,8 @@ class table:
         | *iy*: ``size_t``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_table__deriv_index
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__deriv_index',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double,ctypes.c_size_t])
         ret=func(self._ptr,ix,x0,iy)
         return ret
 
@@ -2050,8 +2396,8 @@ class table:
         x_=ctypes.c_char_p(force_bytes(x))
         y_=ctypes.c_char_p(force_bytes(y))
         yp_=ctypes.c_char_p(force_bytes(yp))
-        func=self._link.o2scl.o2scl_table__deriv2_col
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__deriv2_col',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,x_,y_,yp_)
         return
 
@@ -2065,9 +2411,8 @@ class table:
         """
         sx_=ctypes.c_char_p(force_bytes(sx))
         sy_=ctypes.c_char_p(force_bytes(sy))
-        func=self._link.o2scl.o2scl_table__deriv2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__deriv2',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double,ctypes.c_char_p])
         ret=func(self._ptr,sx_,x0,sy_)
         return ret
 
@@ -2079,9 +2424,8 @@ class table:
         | *iy*: ``size_t``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_table__deriv2_index
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__deriv2_index',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double,ctypes.c_size_t])
         ret=func(self._ptr,ix,x0,iy)
         return ret
 
@@ -2096,9 +2440,8 @@ class table:
         """
         sx_=ctypes.c_char_p(force_bytes(sx))
         sy_=ctypes.c_char_p(force_bytes(sy))
-        func=self._link.o2scl.o2scl_table__integ
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__integ',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p])
         ret=func(self._ptr,sx_,x1,x2,sy_)
         return ret
 
@@ -2111,9 +2454,8 @@ class table:
         | *iy*: ``size_t``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_table__integ_index
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double,ctypes.c_double,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__integ_index',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double,ctypes.c_double,ctypes.c_size_t])
         ret=func(self._ptr,ix,x1,x2,iy)
         return ret
 
@@ -2127,8 +2469,8 @@ class table:
         x_=ctypes.c_char_p(force_bytes(x))
         y_=ctypes.c_char_p(force_bytes(y))
         yi_=ctypes.c_char_p(force_bytes(yi))
-        func=self._link.o2scl.o2scl_table__integ_col
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__integ_col',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,x_,y_,yi_)
         return
 
@@ -2139,9 +2481,8 @@ class table:
         | Returns: a Python float
         """
         max_=ctypes.c_char_p(force_bytes(max))
-        func=self._link.o2scl.o2scl_table__max
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__max',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,max_)
         return ret
 
@@ -2152,49 +2493,48 @@ class table:
         | Returns: a Python float
         """
         min_=ctypes.c_char_p(force_bytes(min))
-        func=self._link.o2scl.o2scl_table__min
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__min',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,min_)
         return ret
 
     def zero_table(self):
         """
         """
-        func=self._link.o2scl.o2scl_table__zero_table
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table__zero_table',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
     def clear(self):
         """
         """
-        func=self._link.o2scl.o2scl_table__clear
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table__clear',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
     def clear_data(self):
         """
         """
-        func=self._link.o2scl.o2scl_table__clear_data
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table__clear_data',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
     def clear_table(self):
         """
         """
-        func=self._link.o2scl.o2scl_table__clear_table
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table__clear_table',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
     def clear_constants(self):
         """
         """
-        func=self._link.o2scl.o2scl_table__clear_constants
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table__clear_constants',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -2204,8 +2544,8 @@ class table:
         | *scol*: string
         """
         scol_=ctypes.c_char_p(force_bytes(scol))
-        func=self._link.o2scl.o2scl_table__sort_table
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__sort_table',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p])
         func(self._ptr,scol_)
         return
 
@@ -2215,8 +2555,8 @@ class table:
         | *scol*: string
         """
         scol_=ctypes.c_char_p(force_bytes(scol))
-        func=self._link.o2scl.o2scl_table__sort_column
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__sort_column',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p])
         func(self._ptr,scol_)
         return
 
@@ -2227,8 +2567,8 @@ class table:
         | *window*: ``size_t``
         """
         col_name_=ctypes.c_char_p(force_bytes(col_name))
-        func=self._link.o2scl.o2scl_table__average_col_roll
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__average_col_roll',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t])
         func(self._ptr,col_name_,window)
         return
 
@@ -2238,16 +2578,16 @@ class table:
         | *window*: ``size_t``
         | *rolling*: ``bool``
         """
-        func=self._link.o2scl.o2scl_table__average_rows
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_bool]
+        func=self._link.get_func('o2scl','o2scl_table__average_rows',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_bool])
         func(self._ptr,window,rolling)
         return
 
     def is_valid(self):
         """
         """
-        func=self._link.o2scl.o2scl_table__is_valid
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table__is_valid',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -2257,8 +2597,8 @@ class table:
         | *list*: string
         """
         list_=ctypes.c_char_p(force_bytes(list))
-        func=self._link.o2scl.o2scl_table__functions_columns
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__functions_columns',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p])
         func(self._ptr,list_)
         return
 
@@ -2270,8 +2610,8 @@ class table:
         """
         function_=ctypes.c_char_p(force_bytes(function))
         scol_=ctypes.c_char_p(force_bytes(scol))
-        func=self._link.o2scl.o2scl_table__function_column
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__function_column',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,function_,scol_)
         return
 
@@ -2283,9 +2623,8 @@ class table:
         | Returns: a Python float
         """
         scol_=ctypes.c_char_p(force_bytes(scol))
-        func=self._link.o2scl.o2scl_table__row_function
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table__row_function',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t])
         ret=func(self._ptr,scol_,row)
         return ret
 
@@ -2296,17 +2635,16 @@ class table:
         | Returns: a Python int
         """
         function_=ctypes.c_char_p(force_bytes(function))
-        func=self._link.o2scl.o2scl_table__function_find_row
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table__function_find_row',
+                                 ctypes.c_size_t,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,function_)
         return ret
 
     def summary(self):
         """
         """
-        func=self._link.o2scl.o2scl_table__summary
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table__summary',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -2316,13 +2654,372 @@ class table:
         data to the table
         """
         # Create a std_vector object and copy the data over
-        vec=std_vector(self._link)
-        vec.resize(len(v))
-        for i in range(0,len(v)):
-            vec[i]=v[i]
+        vec=std_vector.from_numpy(self._link,v)
         self.line_of_data_vector(vec)
         return
 
+    def _column_names(self):
+        """
+        Return a list of the column names as Python bytes objects
+        """
+        return [self.get_column_name(i) for i in
+                range(0,self.get_ncolumns())]
+
+    def append_rows(self,arr,columns=None):
+        """
+        Add the rows of ``arr``, a two-dimensional ``numpy`` array with
+        shape ``(nrows,ncols)``, to the end of the table. If
+        ``columns`` is ``None``, then the columns of ``arr`` are copied
+        to the table columns in order, and ``ncols`` must be equal to
+        the number of columns in the table. Otherwise ``columns`` is a
+        list of ``ncols`` column names which specifies the destination
+        of each column of ``arr``. Any names in ``columns`` which are
+        not already columns in the table are created. Table columns
+        not specified in ``columns`` are set to zero in the new rows.
+
+        When the table is full, the maximum number of lines is at
+        least doubled with :meth:`inc_maxlines()`, so that a sequence
+        of calls to this function requires an amortized constant
+        number of foreign calls per batch. Each column is copied with
+        a single memory copy.
+        """
+        arr=numpy.atleast_2d(numpy.asarray(arr,dtype=numpy.double))
+        if arr.ndim!=2:
+            raise ValueError('Function table.append_rows() requires a '+
+                             'two-dimensional array.')
+        nrows,ncols=arr.shape
+        if columns is None:
+            columns=self._column_names()
+            if len(columns)!=ncols:
+                raise ValueError('Array has '+str(ncols)+' columns but '+
+                                 'table has '+str(len(columns))+
+                                 ' in table.append_rows().')
+        else:
+            columns=[force_bytes(col) for col in columns]
+            if len(columns)!=ncols:
+                raise ValueError('Array has '+str(ncols)+' columns but '+
+                                 str(len(columns))+' column names were '+
+                                 'given in table.append_rows().')
+            for col in columns:
+                if self.is_column(col)==False:
+                    self.new_column(col)
+
+        nlines=self.get_nlines()
+        maxlines=self.get_maxlines()
+        if nlines+nrows>maxlines:
+            self.inc_maxlines(max(maxlines,nlines+nrows-maxlines))
+        self.set_nlines(nlines+nrows)
+
+        for i in range(0,len(columns)):
+            self[columns[i]][nlines:nlines+nrows]=arr[:,i]
+        others=set(self._column_names())-set(columns)
+        for col in others:
+            self[col][nlines:nlines+nrows]=0.0
+        return
+
+    def set_column(self,col,arr):
+        """
+        Copy the one-dimensional ``numpy`` array ``arr`` to the column
+        named ``col`` with a single memory copy, creating the column
+        if it is not already present. If the length of ``arr`` is
+        larger than the current number of lines, the number of lines
+        (and if necessary the maximum number of lines) is increased
+        and the new rows in the other columns are set to zero. If the
+        length of ``arr`` is smaller than the number of lines, then a
+        ``ValueError`` exception is raised.
+        """
+        arr=numpy.asarray(arr,dtype=numpy.double)
+        if arr.ndim!=1:
+            raise ValueError('Function table.set_column() requires a '+
+                             'one-dimensional array.')
+        n=len(arr)
+        nlines=self.get_nlines()
+        if n<nlines:
+            raise ValueError('Array of length '+str(n)+' is shorter '+
+                             'than the '+str(nlines)+' lines in the '+
+                             'table in table.set_column().')
+        if self.is_column(col)==False:
+            self.new_column(col)
+        if n>nlines:
+            maxlines=self.get_maxlines()
+            if n>maxlines:
+                self.inc_maxlines(n-maxlines)
+            self.set_nlines(n)
+            for name in self._column_names():
+                self[name][nlines:n]=0.0
+        self[col][0:n]=arr
+        return
+
+    def to_numpy(self,columns=None,copy=False,structured=False):
+        """
+        Return the columns listed in ``columns`` (or all columns if
+        ``columns`` is ``None``) as a dictionary of one-dimensional
+        ``numpy`` arrays indexed by column name, where each array has
+        been trimmed to the number of lines in the table. If ``copy``
+        is false, the arrays are views of the table data which keep
+        this object alive (see :meth:`__getitem__()`), otherwise they
+        are copies. If ``structured`` is true, a ``numpy`` structured
+        array is returned instead of a dictionary. A structured array
+        stores rows contiguously, so it is always a copy.
+
+        Column names are converted from bytes to Python strings.
+
+        Returns: a dictionary of ``numpy`` arrays or a structured array
+        """
+        if columns is None:
+            columns=self._column_names()
+        nlines=self.get_nlines()
+        ret={}
+        for col in columns:
+            if isinstance(col,bytes):
+                name=col.decode('utf-8')
+            else:
+                name=col
+            ret[name]=self[col][0:nlines]
+            if copy and not structured:
+                ret[name]=ret[name].copy()
+        if structured:
+            sa=numpy.zeros(nlines,dtype=[(name,numpy.double)
+                                         for name in ret])
+            for name in ret:
+                sa[name]=ret[name]
+            return sa
+        return ret
+
+    def to_pandas(self,columns=None,copy=True):
+        """
+        Create a ``pandas`` DataFrame object from the columns listed in
+        ``columns`` (or all columns if ``columns`` is ``None``). The
+        frame is constructed directly from the ``numpy`` views returned
+        by :meth:`to_numpy()`. If ``copy`` is false, then ``pandas`` is
+        allowed to use the views without copying them, in which case
+        the frame is only valid while the table is unmodified.
+
+        This function requires ``pandas``.
+
+        Returns: a ``pandas.DataFrame`` object
+        """
+        import pandas
+        return pandas.DataFrame(self.to_numpy(columns),copy=copy)
+
+    @classmethod
+    def from_numpy(cls,link,data,units=None):
+        """
+        Create a new :class:`table_units` object from ``data``, which
+        is either a dictionary of one-dimensional ``numpy`` arrays
+        indexed by column name, or a ``numpy`` structured array. All
+        columns must have the same length. If ``units`` is not
+        ``None``, it is a dictionary of unit strings indexed by column
+        name. Each column is copied with :meth:`set_column()`.
+
+        Returns: a :class:`table_units` object
+        """
+        if isinstance(data,numpy.ndarray):
+            if data.dtype.names is None:
+                raise ValueError('Function table.from_numpy() requires '+
+                                 'a dictionary or a structured array.')
+            names=data.dtype.names
+        else:
+            names=list(data.keys())
+        lengths=[len(data[name]) for name in names]
+        if len(set(lengths))>1:
+            raise ValueError('Columns have different lengths ('+
+                             ','.join(str(n) for n in lengths)+') in '+
+                             'table.from_numpy().')
+        ret=table_units(link)
+        for name in names:
+            ret.set_column(name,data[name])
+        if units is not None:
+            for name in units:
+                ret.set_unit(name,units[name])
+        return ret
+
+    def __reduce_ex__(self,protocol):
+        """
+        Support for pickling. The column names, the units (for
+        :class:`table_units` objects), the interpolation type, and the
+        data are stored, with the data in a single contiguous buffer
+        (see :func:`_pickle_buffer()`). The object is recreated with
+        the linker from :func:`default_linker()`.
+
+        Table constants are not stored.
+        """
+        names=[name.decode('utf-8') for name in self._column_names()]
+        nlines=self.get_nlines()
+        data=numpy.empty((len(names),nlines))
+        for i in range(0,len(names)):
+            data[i]=self[names[i]][0:nlines]
+        cls=table
+        units=None
+        if isinstance(self,table_units):
+            cls=table_units
+            units=[self.get_unit(name) for name in names]
+        return (_unpickle_table,(cls,names,units,nlines,
+                                 _pickle_buffer(data,protocol),
+                                 self.get_interp_type()))
+
+    def _interp_vec(self,sx,sy):
+        """
+        Return an :class:`interp_vec` object which interpolates the
+        column ``sy`` as a function of the column ``sx`` using the
+        interpolation type of the table. The object is cached and
+        reused by later calls with the same pair of columns, as long
+        as the number of lines, the interpolation type, and the data
+        in both columns are unchanged. Checking the data requires
+        one comparison of each column rather than a foreign call for
+        each line.
+        """
+        sx=force_bytes(sx)
+        sy=force_bytes(sy)
+        nlines=self.get_nlines()
+        x=self[sx][0:nlines]
+        y=self[sy][0:nlines]
+        itype=self.get_interp_type()
+        if self._interp_cache is None:
+            self._interp_cache={}
+        if (sx,sy) in self._interp_cache:
+            itp,xv,yv,itype_old,x_old,y_old=self._interp_cache[(sx,sy)]
+            if (itype==itype_old and numpy.array_equal(x_old,x) and
+                numpy.array_equal(y_old,y)):
+                return itp
+        # Copies of the columns are stored in the cache so that
+        # changes to the table can be detected
+        xv=std_vector.from_numpy(self._link,x)
+        yv=std_vector.from_numpy(self._link,y)
+        itp=interp_vec(self._link)
+        itp.set(nlines,xv,yv,itype)
+        self._interp_cache[(sx,sy)]=(itp,xv,yv,itype,numpy.array(x),
+                                     numpy.array(y))
+        return itp
+
+    def interp_array(self,sx,x0,sy):
+        """
+        Interpolate the column ``sy`` as a function of the column
+        ``sx`` at each of the points in the ``numpy`` array ``x0``.
+
+        The interpolation object for each pair of columns is cached
+        and reused by later calls to this function,
+        :meth:`deriv_array()`, :meth:`deriv2_array()` and
+        :meth:`integ_array()` until the number of lines, the
+        interpolation type, or the data in either column changes.
+
+        Returns: a ``numpy`` array with the same shape as ``x0``
+        """
+        itp=self._interp_vec(sx,sy)
+        return itp.eval_array(x0)
+
+    def deriv_array(self,sx,x0,sy):
+        """
+        Compute the derivative of the column ``sy`` with respect to
+        the column ``sx`` at each of the points in the ``numpy``
+        array ``x0``, using a cached interpolation object (see
+        :meth:`interp_array()`).
+
+        Returns: a ``numpy`` array with the same shape as ``x0``
+        """
+        itp=self._interp_vec(sx,sy)
+        return itp.deriv_array(x0)
+
+    def deriv2_array(self,sx,x0,sy):
+        """
+        Compute the second derivative of the column ``sy`` with
+        respect to the column ``sx`` at each of the points in the
+        ``numpy`` array ``x0``, using a cached interpolation object
+        (see :meth:`interp_array()`).
+
+        Returns: a ``numpy`` array with the same shape as ``x0``
+        """
+        itp=self._interp_vec(sx,sy)
+        return itp.deriv2_array(x0)
+
+    def integ_array(self,sx,x1,x2,sy):
+        """
+        Compute the integral of the column ``sy`` with respect to the
+        column ``sx`` from each of the points in ``x1`` to the
+        corresponding point in ``x2``, using a cached interpolation
+        object (see :meth:`interp_array()`). The arrays ``x1`` and
+        ``x2`` are broadcast against each other.
+
+        Returns: a ``numpy`` array with the broadcast shape of ``x1``
+        and ``x2``
+        """
+        itp=self._interp_vec(sx,sy)
+        return itp.integ_array(x1,x2)
+
+    def to_shared(self,name):
+        """
+        Copy the table to a new shared memory block named ``name``
+        which can be opened in other processes with
+        :meth:`attach_shared()`. The block contains a small header
+        with the column names, the units (for :class:`table_units`
+        objects), and the number of lines, followed by the data for
+        all columns in a single contiguous array.
+
+        The shared memory block exists until :meth:`shared_table.unlink()`
+        is called on the returned object.
+
+        Returns: a :class:`shared_table` object
+        """
+        names=[col.decode('utf-8') for col in self._column_names()]
+        nlines=self.get_nlines()
+        units=None
+        if isinstance(self,table_units):
+            units=[self.get_unit(col).decode('utf-8') for col in names]
+        from multiprocessing import shared_memory
+        # The resource tracker is started by the first shared memory
+        # block, so create the block before reading its process ID.
+        # The header size is not known yet, so allow for the largest
+        # process ID.
+        header=json.dumps({'names': names,'units': units,
+                           'nlines': nlines,
+                           'tracker': 2**63}).encode('utf-8')
+        offset=shared_table._data_offset(len(header))
+        shm=shared_memory.SharedMemory(name=name,create=True,
+                                       size=offset+8*len(names)*nlines)
+        header=json.dumps({'names': names,'units': units,
+                           'nlines': nlines,
+                           'tracker': shared_table._tracker_pid()})
+        header=header.encode('utf-8').ljust(offset-8)
+        shm.buf[0:8]=struct.pack('<Q',len(header))
+        shm.buf[8:8+len(header)]=header
+        data=numpy.ndarray((len(names),nlines),dtype=numpy.double,
+                           buffer=shm.buf,offset=offset)
+        for i in range(0,len(names)):
+            data[i]=self[names[i]][0:nlines]
+        del data
+        return shared_table(shm)
+
+    @staticmethod
+    def attach_shared(name):
+        """
+        Open the shared memory block named ``name`` which was created
+        by :meth:`to_shared()`, possibly in another process.
+
+        Returns: a :class:`shared_table` object
+        """
+        from multiprocessing import shared_memory
+        try:
+            # Python 3.13 and later: do not let the resource tracker
+            # of this process remove the block when it exits
+            shm=shared_memory.SharedMemory(name=name,track=False)
+            return shared_table(shm)
+        except TypeError:
+            pass
+        # Earlier versions register the block with the resource
+        # tracker, which would remove it when this process exits. The
+        # registration is removed only if this process uses a
+        # different tracker than the creator. Processes started by
+        # multiprocessing share the tracker of their parent, and
+        # removing the registration there would also remove the
+        # creator's registration.
+        shm=shared_memory.SharedMemory(name=name)
+        ret=shared_table(shm)
+        tracker=shared_table._tracker_pid()
+        if tracker is not None and tracker!=ret._tracker:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name,'shared_memory')
+        return ret
+
 class table_units(table):
     """
     Python interface for O\ :sub:`2`\ scl class ``table_units``,
@@ -2341,9 +3038,8 @@ class table_units(table):
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_table_units_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_table_units_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2357,8 +3053,8 @@ class table_units(table):
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_table_units_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_table_units_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2382,8 +3078,8 @@ class table_units(table):
         """
 
         new_obj=type(self)(self._link)
-        f2=self._link.o2scl.o2scl_copy_table_units_
-        f2.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        f2=self._link.get_func('o2scl','o2scl_copy_table_units_',
+                               None,[ctypes.c_void_p,ctypes.c_void_p])
         f2(self._ptr,new_obj._ptr)
         return new_obj
 
@@ -2395,8 +3091,8 @@ class table_units(table):
         """
         col_=ctypes.c_char_p(force_bytes(col))
         unit_=ctypes.c_char_p(force_bytes(unit))
-        func=self._link.o2scl.o2scl_table_units__set_unit
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table_units__set_unit',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,col_,unit_)
         return
 
@@ -2407,9 +3103,8 @@ class table_units(table):
         | Returns: Python bytes object
         """
         col_=ctypes.c_char_p(force_bytes(col))
-        func=self._link.o2scl.o2scl_table_units__get_unit
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table_units__get_unit',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,col_)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -2421,8 +3116,8 @@ class table_units(table):
         | *unit_line*: string
         """
         unit_line_=ctypes.c_char_p(force_bytes(unit_line))
-        func=self._link.o2scl.o2scl_table_units__line_of_units
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table_units__line_of_units',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p])
         func(self._ptr,unit_line_)
         return
 
@@ -2432,8 +3127,8 @@ class table_units(table):
         | *col*: string
         """
         col_=ctypes.c_char_p(force_bytes(col))
-        func=self._link.o2scl.o2scl_table_units__remove_unit
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table_units__remove_unit',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p])
         func(self._ptr,col_)
         return
 
@@ -2447,13 +3142,203 @@ class table_units(table):
         """
         col_=ctypes.c_char_p(force_bytes(col))
         unit_=ctypes.c_char_p(force_bytes(unit))
-        func=self._link.o2scl.o2scl_table_units__convert_to_unit
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl','o2scl_table_units__convert_to_unit',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_bool])
         ret=func(self._ptr,col_,unit_,err_on_fail)
         return ret
 
 
+class shared_table:
+    """
+    A table stored in a shared memory block, created by
+    :meth:`table.to_shared()` or :meth:`table.attach_shared()`.
+
+    The columns are available as read-only ``numpy`` arrays which
+    view the shared memory, so reading them in another process
+    does not copy the data. The methods :meth:`get()`,
+    :meth:`get_ncolumns()`, :meth:`get_column_name()`,
+    :meth:`is_column()`, :meth:`get_unit()`, :meth:`get_nlines()`
+    and :meth:`to_numpy()` also read the shared memory. The first
+    time any other :class:`table` or :class:`table_units` method is
+    used, the data is copied to a new :class:`table_units` object
+    (created with the linker from :func:`default_linker()`), and the
+    method is called on that object. From then on, all methods,
+    including the ones above, use the copy. Changes made to the copy
+    are not visible to other processes.
+
+    The object may be used in a ``with`` statement, which calls
+    :meth:`close()` at the end of the block.
+    """
+
+    def __init__(self,shm):
+        """
+        Create the object from the ``SharedMemory`` object ``shm``
+        """
+        self._shm=shm
+        n=struct.unpack('<Q',bytes(shm.buf[0:8]))[0]
+        header=json.loads(bytes(shm.buf[8:8+n]).decode('utf-8'))
+        self.names=header['names']
+        self.units=header['units']
+        self.nlines=header['nlines']
+        self._tracker=header.get('tracker')
+        self._data=numpy.ndarray((len(self.names),self.nlines),
+                                 dtype=numpy.double,buffer=shm.buf,
+                                 offset=shared_table._data_offset(n))
+        self._data.flags.writeable=False
+        self._table=None
+        return
+
+    @staticmethod
+    def _tracker_pid():
+        """
+        Return the process ID of the ``multiprocessing`` resource
+        tracker used by this process, or ``None`` if it is not running
+        or cannot be determined
+        """
+        from multiprocessing import resource_tracker
+        return getattr(resource_tracker._resource_tracker,'_pid',None)
+
+    @staticmethod
+    def _data_offset(header_size):
+        """
+        Return the offset of the data in the shared memory block
+        for a header of ``header_size`` bytes, aligned to 64 bytes
+        """
+        return (8+header_size+63)//64*64
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,exc_type,exc_value,traceback):
+        self.close()
+        return False
+
+    def __getitem__(self,col):
+        """
+        Return a read-only ``numpy`` array which views the column
+        named ``col`` in the shared memory block, or the column of
+        the copy if it has been created
+        """
+        if self._table is not None:
+            return self._table[col]
+        if isinstance(col,bytes):
+            col=col.decode('utf-8')
+        if col not in self.names:
+            raise KeyError('Column '+col+' not found in shared_table.')
+        return self._data[self.names.index(col)]
+
+    def __getattr__(self,name):
+        """
+        Call :class:`table_units` methods on a copy of the table (see
+        the class documentation)
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if self._table is None:
+            from o2sclpy.link_o2scl import default_linker
+            data={self.names[i]: self._data[i]
+                  for i in range(0,len(self.names))}
+            units=None
+            if self.units is not None:
+                units=dict(zip(self.names,self.units))
+            self._table=table.from_numpy(default_linker(),data,units)
+        return getattr(self._table,name)
+
+    def get(self,col,row):
+        """
+        Return the value in column ``col`` and row ``row``
+        """
+        if self._table is not None:
+            return self._table.get(col,row)
+        return float(self[col][row])
+
+    def get_ncolumns(self):
+        """
+        Return the number of columns
+        """
+        if self._table is not None:
+            return self._table.get_ncolumns()
+        return len(self.names)
+
+    def get_column_name(self,icol):
+        """
+        Return the name of column ``icol`` as a bytes object
+        """
+        if self._table is not None:
+            return self._table.get_column_name(icol)
+        return self.names[icol].encode('utf-8')
+
+    def is_column(self,scol):
+        """
+        Return true if the column named ``scol`` is present
+        """
+        if self._table is not None:
+            return self._table.is_column(scol)
+        return force_bytes(scol).decode('utf-8') in self.names
+
+    def get_unit(self,col):
+        """
+        Return the unit of column ``col`` as a bytes object
+        """
+        if self._table is not None:
+            return self._table.get_unit(col)
+        if self.units is None:
+            return b''
+        col=force_bytes(col).decode('utf-8')
+        return self.units[self.names.index(col)].encode('utf-8')
+
+    def get_nlines(self):
+        """
+        Return the number of lines
+        """
+        if self._table is not None:
+            return self._table.get_nlines()
+        return self.nlines
+
+    def to_numpy(self,columns=None,copy=False,structured=False):
+        """
+        Return the columns listed in ``columns`` (or all columns if
+        ``columns`` is ``None``) as a dictionary of ``numpy`` arrays.
+        If ``copy`` is false, these are read-only arrays which view
+        the shared memory block (or views of the copy if it has been
+        created), otherwise they are copies. If ``structured`` is
+        true, a ``numpy`` structured array is returned instead (see
+        :meth:`table.to_numpy()`).
+        """
+        if self._table is not None:
+            return self._table.to_numpy(columns,copy,structured)
+        if columns is None:
+            columns=self.names
+        ret={}
+        for col in columns:
+            name=col.decode('utf-8') if isinstance(col,bytes) else col
+            ret[name]=self[col].copy() if copy else self[col]
+        if structured:
+            sa=numpy.zeros(self.nlines,dtype=[(name,numpy.double)
+                                              for name in ret])
+            for name in ret:
+                sa[name]=ret[name]
+            return sa
+        return ret
+
+    def close(self):
+        """
+        Close the shared memory block in this process. All arrays
+        which view the block must be deleted first.
+        """
+        self._data=None
+        self._shm.close()
+        return
+
+    def unlink(self):
+        """
+        Request that the shared memory block be destroyed after it is
+        closed in all processes. This should be called once, usually
+        by the process which created the block.
+        """
+        self._shm.unlink()
+        return
+
 class uniform_grid:
     """
     Python interface for O\ :sub:`2`\ scl class ``uniform_grid``,
@@ -2476,9 +3361,8 @@ class uniform_grid:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_uniform_grid_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_uniform_grid_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2492,8 +3376,8 @@ class uniform_grid:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_uniform_grid_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_uniform_grid_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2513,9 +3397,8 @@ class uniform_grid:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_uniform_grid__get_nbins
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_uniform_grid__get_nbins',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -2523,9 +3406,8 @@ class uniform_grid:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_uniform_grid__get_npoints
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_uniform_grid__get_npoints',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -2533,9 +3415,8 @@ class uniform_grid:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_uniform_grid__is_log
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_uniform_grid__is_log',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -2543,9 +3424,8 @@ class uniform_grid:
         """
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_uniform_grid__get_start
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_uniform_grid__get_start',
+                                 ctypes.c_double,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -2553,9 +3433,8 @@ class uniform_grid:
         """
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_uniform_grid__get_end
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_uniform_grid__get_end',
+                                 ctypes.c_double,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -2563,9 +3442,8 @@ class uniform_grid:
         """
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_uniform_grid__get_width
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_uniform_grid__get_width',
+                                 ctypes.c_double,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -2574,9 +3452,8 @@ class uniform_grid:
         | Parameters:
         | *n*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_uniform_grid__getitem
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_uniform_grid__getitem',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,n)
         return ret
 
@@ -2585,8 +3462,8 @@ class uniform_grid:
         | Parameters:
         | *v*: :class:`std_vector` object
         """
-        func=self._link.o2scl.o2scl_uniform_grid__vector
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_uniform_grid__vector',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,v._ptr)
         return
 
@@ -2609,9 +3486,8 @@ class uniform_grid_end(uniform_grid):
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_uniform_grid_end_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_uniform_grid_end_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2625,8 +3501,8 @@ class uniform_grid_end(uniform_grid):
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_uniform_grid_end_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_uniform_grid_end_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2651,9 +3527,8 @@ class uniform_grid_end(uniform_grid):
 
         """
 
-        f=link.o2scl.o2scl_uniform_grid_end__init
-        f.restype=ctypes.c_void_p
-        f.argtypes=[ctypes.c_double,ctypes.c_double,ctypes.c_size_t]
+        f=link.get_func('o2scl','o2scl_uniform_grid_end__init',
+                        ctypes.c_void_p,[ctypes.c_double,ctypes.c_double,ctypes.c_size_t])
         return cls(link,f(start,end,n_bins))
 
 
@@ -2675,9 +3550,8 @@ class uniform_grid_width(uniform_grid):
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_uniform_grid_width_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_uniform_grid_width_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2691,8 +3565,8 @@ class uniform_grid_width(uniform_grid):
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_uniform_grid_width_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_uniform_grid_width_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2717,9 +3591,8 @@ class uniform_grid_width(uniform_grid):
 
         """
 
-        f=link.o2scl.o2scl_uniform_grid_width__init
-        f.restype=ctypes.c_void_p
-        f.argtypes=[ctypes.c_double,ctypes.c_double,ctypes.c_size_t]
+        f=link.get_func('o2scl','o2scl_uniform_grid_width__init',
+                        ctypes.c_void_p,[ctypes.c_double,ctypes.c_double,ctypes.c_size_t])
         return cls(link,f(start,width,n_bins))
 
 
@@ -2741,9 +3614,8 @@ class uniform_grid_end_width(uniform_grid):
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_uniform_grid_end_width_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_uniform_grid_end_width_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2757,8 +3629,8 @@ class uniform_grid_end_width(uniform_grid):
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_uniform_grid_end_width_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_uniform_grid_end_width_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2783,9 +3655,8 @@ class uniform_grid_end_width(uniform_grid):
 
         """
 
-        f=link.o2scl.o2scl_uniform_grid_end_width__init
-        f.restype=ctypes.c_void_p
-        f.argtypes=[ctypes.c_double,ctypes.c_double,ctypes.c_double]
+        f=link.get_func('o2scl','o2scl_uniform_grid_end_width__init',
+                        ctypes.c_void_p,[ctypes.c_double,ctypes.c_double,ctypes.c_double])
         return cls(link,f(start,end,width))
 
 
@@ -2807,9 +3678,8 @@ class uniform_grid_log_end(uniform_grid):
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_uniform_grid_log_end_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_uniform_grid_log_end_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2823,8 +3693,8 @@ class uniform_grid_log_end(uniform_grid):
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_uniform_grid_log_end_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_uniform_grid_log_end_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2849,9 +3719,8 @@ class uniform_grid_log_end(uniform_grid):
 
         """
 
-        f=link.o2scl.o2scl_uniform_grid_log_end__init
-        f.restype=ctypes.c_void_p
-        f.argtypes=[ctypes.c_double,ctypes.c_double,ctypes.c_size_t]
+        f=link.get_func('o2scl','o2scl_uniform_grid_log_end__init',
+                        ctypes.c_void_p,[ctypes.c_double,ctypes.c_double,ctypes.c_size_t])
         return cls(link,f(start,end,n_bins))
 
 
@@ -2873,9 +3742,8 @@ class uniform_grid_log_width(uniform_grid):
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_uniform_grid_log_width_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_uniform_grid_log_width_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2889,8 +3757,8 @@ class uniform_grid_log_width(uniform_grid):
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_uniform_grid_log_width_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_uniform_grid_log_width_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2915,9 +3783,8 @@ class uniform_grid_log_width(uniform_grid):
 
         """
 
-        f=link.o2scl.o2scl_uniform_grid_log_width__init
-        f.restype=ctypes.c_void_p
-        f.argtypes=[ctypes.c_double,ctypes.c_double,ctypes.c_size_t]
+        f=link.get_func('o2scl','o2scl_uniform_grid_log_width__init',
+                        ctypes.c_void_p,[ctypes.c_double,ctypes.c_double,ctypes.c_size_t])
         return cls(link,f(start,width,n_bins))
 
 
@@ -2939,9 +3806,8 @@ class uniform_grid_log_end_width(uniform_grid):
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_uniform_grid_log_end_width_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_uniform_grid_log_end_width_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2955,8 +3821,8 @@ class uniform_grid_log_end_width(uniform_grid):
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_uniform_grid_log_end_width_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_uniform_grid_log_end_width_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2981,9 +3847,8 @@ class uniform_grid_log_end_width(uniform_grid):
 
         """
 
-        f=link.o2scl.o2scl_uniform_grid_log_end_width__init
-        f.restype=ctypes.c_void_p
-        f.argtypes=[ctypes.c_double,ctypes.c_double,ctypes.c_double]
+        f=link.get_func('o2scl','o2scl_uniform_grid_log_end_width__init',
+                        ctypes.c_void_p,[ctypes.c_double,ctypes.c_double,ctypes.c_double])
         return cls(link,f(start,end,width))
 
 
@@ -3014,9 +3879,8 @@ class table3d:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_table3d
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_table3d',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -3030,8 +3894,8 @@ class table3d:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_table3d
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_table3d',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -3055,8 +3919,8 @@ class table3d:
         """
 
         new_obj=type(self)(self._link)
-        f2=self._link.o2scl.o2scl_copy_table3d
-        f2.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        f2=self._link.get_func('o2scl','o2scl_copy_table3d',
+                               None,[ctypes.c_void_p,ctypes.c_void_p])
         f2(self._ptr,new_obj._ptr)
         return new_obj
 
@@ -3066,8 +3930,8 @@ class table3d:
         | *nx*: ``size_t``
         | *ny*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_table3d_set_size
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table3d_set_size',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t])
         func(self._ptr,nx,ny)
         return
 
@@ -3083,8 +3947,8 @@ class table3d:
         """
         x_name_=ctypes.c_char_p(force_bytes(x_name))
         y_name_=ctypes.c_char_p(force_bytes(y_name))
-        func=self._link.o2scl.o2scl_table3d_set_xy
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_set_xy',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t,ctypes.c_void_p])
         func(self._ptr,x_name_,nx,x._ptr,y_name_,ny,y._ptr)
         return
 
@@ -3098,8 +3962,8 @@ class table3d:
         """
         x_name_=ctypes.c_char_p(force_bytes(x_name))
         y_name_=ctypes.c_char_p(force_bytes(y_name))
-        func=self._link.o2scl.o2scl_table3d_set_xy_grid
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_set_xy_grid',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         func(self._ptr,x_name_,x_grid._ptr,y_name_,y_grid._ptr)
         return
 
@@ -3112,8 +3976,8 @@ class table3d:
         | *val*: ``double``
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_table3d_set
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_char_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_table3d_set',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_char_p,ctypes.c_double])
         func(self._ptr,ix,iy,name_,val)
         return
 
@@ -3126,9 +3990,8 @@ class table3d:
         | Returns: a Python float
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_table3d_get
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_get',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_char_p])
         ret=func(self._ptr,ix,iy,name_)
         return ret
 
@@ -3140,9 +4003,8 @@ class table3d:
         | *iz*: ``size_t``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_table3d_get_i
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table3d_get_i',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_size_t])
         ret=func(self._ptr,ix,iy,iz)
         return ret
 
@@ -3154,8 +4016,8 @@ class table3d:
         | *iz*: ``size_t``
         | *val*: ``double``
         """
-        func=self._link.o2scl.o2scl_table3d_set_i
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_table3d_set_i',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_double])
         func(self._ptr,ix,iy,iz,val)
         return
 
@@ -3168,8 +4030,8 @@ class table3d:
         | *val*: ``double``
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_table3d_set_val
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_table3d_set_val',
+                                 None,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p,ctypes.c_double])
         func(self._ptr,x,y,name_,val)
         return
 
@@ -3182,9 +4044,8 @@ class table3d:
         | Returns: a Python float
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_table3d_get_val
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_get_val',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p])
         ret=func(self._ptr,x,y,name_)
         return ret
 
@@ -3194,8 +4055,8 @@ class table3d:
         | *ix*: ``size_t``
         | *val*: ``double``
         """
-        func=self._link.o2scl.o2scl_table3d_set_grid_x
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_table3d_set_grid_x',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double])
         func(self._ptr,ix,val)
         return
 
@@ -3205,8 +4066,8 @@ class table3d:
         | *iy*: ``size_t``
         | *val*: ``double``
         """
-        func=self._link.o2scl.o2scl_table3d_set_grid_y
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_table3d_set_grid_y',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double])
         func(self._ptr,iy,val)
         return
 
@@ -3216,9 +4077,8 @@ class table3d:
         | *ix*: ``size_t``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_table3d_get_grid_x
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table3d_get_grid_x',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,ix)
         return ret
 
@@ -3228,9 +4088,8 @@ class table3d:
         | *iy*: ``size_t``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_table3d_get_grid_y
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table3d_get_grid_y',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,iy)
         return ret
 
@@ -3239,8 +4098,8 @@ class table3d:
         | Parameters:
         | Returns: , a Python int, a Python int
         """
-        func=self._link.o2scl.o2scl_table3d_get_size
-        func.argtypes=[ctypes.c_void_p,ctypes.POINTER(ctypes.c_size_t),ctypes.POINTER(ctypes.c_size_t)]
+        func=self._link.get_func('o2scl','o2scl_table3d_get_size',
+                                 None,[ctypes.c_void_p,ctypes.POINTER(ctypes.c_size_t),ctypes.POINTER(ctypes.c_size_t)])
         nx_conv=ctypes.c_size_t(0)
         ny_conv=ctypes.c_size_t(0)
         func(self._ptr,ctypes.byref(nx_conv),ctypes.byref(ny_conv))
@@ -3250,9 +4109,8 @@ class table3d:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_table3d_get_nx
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_get_nx',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -3260,9 +4118,8 @@ class table3d:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_table3d_get_ny
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_get_ny',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -3270,9 +4127,8 @@ class table3d:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_table3d_get_nslices
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_get_nslices',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -3280,9 +4136,8 @@ class table3d:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_table3d_is_size_set
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_is_size_set',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -3290,9 +4145,8 @@ class table3d:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_table3d_is_xy_set
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_is_xy_set',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -3302,22 +4156,43 @@ class table3d:
         | *i*: ``size_t``
         | Returns: Python bytes object
         """
-        func=self._link.o2scl.o2scl_table3d_get_slice_name
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table3d_get_slice_name',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,i)
         strt=std_string(self._link,ret)
         strt._owner=True
         return strt.to_bytes()
 
+    def get_x_name(self):
+        """
+        | Returns: Python bytes object
+        """
+        func=self._link.get_func('o2scl','o2scl_table3d_get_x_name',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
+        ret=func(self._ptr)
+        strt=std_string(self._link,ret)
+        strt._owner=True
+        return strt.to_bytes()
+
+    def get_y_name(self):
+        """
+        | Returns: Python bytes object
+        """
+        func=self._link.get_func('o2scl','o2scl_table3d_get_y_name',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
+        ret=func(self._ptr)
+        strt=std_string(self._link,ret)
+        strt._owner=True
+        return strt.to_bytes()
+
     def new_slice(self,slice):
         """
         | Parameters:
         | *slice*: string
         """
         slice_=ctypes.c_char_p(force_bytes(slice))
-        func=self._link.o2scl.o2scl_table3d_new_slice
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_new_slice',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p])
         func(self._ptr,slice_)
         return
 
@@ -3328,8 +4203,8 @@ class table3d:
         | *val*: ``double``
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_table3d_set_slice_all
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_table3d_set_slice_all',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double])
         func(self._ptr,name_,val)
         return
 
@@ -3340,9 +4215,8 @@ class table3d:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_table3d_lookup_slice
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_lookup_slice',
+                                 ctypes.c_size_t,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,name_)
         return ret
 
@@ -3353,9 +4227,8 @@ class table3d:
         | Returns: a Python boolean, a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_table3d_is_slice
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.c_size_t)]
+        func=self._link.get_func('o2scl','o2scl_table3d_is_slice',
+                                 ctypes.c_bool,[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.c_size_t)])
         ix_conv=ctypes.c_size_t(0)
         ret=func(self._ptr,name_,ctypes.byref(ix_conv))
         return ret,ix_conv.value
@@ -3368,8 +4241,8 @@ class table3d:
         """
         name1_=ctypes.c_char_p(force_bytes(name1))
         name2_=ctypes.c_char_p(force_bytes(name2))
-        func=self._link.o2scl.o2scl_table3d_rename_slice
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_rename_slice',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,name1_,name2_)
         return
 
@@ -3381,8 +4254,8 @@ class table3d:
         """
         name1_=ctypes.c_char_p(force_bytes(name1))
         name2_=ctypes.c_char_p(force_bytes(name2))
-        func=self._link.o2scl.o2scl_table3d_copy_slice
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_copy_slice',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,name1_,name2_)
         return
 
@@ -3393,9 +4266,8 @@ class table3d:
         | Returns: :class:`ublas_matrix` object
         """
         slice_=ctypes.c_char_p(force_bytes(slice))
-        func=self._link.o2scl.o2scl_table3d_get_slice
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_get_slice',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,slice_)
         ret2=ublas_matrix(self._link,ret)
         return ret2
@@ -3407,9 +4279,8 @@ class table3d:
         | Returns: :class:`ublas_matrix` object
         """
         slice_=ctypes.c_char_p(force_bytes(slice))
-        func=self._link.o2scl.o2scl_table3d_get_slice_i
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_get_slice_i',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,slice_)
         ret2=ublas_matrix(self._link,ret)
         return ret2
@@ -3420,8 +4291,8 @@ class table3d:
         | *val*: ``double``
         | *ix*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_table3d_lookup_x
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table3d_lookup_x',
+                                 None,[ctypes.c_void_p,ctypes.c_double,ctypes.c_size_t])
         func(self._ptr,val,ix)
         return
 
@@ -3431,8 +4302,8 @@ class table3d:
         | *val*: ``double``
         | *iy*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_table3d_lookup_y
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_table3d_lookup_y',
+                                 None,[ctypes.c_void_p,ctypes.c_double,ctypes.c_size_t])
         func(self._ptr,val,iy)
         return
 
@@ -3445,9 +4316,8 @@ class table3d:
         | Returns: a Python float
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_table3d_interp
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_interp',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p])
         ret=func(self._ptr,x,y,name_)
         return ret
 
@@ -3460,9 +4330,8 @@ class table3d:
         | Returns: a Python float
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_table3d_deriv_x
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_deriv_x',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p])
         ret=func(self._ptr,x,y,name_)
         return ret
 
@@ -3475,9 +4344,8 @@ class table3d:
         | Returns: a Python float
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_table3d_deriv_y
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_deriv_y',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p])
         ret=func(self._ptr,x,y,name_)
         return ret
 
@@ -3490,9 +4358,8 @@ class table3d:
         | Returns: a Python float
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_table3d_deriv_xy
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_deriv_xy',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_char_p])
         ret=func(self._ptr,x,y,name_)
         return ret
 
@@ -3506,9 +4373,8 @@ class table3d:
         | Returns: a Python float
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_table3d_integ_x
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_integ_x',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_char_p])
         ret=func(self._ptr,x1,x2,y,name_)
         return ret
 
@@ -3522,25 +4388,24 @@ class table3d:
         | Returns: a Python float
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_table3d_integ_y
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_integ_y',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_char_p])
         ret=func(self._ptr,x,y1,y2,name_)
         return ret
 
     def zero_table(self):
         """
         """
-        func=self._link.o2scl.o2scl_table3d_zero_table
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_zero_table',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
     def clear(self):
         """
         """
-        func=self._link.o2scl.o2scl_table3d_clear
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_clear',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -3553,9 +4418,8 @@ class table3d:
         | Returns: a Python int
         """
         function_=ctypes.c_char_p(force_bytes(function))
-        func=self._link.o2scl.o2scl_table3d_function_matrix
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl','o2scl_table3d_function_matrix',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p,ctypes.c_bool])
         ret=func(self._ptr,function_,mat._ptr,throw_on_err)
         return ret
 
@@ -3567,19 +4431,98 @@ class table3d:
         """
         function_=ctypes.c_char_p(force_bytes(function))
         slice_=ctypes.c_char_p(force_bytes(slice))
-        func=self._link.o2scl.o2scl_table3d_function_slice
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_function_slice',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,function_,slice_)
         return
 
     def summary(self):
         """
         """
-        func=self._link.o2scl.o2scl_table3d_summary
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_table3d_summary',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
+    def grid_x(self,copy=True):
+        """
+        Return the x grid as a one-dimensional ``numpy`` array. If
+        ``copy`` is false, the array views the grid data and keeps
+        this object alive. The view is invalidated if the grid is
+        changed.
+
+        Returns: a ``numpy`` array of size :meth:`get_nx()`
+        """
+        return _data_view(self,'o2scl_table3d_get_x_data',ctypes.c_double,copy,
+                          elements=lambda: [self.get_grid_x(i) for i in
+                                            range(0,self.get_nx())])
+
+    def grid_y(self,copy=True):
+        """
+        Return the y grid as a one-dimensional ``numpy`` array. If
+        ``copy`` is false, the array views the grid data and keeps
+        this object alive. The view is invalidated if the grid is
+        changed.
+
+        Returns: a ``numpy`` array of size :meth:`get_ny()`
+        """
+        return _data_view(self,'o2scl_table3d_get_y_data',ctypes.c_double,copy,
+                          elements=lambda: [self.get_grid_y(i) for i in
+                                            range(0,self.get_ny())])
+
+    def slice_numpy(self,name,copy=False):
+        """
+        Return the slice named ``name`` as a two-dimensional ``numpy``
+        array with shape ``(nx,ny)``, so that element ``[ix,iy]``
+        corresponds to :meth:`get()` with the same indices. If
+        ``copy`` is false, the array views the slice data and keeps
+        this object alive. The view is invalidated if the table is
+        resized or if slices are added or removed. Views require a
+        library which exports the matrix data accessor (see
+        :meth:`ublas_matrix.to_numpy()`).
+
+        Returns: a ``numpy`` array
+        """
+        return self.get_slice(name).to_numpy(copy,self)
+
+    def set_slice_numpy(self,name,arr):
+        """
+        Copy the two-dimensional ``numpy`` array ``arr``, which must
+        have shape ``(nx,ny)``, to the slice named ``name`` with a
+        single memory copy, creating the slice if necessary.
+        """
+        arr=numpy.ascontiguousarray(arr,dtype=ctypes.c_double)
+        nx,ny=self.get_size()
+        if arr.shape!=(nx,ny):
+            raise ValueError('Array with shape '+str(arr.shape)+
+                             ' does not match table size '+str((nx,ny))+
+                             ' in table3d.set_slice_numpy().')
+        if self.is_slice(name)[0]==False:
+            self.new_slice(name)
+        self.get_slice(name).assign(arr)
+        return
+
+    def __reduce_ex__(self,protocol):
+        """
+        Support for pickling. The grid names, the grid, the slice
+        names, and the slice data are stored, with the grid and the
+        slice data each in a single contiguous buffer (see
+        :func:`_pickle_buffer()`). The object is recreated with the
+        linker from :func:`default_linker()`.
+        """
+        if self.is_xy_set()==False:
+            return (_unpickle_table3d,(b'',b'',0,0,None,[],None))
+        nx,ny=self.get_size()
+        names=[self.get_slice_name(i).decode('utf-8') for i in
+               range(0,self.get_nslices())]
+        data=numpy.empty((len(names),nx,ny))
+        for i in range(0,len(names)):
+            data[i]=self.slice_numpy(names[i],copy=True)
+        grid=numpy.concatenate((self.grid_x(),self.grid_y()))
+        return (_unpickle_table3d,(self.get_x_name(),self.get_y_name(),
+                                   nx,ny,_pickle_buffer(grid,protocol),
+                                   names,_pickle_buffer(data,protocol)))
+
 
 class index_spec:
     """
@@ -3608,9 +4551,8 @@ class index_spec:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_index_spec
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_index_spec',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -3624,8 +4566,8 @@ class index_spec:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_index_spec
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_index_spec',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -3646,9 +4588,8 @@ class index_spec:
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl.o2scl_index_spec_get_type
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_index_spec_get_type',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @type.setter
@@ -3656,8 +4597,8 @@ class index_spec:
         """
         Setter function for index_spec::type .
         """
-        func=self._link.o2scl.o2scl_index_spec_set_type
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_index_spec_set_type',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -3666,9 +4607,8 @@ class index_spec:
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl.o2scl_index_spec_get_ix1
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_index_spec_get_ix1',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @ix1.setter
@@ -3676,8 +4616,8 @@ class index_spec:
         """
         Setter function for index_spec::ix1 .
         """
-        func=self._link.o2scl.o2scl_index_spec_set_ix1
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_index_spec_set_ix1',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -3686,9 +4626,8 @@ class index_spec:
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl.o2scl_index_spec_get_ix2
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_index_spec_get_ix2',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @ix2.setter
@@ -3696,8 +4635,8 @@ class index_spec:
         """
         Setter function for index_spec::ix2 .
         """
-        func=self._link.o2scl.o2scl_index_spec_set_ix2
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_index_spec_set_ix2',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -3706,9 +4645,8 @@ class index_spec:
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl.o2scl_index_spec_get_ix3
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_index_spec_get_ix3',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @ix3.setter
@@ -3716,8 +4654,8 @@ class index_spec:
         """
         Setter function for index_spec::ix3 .
         """
-        func=self._link.o2scl.o2scl_index_spec_set_ix3
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_index_spec_set_ix3',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -3726,9 +4664,8 @@ class index_spec:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl.o2scl_index_spec_get_val1
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_index_spec_get_val1',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @val1.setter
@@ -3736,8 +4673,8 @@ class index_spec:
         """
         Setter function for index_spec::val1 .
         """
-        func=self._link.o2scl.o2scl_index_spec_set_val1
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_index_spec_set_val1',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3746,9 +4683,8 @@ class index_spec:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl.o2scl_index_spec_get_val2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_index_spec_get_val2',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @val2.setter
@@ -3756,8 +4692,8 @@ class index_spec:
         """
         Setter function for index_spec::val2 .
         """
-        func=self._link.o2scl.o2scl_index_spec_set_val2
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_index_spec_set_val2',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3766,9 +4702,8 @@ class index_spec:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl.o2scl_index_spec_get_val3
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_index_spec_get_val3',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @val3.setter
@@ -3776,8 +4711,8 @@ class index_spec:
         """
         Setter function for index_spec::val3 .
         """
-        func=self._link.o2scl.o2scl_index_spec_set_val3
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_index_spec_set_val3',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3804,9 +4739,8 @@ class tensor:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_tensor_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_tensor_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -3820,8 +4754,8 @@ class tensor:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_tensor_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_tensor_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -3845,24 +4779,24 @@ class tensor:
         """
 
         new_obj=type(self)(self._link)
-        f2=self._link.o2scl.o2scl_copy_tensor_
-        f2.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        f2=self._link.get_func('o2scl','o2scl_copy_tensor_',
+                               None,[ctypes.c_void_p,ctypes.c_void_p])
         f2(self._ptr,new_obj._ptr)
         return new_obj
 
     def is_valid(self):
         """
         """
-        func=self._link.o2scl.o2scl_tensor__is_valid
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__is_valid',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
     def clear(self):
         """
         """
-        func=self._link.o2scl.o2scl_tensor__clear
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__clear',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -3872,8 +4806,8 @@ class tensor:
         | *index*: :class:`vector<size_t>` object
         | *val*: ``double``
         """
-        func=self._link.o2scl.o2scl_tensor__set
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_tensor__set',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,index._ptr,val)
         return
 
@@ -3882,8 +4816,8 @@ class tensor:
         | Parameters:
         | *x*: ``double``
         """
-        func=self._link.o2scl.o2scl_tensor__set_all
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_tensor__set_all',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,x)
         return
 
@@ -3892,8 +4826,8 @@ class tensor:
         | Parameters:
         | *data*: :class:`std_vector` object
         """
-        func=self._link.o2scl.o2scl_tensor__swap_data
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__swap_data',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,data._ptr)
         return
 
@@ -3903,9 +4837,8 @@ class tensor:
         | *index*: :class:`vector<size_t>` object
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_tensor__get
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__get',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,index._ptr)
         return ret
 
@@ -3915,8 +4848,8 @@ class tensor:
         | *n*: ``size_t``
         | *index*: :class:`vector<size_t>` object
         """
-        func=self._link.o2scl.o2scl_tensor__resize
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__resize',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p])
         func(self._ptr,n,index._ptr)
         return
 
@@ -3924,9 +4857,8 @@ class tensor:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor__get_rank
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__get_rank',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -3936,9 +4868,8 @@ class tensor:
         | *i*: ``size_t``
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor__get_size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_tensor__get_size',
+                                 ctypes.c_size_t,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,i)
         return ret
 
@@ -3946,9 +4877,8 @@ class tensor:
         """
         | Returns: :class:`std_vector_size_t` object
         """
-        func=self._link.o2scl.o2scl_tensor__get_size_arr
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__get_size_arr',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
         ret=func(self._ptr)
         ret2=std_vector_size_t(self._link,ret)
         return ret2
@@ -3957,21 +4887,20 @@ class tensor:
         """
         | Returns: ``numpy`` array
         """
-        func=self._link.o2scl.o2scl_tensor__get_data
+        func=self._link.get_func('o2scl','o2scl_tensor__get_data',
+                                 None,[ctypes.c_void_p,ctypes.POINTER(ctypes.POINTER(ctypes.c_double)),ctypes.POINTER(ctypes.c_int)])
         n_=ctypes.c_int(0)
         ptr_=ctypes.POINTER(ctypes.c_double)()
-        func.argtypes=[ctypes.c_void_p,ctypes.POINTER(ctypes.POINTER(ctypes.c_double)),ctypes.POINTER(ctypes.c_int)]
         func(self._ptr,ctypes.byref(ptr_),ctypes.byref(n_))
-        ret=numpy.ctypeslib.as_array(ptr_,shape=(n_.value,))
+        ret=_ptr_view(self,ptr_,n_.value,ctypes.c_double)
         return ret
 
     def total_size(self):
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor__total_size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__total_size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -3981,9 +4910,8 @@ class tensor:
         | *index*: :class:`std_vector_size_t` object
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor__pack_indices
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__pack_indices',
+                                 ctypes.c_size_t,[ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,index._ptr)
         return ret
 
@@ -3993,8 +4921,8 @@ class tensor:
         | *ix*: ``size_t``
         | *index*: :class:`std_vector_size_t` object
         """
-        func=self._link.o2scl.o2scl_tensor__unpack_index
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__unpack_index',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p])
         func(self._ptr,ix,index._ptr)
         return
 
@@ -4002,9 +4930,8 @@ class tensor:
         """
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_tensor__min_value
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__min_value',
+                                 ctypes.c_double,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4013,8 +4940,8 @@ class tensor:
         | Parameters:
         | *index*: :class:`std_vector_size_t` object
         """
-        func=self._link.o2scl.o2scl_tensor__min_index
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__min_index',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,index._ptr)
         return
 
@@ -4024,8 +4951,8 @@ class tensor:
         | *ix*: :class:`std_vector_size_t` object
         | Returns: , a Python float
         """
-        func=self._link.o2scl.o2scl_tensor__min
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl','o2scl_tensor__min',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_double)])
         value_conv=ctypes.c_double(0)
         func(self._ptr,ix._ptr,ctypes.byref(value_conv))
         return value_conv.value
@@ -4034,9 +4961,8 @@ class tensor:
         """
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_tensor__max_value
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__max_value',
+                                 ctypes.c_double,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4045,8 +4971,8 @@ class tensor:
         | Parameters:
         | *index*: :class:`std_vector_size_t` object
         """
-        func=self._link.o2scl.o2scl_tensor__max_index
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__max_index',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,index._ptr)
         return
 
@@ -4056,8 +4982,8 @@ class tensor:
         | *ix*: :class:`std_vector_size_t` object
         | Returns: , a Python float
         """
-        func=self._link.o2scl.o2scl_tensor__max
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl','o2scl_tensor__max',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_double)])
         value_conv=ctypes.c_double(0)
         func(self._ptr,ix._ptr,ctypes.byref(value_conv))
         return value_conv.value
@@ -4067,8 +4993,8 @@ class tensor:
         | Parameters:
         | Returns: , a Python float, a Python float
         """
-        func=self._link.o2scl.o2scl_tensor__minmax_value
-        func.argtypes=[ctypes.c_void_p,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl','o2scl_tensor__minmax_value',
+                                 None,[ctypes.c_void_p,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)])
         min_conv=ctypes.c_double(0)
         max_conv=ctypes.c_double(0)
         func(self._ptr,ctypes.byref(min_conv),ctypes.byref(max_conv))
@@ -4080,8 +5006,8 @@ class tensor:
         | *min*: :class:`std_vector_size_t` object
         | *max*: :class:`std_vector_size_t` object
         """
-        func=self._link.o2scl.o2scl_tensor__minmax_index
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__minmax_index',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,min._ptr,max._ptr)
         return
 
@@ -4092,8 +5018,8 @@ class tensor:
         | *max_ix*: :class:`std_vector_size_t` object
         | Returns: , a Python float, a Python float
         """
-        func=self._link.o2scl.o2scl_tensor__minmax
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_double),ctypes.c_void_p,ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl','o2scl_tensor__minmax',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_double),ctypes.c_void_p,ctypes.POINTER(ctypes.c_double)])
         min_value_conv=ctypes.c_double(0)
         max_value_conv=ctypes.c_double(0)
         func(self._ptr,min_ix._ptr,ctypes.byref(min_value_conv),max_ix._ptr,ctypes.byref(max_value_conv))
@@ -4103,9 +5029,8 @@ class tensor:
         """
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_tensor__total_sum
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__total_sum',
+                                 ctypes.c_double,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4122,8 +5047,8 @@ class tensor:
         x_name_=ctypes.c_char_p(force_bytes(x_name))
         y_name_=ctypes.c_char_p(force_bytes(y_name))
         slice_name_=ctypes.c_char_p(force_bytes(slice_name))
-        func=self._link.o2scl.o2scl_tensor__convert_table3d_sum
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_tensor__convert_table3d_sum',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,ix_x,ix_y,tab._ptr,x_name_,y_name_,slice_name_)
         return
 
@@ -4136,9 +5061,8 @@ class tensor:
 
         """
 
-        f=link.o2scl.o2scl_tensor__create_size
-        f.restype=ctypes.c_void_p
-        f.argtypes=[ctypes.c_size_t,ctypes.c_void_p]
+        f=link.get_func('o2scl','o2scl_tensor__create_size',
+                        ctypes.c_void_p,[ctypes.c_size_t,ctypes.c_void_p])
         return cls(link,f(rank,sizes._ptr))
 
     def create_size(self,v):
@@ -4147,10 +5071,7 @@ class tensor:
         data to the table
         """
         # Create a std_vector object and copy the data over
-        vec=std_vector_size_t(self._link)
-        vec.resize(len(v))
-        for i in range(0,len(v)):
-            vec[i]=v[i]
+        vec=std_vector_size_t.from_numpy(self._link,v)
         self.create_size_vector(vec)
         return
      
@@ -4183,7 +5104,33 @@ class tensor:
         self.resize_vector(len(svst),svst)
         return
 
-class tensor_grid:
+    def as_ndarray(self,copy=False):
+        """
+        Return a ``numpy`` array with one dimension for each index of
+        the tensor which views the tensor data. If ``copy`` is true,
+        a copy of the data is returned instead.
+
+        The view is invalidated if the tensor is resized.
+        """
+        return _tensor_view(self,self.get_data(),copy)
+
+    def __getitem__(self,index):
+        """
+        Get elements of the tensor using ``numpy`` indexing on
+        the array returned by :meth:`as_ndarray()`, e.g.
+        ``t[0,:,2]`` or ``t[...,1]``
+        """
+        return self.as_ndarray()[index]
+
+    def __setitem__(self,index,value):
+        """
+        Set elements of the tensor using ``numpy`` indexing on
+        the array returned by :meth:`as_ndarray()`
+        """
+        self.as_ndarray()[index]=value
+        return
+
+class tensor_grid(tensor):
     """
     Python interface for O\ :sub:`2`\ scl class ``tensor_grid``,
     see
@@ -4205,9 +5152,8 @@ class tensor_grid:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_tensor_grid_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_tensor_grid_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -4221,8 +5167,8 @@ class tensor_grid:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_tensor_grid_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_tensor_grid_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -4246,16 +5192,16 @@ class tensor_grid:
         """
 
         new_obj=type(self)(self._link)
-        f2=self._link.o2scl.o2scl_copy_tensor_grid_
-        f2.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        f2=self._link.get_func('o2scl','o2scl_copy_tensor_grid_',
+                               None,[ctypes.c_void_p,ctypes.c_void_p])
         f2(self._ptr,new_obj._ptr)
         return new_obj
 
     def is_valid(self):
         """
         """
-        func=self._link.o2scl.o2scl_tensor_grid__is_valid
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_grid__is_valid',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -4265,8 +5211,8 @@ class tensor_grid:
         | *grid_point*: :class:`vector<double>` object
         | *val*: ``double``
         """
-        func=self._link.o2scl.o2scl_tensor_grid__set_val
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_tensor_grid__set_val',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,grid_point._ptr,val)
         return
 
@@ -4276,9 +5222,8 @@ class tensor_grid:
         | *grid_point*: :class:`vector<double>` object
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_tensor_grid__get_val
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_grid__get_val',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,grid_point._ptr)
         return ret
 
@@ -4286,9 +5231,8 @@ class tensor_grid:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl.o2scl_tensor_grid__is_grid_set
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_grid__is_grid_set',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4297,16 +5241,16 @@ class tensor_grid:
         | Parameters:
         | *grid*: :class:`vector<double>` object
         """
-        func=self._link.o2scl.o2scl_tensor_grid__set_grid_packed
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_grid__set_grid_packed',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,grid._ptr)
         return
 
     def default_grid(self):
         """
         """
-        func=self._link.o2scl.o2scl_tensor_grid__default_grid
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_grid__default_grid',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -4316,8 +5260,8 @@ class tensor_grid:
         | *i*: ``size_t``
         | *grid*: :class:`vector<double>` object
         """
-        func=self._link.o2scl.o2scl_tensor_grid__set_grid_i_vec
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_grid__set_grid_i_vec',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p])
         func(self._ptr,i,grid._ptr)
         return
 
@@ -4328,9 +5272,8 @@ class tensor_grid:
         | *j*: ``size_t``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_tensor_grid__get_grid
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_tensor_grid__get_grid',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t])
         ret=func(self._ptr,i,j)
         return ret
 
@@ -4341,11 +5284,78 @@ class tensor_grid:
         | *j*: ``size_t``
         | *val*: ``double``
         """
-        func=self._link.o2scl.o2scl_tensor_grid__set_grid
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_tensor_grid__set_grid',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t,ctypes.c_double])
         func(self._ptr,i,j,val)
         return
 
+    def resize_vector(self,n,index):
+        """
+        | Parameters:
+        | *n*: ``size_t``
+        | *index*: :class:`vector<size_t>` object
+
+        Resize the tensor and set the default grid (see
+        :meth:`default_grid()`), so that the grid is consistent with
+        the new sizes. The data is not preserved.
+        """
+        tensor.resize_vector(self,n,index)
+        if n>0 and all(index[i]>0 for i in range(0,n)):
+            self.default_grid()
+        return
+
+    @classmethod
+    def create_size(cls,link,rank,sizes):
+        """
+        Create a tensor_grid object with ``rank`` indices with the
+        sizes in the :class:`std_vector_size_t` object ``sizes`` and
+        the default grid (see :meth:`resize_vector()`)
+
+        Returns: a tensor_grid object
+        """
+        ret=cls(link)
+        ret.resize_vector(rank,sizes)
+        return ret
+
+    def grids(self):
+        """
+        Return a list of ``numpy`` arrays, one for each index of the
+        tensor, which contain the grid for that index. The packed grid
+        is copied with one foreign call if the library exports
+        ``o2scl_tensor_grid__get_grid_packed``.
+        """
+        rank=self.get_rank()
+        sizes=[self.get_size(i) for i in range(0,rank)]
+        if rank==0:
+            return []
+        if self._link.has_func('o2scl','o2scl_tensor_grid__get_grid_packed'):
+            func=self._link.get_func('o2scl','o2scl_tensor_grid__get_grid_packed',
+                                     ctypes.c_void_p,[ctypes.c_void_p])
+            packed=std_vector(self._link,func(self._ptr)).to_numpy()
+            return numpy.split(packed,numpy.cumsum(sizes)[0:-1])
+        ret=[]
+        for i in range(0,rank):
+            ret.append(numpy.array([self.get_grid(i,j) for j in
+                                    range(0,sizes[i])]))
+        return ret
+
+    def __reduce_ex__(self,protocol):
+        """
+        Support for pickling. The size of each index, the grid, and
+        the data are stored, with the grid and the data each in a
+        single contiguous buffer (see :func:`_pickle_buffer()`). The
+        object is recreated with the linker from
+        :func:`default_linker()`.
+        """
+        rank=self.get_rank()
+        sizes=[self.get_size(i) for i in range(0,rank)]
+        grid=None
+        if rank>0 and self.is_grid_set():
+            grid=_pickle_buffer(numpy.concatenate(self.grids()),protocol)
+        return (_unpickle_tensor_grid,
+                (sizes,grid,_pickle_buffer(self.as_ndarray(copy=rank==0),
+                                           protocol)))
+
 
 class tensor_int:
     """
@@ -4369,9 +5379,8 @@ class tensor_int:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_tensor_int_std_vector_int_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_tensor_int_std_vector_int_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -4385,8 +5394,8 @@ class tensor_int:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_tensor_int_std_vector_int_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_tensor_int_std_vector_int_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -4410,24 +5419,24 @@ class tensor_int:
         """
 
         new_obj=type(self)(self._link)
-        f2=self._link.o2scl.o2scl_copy_tensor_int_std_vector_int_
-        f2.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        f2=self._link.get_func('o2scl','o2scl_copy_tensor_int_std_vector_int_',
+                               None,[ctypes.c_void_p,ctypes.c_void_p])
         f2(self._ptr,new_obj._ptr)
         return new_obj
 
     def is_valid(self):
         """
         """
-        func=self._link.o2scl.o2scl_tensor_int_std_vector_int__is_valid
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_int_std_vector_int__is_valid',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
     def clear(self):
         """
         """
-        func=self._link.o2scl.o2scl_tensor_int_std_vector_int__clear
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_int_std_vector_int__clear',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -4437,8 +5446,8 @@ class tensor_int:
         | *index*: :class:`vector<size_t>` object
         | *val*: ``int``
         """
-        func=self._link.o2scl.o2scl_tensor_int_std_vector_int__set
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_tensor_int_std_vector_int__set',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,index._ptr,val)
         return
 
@@ -4447,8 +5456,8 @@ class tensor_int:
         | Parameters:
         | *x*: ``int``
         """
-        func=self._link.o2scl.o2scl_tensor_int_std_vector_int__set_all
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_tensor_int_std_vector_int__set_all',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,x)
         return
 
@@ -4458,9 +5467,8 @@ class tensor_int:
         | *index*: :class:`vector<size_t>` object
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_int_std_vector_int__get
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_int_std_vector_int__get',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,index._ptr)
         return ret
 
@@ -4470,8 +5478,8 @@ class tensor_int:
         | *n*: ``size_t``
         | *index*: :class:`vector<size_t>` object
         """
-        func=self._link.o2scl.o2scl_tensor_int_std_vector_int__resize
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_int_std_vector_int__resize',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p])
         func(self._ptr,n,index._ptr)
         return
 
@@ -4479,9 +5487,8 @@ class tensor_int:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_int_std_vector_int__get_rank
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_int_std_vector_int__get_rank',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4491,9 +5498,8 @@ class tensor_int:
         | *i*: ``size_t``
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_int_std_vector_int__get_size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_tensor_int_std_vector_int__get_size',
+                                 ctypes.c_size_t,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,i)
         return ret
 
@@ -4501,9 +5507,8 @@ class tensor_int:
         """
         | Returns: :class:`std_vector_int` object
         """
-        func=self._link.o2scl.o2scl_tensor_int_std_vector_int__get_data
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_int_std_vector_int__get_data',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
         ret=func(self._ptr)
         ret2=std_vector_int(self._link,ret)
         return ret2
@@ -4512,9 +5517,8 @@ class tensor_int:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_int_std_vector_int__total_size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_int_std_vector_int__total_size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4522,9 +5526,8 @@ class tensor_int:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_int_std_vector_int__min_value
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_int_std_vector_int__min_value',
+                                 ctypes.c_int,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4532,9 +5535,8 @@ class tensor_int:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_int_std_vector_int__max_value
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_int_std_vector_int__max_value',
+                                 ctypes.c_int,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4542,9 +5544,8 @@ class tensor_int:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_int_std_vector_int__total_sum
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_int_std_vector_int__total_sum',
+                                 ctypes.c_int,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4557,9 +5558,8 @@ class tensor_int:
 
         """
 
-        f=link.o2scl.o2scl_tensor_int_std_vector_int__create_size
-        f.restype=ctypes.c_void_p
-        f.argtypes=[ctypes.c_size_t,ctypes.c_void_p]
+        f=link.get_func('o2scl','o2scl_tensor_int_std_vector_int__create_size',
+                        ctypes.c_void_p,[ctypes.c_size_t,ctypes.c_void_p])
         return cls(link,f(rank,sizes._ptr))
 
     def create_size(self,v):
@@ -4568,10 +5568,7 @@ class tensor_int:
         data to the table
         """
         # Create a std_vector object and copy the data over
-        vec=std_vector_size_t(self._link)
-        vec.resize(len(v))
-        for i in range(0,len(v)):
-            vec[i]=v[i]
+        vec=std_vector_size_t.from_numpy(self._link,v)
         self.create_size_vector(vec)
         return
      
@@ -4604,6 +5601,36 @@ class tensor_int:
         self.resize_vector(svst)
         return
 
+    def as_ndarray(self,copy=False):
+        """
+        Return a ``numpy`` array with one dimension for each index of
+        the tensor which views the tensor data. If ``copy`` is true,
+        a copy of the data is returned instead.
+
+        The view is invalidated if the tensor is resized.
+        """
+        # The data is copied here when copy is true, so that the
+        # element-by-element fallback of _data_view() can be used
+        data=_data_view(self.get_data(),'o2scl_std_vector_int__data',
+                        ctypes.c_int,copy,self)
+        return _tensor_view(self,data,copy)
+
+    def __getitem__(self,index):
+        """
+        Get elements of the tensor using ``numpy`` indexing on
+        the array returned by :meth:`as_ndarray()`, e.g.
+        ``t[0,:,2]`` or ``t[...,1]``
+        """
+        return self.as_ndarray()[index]
+
+    def __setitem__(self,index,value):
+        """
+        Set elements of the tensor using ``numpy`` indexing on
+        the array returned by :meth:`as_ndarray()`
+        """
+        self.as_ndarray()[index]=value
+        return
+
 class tensor_size_t:
     """
     Python interface for O\ :sub:`2`\ scl class ``tensor``,
@@ -4626,9 +5653,8 @@ class tensor_size_t:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_tensor_size_t_std_vector_size_t_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_tensor_size_t_std_vector_size_t_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -4642,8 +5668,8 @@ class tensor_size_t:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_tensor_size_t_std_vector_size_t_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_tensor_size_t_std_vector_size_t_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -4667,24 +5693,24 @@ class tensor_size_t:
         """
 
         new_obj=type(self)(self._link)
-        f2=self._link.o2scl.o2scl_copy_tensor_size_t_std_vector_size_t_
-        f2.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        f2=self._link.get_func('o2scl','o2scl_copy_tensor_size_t_std_vector_size_t_',
+                               None,[ctypes.c_void_p,ctypes.c_void_p])
         f2(self._ptr,new_obj._ptr)
         return new_obj
 
     def is_valid(self):
         """
         """
-        func=self._link.o2scl.o2scl_tensor_size_t_std_vector_size_t__is_valid
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__is_valid',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
     def clear(self):
         """
         """
-        func=self._link.o2scl.o2scl_tensor_size_t_std_vector_size_t__clear
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__clear',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -4694,8 +5720,8 @@ class tensor_size_t:
         | *index*: :class:`vector<size_t>` object
         | *val*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_tensor_size_t_std_vector_size_t__set
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__set',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,index._ptr,val)
         return
 
@@ -4704,8 +5730,8 @@ class tensor_size_t:
         | Parameters:
         | *x*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_tensor_size_t_std_vector_size_t__set_all
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__set_all',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,x)
         return
 
@@ -4715,9 +5741,8 @@ class tensor_size_t:
         | *index*: :class:`vector<size_t>` object
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_size_t_std_vector_size_t__get
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__get',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,index._ptr)
         return ret
 
@@ -4727,8 +5752,8 @@ class tensor_size_t:
         | *n*: ``size_t``
         | *index*: :class:`vector<size_t>` object
         """
-        func=self._link.o2scl.o2scl_tensor_size_t_std_vector_size_t__resize
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__resize',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p])
         func(self._ptr,n,index._ptr)
         return
 
@@ -4736,9 +5761,8 @@ class tensor_size_t:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_size_t_std_vector_size_t__get_rank
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__get_rank',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4748,9 +5772,8 @@ class tensor_size_t:
         | *i*: ``size_t``
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_size_t_std_vector_size_t__get_size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__get_size',
+                                 ctypes.c_size_t,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,i)
         return ret
 
@@ -4758,9 +5781,8 @@ class tensor_size_t:
         """
         | Returns: :class:`std_vector_size_t` object
         """
-        func=self._link.o2scl.o2scl_tensor_size_t_std_vector_size_t__get_data
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__get_data',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
         ret=func(self._ptr)
         ret2=std_vector_size_t(self._link,ret)
         return ret2
@@ -4769,9 +5791,8 @@ class tensor_size_t:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_size_t_std_vector_size_t__total_size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__total_size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4779,9 +5800,8 @@ class tensor_size_t:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_size_t_std_vector_size_t__min_value
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__min_value',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4789,9 +5809,8 @@ class tensor_size_t:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_size_t_std_vector_size_t__max_value
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__max_value',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4799,9 +5818,8 @@ class tensor_size_t:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_tensor_size_t_std_vector_size_t__total_sum
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__total_sum',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4814,9 +5832,8 @@ class tensor_size_t:
 
         """
 
-        f=link.o2scl.o2scl_tensor_size_t_std_vector_size_t__create_size
-        f.restype=ctypes.c_void_p
-        f.argtypes=[ctypes.c_size_t,ctypes.c_void_p]
+        f=link.get_func('o2scl','o2scl_tensor_size_t_std_vector_size_t__create_size',
+                        ctypes.c_void_p,[ctypes.c_size_t,ctypes.c_void_p])
         return cls(link,f(rank,sizes._ptr))
 
     def create_size(self,v):
@@ -4825,10 +5842,7 @@ class tensor_size_t:
         data to the table
         """
         # Create a std_vector object and copy the data over
-        vec=std_vector_size_t(self._link)
-        vec.resize(len(v))
-        for i in range(0,len(v)):
-            vec[i]=v[i]
+        vec=std_vector_size_t.from_numpy(self._link,v)
         self.create_size_vector(vec)
         return
       
@@ -4861,6 +5875,36 @@ class tensor_size_t:
         self.resize_vector(svst)
         return
 
+    def as_ndarray(self,copy=False):
+        """
+        Return a ``numpy`` array with one dimension for each index of
+        the tensor which views the tensor data. If ``copy`` is true,
+        a copy of the data is returned instead.
+
+        The view is invalidated if the tensor is resized.
+        """
+        # The data is copied here when copy is true, so that the
+        # element-by-element fallback of _data_view() can be used
+        data=_data_view(self.get_data(),'o2scl_std_vector_size_t__data',
+                        ctypes.c_size_t,copy,self)
+        return _tensor_view(self,data,copy)
+
+    def __getitem__(self,index):
+        """
+        Get elements of the tensor using ``numpy`` indexing on
+        the array returned by :meth:`as_ndarray()`, e.g.
+        ``t[0,:,2]`` or ``t[...,1]``
+        """
+        return self.as_ndarray()[index]
+
+    def __setitem__(self,index,value):
+        """
+        Set elements of the tensor using ``numpy`` indexing on
+        the array returned by :meth:`as_ndarray()`
+        """
+        self.as_ndarray()[index]=value
+        return
+
 class find_constants_const_entry:
     """
     Python interface for O\ :sub:`2`\ scl class ``find_constants::const_entry``,
@@ -4888,9 +5932,8 @@ class find_constants_const_entry:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_find_constants_const_entry
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_find_constants_const_entry',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -4904,8 +5947,8 @@ class find_constants_const_entry:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_find_constants_const_entry
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_find_constants_const_entry',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -4925,8 +5968,8 @@ class find_constants_const_entry:
         """
         Get object of type :class:`std::vector<std::string>`
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_get_names
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_get_names',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,names._ptr)
         return
 
@@ -4934,8 +5977,8 @@ class find_constants_const_entry:
         """
         Set object of type :class:`std::vector<std::string>`
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_set_names
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_set_names',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -4943,9 +5986,8 @@ class find_constants_const_entry:
         """
         Get object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_get_unit
-        func.restype=ctypes.c_char_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_get_unit',
+                                 ctypes.c_char_p,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,unit._ptr)
         return
 
@@ -4953,8 +5995,8 @@ class find_constants_const_entry:
         """
         Set object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_set_unit
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_set_unit',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -4963,9 +6005,8 @@ class find_constants_const_entry:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_get_unit_flag
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_get_unit_flag',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @unit_flag.setter
@@ -4973,8 +6014,8 @@ class find_constants_const_entry:
         """
         Setter function for find_constants::const_entry::unit_flag .
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_set_unit_flag
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_set_unit_flag',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -4983,9 +6024,8 @@ class find_constants_const_entry:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_get_val
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_get_val',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @val.setter
@@ -4993,8 +6033,8 @@ class find_constants_const_entry:
         """
         Setter function for find_constants::const_entry::val .
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_set_val
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_set_val',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -5002,9 +6042,8 @@ class find_constants_const_entry:
         """
         Get object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_get_source
-        func.restype=ctypes.c_char_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_get_source',
+                                 ctypes.c_char_p,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,source._ptr)
         return
 
@@ -5012,8 +6051,8 @@ class find_constants_const_entry:
         """
         Set object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_set_source
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_set_source',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -5022,9 +6061,8 @@ class find_constants_const_entry:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_get_m
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_get_m',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @m.setter
@@ -5032,8 +6070,8 @@ class find_constants_const_entry:
         """
         Setter function for find_constants::const_entry::m .
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_set_m
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_set_m',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5042,9 +6080,8 @@ class find_constants_const_entry:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_get_k
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_get_k',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @k.setter
@@ -5052,8 +6089,8 @@ class find_constants_const_entry:
         """
         Setter function for find_constants::const_entry::k .
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_set_k
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_set_k',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5062,9 +6099,8 @@ class find_constants_const_entry:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_get_s
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_get_s',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @s.setter
@@ -5072,8 +6108,8 @@ class find_constants_const_entry:
         """
         Setter function for find_constants::const_entry::s .
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_set_s
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_set_s',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5082,9 +6118,8 @@ class find_constants_const_entry:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_get_K
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_get_K',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @K.setter
@@ -5092,8 +6127,8 @@ class find_constants_const_entry:
         """
         Setter function for find_constants::const_entry::K .
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_set_K
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_set_K',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5102,9 +6137,8 @@ class find_constants_const_entry:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_get_A
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_get_A',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @A.setter
@@ -5112,8 +6146,8 @@ class find_constants_const_entry:
         """
         Setter function for find_constants::const_entry::A .
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_set_A
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_set_A',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5122,9 +6156,8 @@ class find_constants_const_entry:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_get_mol
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_get_mol',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @mol.setter
@@ -5132,8 +6165,8 @@ class find_constants_const_entry:
         """
         Setter function for find_constants::const_entry::mol .
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_set_mol
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_set_mol',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5142,9 +6175,8 @@ class find_constants_const_entry:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_get_cd
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_get_cd',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @cd.setter
@@ -5152,8 +6184,8 @@ class find_constants_const_entry:
         """
         Setter function for find_constants::const_entry::cd .
         """
-        func=self._link.o2scl.o2scl_find_constants_const_entry_set_cd
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_find_constants_const_entry_set_cd',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5185,9 +6217,8 @@ class find_constants:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_find_constants
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_find_constants',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -5201,8 +6232,8 @@ class find_constants:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_find_constants
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_find_constants',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -5228,8 +6259,8 @@ class find_constants:
         """
         name_=ctypes.c_char_p(force_bytes(name))
         unit_=ctypes.c_char_p(force_bytes(unit))
-        func=self._link.o2scl.o2scl_find_constants_find_print
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_size_t,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_find_constants_find_print',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_size_t,ctypes.c_int])
         func(self._ptr,name_,unit_,prec,verbose)
         return
 
@@ -5242,17 +6273,16 @@ class find_constants:
         """
         name_=ctypes.c_char_p(force_bytes(name))
         unit_=ctypes.c_char_p(force_bytes(unit))
-        func=self._link.o2scl.o2scl_find_constants_find_unique
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_find_unique',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p])
         ret=func(self._ptr,name_,unit_)
         return ret
 
     def output_list_cout(self):
         """
         """
-        func=self._link.o2scl.o2scl_find_constants_output_list_cout
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_find_constants_output_list_cout',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -5262,8 +6292,8 @@ class find_constants:
         | *f*: :class:`find_constants::const_entry` object
         | *verbose* =0: ``int``
         """
-        func=self._link.o2scl.o2scl_find_constants_add_constant
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_find_constants_add_constant',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,f._ptr,verbose)
         return
 
@@ -5274,8 +6304,8 @@ class find_constants:
         | *verbose* =0: ``int``
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_find_constants_del_constant
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_find_constants_del_constant',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,name._ptr,verbose)
         return
 
@@ -5307,9 +6337,8 @@ class convert_units_der_unit:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_convert_units_der_unit
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_convert_units_der_unit',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -5323,8 +6352,8 @@ class convert_units_der_unit:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_convert_units_der_unit
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_convert_units_der_unit',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -5344,9 +6373,8 @@ class convert_units_der_unit:
         """
         Get object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_get_label
-        func.restype=ctypes.c_char_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_get_label',
+                                 ctypes.c_char_p,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,label._ptr)
         return
 
@@ -5354,8 +6382,8 @@ class convert_units_der_unit:
         """
         Set object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_set_label
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_set_label',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -5364,9 +6392,8 @@ class convert_units_der_unit:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_get_m
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_get_m',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @m.setter
@@ -5374,8 +6401,8 @@ class convert_units_der_unit:
         """
         Setter function for convert_units<>::der_unit::m .
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_set_m
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_set_m',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5384,9 +6411,8 @@ class convert_units_der_unit:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_get_k
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_get_k',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @k.setter
@@ -5394,8 +6420,8 @@ class convert_units_der_unit:
         """
         Setter function for convert_units<>::der_unit::k .
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_set_k
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_set_k',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5404,9 +6430,8 @@ class convert_units_der_unit:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_get_s
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_get_s',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @s.setter
@@ -5414,8 +6439,8 @@ class convert_units_der_unit:
         """
         Setter function for convert_units<>::der_unit::s .
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_set_s
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_set_s',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5424,9 +6449,8 @@ class convert_units_der_unit:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_get_K
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_get_K',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @K.setter
@@ -5434,8 +6458,8 @@ class convert_units_der_unit:
         """
         Setter function for convert_units<>::der_unit::K .
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_set_K
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_set_K',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5444,9 +6468,8 @@ class convert_units_der_unit:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_get_A
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_get_A',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @A.setter
@@ -5454,8 +6477,8 @@ class convert_units_der_unit:
         """
         Setter function for convert_units<>::der_unit::A .
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_set_A
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_set_A',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5464,9 +6487,8 @@ class convert_units_der_unit:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_get_mol
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_get_mol',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @mol.setter
@@ -5474,8 +6496,8 @@ class convert_units_der_unit:
         """
         Setter function for convert_units<>::der_unit::mol .
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_set_mol
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_set_mol',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5484,9 +6506,8 @@ class convert_units_der_unit:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_get_cd
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_get_cd',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @cd.setter
@@ -5494,8 +6515,8 @@ class convert_units_der_unit:
         """
         Setter function for convert_units<>::der_unit::cd .
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_set_cd
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_set_cd',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5504,9 +6525,8 @@ class convert_units_der_unit:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_get_val
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_get_val',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @val.setter
@@ -5514,8 +6534,8 @@ class convert_units_der_unit:
         """
         Setter function for convert_units<>::der_unit::val .
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_set_val
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_set_val',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -5523,9 +6543,8 @@ class convert_units_der_unit:
         """
         Get object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_get_name
-        func.restype=ctypes.c_char_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_get_name',
+                                 ctypes.c_char_p,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,name._ptr)
         return
 
@@ -5533,8 +6552,8 @@ class convert_units_der_unit:
         """
         Set object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_convert_units_der_unit_set_name
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units_der_unit_set_name',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -5581,9 +6600,8 @@ class convert_units:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_convert_units_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_convert_units_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -5597,8 +6615,8 @@ class convert_units:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_convert_units_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_convert_units_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -5619,9 +6637,8 @@ class convert_units:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_convert_units__get_verbose
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units__get_verbose',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @verbose.setter
@@ -5629,8 +6646,8 @@ class convert_units:
         """
         Setter function for convert_units<>::verbose .
         """
-        func=self._link.o2scl.o2scl_convert_units__set_verbose
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_convert_units__set_verbose',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -5639,9 +6656,8 @@ class convert_units:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl.o2scl_convert_units__get_err_on_fail
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units__get_err_on_fail',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @err_on_fail.setter
@@ -5649,8 +6665,8 @@ class convert_units:
         """
         Setter function for convert_units<>::err_on_fail .
         """
-        func=self._link.o2scl.o2scl_convert_units__set_err_on_fail
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl','o2scl_convert_units__set_err_on_fail',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -5659,9 +6675,8 @@ class convert_units:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl.o2scl_convert_units__get_combine_two_conv
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units__get_combine_two_conv',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @combine_two_conv.setter
@@ -5669,8 +6684,8 @@ class convert_units:
         """
         Setter function for convert_units<>::combine_two_conv .
         """
-        func=self._link.o2scl.o2scl_convert_units__set_combine_two_conv
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl','o2scl_convert_units__set_combine_two_conv',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -5684,9 +6699,8 @@ class convert_units:
         """
         frm_=ctypes.c_char_p(force_bytes(frm))
         to_=ctypes.c_char_p(force_bytes(to))
-        func=self._link.o2scl.o2scl_convert_units__convert
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_convert_units__convert',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_double])
         ret=func(self._ptr,frm_,to_,val)
         return ret
 
@@ -5701,9 +6715,8 @@ class convert_units:
         """
         frm_=ctypes.c_char_p(force_bytes(frm))
         to_=ctypes.c_char_p(force_bytes(to))
-        func=self._link.o2scl.o2scl_convert_units__convert_ret
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_convert_units__convert_ret',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,frm_,to_,val,converted)
         return ret
 
@@ -5713,8 +6726,8 @@ class convert_units:
         | *name*: :class:`std_string` object
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl.o2scl_convert_units__del_unit
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units__del_unit',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,name._ptr)
         return
 
@@ -5723,8 +6736,8 @@ class convert_units:
         | Parameters:
         | *d*: :class:`convert_units<>::der_unit` object
         """
-        func=self._link.o2scl.o2scl_convert_units__add_unit
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units__add_unit',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,d._ptr)
         return
 
@@ -5735,8 +6748,8 @@ class convert_units:
         | *hbar_is_one* =true: ``bool``
         | *kb_is_one* =true: ``bool``
         """
-        func=self._link.o2scl.o2scl_convert_units__set_natural_units
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool,ctypes.c_bool,ctypes.c_bool]
+        func=self._link.get_func('o2scl','o2scl_convert_units__set_natural_units',
+                                 None,[ctypes.c_void_p,ctypes.c_bool,ctypes.c_bool,ctypes.c_bool])
         func(self._ptr,c_is_one,hbar_is_one,kb_is_one)
         return
 
@@ -5749,9 +6762,8 @@ class convert_units:
         """
         frm_=ctypes.c_char_p(force_bytes(frm))
         to_=ctypes.c_char_p(force_bytes(to))
-        func=self._link.o2scl.o2scl_convert_units__is_in_cache
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units__is_in_cache',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p])
         ret=func(self._ptr,frm_,to_)
         return ret
 
@@ -5764,41 +6776,40 @@ class convert_units:
         """
         frm_=ctypes.c_char_p(force_bytes(frm))
         to_=ctypes.c_char_p(force_bytes(to))
-        func=self._link.o2scl.o2scl_convert_units__remove_cache
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units__remove_cache',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p])
         ret=func(self._ptr,frm_,to_)
         return ret
 
     def clear_cache(self):
         """
         """
-        func=self._link.o2scl.o2scl_convert_units__clear_cache
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units__clear_cache',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
     def test_unique(self):
         """
         """
-        func=self._link.o2scl.o2scl_convert_units__test_unique
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units__test_unique',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
     def print_cache(self):
         """
         """
-        func=self._link.o2scl.o2scl_convert_units__print_cache
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units__print_cache',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
     def print_units_cout(self):
         """
         """
-        func=self._link.o2scl.o2scl_convert_units__print_units_cout
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_convert_units__print_units_cout',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -5838,9 +6849,8 @@ class columnify:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_columnify
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_columnify',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -5854,8 +6864,8 @@ class columnify:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_columnify
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_columnify',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -5876,9 +6886,8 @@ class columnify:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_columnify_get_align_left
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_columnify_get_align_left',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
 
@@ -5887,9 +6896,8 @@ class columnify:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_columnify_get_align_right
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_columnify_get_align_right',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
 
@@ -5898,9 +6906,8 @@ class columnify:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_columnify_get_align_lmid
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_columnify_get_align_lmid',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
 
@@ -5909,9 +6916,8 @@ class columnify:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_columnify_get_align_rmid
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_columnify_get_align_rmid',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
 
@@ -5920,9 +6926,8 @@ class columnify:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_columnify_get_align_dp
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_columnify_get_align_dp',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
 
@@ -5931,9 +6936,8 @@ class columnify:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_columnify_get_align_lnum
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_columnify_get_align_lnum',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
 
@@ -5965,9 +6969,8 @@ class format_float:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_format_float
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_format_float',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -5981,8 +6984,8 @@ class format_float:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_format_float
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_format_float',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -6003,8 +7006,8 @@ class format_float:
         | Parameters:
         | *sig_figs*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_format_float_set_sig_figs
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_format_float_set_sig_figs',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,sig_figs)
         return
 
@@ -6014,8 +7017,8 @@ class format_float:
         | *min*: ``int``
         | *max*: ``int``
         """
-        func=self._link.o2scl.o2scl_format_float_set_exp_limits
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_format_float_set_exp_limits',
+                                 None,[ctypes.c_void_p,ctypes.c_int,ctypes.c_int])
         func(self._ptr,min,max)
         return
 
@@ -6024,8 +7027,8 @@ class format_float:
         | Parameters:
         | *pad*: ``bool``
         """
-        func=self._link.o2scl.o2scl_format_float_set_pad_zeros
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl','o2scl_format_float_set_pad_zeros',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,pad)
         return
 
@@ -6035,8 +7038,8 @@ class format_float:
         | *dec_point*: string
         """
         dec_point_=ctypes.c_char_p(force_bytes(dec_point))
-        func=self._link.o2scl.o2scl_format_float_set_dec_point
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_format_float_set_dec_point',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p])
         func(self._ptr,dec_point_)
         return
 
@@ -6045,32 +7048,32 @@ class format_float:
         | Parameters:
         | *d*: ``int``
         """
-        func=self._link.o2scl.o2scl_format_float_set_exp_digits
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_format_float_set_exp_digits',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,d)
         return
 
     def html_mode(self):
         """
         """
-        func=self._link.o2scl.o2scl_format_float_html_mode
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_format_float_html_mode',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
     def latex_mode(self):
         """
         """
-        func=self._link.o2scl.o2scl_format_float_latex_mode
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_format_float_latex_mode',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
     def c_mode(self):
         """
         """
-        func=self._link.o2scl.o2scl_format_float_c_mode
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_format_float_c_mode',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -6081,9 +7084,8 @@ class format_float:
         | *debug* =false: ``bool``
         | Returns: Python bytes object
         """
-        func=self._link.o2scl.o2scl_format_float_convert
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_bool]
+        func=self._link.get_func('o2scl','o2scl_format_float_convert',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_double,ctypes.c_bool])
         ret=func(self._ptr,x,debug)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -6117,9 +7119,8 @@ class interp:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_interp_std_vector_double_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_interp_std_vector_double_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -6133,8 +7134,8 @@ class interp:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_interp_std_vector_double_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_interp_std_vector_double_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -6159,9 +7160,8 @@ class interp:
         | *y*: :class:`std_vector` object
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_interp_std_vector_double__eval
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_interp_std_vector_double__eval',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,x0,n,x._ptr,y._ptr)
         return ret
 
@@ -6174,9 +7174,8 @@ class interp:
         | *y*: :class:`std_vector` object
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_interp_std_vector_double__deriv
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_interp_std_vector_double__deriv',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,x0,n,x._ptr,y._ptr)
         return ret
 
@@ -6189,9 +7188,8 @@ class interp:
         | *y*: :class:`std_vector` object
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_interp_std_vector_double__deriv2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_interp_std_vector_double__deriv2',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,x0,n,x._ptr,y._ptr)
         return ret
 
@@ -6205,9 +7203,8 @@ class interp:
         | *y*: :class:`std_vector` object
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_interp_std_vector_double__integ
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_interp_std_vector_double__integ',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,x1,x2,n,x._ptr,y._ptr)
         return ret
 
@@ -6216,8 +7213,8 @@ class interp:
         | Parameters:
         | *interp_type*: ``int``
         """
-        func=self._link.o2scl.o2scl_interp_std_vector_double__set_type
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_interp_std_vector_double__set_type',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,interp_type)
         return
 
@@ -6237,6 +7234,7 @@ class interp_vec:
     _ptr=0
     _link=0
     _owner=True
+    _vecs=None
 
     def __init__(self,link,pointer=0):
         """
@@ -6249,9 +7247,8 @@ class interp_vec:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_interp_vec_std_vector_double_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_interp_vec_std_vector_double_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -6265,8 +7262,8 @@ class interp_vec:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_interp_vec_std_vector_double_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_interp_vec_std_vector_double_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -6286,20 +7283,30 @@ class interp_vec:
         """
         | Parameters:
         | *n*: ``size_t``
-        | *x*: :class:`std_vector` object
-        | *y*: :class:`std_vector` object
+        | *x*: :class:`std_vector` object or ``numpy`` array
+        | *y*: :class:`std_vector` object or ``numpy`` array
         | *interp_type*: ``int``
-        """
-        func=self._link.o2scl.o2scl_interp_vec_std_vector_double__set
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int]
+
+        The C++ object refers to ``x`` and ``y`` rather than copying
+        them, so this object keeps a reference to both vectors. Arrays
+        which are not :class:`std_vector` objects are first copied to
+        new :class:`std_vector` objects.
+        """
+        if not isinstance(x,std_vector):
+            x=std_vector.from_numpy(self._link,x)
+        if not isinstance(y,std_vector):
+            y=std_vector.from_numpy(self._link,y)
+        func=self._link.get_func('o2scl','o2scl_interp_vec_std_vector_double__set',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,n,x._ptr,y._ptr,interp_type)
+        self._vecs=(x,y)
         return
 
     def clear(self):
         """
         """
-        func=self._link.o2scl.o2scl_interp_vec_std_vector_double__clear
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_interp_vec_std_vector_double__clear',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -6309,9 +7316,8 @@ class interp_vec:
         | *x0*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_interp_vec_std_vector_double__eval
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_interp_vec_std_vector_double__eval',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,x0)
         return ret
 
@@ -6321,9 +7327,8 @@ class interp_vec:
         | *x0*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_interp_vec_std_vector_double__deriv
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_interp_vec_std_vector_double__deriv',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,x0)
         return ret
 
@@ -6333,9 +7338,8 @@ class interp_vec:
         | *x0*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_interp_vec_std_vector_double__deriv2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_interp_vec_std_vector_double__deriv2',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,x0)
         return ret
 
@@ -6346,12 +7350,68 @@ class interp_vec:
         | *x2*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_interp_vec_std_vector_double__integ
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_interp_vec_std_vector_double__integ',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,x1,x2)
         return ret
 
+    def _eval_array(self,name,out,*args):
+        """
+        Broadcast the arrays in ``args`` against each other and call
+        the C function ``name``, which loops over the points and
+        stores the results in ``out``. If ``out`` is ``None``, a new
+        array is created, otherwise ``out`` must be a writeable,
+        C-contiguous array of ``double`` values with the broadcast
+        shape (see :func:`_array_call()`).
+        """
+        return _array_call(self,'o2scl',name,args,out=out)
+
+    def eval_array(self,x0,out=None):
+        """
+        Interpolate at each point in the ``numpy`` array ``x0`` with
+        a single foreign call, storing the results in ``out`` if it
+        is not ``None``.
+
+        Returns: a ``numpy`` array with the same shape as ``x0``
+        """
+        return self._eval_array('o2scl_interp_vec_std_vector_double__eval_array',
+                                out,x0)
+
+    def deriv_array(self,x0,out=None):
+        """
+        Compute the derivative at each point in the ``numpy`` array
+        ``x0`` with a single foreign call, storing the results in
+        ``out`` if it is not ``None``.
+
+        Returns: a ``numpy`` array with the same shape as ``x0``
+        """
+        return self._eval_array('o2scl_interp_vec_std_vector_double__deriv_array',
+                                out,x0)
+
+    def deriv2_array(self,x0,out=None):
+        """
+        Compute the second derivative at each point in the ``numpy``
+        array ``x0`` with a single foreign call, storing the results
+        in ``out`` if it is not ``None``.
+
+        Returns: a ``numpy`` array with the same shape as ``x0``
+        """
+        return self._eval_array('o2scl_interp_vec_std_vector_double__deriv2_array',
+                                out,x0)
+
+    def integ_array(self,x1,x2,out=None):
+        """
+        Compute the integral from each point in ``x1`` to the
+        corresponding point in ``x2`` with a single foreign call,
+        storing the results in ``out`` if it is not ``None``. The
+        arrays ``x1`` and ``x2`` are broadcast against each other.
+
+        Returns: a ``numpy`` array with the broadcast shape of ``x1``
+        and ``x2``
+        """
+        return self._eval_array('o2scl_interp_vec_std_vector_double__integ_array',
+                                out,x1,x2)
+
 
 class interp_krige_optim:
     """
@@ -6380,9 +7440,8 @@ class interp_krige_optim:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_interp_krige_optim_std_vector_double_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_interp_krige_optim_std_vector_double_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -6396,8 +7455,8 @@ class interp_krige_optim:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_interp_krige_optim_std_vector_double_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_interp_krige_optim_std_vector_double_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -6418,9 +7477,8 @@ class interp_krige_optim:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_interp_krige_optim_std_vector_double__get_verbose
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_interp_krige_optim_std_vector_double__get_verbose',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @verbose.setter
@@ -6428,8 +7486,8 @@ class interp_krige_optim:
         """
         Setter function for interp_krige_optim<std::vector<double>>::verbose .
         """
-        func=self._link.o2scl.o2scl_interp_krige_optim_std_vector_double__set_verbose
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_interp_krige_optim_std_vector_double__set_verbose',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -6438,9 +7496,8 @@ class interp_krige_optim:
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl.o2scl_interp_krige_optim_std_vector_double__get_mode
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_interp_krige_optim_std_vector_double__get_mode',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @mode.setter
@@ -6448,8 +7505,8 @@ class interp_krige_optim:
         """
         Setter function for interp_krige_optim<std::vector<double>>::mode .
         """
-        func=self._link.o2scl.o2scl_interp_krige_optim_std_vector_double__set_mode
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_interp_krige_optim_std_vector_double__set_mode',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -6458,9 +7515,8 @@ class interp_krige_optim:
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl.o2scl_interp_krige_optim_std_vector_double__get_nlen
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_interp_krige_optim_std_vector_double__get_nlen',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @nlen.setter
@@ -6468,8 +7524,8 @@ class interp_krige_optim:
         """
         Setter function for interp_krige_optim<std::vector<double>>::nlen .
         """
-        func=self._link.o2scl.o2scl_interp_krige_optim_std_vector_double__set_nlen
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_interp_krige_optim_std_vector_double__set_nlen',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -6478,9 +7534,8 @@ class interp_krige_optim:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl.o2scl_interp_krige_optim_std_vector_double__get_full_min
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_interp_krige_optim_std_vector_double__get_full_min',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @full_min.setter
@@ -6488,8 +7543,8 @@ class interp_krige_optim:
         """
         Setter function for interp_krige_optim<std::vector<double>>::full_min .
         """
-        func=self._link.o2scl.o2scl_interp_krige_optim_std_vector_double__set_full_min
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl','o2scl_interp_krige_optim_std_vector_double__set_full_min',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -6521,9 +7576,8 @@ class gen_test_number:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_gen_test_number_double_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_gen_test_number_double_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -6537,8 +7591,8 @@ class gen_test_number:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_gen_test_number_double_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_gen_test_number_double_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -6557,8 +7611,8 @@ class gen_test_number:
     def reset(self):
         """
         """
-        func=self._link.o2scl.o2scl_gen_test_number_double__reset
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_gen_test_number_double__reset',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -6567,8 +7621,8 @@ class gen_test_number:
         | Parameters:
         | *r*: ``double``
         """
-        func=self._link.o2scl.o2scl_gen_test_number_double__set_radix
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_gen_test_number_double__set_radix',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,r)
         return
 
@@ -6576,9 +7630,8 @@ class gen_test_number:
         """
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_gen_test_number_double__gen
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_gen_test_number_double__gen',
+                                 ctypes.c_double,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -6600,15 +7653,14 @@ class shared_ptr_table_units(table_units):
 
         self._link=link
         if shared_ptr==0:
-            f2=self._link.o2scl.o2scl_create_shared_ptr_table_units_
-            f2.restype=ctypes.c_void_p
+            f2=self._link.get_func('o2scl','o2scl_create_shared_ptr_table_units_',
+                                   ctypes.c_void_p,[])
             self._s_ptr=f2()
         else:
             self._s_ptr=shared_ptr
 
-        f=self._link.o2scl.o2scl_shared_ptr_table_units__ptr
-        f.argtypes=[ctypes.c_void_p]
-        f.restype=ctypes.c_void_p
+        f=self._link.get_func('o2scl','o2scl_shared_ptr_table_units__ptr',
+                              ctypes.c_void_p,[ctypes.c_void_p])
         self._ptr=f(self._s_ptr)
         return
 
@@ -6617,8 +7669,8 @@ class shared_ptr_table_units(table_units):
         Delete function for shared_ptr_table_units .
         """
 
-        f=self._link.o2scl.o2scl_free_shared_ptr_table_units_
-        f.argtypes=[ctypes.c_void_p]
+        f=self._link.get_func('o2scl','o2scl_free_shared_ptr_table_units_',
+                              None,[ctypes.c_void_p])
         f(self._s_ptr)
         return
 
@@ -6629,9 +7681,8 @@ def ix_index(link,ix):
         | *ix*: ``size_t``
         | Returns: ``ctypes.c_index_spec`` object
     """
-    func=link.o2scl.o2scl_ix_index_wrapper
-    func.restype=ctypes.c_index_spec
-    func.argtypes=[ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_ix_index_wrapper',
+                       ctypes.c_index_spec,[ctypes.c_size_t])
     ret=func(ix)
     return ret
 
@@ -6643,9 +7694,8 @@ def ix_fixed(link,ix,ix2):
         | *ix2*: ``size_t``
         | Returns: ``ctypes.c_index_spec`` object
     """
-    func=link.o2scl.o2scl_ix_fixed_wrapper
-    func.restype=ctypes.c_index_spec
-    func.argtypes=[ctypes.c_size_t,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_ix_fixed_wrapper',
+                       ctypes.c_index_spec,[ctypes.c_size_t,ctypes.c_size_t])
     ret=func(ix,ix2)
     return ret
 
@@ -6656,9 +7706,8 @@ def ix_sum(link,ix):
         | *ix*: ``size_t``
         | Returns: ``ctypes.c_index_spec`` object
     """
-    func=link.o2scl.o2scl_ix_sum_wrapper
-    func.restype=ctypes.c_index_spec
-    func.argtypes=[ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_ix_sum_wrapper',
+                       ctypes.c_index_spec,[ctypes.c_size_t])
     ret=func(ix)
     return ret
 
@@ -6670,9 +7719,8 @@ def ix_trace(link,ix,ix2):
         | *ix2*: ``size_t``
         | Returns: ``ctypes.c_index_spec`` object
     """
-    func=link.o2scl.o2scl_ix_trace_wrapper
-    func.restype=ctypes.c_index_spec
-    func.argtypes=[ctypes.c_size_t,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_ix_trace_wrapper',
+                       ctypes.c_index_spec,[ctypes.c_size_t,ctypes.c_size_t])
     ret=func(ix,ix2)
     return ret
 
@@ -6683,9 +7731,8 @@ def ix_reverse(link,ix):
         | *ix*: ``size_t``
         | Returns: ``ctypes.c_index_spec`` object
     """
-    func=link.o2scl.o2scl_ix_reverse_wrapper
-    func.restype=ctypes.c_index_spec
-    func.argtypes=[ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_ix_reverse_wrapper',
+                       ctypes.c_index_spec,[ctypes.c_size_t])
     ret=func(ix)
     return ret
 
@@ -6698,9 +7745,8 @@ def ix_range(link,ix,start,end):
         | *end*: ``size_t``
         | Returns: ``ctypes.c_index_spec`` object
     """
-    func=link.o2scl.o2scl_ix_range_wrapper
-    func.restype=ctypes.c_index_spec
-    func.argtypes=[ctypes.c_size_t,ctypes.c_size_t,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_ix_range_wrapper',
+                       ctypes.c_index_spec,[ctypes.c_size_t,ctypes.c_size_t,ctypes.c_size_t])
     ret=func(ix,start,end)
     return ret
 
@@ -6712,9 +7758,8 @@ def ix_interp(link,ix,v):
         | *v*: ``double``
         | Returns: ``ctypes.c_index_spec`` object
     """
-    func=link.o2scl.o2scl_ix_interp_wrapper
-    func.restype=ctypes.c_index_spec
-    func.argtypes=[ctypes.c_size_t,ctypes.c_double]
+    func=link.get_func('o2scl','o2scl_ix_interp_wrapper',
+                       ctypes.c_index_spec,[ctypes.c_size_t,ctypes.c_double])
     ret=func(ix,v)
     return ret
 
@@ -6729,9 +7774,8 @@ def ix_grid(link,ix,start,end,n_bins,log=False):
         | *log*: ``bool``
         | Returns: ``ctypes.c_index_spec`` object
     """
-    func=link.o2scl.o2scl_ix_grid_wrapper
-    func.restype=ctypes.c_index_spec
-    func.argtypes=[ctypes.c_size_t,ctypes.c_double,ctypes.c_double,ctypes.c_size_t,ctypes.c_bool]
+    func=link.get_func('o2scl','o2scl_ix_grid_wrapper',
+                       ctypes.c_index_spec,[ctypes.c_size_t,ctypes.c_double,ctypes.c_double,ctypes.c_size_t,ctypes.c_bool])
     ret=func(ix,start,end,n_bins,log)
     return ret
 
@@ -6746,9 +7790,8 @@ def ix_gridw(link,ix,start,end,width,log=False):
         | *log*: ``bool``
         | Returns: ``ctypes.c_index_spec`` object
     """
-    func=link.o2scl.o2scl_ix_gridw_wrapper
-    func.restype=ctypes.c_index_spec
-    func.argtypes=[ctypes.c_size_t,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_bool]
+    func=link.get_func('o2scl','o2scl_ix_gridw_wrapper',
+                       ctypes.c_index_spec,[ctypes.c_size_t,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_bool])
     ret=func(ix,start,end,width,log)
     return ret
 
@@ -6762,9 +7805,8 @@ def fermi_function(link,E,mu,T,limit=40.0):
         | *limit*: ``double``
         | Returns: ``ctypes.c_double`` object
     """
-    func=link.o2scl.o2scl_fermi_function_wrapper
-    func.restype=ctypes.c_double
-    func.argtypes=[ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double]
+    func=link.get_func('o2scl','o2scl_fermi_function_wrapper',
+                       ctypes.c_double,[ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double])
     ret=func(E,mu,T,limit)
     return ret
 
@@ -6778,9 +7820,8 @@ def bose_function(link,E,mu,T,limit=40.0):
         | *limit*: ``double``
         | Returns: ``ctypes.c_double`` object
     """
-    func=link.o2scl.o2scl_bose_function_wrapper
-    func.restype=ctypes.c_double
-    func.argtypes=[ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double]
+    func=link.get_func('o2scl','o2scl_bose_function_wrapper',
+                       ctypes.c_double,[ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double])
     ret=func(E,mu,T,limit)
     return ret
 
@@ -6796,9 +7837,8 @@ def quadratic_extremum_x(link,x1,x2,x3,y1,y2,y3):
         | *y3*: ``double``
         | Returns: ``ctypes.c_double`` object
     """
-    func=link.o2scl.o2scl_quadratic_extremum_x_double__wrapper
-    func.restype=ctypes.c_double
-    func.argtypes=[ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double]
+    func=link.get_func('o2scl','o2scl_quadratic_extremum_x_double__wrapper',
+                       ctypes.c_double,[ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double])
     ret=func(x1,x2,x3,y1,y2,y3)
     return ret
 
@@ -6814,9 +7854,8 @@ def quadratic_extremum_y(link,x1,x2,x3,y1,y2,y3):
         | *y3*: ``double``
         | Returns: ``ctypes.c_double`` object
     """
-    func=link.o2scl.o2scl_quadratic_extremum_y_double__wrapper
-    func.restype=ctypes.c_double
-    func.argtypes=[ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double]
+    func=link.get_func('o2scl','o2scl_quadratic_extremum_y_double__wrapper',
+                       ctypes.c_double,[ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double])
     ret=func(x1,x2,x3,y1,y2,y3)
     return ret
 
@@ -6829,8 +7868,8 @@ def screenify(link,nin,in_cols,out_cols,max_size=80):
         | *out_cols*: :class:`vector<std::string>` object
         | *max_size*: ``size_t``
     """
-    func=link.o2scl.o2scl_screenify_vector_std_string__wrapper
-    func.argtypes=[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_screenify_vector_std_string__wrapper',
+                       None,[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t])
     func(nin,in_cols._ptr,out_cols._ptr,max_size)
     return
 
@@ -6842,9 +7881,8 @@ def file_exists(link,fname):
         | Returns: ``ctypes.c_bool`` object
     """
     fname_=ctypes.c_char_p(force_bytes(fname))
-    func=link.o2scl.o2scl_file_exists_wrapper
-    func.restype=ctypes.c_bool
-    func.argtypes=[ctypes.c_char_p]
+    func=link.get_func('o2scl','o2scl_file_exists_wrapper',
+                       ctypes.c_bool,[ctypes.c_char_p])
     ret=func(fname_)
     return ret
 
@@ -6859,8 +7897,8 @@ def RGBtoHSV(link,r,g,b,h,s,v):
         | *s*: ``double``
         | *v*: ``double``
     """
-    func=link.o2scl.o2scl_RGBtoHSV_wrapper
-    func.argtypes=[ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p]
+    func=link.get_func('o2scl','o2scl_RGBtoHSV_wrapper',
+                       None,[ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p])
     func(r,g,b,h._ptr,s._ptr,v._ptr)
     return
 
@@ -6875,8 +7913,8 @@ def HSVtoRGB(link,h,s,v,r,g,b):
         | *g*: ``double``
         | *b*: ``double``
     """
-    func=link.o2scl.o2scl_HSVtoRGB_wrapper
-    func.argtypes=[ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p]
+    func=link.get_func('o2scl','o2scl_HSVtoRGB_wrapper',
+                       None,[ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p])
     func(h,s,v,r._ptr,g._ptr,b._ptr)
     return
 
@@ -6888,8 +7926,8 @@ def wordexp_single_file(link,fname):
     """
     fname.__del__()
     fname._ptr=ctypes.c_void_p()
-    func=link.o2scl.o2scl_wordexp_single_file_wrapper
-    func.argtypes=[ctypes.POINTER(ctypes.c_void_p)]
+    func=link.get_func('o2scl','o2scl_wordexp_single_file_wrapper',
+                       None,[ctypes.POINTER(ctypes.c_void_p)])
     func(ctypes.byref(fname._ptr))
     fname._owner=True
     return
@@ -6902,8 +7940,8 @@ def wordexp_wrapper(link,word,matches):
         | *matches*: :class:`std::vector<std::string>` object
     """
     word_=ctypes.c_char_p(force_bytes(word))
-    func=link.o2scl.o2scl_wordexp_wrapper_wrapper
-    func.argtypes=[ctypes.c_char_p,ctypes.c_void_p]
+    func=link.get_func('o2scl','o2scl_wordexp_wrapper_wrapper',
+                       None,[ctypes.c_char_p,ctypes.c_void_p])
     func(word_,matches._ptr)
     return
 
@@ -6916,9 +7954,8 @@ def function_to_double(link,s,verbose=0):
         | Returns: ``ctypes.c_double`` object
     """
     s_=ctypes.c_char_p(force_bytes(s))
-    func=link.o2scl.o2scl_function_to_double_wrapper
-    func.restype=ctypes.c_double
-    func.argtypes=[ctypes.c_char_p,ctypes.c_int]
+    func=link.get_func('o2scl','o2scl_function_to_double_wrapper',
+                       ctypes.c_double,[ctypes.c_char_p,ctypes.c_int])
     ret=func(s_,verbose)
     return ret
 
@@ -6932,9 +7969,8 @@ def function_to_double_nothrow(link,s,result,verbose=0):
         | Returns: ``ctypes.c_int`` object
     """
     s_=ctypes.c_char_p(force_bytes(s))
-    func=link.o2scl.o2scl_function_to_double_nothrow_wrapper
-    func.restype=ctypes.c_int
-    func.argtypes=[ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int]
+    func=link.get_func('o2scl','o2scl_function_to_double_nothrow_wrapper',
+                       ctypes.c_int,[ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int])
     ret=func(s_,result._ptr,verbose)
     return ret
 
@@ -6948,9 +7984,8 @@ def string_to_uint_list(link,x,list):
     """
     x.__del__()
     x._ptr=ctypes.c_void_p()
-    func=link.o2scl.o2scl_string_to_uint_list_vector_size_t__wrapper
-    func.restype=ctypes.c_int
-    func.argtypes=[ctypes.POINTER(ctypes.c_void_p),ctypes.c_void_p]
+    func=link.get_func('o2scl','o2scl_string_to_uint_list_vector_size_t__wrapper',
+                       ctypes.c_int,[ctypes.POINTER(ctypes.c_void_p),ctypes.c_void_p])
     ret=func(ctypes.byref(x._ptr),list._ptr)
     x._owner=True
     return ret
@@ -6965,9 +8000,8 @@ def vector_level_count(link,level,n,x,y):
         | *y*: :class:`std::vector<double>` object
         | Returns: ``ctypes.c_size_t`` object
     """
-    func=link.o2scl.o2scl_vector_level_count_std_vector_double_std_vector_double__wrapper
-    func.restype=ctypes.c_size_t
-    func.argtypes=[ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p]
+    func=link.get_func('o2scl','o2scl_vector_level_count_std_vector_double_std_vector_double__wrapper',
+                       ctypes.c_size_t,[ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p])
     ret=func(level,n,x._ptr,y._ptr)
     return ret
 
@@ -6980,8 +8014,8 @@ def vector_deriv_interp(link,n,v,dv,interp_type=2):
         | *dv*: :class:`std::vector<double>` object
         | *interp_type*: ``size_t``
     """
-    func=link.o2scl.o2scl_vector_deriv_interp_std_vector_double_std_vector_double__wrapper
-    func.argtypes=[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_vector_deriv_interp_std_vector_double_std_vector_double__wrapper',
+                       None,[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t])
     func(n,v._ptr,dv._ptr,interp_type)
     return
 
@@ -6994,8 +8028,8 @@ def vector_deriv2_interp(link,n,v,dv,interp_type=2):
         | *dv*: :class:`std::vector<double>` object
         | *interp_type*: ``size_t``
     """
-    func=link.o2scl.o2scl_vector_deriv2_interp_std_vector_double_std_vector_double__wrapper
-    func.argtypes=[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_vector_deriv2_interp_std_vector_double_std_vector_double__wrapper',
+                       None,[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t])
     func(n,v._ptr,dv._ptr,interp_type)
     return
 
@@ -7009,8 +8043,8 @@ def vector_deriv_xy_interp(link,n,vx,vy,dv,interp_type=2):
         | *dv*: :class:`std::vector<double>` object
         | *interp_type*: ``size_t``
     """
-    func=link.o2scl.o2scl_vector_deriv_xy_interp_std_vector_double_std_vector_double_std_vector_double__wrapper
-    func.argtypes=[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_vector_deriv_xy_interp_std_vector_double_std_vector_double_std_vector_double__wrapper',
+                       None,[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t])
     func(n,vx._ptr,vy._ptr,dv._ptr,interp_type)
     return
 
@@ -7024,8 +8058,8 @@ def vector_deriv2_xy_interp(link,n,vx,vy,dv,interp_type=2):
         | *dv*: :class:`std::vector<double>` object
         | *interp_type*: ``size_t``
     """
-    func=link.o2scl.o2scl_vector_deriv2_xy_interp_std_vector_double_std_vector_double_std_vector_double__wrapper
-    func.argtypes=[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_vector_deriv2_xy_interp_std_vector_double_std_vector_double_std_vector_double__wrapper',
+                       None,[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t])
     func(n,vx._ptr,vy._ptr,dv._ptr,interp_type)
     return
 
@@ -7038,9 +8072,8 @@ def vector_integ_interp(link,n,vx,interp_type=2):
         | *interp_type*: ``size_t``
         | Returns: ``ctypes.c_double`` object
     """
-    func=link.o2scl.o2scl_vector_integ_interp_std_vector_double__wrapper
-    func.restype=ctypes.c_double
-    func.argtypes=[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_vector_integ_interp_std_vector_double__wrapper',
+                       ctypes.c_double,[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_size_t])
     ret=func(n,vx._ptr,interp_type)
     return ret
 
@@ -7054,9 +8087,8 @@ def vector_integ_xy_interp(link,n,vx,vy,interp_type=2):
         | *interp_type*: ``size_t``
         | Returns: ``ctypes.c_double`` object
     """
-    func=link.o2scl.o2scl_vector_integ_xy_interp_std_vector_double_std_vector_double__wrapper
-    func.restype=ctypes.c_double
-    func.argtypes=[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_vector_integ_xy_interp_std_vector_double_std_vector_double__wrapper',
+                       ctypes.c_double,[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t])
     ret=func(n,vx._ptr,vy._ptr,interp_type)
     return ret
 
@@ -7070,9 +8102,8 @@ def vector_integ_ul_interp(link,n,x2,v,interp_type=2):
         | *interp_type*: ``size_t``
         | Returns: ``ctypes.c_double`` object
     """
-    func=link.o2scl.o2scl_vector_integ_ul_interp_std_vector_double__wrapper
-    func.restype=ctypes.c_double
-    func.argtypes=[ctypes.c_size_t,ctypes.c_double,ctypes.c_void_p,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_vector_integ_ul_interp_std_vector_double__wrapper',
+                       ctypes.c_double,[ctypes.c_size_t,ctypes.c_double,ctypes.c_void_p,ctypes.c_size_t])
     ret=func(n,x2,v._ptr,interp_type)
     return ret
 
@@ -7087,9 +8118,8 @@ def vector_integ_ul_xy_interp(link,n,x2,vx,vy,interp_type=2):
         | *interp_type*: ``size_t``
         | Returns: ``ctypes.c_double`` object
     """
-    func=link.o2scl.o2scl_vector_integ_ul_xy_interp_std_vector_double_std_vector_double__wrapper
-    func.restype=ctypes.c_double
-    func.argtypes=[ctypes.c_size_t,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_vector_integ_ul_xy_interp_std_vector_double_std_vector_double__wrapper',
+                       ctypes.c_double,[ctypes.c_size_t,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t])
     ret=func(n,x2,vx._ptr,vy._ptr,interp_type)
     return ret
 
@@ -7103,8 +8133,8 @@ def vector_find_level(link,level,n,x,y,locs):
         | *y*: :class:`std::vector<double>` object
         | *locs*: :class:`std::vector<double>` object
     """
-    func=link.o2scl.o2scl_vector_find_level_std_vector_double_std_vector_double__wrapper
-    func.argtypes=[ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p]
+    func=link.get_func('o2scl','o2scl_vector_find_level_std_vector_double_std_vector_double__wrapper',
+                       None,[ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p])
     func(level,n,x._ptr,y._ptr,locs._ptr)
     return
 
@@ -7121,8 +8151,8 @@ def vector_invert_enclosed_sum(link,sum,n,x,y,lev,boundaries=0,verbose=0,err_on_
         | *verbose*: ``int``
         | *err_on_fail*: ``bool``
     """
-    func=link.o2scl.o2scl_vector_invert_enclosed_sum_std_vector_double_std_vector_double__wrapper
-    func.argtypes=[ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int,ctypes.c_int,ctypes.c_bool]
+    func=link.get_func('o2scl','o2scl_vector_invert_enclosed_sum_std_vector_double_std_vector_double__wrapper',
+                       None,[ctypes.c_double,ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int,ctypes.c_int,ctypes.c_bool])
     func(sum,n,x._ptr,y._ptr,lev._ptr,boundaries,verbose,err_on_fail)
     return
 
@@ -7140,9 +8170,8 @@ def vector_region_int(link,n,x,y,intl,locs,boundaries=0,verbose=0,err_on_fail=Tr
         | *err_on_fail*: ``bool``
         | Returns: ``ctypes.c_int`` object
     """
-    func=link.o2scl.o2scl_vector_region_int_std_vector_double_std_vector_double__wrapper
-    func.restype=ctypes.c_int
-    func.argtypes=[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_void_p,ctypes.c_int,ctypes.c_int,ctypes.c_bool]
+    func=link.get_func('o2scl','o2scl_vector_region_int_std_vector_double_std_vector_double__wrapper',
+                       ctypes.c_int,[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_void_p,ctypes.c_int,ctypes.c_int,ctypes.c_bool])
     ret=func(n,x._ptr,y._ptr,intl,locs._ptr,boundaries,verbose,err_on_fail)
     return ret
 
@@ -7160,9 +8189,8 @@ def vector_region_fracint(link,n,x,y,intl,locs,boundaries=0,verbose=0,err_on_fai
         | *err_on_fail*: ``bool``
         | Returns: ``ctypes.c_int`` object
     """
-    func=link.o2scl.o2scl_vector_region_fracint_std_vector_double_std_vector_double__wrapper
-    func.restype=ctypes.c_int
-    func.argtypes=[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_void_p,ctypes.c_int,ctypes.c_int,ctypes.c_bool]
+    func=link.get_func('o2scl','o2scl_vector_region_fracint_std_vector_double_std_vector_double__wrapper',
+                       ctypes.c_int,[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_void_p,ctypes.c_int,ctypes.c_int,ctypes.c_bool])
     ret=func(n,x._ptr,y._ptr,intl,locs._ptr,boundaries,verbose,err_on_fail)
     return ret
 
@@ -7181,9 +8209,8 @@ def vector_bound_fracint(link,n,x,y,frac,low,high,boundaries=0,verbose=0,err_on_
         | *err_on_fail*: ``bool``
         | Returns: ``ctypes.c_int`` object
     """
-    func=link.o2scl.o2scl_vector_bound_fracint_std_vector_double_std_vector_double__wrapper
-    func.restype=ctypes.c_int
-    func.argtypes=[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int,ctypes.c_int,ctypes.c_bool]
+    func=link.get_func('o2scl','o2scl_vector_bound_fracint_std_vector_double_std_vector_double__wrapper',
+                       ctypes.c_int,[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int,ctypes.c_int,ctypes.c_bool])
     ret=func(n,x._ptr,y._ptr,frac,low._ptr,high._ptr,boundaries,verbose,err_on_fail)
     return ret
 
@@ -7202,9 +8229,8 @@ def vector_bound_int(link,n,x,y,frac,low,high,boundaries=0,verbose=0,err_on_fail
         | *err_on_fail*: ``bool``
         | Returns: ``ctypes.c_int`` object
     """
-    func=link.o2scl.o2scl_vector_bound_int_std_vector_double_std_vector_double__wrapper
-    func.restype=ctypes.c_int
-    func.argtypes=[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int,ctypes.c_int,ctypes.c_bool]
+    func=link.get_func('o2scl','o2scl_vector_bound_int_std_vector_double_std_vector_double__wrapper',
+                       ctypes.c_int,[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_int,ctypes.c_int,ctypes.c_bool])
     ret=func(n,x._ptr,y._ptr,frac,low._ptr,high._ptr,boundaries,verbose,err_on_fail)
     return ret
 
@@ -7219,8 +8245,8 @@ def rebin_xy(link,x,y,x_out,y_out,n_pts,interp_type):
         | *n_pts*: ``size_t``
         | *interp_type*: ``size_t``
     """
-    func=link.o2scl.o2scl_rebin_xy_std_vector_double_std_vector_double_std_vector_double_std_vector_double__wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_rebin_xy_std_vector_double_std_vector_double_std_vector_double_std_vector_double__wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t])
     func(x._ptr,y._ptr,x_out._ptr,y_out._ptr,n_pts,interp_type)
     return
 
@@ -7232,9 +8258,8 @@ def linear_or_log_chi2(link,x,y):
         | *y*: :class:`std::vector<double>` object
         | Returns: ``ctypes.c_double`` object
     """
-    func=link.o2scl.o2scl_linear_or_log_chi2_std_vector_double_std_vector_double__wrapper
-    func.restype=ctypes.c_double
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+    func=link.get_func('o2scl','o2scl_linear_or_log_chi2_std_vector_double_std_vector_double__wrapper',
+                       ctypes.c_double,[ctypes.c_void_p,ctypes.c_void_p])
     ret=func(x._ptr,y._ptr)
     return ret
 
@@ -7247,8 +8272,8 @@ def linear_or_log_pair(link,x,y,log_x,log_y):
         | *log_x*: ``bool``
         | *log_y*: ``bool``
     """
-    func=link.o2scl.o2scl_linear_or_log_std_vector_double_std_vector_double__wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p]
+    func=link.get_func('o2scl','o2scl_linear_or_log_std_vector_double_std_vector_double__wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p])
     func(x._ptr,y._ptr,log_x._ptr,log_y._ptr)
     return
 
@@ -7262,8 +8287,8 @@ def vector_refine(link,n,index,data,factor,interp_type=2):
         | *factor*: ``size_t``
         | *interp_type*: ``size_t``
     """
-    func=link.o2scl.o2scl_vector_refine_std_vector_double_std_vector_double_double__wrapper
-    func.argtypes=[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t]
+    func=link.get_func('o2scl','o2scl_vector_refine_std_vector_double_std_vector_double_double__wrapper',
+                       None,[ctypes.c_size_t,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t])
     func(n,index._ptr,data._ptr,factor,interp_type)
     return
 
@@ -7274,8 +8299,8 @@ def linear_or_log(link,x,log_x):
         | *x*: :class:`std::vector<double>` object
         | *log_x*: ``bool``
     """
-    func=link.o2scl.o2scl_linear_or_log_std_vector_double__wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+    func=link.get_func('o2scl','o2scl_linear_or_log_std_vector_double__wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p])
     func(x._ptr,log_x._ptr)
     return
 
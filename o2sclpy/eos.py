@@ -22,10 +22,24 @@
 """
 
 import ctypes
+import numpy
+import os
+import collections
+import json
+import hashlib
 from abc import abstractmethod
-from o2sclpy.utils import force_bytes
+from o2sclpy.utils import force_bytes, user_cache_dir, atomic_write
+from o2sclpy.utils import evict_lru
 
 from o2sclpy.base import *
+from o2sclpy.base import _array_call
+
+def _eos_array(obj,name,nb,delta):
+    """
+    Call the C function ``name`` for the arrays ``nb`` and ``delta``
+    (see :func:`base._array_call()`)
+    """
+    return _array_call(obj,'o2scl_eos',name,[nb,delta])
 
 class eos_base:
     """
@@ -49,9 +63,8 @@ class eos_base:
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_base
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_base',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -65,8 +78,8 @@ class eos_base:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_base
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_base',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -86,8 +99,8 @@ class eos_base:
         """
         Get object of type :class:`o2scl::thermo`
         """
-        func=self._link.o2scl_eos.o2scl_eos_base_get_def_thermo
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_base_get_def_thermo',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,def_thermo._ptr)
         return
 
@@ -95,8 +108,8 @@ class eos_base:
         """
         Set object of type :class:`o2scl::thermo`
         """
-        func=self._link.o2scl_eos.o2scl_eos_base_set_def_thermo
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_base_set_def_thermo',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -120,9 +133,8 @@ class eos_had_base(eos_base):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_had_base
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_had_base',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -136,8 +148,8 @@ class eos_had_base(eos_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_had_base
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_had_base',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -158,9 +170,8 @@ class eos_had_base(eos_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_get_eoa
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_get_eoa',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @eoa.setter
@@ -168,8 +179,8 @@ class eos_had_base(eos_base):
         """
         Setter function for eos_had_base::eoa .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_set_eoa
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_set_eoa',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -178,9 +189,8 @@ class eos_had_base(eos_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_get_msom
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_get_msom',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @msom.setter
@@ -188,8 +198,8 @@ class eos_had_base(eos_base):
         """
         Setter function for eos_had_base::msom .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_set_msom
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_set_msom',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -198,9 +208,8 @@ class eos_had_base(eos_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_get_comp
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_get_comp',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @comp.setter
@@ -208,8 +217,8 @@ class eos_had_base(eos_base):
         """
         Setter function for eos_had_base::comp .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_set_comp
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_set_comp',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -218,9 +227,8 @@ class eos_had_base(eos_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_get_n0
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_get_n0',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @n0.setter
@@ -228,8 +236,8 @@ class eos_had_base(eos_base):
         """
         Setter function for eos_had_base::n0 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_set_n0
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_set_n0',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -238,9 +246,8 @@ class eos_had_base(eos_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_get_esym
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_get_esym',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @esym.setter
@@ -248,8 +255,8 @@ class eos_had_base(eos_base):
         """
         Setter function for eos_had_base::esym .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_set_esym
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_set_esym',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -258,9 +265,8 @@ class eos_had_base(eos_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_get_kprime
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_get_kprime',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @kprime.setter
@@ -268,8 +274,8 @@ class eos_had_base(eos_base):
         """
         Setter function for eos_had_base::kprime .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_set_kprime
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_set_kprime',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -278,9 +284,8 @@ class eos_had_base(eos_base):
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_get_err_nonconv
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_get_err_nonconv',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @err_nonconv.setter
@@ -288,8 +293,8 @@ class eos_had_base(eos_base):
         """
         Setter function for eos_had_base::err_nonconv .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_set_err_nonconv
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_set_err_nonconv',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -297,8 +302,8 @@ class eos_had_base(eos_base):
         """
         Get object of type :class:`o2scl::fermion`
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_get_def_neutron
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_get_def_neutron',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,def_neutron._ptr)
         return
 
@@ -306,8 +311,8 @@ class eos_had_base(eos_base):
         """
         Set object of type :class:`o2scl::fermion`
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_set_def_neutron
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_set_def_neutron',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -315,8 +320,8 @@ class eos_had_base(eos_base):
         """
         Get object of type :class:`o2scl::fermion`
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_get_def_proton
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_get_def_proton',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,def_proton._ptr)
         return
 
@@ -324,8 +329,8 @@ class eos_had_base(eos_base):
         """
         Set object of type :class:`o2scl::fermion`
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_set_def_proton
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_set_def_proton',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -337,9 +342,8 @@ class eos_had_base(eos_base):
         | *th*: :class:`o2scl::thermo` object
         | Returns: a Python int
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_calc_e
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_calc_e',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,n._ptr,p._ptr,th._ptr)
         return ret
 
@@ -351,9 +355,8 @@ class eos_had_base(eos_base):
         | *th*: :class:`o2scl::thermo` object
         | Returns: a Python int
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_calc_p
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_calc_p',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,n._ptr,p._ptr,th._ptr)
         return ret
 
@@ -364,9 +367,8 @@ class eos_had_base(eos_base):
         | *delta* =0.0: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_fcomp
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_fcomp',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -377,9 +379,8 @@ class eos_had_base(eos_base):
         | *delta*: ``double``
         | Returns: a Python float, a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_fcomp_err
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_fcomp_err',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double)])
         unc_conv=ctypes.c_double(0)
         ret=func(self._ptr,nb,delta,ctypes.byref(unc_conv))
         return ret,unc_conv.value
@@ -391,9 +392,8 @@ class eos_had_base(eos_base):
         | *delta* =0.0: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_feoa
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_feoa',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -404,9 +404,8 @@ class eos_had_base(eos_base):
         | *delta* =0.0: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_fesym
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_fesym',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -417,9 +416,8 @@ class eos_had_base(eos_base):
         | *delta*: ``double``
         | Returns: a Python float, a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_fesym_err
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_fesym_err',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double)])
         unc_conv=ctypes.c_double(0)
         ret=func(self._ptr,nb,delta,ctypes.byref(unc_conv))
         return ret,unc_conv.value
@@ -431,9 +429,8 @@ class eos_had_base(eos_base):
         | *delta* =0.0: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_fesym_slope
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_fesym_slope',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -444,9 +441,8 @@ class eos_had_base(eos_base):
         | *delta* =0.0: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_fesym_curve
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_fesym_curve',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -457,9 +453,8 @@ class eos_had_base(eos_base):
         | *delta* =0.0: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_fesym_skew
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_fesym_skew',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -469,9 +464,8 @@ class eos_had_base(eos_base):
         | *nb*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_fesym_diff
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_fesym_diff',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,nb)
         return ret
 
@@ -481,9 +475,8 @@ class eos_had_base(eos_base):
         | *nb*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_feta
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_feta',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,nb)
         return ret
 
@@ -493,9 +486,8 @@ class eos_had_base(eos_base):
         | *nb*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_feta_prime
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_feta_prime',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,nb)
         return ret
 
@@ -506,9 +498,8 @@ class eos_had_base(eos_base):
         | *delta* =0.0: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_fkprime
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_fkprime',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -519,9 +510,8 @@ class eos_had_base(eos_base):
         | *delta* =0.0: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_fmsom
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_fmsom',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -532,9 +522,8 @@ class eos_had_base(eos_base):
         | *delta* =0.0: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_f_effm_neut
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_f_effm_neut',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -545,9 +534,8 @@ class eos_had_base(eos_base):
         | *delta* =0.0: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_f_effm_prot
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_f_effm_prot',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -558,9 +546,8 @@ class eos_had_base(eos_base):
         | *delta*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_f_effm_scalar
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_f_effm_scalar',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -571,9 +558,8 @@ class eos_had_base(eos_base):
         | *delta*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_f_effm_vector
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_f_effm_vector',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -583,9 +569,8 @@ class eos_had_base(eos_base):
         | *delta*: ``double``
         | Returns: a Python float, a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_fn0
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_fn0',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.POINTER(ctypes.c_double)])
         leoa_conv=ctypes.c_double(0)
         ret=func(self._ptr,delta,ctypes.byref(leoa_conv))
         return ret,leoa_conv.value
@@ -597,8 +582,8 @@ class eos_had_base(eos_base):
         | *mup*: ``double``
         | Returns: , a Python float, a Python float, a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_f_number_suscept
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_f_number_suscept',
+                                 None,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)])
         dPdnn_conv=ctypes.c_double(0)
         dPdnp_conv=ctypes.c_double(0)
         dPdpp_conv=ctypes.c_double(0)
@@ -612,8 +597,8 @@ class eos_had_base(eos_base):
         | *mup*: ``double``
         | Returns: , a Python float, a Python float, a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_f_inv_number_suscept
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_f_inv_number_suscept',
+                                 None,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)])
         dednn_conv=ctypes.c_double(0)
         dednp_conv=ctypes.c_double(0)
         dedpp_conv=ctypes.c_double(0)
@@ -624,9 +609,8 @@ class eos_had_base(eos_base):
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_saturation
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_saturation',
+                                 ctypes.c_int,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -637,9 +621,8 @@ class eos_had_base(eos_base):
         | *np*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_calc_mun_e
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_calc_mun_e',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nn,np)
         return ret
 
@@ -650,9 +633,8 @@ class eos_had_base(eos_base):
         | *np*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_calc_mup_e
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_calc_mup_e',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nn,np)
         return ret
 
@@ -663,9 +645,8 @@ class eos_had_base(eos_base):
         | *np*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_calc_ed
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_calc_ed',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nn,np)
         return ret
 
@@ -676,9 +657,8 @@ class eos_had_base(eos_base):
         | *np*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_calc_pr
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_calc_pr',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nn,np)
         return ret
 
@@ -689,9 +669,8 @@ class eos_had_base(eos_base):
         | *mup*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_calc_nn_p
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_calc_nn_p',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,mun,mup)
         return ret
 
@@ -702,9 +681,8 @@ class eos_had_base(eos_base):
         | *mup*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_calc_np_p
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_calc_np_p',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nn,mup)
         return ret
 
@@ -715,9 +693,8 @@ class eos_had_base(eos_base):
         | *delta*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_calc_dmu_delta
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_calc_dmu_delta',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -728,9 +705,8 @@ class eos_had_base(eos_base):
         | *delta*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_calc_musum_delta
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_calc_musum_delta',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -741,9 +717,8 @@ class eos_had_base(eos_base):
         | *delta*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_calc_pressure_nb
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_calc_pressure_nb',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
@@ -754,12 +729,119 @@ class eos_had_base(eos_base):
         | *delta*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_base_calc_edensity_nb
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_base_calc_edensity_nb',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,nb,delta)
         return ret
 
+    def fcomp_array(self,nb,delta=0.0):
+        """
+        Array version of :meth:`fcomp()`.
+
+        | Parameters:
+        | *nb*: ``numpy`` array
+        | *delta*: ``numpy`` array
+        | Returns: a ``numpy`` array
+        """
+        return _eos_array(self,'o2scl_eos_had_base_fcomp_array',
+                          nb,delta)
+
+    def feoa_array(self,nb,delta=0.0):
+        """
+        Array version of :meth:`feoa()`.
+
+        | Parameters:
+        | *nb*: ``numpy`` array
+        | *delta*: ``numpy`` array
+        | Returns: a ``numpy`` array
+        """
+        return _eos_array(self,'o2scl_eos_had_base_feoa_array',
+                          nb,delta)
+
+    def fesym_array(self,nb,delta=0.0):
+        """
+        Array version of :meth:`fesym()`.
+
+        | Parameters:
+        | *nb*: ``numpy`` array
+        | *delta*: ``numpy`` array
+        | Returns: a ``numpy`` array
+        """
+        return _eos_array(self,'o2scl_eos_had_base_fesym_array',
+                          nb,delta)
+
+    def fesym_slope_array(self,nb,delta=0.0):
+        """
+        Array version of :meth:`fesym_slope()`.
+
+        | Parameters:
+        | *nb*: ``numpy`` array
+        | *delta*: ``numpy`` array
+        | Returns: a ``numpy`` array
+        """
+        return _eos_array(self,'o2scl_eos_had_base_fesym_slope_array',
+                          nb,delta)
+
+    def fkprime_array(self,nb,delta=0.0):
+        """
+        Array version of :meth:`fkprime()`.
+
+        | Parameters:
+        | *nb*: ``numpy`` array
+        | *delta*: ``numpy`` array
+        | Returns: a ``numpy`` array
+        """
+        return _eos_array(self,'o2scl_eos_had_base_fkprime_array',
+                          nb,delta)
+
+    def fmsom_array(self,nb,delta=0.0):
+        """
+        Array version of :meth:`fmsom()`.
+
+        | Parameters:
+        | *nb*: ``numpy`` array
+        | *delta*: ``numpy`` array
+        | Returns: a ``numpy`` array
+        """
+        return _eos_array(self,'o2scl_eos_had_base_fmsom_array',
+                          nb,delta)
+
+    def f_effm_neut_array(self,nb,delta=0.0):
+        """
+        Array version of :meth:`f_effm_neut()`.
+
+        | Parameters:
+        | *nb*: ``numpy`` array
+        | *delta*: ``numpy`` array
+        | Returns: a ``numpy`` array
+        """
+        return _eos_array(self,'o2scl_eos_had_base_f_effm_neut_array',
+                          nb,delta)
+
+    def calc_pressure_nb_array(self,nb,delta):
+        """
+        Array version of :meth:`calc_pressure_nb()`.
+
+        | Parameters:
+        | *nb*: ``numpy`` array
+        | *delta*: ``numpy`` array
+        | Returns: a ``numpy`` array
+        """
+        return _eos_array(self,'o2scl_eos_had_base_calc_pressure_nb_array',
+                          nb,delta)
+
+    def calc_edensity_nb_array(self,nb,delta):
+        """
+        Array version of :meth:`calc_edensity_nb()`.
+
+        | Parameters:
+        | *nb*: ``numpy`` array
+        | *delta*: ``numpy`` array
+        | Returns: a ``numpy`` array
+        """
+        return _eos_array(self,'o2scl_eos_had_base_calc_edensity_nb_array',
+                          nb,delta)
+
 
 class eos_had_eden_base(eos_had_base):
     """
@@ -780,9 +862,8 @@ class eos_had_eden_base(eos_had_base):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_had_eden_base
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_had_eden_base',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -796,8 +877,8 @@ class eos_had_eden_base(eos_had_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_had_eden_base
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_had_eden_base',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -833,9 +914,8 @@ class eos_had_pres_base(eos_had_base):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_had_pres_base
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_had_pres_base',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -849,8 +929,8 @@ class eos_had_pres_base(eos_had_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_had_pres_base
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_had_pres_base',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -886,9 +966,8 @@ class eos_had_temp_base(eos_had_base):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_had_temp_base
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_had_temp_base',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -902,8 +981,8 @@ class eos_had_temp_base(eos_had_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_had_temp_base
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_had_temp_base',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -939,9 +1018,8 @@ class eos_had_temp_eden_base(eos_had_temp_base):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_had_temp_eden_base
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_had_temp_eden_base',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -955,8 +1033,8 @@ class eos_had_temp_eden_base(eos_had_temp_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_had_temp_eden_base
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_had_temp_eden_base',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -992,9 +1070,8 @@ class eos_had_temp_pres_base(eos_had_temp_base):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_had_temp_pres_base
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_had_temp_pres_base',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1008,8 +1085,8 @@ class eos_had_temp_pres_base(eos_had_temp_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_had_temp_pres_base
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_had_temp_pres_base',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1044,9 +1121,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_had_skyrme
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_had_skyrme',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1060,8 +1136,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_had_skyrme
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_had_skyrme',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1082,9 +1158,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_t0
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_t0',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @t0.setter
@@ -1092,8 +1167,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::t0 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_t0
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_t0',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1102,9 +1177,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_t1
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_t1',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @t1.setter
@@ -1112,8 +1186,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::t1 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_t1
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_t1',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1122,9 +1196,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_t2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_t2',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @t2.setter
@@ -1132,8 +1205,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::t2 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_t2
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_t2',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1142,9 +1215,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_t3
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_t3',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @t3.setter
@@ -1152,8 +1224,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::t3 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_t3
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_t3',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1162,9 +1234,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_x0
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_x0',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @x0.setter
@@ -1172,8 +1243,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::x0 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_x0
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_x0',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1182,9 +1253,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_x1
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_x1',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @x1.setter
@@ -1192,8 +1262,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::x1 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_x1
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_x1',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1202,9 +1272,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_x2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_x2',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @x2.setter
@@ -1212,8 +1281,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::x2 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_x2
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_x2',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1222,9 +1291,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_x3
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_x3',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @x3.setter
@@ -1232,8 +1300,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::x3 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_x3
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_x3',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1242,9 +1310,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_alpha
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_alpha',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @alpha.setter
@@ -1252,8 +1319,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::alpha .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_alpha
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_alpha',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1262,9 +1329,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_a
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_a',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @a.setter
@@ -1272,8 +1338,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::a .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_a
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_a',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1282,9 +1348,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_b
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_b',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @b.setter
@@ -1292,8 +1357,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::b .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_b
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_b',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1302,9 +1367,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_W0
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_W0',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @W0.setter
@@ -1312,8 +1376,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::W0 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_W0
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_W0',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1322,9 +1386,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_b4
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_b4',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @b4.setter
@@ -1332,8 +1395,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::b4 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_b4
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_b4',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1342,9 +1405,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_b4p
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_b4p',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @b4p.setter
@@ -1352,8 +1414,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::b4p .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_b4p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_b4p',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1362,9 +1424,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_parent_method
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_parent_method',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @parent_method.setter
@@ -1372,8 +1433,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Setter function for eos_had_skyrme::parent_method .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_parent_method
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_parent_method',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -1381,9 +1442,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Get object of type :class:`std::string`
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_reference
-        func.restype=ctypes.c_char_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_reference',
+                                 ctypes.c_char_p,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,reference._ptr)
         return
 
@@ -1391,8 +1451,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Set object of type :class:`std::string`
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_reference
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_reference',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -1400,8 +1460,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Get object of type :class:`o2scl::fermion_deriv_nr`
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_get_nrfd
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_get_nrfd',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,nrfd._ptr)
         return
 
@@ -1409,8 +1469,8 @@ class eos_had_skyrme(eos_had_temp_eden_base):
         """
         Set object of type :class:`o2scl::fermion_deriv_nr`
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_skyrme_set_nrfd
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_skyrme_set_nrfd',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -1433,9 +1493,8 @@ class eos_had_apr(eos_had_temp_eden_base):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_had_apr
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_had_apr',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1449,8 +1508,8 @@ class eos_had_apr(eos_had_temp_eden_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_had_apr
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_had_apr',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1471,9 +1530,8 @@ class eos_had_apr(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_apr_get_pion
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_apr_get_pion',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @pion.setter
@@ -1481,8 +1539,8 @@ class eos_had_apr(eos_had_temp_eden_base):
         """
         Setter function for eos_had_apr::pion .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_apr_set_pion
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_apr_set_pion',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -1491,9 +1549,8 @@ class eos_had_apr(eos_had_temp_eden_base):
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_apr_get_parent_method
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_apr_get_parent_method',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @parent_method.setter
@@ -1501,8 +1558,8 @@ class eos_had_apr(eos_had_temp_eden_base):
         """
         Setter function for eos_had_apr::parent_method .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_apr_set_parent_method
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_apr_set_parent_method',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -1525,9 +1582,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_had_rmf
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_had_rmf',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1541,8 +1597,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_had_rmf
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_had_rmf',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1563,9 +1619,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_calc_e_steps
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_calc_e_steps',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @calc_e_steps.setter
@@ -1573,8 +1628,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::calc_e_steps .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_calc_e_steps
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_calc_e_steps',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -1583,9 +1638,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_calc_e_relative
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_calc_e_relative',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @calc_e_relative.setter
@@ -1593,8 +1647,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::calc_e_relative .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_calc_e_relative
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_calc_e_relative',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -1603,9 +1657,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_zm_mode
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_zm_mode',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @zm_mode.setter
@@ -1613,8 +1666,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::zm_mode .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_zm_mode
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_zm_mode',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -1623,9 +1676,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_verbose
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_verbose',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @verbose.setter
@@ -1633,8 +1685,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::verbose .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_verbose
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_verbose',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -1643,9 +1695,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_err_nonconv
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_err_nonconv',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @err_nonconv.setter
@@ -1653,8 +1704,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::err_nonconv .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_err_nonconv
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_err_nonconv',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -1663,9 +1714,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_mnuc
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_mnuc',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @mnuc.setter
@@ -1673,8 +1723,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::mnuc .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_mnuc
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_mnuc',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1683,9 +1733,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_ms
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_ms',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @ms.setter
@@ -1693,8 +1742,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::ms .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_ms
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_ms',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1703,9 +1752,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_mw
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_mw',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @mw.setter
@@ -1713,8 +1761,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::mw .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_mw
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_mw',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1723,9 +1771,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_mr
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_mr',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @mr.setter
@@ -1733,8 +1780,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::mr .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_mr
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_mr',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1743,9 +1790,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_cs
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_cs',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @cs.setter
@@ -1753,8 +1799,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::cs .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_cs
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_cs',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1763,9 +1809,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_cw
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_cw',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @cw.setter
@@ -1773,8 +1818,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::cw .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_cw
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_cw',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1783,9 +1828,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_cr
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_cr',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @cr.setter
@@ -1793,8 +1837,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::cr .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_cr
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_cr',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1803,9 +1847,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_b
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_b',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @b.setter
@@ -1813,8 +1856,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::b .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_b
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_b',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1823,9 +1866,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_c
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_c',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @c.setter
@@ -1833,8 +1875,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::c .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_c
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_c',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1843,9 +1885,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_zeta
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_zeta',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @zeta.setter
@@ -1853,8 +1894,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::zeta .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_zeta
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_zeta',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1863,9 +1904,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_xi
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_xi',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @xi.setter
@@ -1873,8 +1913,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::xi .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_xi
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_xi',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1883,9 +1923,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_a1
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_a1',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @a1.setter
@@ -1893,8 +1932,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::a1 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_a1
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_a1',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1903,9 +1942,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_a2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_a2',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @a2.setter
@@ -1913,8 +1951,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::a2 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_a2
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_a2',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1923,9 +1961,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_a3
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_a3',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @a3.setter
@@ -1933,8 +1970,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::a3 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_a3
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_a3',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1943,9 +1980,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_a4
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_a4',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @a4.setter
@@ -1953,8 +1989,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::a4 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_a4
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_a4',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1963,9 +1999,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_a5
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_a5',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @a5.setter
@@ -1973,8 +2008,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::a5 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_a5
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_a5',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1983,9 +2018,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_a6
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_a6',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @a6.setter
@@ -1993,8 +2027,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::a6 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_a6
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_a6',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2003,9 +2037,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_b1
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_b1',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @b1.setter
@@ -2013,8 +2046,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::b1 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_b1
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_b1',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2023,9 +2056,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_b2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_b2',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @b2.setter
@@ -2033,8 +2065,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::b2 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_b2
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_b2',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2043,9 +2075,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_get_b3
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_get_b3',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @b3.setter
@@ -2053,8 +2084,8 @@ class eos_had_rmf(eos_had_temp_pres_base):
         """
         Setter function for eos_had_rmf::b3 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_had_rmf_set_b3
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_had_rmf_set_b3',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2077,9 +2108,8 @@ class eos_quark(eos_base):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_quark
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_quark',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2093,8 +2123,8 @@ class eos_quark(eos_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_quark
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_quark',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2129,9 +2159,8 @@ class eos_quark_bag(eos_quark):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_quark_bag
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_quark_bag',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2145,8 +2174,8 @@ class eos_quark_bag(eos_quark):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_quark_bag
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_quark_bag',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2167,9 +2196,8 @@ class eos_quark_bag(eos_quark):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_bag_get_bag_constant
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_bag_get_bag_constant',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @bag_constant.setter
@@ -2177,8 +2205,8 @@ class eos_quark_bag(eos_quark):
         """
         Setter function for eos_quark_bag::bag_constant .
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_bag_set_bag_constant
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_bag_set_bag_constant',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2201,9 +2229,8 @@ class eos_quark_njl(eos_quark):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_quark_njl
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_quark_njl',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2217,8 +2244,8 @@ class eos_quark_njl(eos_quark):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_quark_njl
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_quark_njl',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2239,9 +2266,8 @@ class eos_quark_njl(eos_quark):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_njl_get_B0
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_njl_get_B0',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @B0.setter
@@ -2249,8 +2275,8 @@ class eos_quark_njl(eos_quark):
         """
         Setter function for eos_quark_njl::B0 .
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_njl_set_B0
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_njl_set_B0',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2259,9 +2285,8 @@ class eos_quark_njl(eos_quark):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_njl_get_L
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_njl_get_L',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @L.setter
@@ -2269,8 +2294,8 @@ class eos_quark_njl(eos_quark):
         """
         Setter function for eos_quark_njl::L .
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_njl_set_L
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_njl_set_L',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2279,9 +2304,8 @@ class eos_quark_njl(eos_quark):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_njl_get_G
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_njl_get_G',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @G.setter
@@ -2289,8 +2313,8 @@ class eos_quark_njl(eos_quark):
         """
         Setter function for eos_quark_njl::G .
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_njl_set_G
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_njl_set_G',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2299,9 +2323,8 @@ class eos_quark_njl(eos_quark):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_njl_get_K
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_njl_get_K',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @K.setter
@@ -2309,8 +2332,8 @@ class eos_quark_njl(eos_quark):
         """
         Setter function for eos_quark_njl::K .
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_njl_set_K
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_njl_set_K',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2319,9 +2342,8 @@ class eos_quark_njl(eos_quark):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_njl_get_limit
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_njl_get_limit',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @limit.setter
@@ -2329,8 +2351,8 @@ class eos_quark_njl(eos_quark):
         """
         Setter function for eos_quark_njl::limit .
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_njl_set_limit
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_njl_set_limit',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2339,9 +2361,8 @@ class eos_quark_njl(eos_quark):
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_njl_get_fromqq
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_njl_get_fromqq',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @fromqq.setter
@@ -2349,8 +2370,8 @@ class eos_quark_njl(eos_quark):
         """
         Setter function for eos_quark_njl::fromqq .
         """
-        func=self._link.o2scl_eos.o2scl_eos_quark_njl_set_fromqq
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_quark_njl_set_fromqq',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -2378,9 +2399,8 @@ class eos_tov:
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_tov
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_tov',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2394,8 +2414,8 @@ class eos_tov:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_tov
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_tov',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2416,9 +2436,8 @@ class eos_tov:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_eos.o2scl_eos_tov_get_verbose
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_get_verbose',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @verbose.setter
@@ -2426,8 +2445,8 @@ class eos_tov:
         """
         Setter function for eos_tov::verbose .
         """
-        func=self._link.o2scl_eos.o2scl_eos_tov_set_verbose
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_set_verbose',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -2435,9 +2454,8 @@ class eos_tov:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl_eos.o2scl_eos_tov_has_baryons
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_has_baryons',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -2460,9 +2478,8 @@ class eos_tov_buchdahl(eos_tov):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_tov_buchdahl
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_tov_buchdahl',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2476,8 +2493,8 @@ class eos_tov_buchdahl(eos_tov):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_tov_buchdahl
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_tov_buchdahl',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2498,9 +2515,8 @@ class eos_tov_buchdahl(eos_tov):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_tov_buchdahl_get_Pstar
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_buchdahl_get_Pstar',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @Pstar.setter
@@ -2508,8 +2524,8 @@ class eos_tov_buchdahl(eos_tov):
         """
         Setter function for eos_tov_buchdahl::Pstar .
         """
-        func=self._link.o2scl_eos.o2scl_eos_tov_buchdahl_set_Pstar
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_buchdahl_set_Pstar',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2532,9 +2548,8 @@ class eos_tov_polytrope(eos_tov):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_tov_polytrope
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_tov_polytrope',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2548,8 +2563,8 @@ class eos_tov_polytrope(eos_tov):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_tov_polytrope
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_tov_polytrope',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2571,8 +2586,8 @@ class eos_tov_polytrope(eos_tov):
         | *coeff*: ``double``
         | *index*: ``double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_tov_polytrope_set_coeff_index
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_polytrope_set_coeff_index',
+                                 None,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         func(self._ptr,coeff,index)
         return
 
@@ -2595,9 +2610,8 @@ class eos_tov_linear(eos_tov):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_tov_linear
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_tov_linear',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2611,8 +2625,8 @@ class eos_tov_linear(eos_tov):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_tov_linear
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_tov_linear',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2634,8 +2648,8 @@ class eos_tov_linear(eos_tov):
         | *cs2*: ``double``
         | *eps0*: ``double``
         """
-        func=self._link.o2scl_eos.o2scl_eos_tov_linear_set_cs2_eps0
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_linear_set_cs2_eps0',
+                                 None,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         func(self._ptr,cs2,eps0)
         return
 
@@ -2647,6 +2661,19 @@ class eos_tov_interp(eos_tov):
     https://neutronstars.utk.edu/code/o2scl/eos/html/class/eos_tov_interp.html .
     """
 
+    _eos_hash=None
+    """
+    A hash of the EOS given to :meth:`read_table()` or
+    :meth:`read_arrays()`, used by :class:`tov_result_cache` (see
+    :meth:`_hash()`)
+    """
+
+    _crust=['default_low_dens_eos']
+    """
+    The crust choice and its arguments, used by
+    :class:`tov_result_cache`
+    """
+
     def __init__(self,link,pointer=0):
         """
         Init function for class eos_tov_interp
@@ -2658,9 +2685,8 @@ class eos_tov_interp(eos_tov):
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_eos_tov_interp
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_eos_tov_interp',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2674,8 +2700,8 @@ class eos_tov_interp(eos_tov):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_eos_tov_interp
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_eos_tov_interp',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2696,9 +2722,8 @@ class eos_tov_interp(eos_tov):
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_eos_tov_interp_get_err_nonconv
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_interp_get_err_nonconv',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @err_nonconv.setter
@@ -2706,8 +2731,8 @@ class eos_tov_interp(eos_tov):
         """
         Setter function for eos_tov_interp::err_nonconv .
         """
-        func=self._link.o2scl_eos.o2scl_eos_tov_interp_set_err_nonconv
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_interp_set_err_nonconv',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -2722,25 +2747,95 @@ class eos_tov_interp(eos_tov):
         s_cole_=ctypes.c_char_p(force_bytes(s_cole))
         s_colp_=ctypes.c_char_p(force_bytes(s_colp))
         s_colnb_=ctypes.c_char_p(force_bytes(s_colnb))
-        func=self._link.o2scl_eos.o2scl_eos_tov_interp_read_table
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_interp_read_table',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,eos._ptr,s_cole_,s_colp_,s_colnb_)
-        return
+        self._eos_hash=None
+        if tov_cache.enabled:
+            self._eos_hash=tov_result_cache.eos_hash(eos,[s_cole,s_colp,
+                                                          s_colnb])
+        return
+
+    def read_arrays(self,ed,pr,nb=None,units='Msun/km^3'):
+        """
+        Read the EOS from the one-dimensional ``numpy`` arrays of
+        energy density ``ed``, pressure ``pr`` and, optionally, baryon
+        density ``nb``, as in :meth:`read_table()` but without
+        creating a table.
+
+        If ``units`` is a string, it is the unit of ``ed`` and ``pr``
+        and ``nb`` is in ``1/fm^3``. Otherwise, ``units`` is a
+        dictionary of unit strings with the keys ``ed``, ``pr`` and
+        ``nb`` (missing keys use the defaults). The arrays are
+        converted to ``Msun/km^3`` and ``1/fm^3`` by multiplying by
+        the conversion factor from :class:`convert_units`, and an
+        empty unit string means that no conversion is needed. Arrays
+        which are already contiguous and in these units are passed to
+        O\ :sub:`2`\ scl without being copied in Python.
+        """
+        if isinstance(units,dict):
+            units=dict({'ed': 'Msun/km^3','pr': 'Msun/km^3',
+                        'nb': '1/fm^3'},**units)
+        else:
+            units={'ed': units,'pr': units,'nb': '1/fm^3'}
+        internal={'ed': 'Msun/km^3','pr': 'Msun/km^3','nb': '1/fm^3'}
+        cu=self._link.o2scl_settings.get_convert_units()
+        arrays={'ed': ed,'pr': pr,'nb': nb}
+        for name in arrays:
+            if arrays[name] is None:
+                continue
+            arr=numpy.ascontiguousarray(arrays[name],dtype=numpy.double)
+            if arr.ndim!=1 or len(arr)!=len(arrays['ed']):
+                raise ValueError('Arrays must be one-dimensional and '+
+                                 'have the same length in '+
+                                 'eos_tov_interp.read_arrays().')
+            unit=force_bytes(units[name]).decode('utf-8')
+            if unit!='' and unit!=internal[name]:
+                arr=arr*cu.convert(unit,internal[name],1.0)
+            arrays[name]=arr
+        dp=ctypes.POINTER(ctypes.c_double)
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_interp_read_vectors',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,dp,dp,dp])
+        func(self._ptr,len(arrays['ed']),
+             arrays['ed'].ctypes.data_as(dp),
+             arrays['pr'].ctypes.data_as(dp),
+             None if arrays['nb'] is None else arrays['nb'].ctypes.data_as(dp))
+        self._eos_hash=None
+        if tov_cache.enabled:
+            self._eos_hash=tov_result_cache.arrays_hash(arrays)
+        return
+
+    def _hash(self):
+        """
+        Return the hash of the EOS used by :class:`tov_result_cache`,
+        or ``None`` if the results for this EOS cannot be cached.
+
+        The hash is computed by :meth:`read_table()` and
+        :meth:`read_arrays()` only if the cache is enabled, so that
+        reading an EOS costs nothing extra otherwise. The EOS is
+        copied by O\ :sub:`2`\ scl when it is read, so the caller may
+        modify the table or arrays afterwards. An EOS read while the
+        cache is disabled is never cached, and must be read again
+        after :meth:`tov_result_cache.enable()` to use the cache.
+        """
+        return self._eos_hash
 
     def default_low_dens_eos(self):
         """
         """
-        func=self._link.o2scl_eos.o2scl_eos_tov_interp_default_low_dens_eos
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_interp_default_low_dens_eos',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
+        self._crust=['default_low_dens_eos']
         return
 
     def sho11_low_dens_eos(self):
         """
         """
-        func=self._link.o2scl_eos.o2scl_eos_tov_interp_sho11_low_dens_eos
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_interp_sho11_low_dens_eos',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
+        self._crust=['sho11_low_dens_eos']
         return
 
     def s12_low_dens_eos(self,model="SLy4",external=False):
@@ -2750,9 +2845,10 @@ class eos_tov_interp(eos_tov):
         | *external* =false: ``bool``
         """
         model_=ctypes.c_char_p(force_bytes(model))
-        func=self._link.o2scl_eos.o2scl_eos_tov_interp_s12_low_dens_eos
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_interp_s12_low_dens_eos',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool])
         func(self._ptr,model_,external)
+        self._crust=['s12_low_dens_eos',force_bytes(model).decode('utf-8'),external]
         return
 
     def gcp10_low_dens_eos(self,model="BSk20",external=False):
@@ -2762,9 +2858,10 @@ class eos_tov_interp(eos_tov):
         | *external* =false: ``bool``
         """
         model_=ctypes.c_char_p(force_bytes(model))
-        func=self._link.o2scl_eos.o2scl_eos_tov_interp_gcp10_low_dens_eos
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_interp_gcp10_low_dens_eos',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool])
         func(self._ptr,model_,external)
+        self._crust=['gcp10_low_dens_eos',force_bytes(model).decode('utf-8'),external]
         return
 
     def ngl13_low_dens_eos(self,L,model="PNM",external=False):
@@ -2775,9 +2872,10 @@ class eos_tov_interp(eos_tov):
         | *external* =false: ``bool``
         """
         model_=ctypes.c_char_p(force_bytes(model))
-        func=self._link.o2scl_eos.o2scl_eos_tov_interp_ngl13_low_dens_eos
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_char_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_interp_ngl13_low_dens_eos',
+                                 None,[ctypes.c_void_p,ctypes.c_double,ctypes.c_char_p,ctypes.c_bool])
         func(self._ptr,L,model_,external)
+        self._crust=['ngl13_low_dens_eos',L,force_bytes(model).decode('utf-8'),external]
         return
 
     def ngl13_low_dens_eos2(self,S,L,nt,fname=""):
@@ -2789,17 +2887,19 @@ class eos_tov_interp(eos_tov):
         | *fname* ="": string
         """
         fname_=ctypes.c_char_p(force_bytes(fname))
-        func=self._link.o2scl_eos.o2scl_eos_tov_interp_ngl13_low_dens_eos2
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_char_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_interp_ngl13_low_dens_eos2',
+                                 None,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_char_p])
         func(self._ptr,S,L,nt,fname_)
+        self._crust=['ngl13_low_dens_eos2',S,L,nt,force_bytes(fname).decode('utf-8')]
         return
 
     def no_low_dens_eos(self):
         """
         """
-        func=self._link.o2scl_eos.o2scl_eos_tov_interp_no_low_dens_eos
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_eos_tov_interp_no_low_dens_eos',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
+        self._crust=['no_low_dens_eos']
         return
 
 
@@ -2813,6 +2913,7 @@ class tov_solve:
     _ptr=0
     _link=0
     _owner=True
+    _eos=None
 
     def __init__(self,link,pointer=0):
         """
@@ -2825,9 +2926,8 @@ class tov_solve:
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_tov_solve
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_tov_solve',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2841,8 +2941,8 @@ class tov_solve:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_tov_solve
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_tov_solve',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2863,9 +2963,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_buffer_size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_buffer_size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @buffer_size.setter
@@ -2873,8 +2972,8 @@ class tov_solve:
         """
         Setter function for tov_solve::buffer_size .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_buffer_size
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_buffer_size',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -2883,9 +2982,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_max_table_size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_max_table_size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @max_table_size.setter
@@ -2893,8 +2991,8 @@ class tov_solve:
         """
         Setter function for tov_solve::max_table_size .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_max_table_size
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_max_table_size',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -2903,9 +3001,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_mass
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_mass',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @mass.setter
@@ -2913,8 +3010,8 @@ class tov_solve:
         """
         Setter function for tov_solve::mass .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_mass
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_mass',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2923,9 +3020,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_rad
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_rad',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @rad.setter
@@ -2933,8 +3029,8 @@ class tov_solve:
         """
         Setter function for tov_solve::rad .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_rad
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_rad',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2943,9 +3039,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_bmass
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_bmass',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @bmass.setter
@@ -2953,8 +3048,8 @@ class tov_solve:
         """
         Setter function for tov_solve::bmass .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_bmass
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_bmass',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2963,9 +3058,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_gpot
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_gpot',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @gpot.setter
@@ -2973,8 +3067,8 @@ class tov_solve:
         """
         Setter function for tov_solve::gpot .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_gpot
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_gpot',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2983,9 +3077,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_last_rjw
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_last_rjw',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @last_rjw.setter
@@ -2993,8 +3086,8 @@ class tov_solve:
         """
         Setter function for tov_solve::last_rjw .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_last_rjw
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_last_rjw',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3003,9 +3096,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_last_f
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_last_f',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @last_f.setter
@@ -3013,8 +3105,8 @@ class tov_solve:
         """
         Setter function for tov_solve::last_f .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_last_f
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_last_f',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3023,9 +3115,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_domega_rat
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_domega_rat',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @domega_rat.setter
@@ -3033,8 +3124,8 @@ class tov_solve:
         """
         Setter function for tov_solve::domega_rat .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_domega_rat
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_domega_rat',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3043,9 +3134,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_pcent_max
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_pcent_max',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @pcent_max.setter
@@ -3053,8 +3143,8 @@ class tov_solve:
         """
         Setter function for tov_solve::pcent_max .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_pcent_max
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_pcent_max',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3063,9 +3153,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_reformat_results
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_reformat_results',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @reformat_results.setter
@@ -3073,8 +3162,8 @@ class tov_solve:
         """
         Setter function for tov_solve::reformat_results .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_reformat_results
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_reformat_results',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -3083,9 +3172,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_baryon_mass
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_baryon_mass',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @baryon_mass.setter
@@ -3093,8 +3181,8 @@ class tov_solve:
         """
         Setter function for tov_solve::baryon_mass .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_baryon_mass
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_baryon_mass',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3103,9 +3191,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_ang_vel
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_ang_vel',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @ang_vel.setter
@@ -3113,8 +3200,8 @@ class tov_solve:
         """
         Setter function for tov_solve::ang_vel .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_ang_vel
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_ang_vel',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -3123,9 +3210,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_gen_rel
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_gen_rel',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @gen_rel.setter
@@ -3133,8 +3219,8 @@ class tov_solve:
         """
         Setter function for tov_solve::gen_rel .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_gen_rel
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_gen_rel',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -3143,9 +3229,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_calc_gpot
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_calc_gpot',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @calc_gpot.setter
@@ -3153,8 +3238,8 @@ class tov_solve:
         """
         Setter function for tov_solve::calc_gpot .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_calc_gpot
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_calc_gpot',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -3163,9 +3248,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_step_min
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_step_min',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @step_min.setter
@@ -3173,8 +3257,8 @@ class tov_solve:
         """
         Setter function for tov_solve::step_min .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_step_min
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_step_min',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3183,9 +3267,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_step_max
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_step_max',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @step_max.setter
@@ -3193,8 +3276,8 @@ class tov_solve:
         """
         Setter function for tov_solve::step_max .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_step_max
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_step_max',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3203,9 +3286,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_step_start
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_step_start',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @step_start.setter
@@ -3213,8 +3295,8 @@ class tov_solve:
         """
         Setter function for tov_solve::step_start .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_step_start
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_step_start',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3223,9 +3305,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_verbose
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_verbose',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @verbose.setter
@@ -3233,8 +3314,8 @@ class tov_solve:
         """
         Setter function for tov_solve::verbose .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_verbose
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_verbose',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -3243,9 +3324,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_max_integ_steps
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_max_integ_steps',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @max_integ_steps.setter
@@ -3253,8 +3333,8 @@ class tov_solve:
         """
         Setter function for tov_solve::max_integ_steps .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_max_integ_steps
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_max_integ_steps',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -3263,9 +3343,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_err_nonconv
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_err_nonconv',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @err_nonconv.setter
@@ -3273,8 +3352,8 @@ class tov_solve:
         """
         Setter function for tov_solve::err_nonconv .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_err_nonconv
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_err_nonconv',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -3283,9 +3362,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_pmax_default
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_pmax_default',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @pmax_default.setter
@@ -3293,8 +3371,8 @@ class tov_solve:
         """
         Setter function for tov_solve::pmax_default .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_pmax_default
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_pmax_default',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3303,9 +3381,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_prbegin
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_prbegin',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @prbegin.setter
@@ -3313,8 +3390,8 @@ class tov_solve:
         """
         Setter function for tov_solve::prbegin .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_prbegin
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_prbegin',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3323,9 +3400,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_prend
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_prend',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @prend.setter
@@ -3333,8 +3409,8 @@ class tov_solve:
         """
         Setter function for tov_solve::prend .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_prend
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_prend',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3343,9 +3419,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_princ
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_princ',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @princ.setter
@@ -3353,8 +3428,8 @@ class tov_solve:
         """
         Setter function for tov_solve::princ .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_princ
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_princ',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3363,9 +3438,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_fixed_pr_guess
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_fixed_pr_guess',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @fixed_pr_guess.setter
@@ -3373,8 +3447,8 @@ class tov_solve:
         """
         Setter function for tov_solve::fixed_pr_guess .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_fixed_pr_guess
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_fixed_pr_guess',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3383,9 +3457,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_max_begin
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_max_begin',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @max_begin.setter
@@ -3393,8 +3466,8 @@ class tov_solve:
         """
         Setter function for tov_solve::max_begin .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_max_begin
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_max_begin',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3403,9 +3476,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_max_end
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_max_end',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @max_end.setter
@@ -3413,8 +3485,8 @@ class tov_solve:
         """
         Setter function for tov_solve::max_end .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_max_end
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_max_end',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3423,9 +3495,8 @@ class tov_solve:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_max_inc
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_max_inc',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @max_inc.setter
@@ -3433,8 +3504,8 @@ class tov_solve:
         """
         Setter function for tov_solve::max_inc .
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_max_inc
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_max_inc',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3443,19 +3514,32 @@ class tov_solve:
         | Parameters:
         | *eos*: :class:`eos_tov` object
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_set_eos
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_set_eos',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,eos._ptr)
+        self._eos=eos
         return
 
     def mvsr(self):
         """
         | Returns: a Python int
-        """
-        func=self._link.o2scl_eos.o2scl_tov_solve_mvsr
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+
+        If the cache ``tov_cache`` is enabled (see
+        :class:`tov_result_cache`) and the EOS is an
+        :class:`eos_tov_interp` object, a stored result table is
+        copied to the results table instead of solving the TOV
+        equations, and new results are stored in the cache. Only the
+        results table is restored from the cache, not the properties
+        of the last star such as ``mass`` and ``rad``.
+        """
+        key=tov_cache.key(self)
+        if key is not None and tov_cache.load(self,key):
+            return 0
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_mvsr',
+                                 ctypes.c_int,[ctypes.c_void_p])
         ret=func(self._ptr)
+        if key is not None and ret==0:
+            tov_cache.store(self,key)
         return ret
 
     def fixed(self,mass,pmax=1.0e20):
@@ -3465,19 +3549,29 @@ class tov_solve:
         | *pmax* =1.0e20: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_fixed
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_fixed',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,mass,pmax)
         return ret
 
+    def fixed_pr(self,pcent,pmax=1.0e20):
+        """
+        | Parameters:
+        | *pcent*: ``double``
+        | *pmax* =1.0e20: ``double``
+        | Returns: a Python int
+        """
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_fixed_pr',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
+        ret=func(self._ptr,pcent,pmax)
+        return ret
+
     def max(self):
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_max
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_max',
+                                 ctypes.c_int,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -3485,12 +3579,187 @@ class tov_solve:
         """
         | Returns: :class:`shared_ptr_table_units`.
         """
-        func=self._link.o2scl_eos.o2scl_tov_solve_get_results
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_solve_get_results',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
         sp=shared_ptr_table_units(self._link,func(self._ptr))
         return sp
 
+    def mvsr_adaptive(self,tol=1.0e-4,n_init=16,max_stars=400):
+        """
+        Compute the mass-radius curve for central pressures from
+        ``prbegin`` to ``prend`` as in :meth:`mvsr()`, but choose the
+        central pressures adaptively instead of using the fixed factor
+        ``princ``.
+
+        The stars are first computed with :meth:`fixed_pr()` at
+        ``n_init`` central pressures evenly spaced in the logarithm.
+        The interval between two neighbouring stars is then split at
+        the geometric mean of their central pressures if the mass or
+        the radius at its midpoint, estimated from a parabola through
+        the nearby stars, differs from the linear interpolation by
+        more than ``tol`` times the maximum mass or radius, i.e.
+        where dM/dP\ :sub:`c` or dR/dP\ :sub:`c` changes quickly.
+        The two intervals next to the maximum mass are also split
+        until the peak of a parabola through the three stars around
+        it exceeds the largest computed mass by less than ``tol``
+        times the maximum mass. The refinement stops when no interval
+        is split or after ``max_stars`` stars. Central pressures for
+        which :meth:`fixed_pr()` fails are skipped, and intervals
+        containing them are not split again.
+
+        Returns: a :class:`table_units` object with one row for each
+        star in order of increasing central pressure and the same
+        columns and units as the table from :meth:`get_results()`
+        after :meth:`mvsr()`
+        """
+        # For these columns the mvsr() table stores a property of the
+        # star rather than its central value
+        star_cols={'gm': 'mass','r': 'rad','bm': 'bmass','gp': 'gpot',
+                   'rjw': 'last_rjw','omega_rat': 'domega_rat'}
+        stars={}
+        failed=set()
+        names=None
+        units=None
+        count=0
+        todo=list(numpy.linspace(numpy.log(self.prbegin),
+                                 numpy.log(self.prend),n_init))
+        while len(todo)>0 and count<max_stars:
+            for lpc in todo[0:max_stars-count]:
+                count+=1
+                if self.fixed_pr(numpy.exp(lpc))!=0:
+                    failed.add(lpc)
+                    continue
+                tab=self.get_results()
+                prof=tab.to_numpy()
+                if names is None:
+                    names=list(prof.keys())
+                    units={name: tab.get_unit(name) for name in names}
+                center=numpy.argmin(prof['r'])
+                stars[lpc]=[getattr(self,star_cols[name])
+                            if name in star_cols else prof[name][center]
+                            for name in names]
+            todo=[]
+            x=numpy.array(sorted(stars.keys()))
+            if len(x)<3:
+                break
+            m=numpy.array([stars[lpc][names.index('gm')] for lpc in x])
+            r=numpy.array([stars[lpc][names.index('r')] for lpc in x])
+            split=set()
+            for i in range(0,len(x)-1):
+                j=min(max(i-1,0),len(x)-3)
+                xmid=(x[i]+x[i+1])/2.0
+                for f in [m/numpy.max(m),r/numpy.max(r)]:
+                    quad=numpy.polyval(numpy.polyfit(x[j:j+3],f[j:j+3],2),
+                                       xmid)
+                    if abs(quad-(f[i]+f[i+1])/2.0)>tol:
+                        split.add(i)
+            k=numpy.argmax(m)
+            if k>0 and k<len(x)-1:
+                a,b,c=numpy.polyfit(x[k-1:k+2],m[k-1:k+2],2)
+                if a<0.0 and c-b*b/4.0/a-m[k]>tol*m[k]:
+                    split.update([k-1,k])
+            # Do not split intervals which are already very small,
+            # e.g. at a phase transition, or for which the star at the
+            # midpoint failed
+            todo=[(x[i]+x[i+1])/2.0 for i in sorted(split)
+                  if x[i+1]-x[i]>1.0e-8 and (x[i]+x[i+1])/2.0 not in failed]
+
+        if names is None:
+            return table_units(self._link)
+        x=sorted(stars.keys())
+        return table.from_numpy(self._link,
+                                {names[i]: numpy.array([stars[lpc][i]
+                                                        for lpc in x])
+                                 for i in range(0,len(names))},units)
+
+    def fixed_many(self,masses,tol=1.0e-8,max_iter=50,calc_mvsr=True):
+        """
+        Compute the star for each gravitational mass (in solar
+        masses) in ``masses`` and its Love number and tidal
+        deformability with :class:`tov_love`.
+
+        The mass-radius curve is computed once with :meth:`mvsr()`,
+        or, if ``calc_mvsr`` is false, the curve from the last call
+        to :meth:`mvsr()` is used. Each target mass is then bracketed
+        by two stars on the curve below the maximum mass, and the
+        central pressure is found by false position in the logarithm
+        of the central pressure, using :meth:`fixed_pr()` until the
+        mass is within ``tol`` times the target or after
+        ``max_iter`` iterations. Unlike :meth:`fixed()`, the maximum
+        mass is not recomputed for each target.
+
+        Returns: a :class:`table_units` object with one row for each
+        element of ``masses`` and columns ``gm``, the radius ``r``,
+        the central pressure ``pr``, the Love number ``k2`` and the
+        dimensionless tidal deformability ``lambda``. The values are
+        ``nan`` for masses which are not on the curve or for which
+        the solver fails.
+        """
+        masses=numpy.asarray(masses,dtype=numpy.double)
+        data={col: numpy.full(len(masses),numpy.nan)
+              for col in ['gm','r','pr','k2','lambda']}
+        units={'gm': 'Msun','r': 'km','pr': 'Msun/km^3'}
+        if calc_mvsr and self.mvsr()!=0:
+            return table.from_numpy(self._link,data,units)
+        # Convert a copy of the central pressures, leaving the results
+        # table unchanged
+        tab=self.get_results()
+        curve=tab.to_numpy(['gm','pr'],copy=True)
+        unit=tab.get_unit('pr').decode('utf-8')
+        if unit!='' and unit!='Msun/km^3':
+            cu=self._link.o2scl_settings.get_convert_units()
+            curve['pr']*=cu.convert(unit,'Msun/km^3',1.0)
+        k=numpy.argmax(curve['gm'])
+        m=curve['gm'][0:k+1]
+        x=numpy.log(curve['pr'][0:k+1])
+
+        fc=find_constants(self._link)
+        twoG=fc.find_unique('schwarz','m')/1.0e3
+        tl=tov_love(self._link)
+        tl.err_nonconv=self.err_nonconv
+        for j in range(0,len(masses)):
+            mass=masses[j]
+            i=numpy.searchsorted(m,mass)
+            if i==0 or i>=len(m):
+                continue
+            lo,hi=x[i-1],x[i]
+            flo,fhi=m[i-1]-mass,m[i]-mass
+            side=0
+            found=False
+            for it in range(0,max_iter):
+                xn=(lo*fhi-hi*flo)/(fhi-flo)
+                if self.fixed_pr(numpy.exp(xn))!=0:
+                    break
+                fn=self.mass-mass
+                if abs(fn)<tol*mass:
+                    found=True
+                    break
+                # Halve the value at the end which is kept twice in
+                # a row (the Illinois method)
+                if fn>0.0:
+                    hi,fhi=xn,fn
+                    if side==1:
+                        flo/=2.0
+                    side=1
+                else:
+                    lo,flo=xn,fn
+                    if side==-1:
+                        fhi/=2.0
+                    side=-1
+            if not found:
+                continue
+            rad=self.rad
+            ret,k2,lam=_tidal_deformability(tl,self.get_results(),
+                                            self.mass,twoG)
+            if ret!=0:
+                continue
+            data['gm'][j]=self.mass
+            data['r'][j]=rad
+            data['pr'][j]=numpy.exp(xn)
+            data['k2'][j]=k2
+            data['lambda'][j]=lam
+        return table.from_numpy(self._link,data,units)
+
 
 class tov_love:
     """
@@ -3514,9 +3783,8 @@ class tov_love:
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_tov_love
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_tov_love',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -3530,8 +3798,8 @@ class tov_love:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_tov_love
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_tov_love',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -3552,9 +3820,8 @@ class tov_love:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_get_show_ode
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_get_show_ode',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @show_ode.setter
@@ -3562,8 +3829,8 @@ class tov_love:
         """
         Setter function for tov_love::show_ode .
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_set_show_ode
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_set_show_ode',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -3572,9 +3839,8 @@ class tov_love:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_get_addl_testing
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_get_addl_testing',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @addl_testing.setter
@@ -3582,8 +3848,8 @@ class tov_love:
         """
         Setter function for tov_love::addl_testing .
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_set_addl_testing
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_set_addl_testing',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -3592,9 +3858,8 @@ class tov_love:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_get_err_nonconv
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_get_err_nonconv',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @err_nonconv.setter
@@ -3602,8 +3867,8 @@ class tov_love:
         """
         Setter function for tov_love::err_nonconv .
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_set_err_nonconv
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_set_err_nonconv',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -3611,8 +3876,8 @@ class tov_love:
         """
         Get object of type :class:`table_units<>`
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_get_results
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_get_results',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,results._ptr)
         return
 
@@ -3620,8 +3885,8 @@ class tov_love:
         """
         Set object of type :class:`table_units<>`
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_set_results
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_set_results',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -3630,9 +3895,8 @@ class tov_love:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_get_delta
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_get_delta',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @delta.setter
@@ -3640,8 +3904,8 @@ class tov_love:
         """
         Setter function for tov_love::delta .
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_set_delta
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_set_delta',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3650,9 +3914,8 @@ class tov_love:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_get_eps
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_get_eps',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @eps.setter
@@ -3660,8 +3923,8 @@ class tov_love:
         """
         Setter function for tov_love::eps .
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_set_eps
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_set_eps',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3670,8 +3933,8 @@ class tov_love:
         Object of type :class:`table_units<>`
         """
         sp=shared_ptr_table_units(self._link)
-        func=self._link.o2scl_eos.o2scl_tov_love_get_tab
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_get_tab',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,sp._s_ptr)
         return
 
@@ -3679,8 +3942,8 @@ class tov_love:
         """
         Set object of type :class:`table_units<>`
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_set_tab
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_set_tab',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._s_ptr)
         return
 
@@ -3690,9 +3953,8 @@ class tov_love:
         | *tabulate*: ``bool``
         | Returns: a Python int, a Python float, a Python float, a Python float, a Python float, a Python float
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_calc_y
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_calc_y',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.c_bool])
         yR_conv=ctypes.c_double(0)
         beta_conv=ctypes.c_double(0)
         k2_conv=ctypes.c_double(0)
@@ -3706,16 +3968,16 @@ class tov_love:
         | Parameters:
         | *rd*: ``double``
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_add_disc
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_add_disc',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,rd)
         return
 
     def clear_discs(self):
         """
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_clear_discs
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_clear_discs',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -3724,9 +3986,8 @@ class tov_love:
         | Parameters:
         | Returns: a Python int, a Python float, a Python float, a Python float, a Python float, a Python float
         """
-        func=self._link.o2scl_eos.o2scl_tov_love_calc_H
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl_eos','o2scl_tov_love_calc_H',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)])
         yR_conv=ctypes.c_double(0)
         beta_conv=ctypes.c_double(0)
         k2_conv=ctypes.c_double(0)
@@ -3758,9 +4019,8 @@ class nstar_cold:
         """
 
         if pointer==0:
-            f=link.o2scl_eos.o2scl_create_nstar_cold
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_eos','o2scl_create_nstar_cold',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -3774,8 +4034,8 @@ class nstar_cold:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_eos.o2scl_free_nstar_cold
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_eos','o2scl_free_nstar_cold',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -3796,9 +4056,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_pressure_dec_nb
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_pressure_dec_nb',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @pressure_dec_nb.setter
@@ -3806,8 +4065,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::pressure_dec_nb .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_pressure_dec_nb
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_pressure_dec_nb',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3816,9 +4075,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_allow_urca_nb
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_allow_urca_nb',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @allow_urca_nb.setter
@@ -3826,8 +4084,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::allow_urca_nb .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_allow_urca_nb
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_allow_urca_nb',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3836,9 +4094,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_deny_urca_nb
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_deny_urca_nb',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @deny_urca_nb.setter
@@ -3846,8 +4103,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::deny_urca_nb .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_deny_urca_nb
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_deny_urca_nb',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3856,9 +4113,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_acausal_nb
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_acausal_nb',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @acausal_nb.setter
@@ -3866,8 +4122,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::acausal_nb .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_acausal_nb
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_acausal_nb',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3876,9 +4132,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_acausal_ed
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_acausal_ed',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @acausal_ed.setter
@@ -3886,8 +4141,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::acausal_ed .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_acausal_ed
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_acausal_ed',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3896,9 +4151,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_acausal_pr
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_acausal_pr',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @acausal_pr.setter
@@ -3906,8 +4160,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::acausal_pr .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_acausal_pr
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_acausal_pr',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3916,9 +4170,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_eos_neg
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_eos_neg',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @eos_neg.setter
@@ -3926,8 +4179,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::eos_neg .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_eos_neg
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_eos_neg',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -3936,9 +4189,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_verbose
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_verbose',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @verbose.setter
@@ -3946,8 +4198,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::verbose .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_verbose
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_verbose',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -3956,9 +4208,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_nb_start
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_nb_start',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @nb_start.setter
@@ -3966,8 +4217,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::nb_start .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_nb_start
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_nb_start',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3976,9 +4227,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_nb_end
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_nb_end',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @nb_end.setter
@@ -3986,8 +4236,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::nb_end .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_nb_end
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_nb_end',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -3996,9 +4246,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_dnb
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_dnb',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dnb.setter
@@ -4006,8 +4255,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::dnb .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_dnb
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_dnb',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -4016,9 +4265,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_max_row
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_max_row',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @max_row.setter
@@ -4026,8 +4274,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::max_row .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_max_row
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_max_row',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -4036,9 +4284,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_remove_rows
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_remove_rows',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @remove_rows.setter
@@ -4046,8 +4293,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::remove_rows .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_remove_rows
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_remove_rows',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -4056,9 +4303,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_include_muons
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_include_muons',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @include_muons.setter
@@ -4066,8 +4312,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::include_muons .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_include_muons
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_include_muons',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -4076,9 +4322,8 @@ class nstar_cold:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_err_nonconv
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_err_nonconv',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @err_nonconv.setter
@@ -4086,8 +4331,8 @@ class nstar_cold:
         """
         Setter function for nstar_cold::err_nonconv .
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_err_nonconv
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_err_nonconv',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -4096,8 +4341,8 @@ class nstar_cold:
         | Parameters:
         | *eos*: :class:`eos_had_base` object
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_set_eos
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_set_eos',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,eos._ptr)
         return
 
@@ -4107,9 +4352,8 @@ class nstar_cold:
         | *np_0* =0.0: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_calc_eos
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_calc_eos',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,np_0)
         return ret
 
@@ -4117,9 +4361,8 @@ class nstar_cold:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_calc_nstar
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_calc_nstar',
+                                 ctypes.c_int,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -4129,9 +4372,8 @@ class nstar_cold:
         | *target_mass*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_fixed
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_fixed',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,target_mass)
         return ret
 
@@ -4139,9 +4381,8 @@ class nstar_cold:
         """
         | Returns: :class:`shared_ptr_table_units`.
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_eos_results
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_eos_results',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
         sp=shared_ptr_table_units(self._link,func(self._ptr))
         return sp
 
@@ -4149,12 +4390,282 @@ class nstar_cold:
         """
         | Returns: :class:`shared_ptr_table_units`.
         """
-        func=self._link.o2scl_eos.o2scl_nstar_cold_get_tov_results
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_eos','o2scl_nstar_cold_get_tov_results',
+                                 ctypes.c_void_p,[ctypes.c_void_p])
         sp=shared_ptr_table_units(self._link,func(self._ptr))
         return sp
 
+    def fixed_many(self,masses,tol=1.0e-8,max_iter=50,ts=None):
+        """
+        Compute the radius, the Love number and the tidal
+        deformability for each gravitational mass in ``masses`` with
+        :meth:`tov_solve.fixed_many()`, so that the maximum mass is
+        only computed once. The EOS from the last call to
+        :meth:`calc_eos()` is used with a new :class:`eos_tov_interp`
+        object and the default crust.
+
+        The TOV solver used by this object is not accessible from
+        Python, so the stars are computed with the :class:`tov_solve`
+        object ``ts``, or, if ``ts`` is ``None``, with a new object
+        with the default settings. If the TOV solver of this object
+        or the crust has been modified in C++, the results may differ
+        from those of :meth:`fixed()`.
+
+        Returns: a :class:`table_units` object (see
+        :meth:`tov_solve.fixed_many()`)
+        """
+        eti=eos_tov_interp(self._link)
+        eti.err_nonconv=self.err_nonconv
+        eti.read_table(self.get_eos_results(),'ed','pr','nb')
+        if ts is None:
+            ts=tov_solve(self._link)
+            ts.err_nonconv=self.err_nonconv
+        ts.set_eos(eti)
+        return ts.fixed_many(masses,tol,max_iter)
+
+
+class tov_result_cache:
+    """
+    An opt-in cache for the mass-radius curves computed by
+    :meth:`tov_solve.mvsr()`. The cache is used through the
+    module-level object ``tov_cache``, which is disabled until
+    :meth:`enable()` is called.
+
+    Results are only cached when the EOS is an
+    :class:`eos_tov_interp` object. The key is a hash of the EOS
+    columns and units given to :meth:`eos_tov_interp.read_table()`
+    or of the arrays given to :meth:`eos_tov_interp.read_arrays()`,
+    the crust choice, the settings ``prbegin``, ``prend``,
+    ``princ``, ``step_min``, ``step_max``, ``step_start``,
+    ``gen_rel``, ``ang_vel``, ``calc_gpot``, ``reformat_results`` and
+    ``max_table_size`` of :class:`tov_solve`, and the
+    O\ :sub:`2`\ scl version. The EOS is only hashed if the cache
+    is enabled when it is read, and results for an EOS read while the
+    cache is disabled are not cached (see
+    :meth:`eos_tov_interp._hash()`).
+
+    The most recently used tables are kept in memory, up to
+    :attr:`max_memory` tables. All tables are also stored on disk as
+    a ``.npy`` file with the data and a ``.json`` file with the
+    column names and units. When the total size of the ``.npy`` files
+    exceeds :attr:`max_bytes`, the least recently used tables are
+    removed. Files are written to a temporary name and then renamed,
+    so many processes may share the same cache directory.
+
+    The number of lookups which were found in memory, found on disk,
+    or not found are counted in :attr:`memory_hits`,
+    :attr:`disk_hits` and :attr:`misses`.
+    """
+
+    enabled=False
+    """
+    If true, then the cache is used by :meth:`tov_solve.mvsr()`
+    """
+
+    directory=user_cache_dir('tov')
+    """
+    The cache directory
+    """
+
+    max_bytes=256*1024*1024
+    """
+    The maximum total size of the ``.npy`` files in the cache
+    """
+
+    max_memory=64
+    """
+    The maximum number of tables kept in memory
+    """
+
+    memory_hits=0
+    """
+    The number of tables found in memory
+    """
+
+    disk_hits=0
+    """
+    The number of tables found on disk
+    """
+
+    misses=0
+    """
+    The number of tables not found
+    """
+
+    def __init__(self):
+        self._memory=collections.OrderedDict()
+        return
+
+    def enable(self,directory=None,max_bytes=None,max_memory=None):
+        """
+        Enable the cache, optionally setting the cache directory, the
+        maximum total size in bytes of the files, and the maximum
+        number of tables in memory
+        """
+        if directory is not None:
+            self.directory=directory
+        if max_bytes is not None:
+            self.max_bytes=max_bytes
+        if max_memory is not None:
+            self.max_memory=max_memory
+        self.enabled=True
+        return
+
+    def disable(self):
+        """
+        Disable the cache. Tables already in the cache are kept.
+        """
+        self.enabled=False
+        return
+
+    def clear(self):
+        """
+        Remove all tables from memory and from the cache directory
+        """
+        self._memory.clear()
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith('.npy') or name.endswith('.json'):
+                    os.remove(os.path.join(self.directory,name))
+        return
+
+    def stats(self):
+        """
+        Return a dictionary with the counters :attr:`memory_hits`,
+        :attr:`disk_hits` and :attr:`misses`
+        """
+        return {'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,'misses': self.misses}
+
+    def reset_stats(self):
+        """
+        Set the counters :attr:`memory_hits`, :attr:`disk_hits` and
+        :attr:`misses` to zero
+        """
+        self.memory_hits=0
+        self.disk_hits=0
+        self.misses=0
+        return
+
+    @staticmethod
+    def eos_hash(eos,columns):
+        """
+        Return a hash of the data and units of the columns named in
+        ``columns`` (empty names are skipped) of the table ``eos``
+        """
+        h=hashlib.sha256()
+        nlines=eos.get_nlines()
+        for col in columns:
+            col=force_bytes(col)
+            if col==b'':
+                continue
+            h.update(col+b'\0')
+            if isinstance(eos,table_units):
+                h.update(force_bytes(eos.get_unit(col))+b'\0')
+            h.update(numpy.ascontiguousarray(eos[col][0:nlines]).tobytes())
+        return h.hexdigest()
+
+    @staticmethod
+    def arrays_hash(arrays):
+        """
+        Return a hash of the dictionary ``arrays`` of ``numpy`` arrays
+        in internal units from :meth:`eos_tov_interp.read_arrays()`
+        (``None`` values are skipped)
+        """
+        h=hashlib.sha256()
+        for name in sorted(arrays):
+            if arrays[name] is None:
+                continue
+            h.update(name.encode('utf-8')+b'\0')
+            h.update(arrays[name].tobytes())
+        return h.hexdigest()
+
+    def key(self,ts):
+        """
+        Return the key for the current EOS and settings of the
+        :class:`tov_solve` object ``ts``, or ``None`` if the cache is
+        disabled or the results cannot be cached
+        """
+        if self.enabled==False:
+            return None
+        eos=ts._eos
+        if not isinstance(eos,eos_tov_interp) or eos._hash() is None:
+            return None
+        key=[eos._hash(),eos._crust,ts.prbegin,ts.prend,ts.princ,
+             ts.step_min,ts.step_max,ts.step_start,ts.gen_rel,
+             ts.ang_vel,ts.calc_gpot,ts.reformat_results,
+             ts.max_table_size,
+             ts._link.o2scl_settings.o2scl_version().decode('utf-8')]
+        return hashlib.sha256(json.dumps(key).encode('utf-8')).hexdigest()
+
+    def load(self,ts,key):
+        """
+        If the table with key ``key`` is in the cache, copy it to the
+        results table of the :class:`tov_solve` object ``ts`` and
+        return true. Otherwise, return false.
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            names,units,data=self._memory[key]
+            self.memory_hits+=1
+        else:
+            path=os.path.join(self.directory,'tov_'+key[0:24])
+            try:
+                with open(path+'.json') as f:
+                    info=json.load(f)
+                data=numpy.load(path+'.npy')
+                # Update the modification time for least-recently-used
+                # removal. This fails if the file was removed by another
+                # process after it was read.
+                os.utime(path+'.npy')
+            except (OSError,ValueError):
+                self.misses+=1
+                return False
+            names=info['names']
+            units=info['units']
+            self._remember(key,names,units,data)
+            self.disk_hits+=1
+        tab=ts.get_results()
+        tab.clear()
+        for i in range(0,len(names)):
+            tab.set_column(names[i],data[i])
+            tab.set_unit(names[i],units[i])
+        return True
+
+    def store(self,ts,key):
+        """
+        Store the results table of the :class:`tov_solve` object
+        ``ts`` with key ``key`` and then remove the least recently
+        used tables if the cache is too large
+        """
+        tab=ts.get_results()
+        names=[name.decode('utf-8') for name in tab._column_names()]
+        units=[tab.get_unit(name).decode('utf-8') for name in names]
+        nlines=tab.get_nlines()
+        data=numpy.empty((len(names),nlines))
+        for i in range(0,len(names)):
+            data[i]=tab[names[i]][0:nlines]
+        self._remember(key,names,units,data)
+
+        path=os.path.join(self.directory,'tov_'+key[0:24])
+        info={'names': names,'units': units}
+        atomic_write(path+'.json',lambda f: json.dump(info,f))
+        atomic_write(path+'.npy',lambda f: numpy.save(f,data),True)
+        evict_lru(self.directory,self.max_bytes)
+        return
+
+    def _remember(self,key,names,units,data):
+        """
+        Add a table to the memory tier, removing the least recently
+        used tables if there are more than :attr:`max_memory`
+        """
+        self._memory[key]=(names,units,data)
+        self._memory.move_to_end(key)
+        while len(self._memory)>self.max_memory:
+            self._memory.popitem(last=False)
+        return
+
+tov_cache=tov_result_cache()
 
 def skyrme_load(link,sk,model,external=False,verbose=0):
     """
@@ -4166,8 +4677,8 @@ def skyrme_load(link,sk,model,external=False,verbose=0):
         | *verbose*: ``int``
     """
     model_=ctypes.c_char_p(force_bytes(model))
-    func=link.o2scl_eos.o2scl_skyrme_load_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool,ctypes.c_int]
+    func=link.get_func('o2scl_eos','o2scl_skyrme_load_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool,ctypes.c_int])
     func(sk._ptr,model_,external,verbose)
     return
 
@@ -4180,8 +4691,353 @@ def rmf_load(link,rmf,model,external=False):
         | *external*: ``bool``
     """
     model_=ctypes.c_char_p(force_bytes(model))
-    func=link.o2scl_eos.o2scl_rmf_load_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool]
+    func=link.get_func('o2scl_eos','o2scl_rmf_load_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool])
     func(rmf._ptr,model_,external)
     return
 
+
+def _saturation_worker(link,item):
+    """
+    Compute the saturation properties of the model ``item[1]`` of the
+    class named ``item[0]`` in a worker process for
+    :func:`survey_saturation()`
+
+    Returns: the value returned by :meth:`eos_had_base.saturation()`
+    and a dictionary of the saturation properties, which are NaN if
+    the saturation point was not found
+    """
+    cls,model=item
+    eos=globals()[cls](link)
+    if cls=='eos_had_rmf':
+        rmf_load(link,eos,model)
+    else:
+        skyrme_load(link,eos,model)
+    eos.err_nonconv=False
+    ret=eos.saturation()
+    if ret!=0:
+        return ret,{fld: numpy.nan for fld in _saturation_units}
+    return 0,{'n0': eos.n0,'eoa': eos.eoa,'comp': eos.comp,
+              'esym': eos.esym,'msom': eos.msom,'kprime': eos.kprime,
+              'fesym_slope': eos.fesym_slope(eos.n0)}
+
+_saturation_units={'n0': '1/fm^3','eoa': '1/fm','comp': '1/fm',
+                   'esym': '1/fm','msom': '','kprime': '1/fm',
+                   'fesym_slope': '1/fm'}
+
+def survey_saturation(models,eos_class,processes=None,link=None,
+                      cache_dir=None,use_cache=True,as_table=False):
+    """
+    Compute the saturation density ``n0``, the binding energy ``eoa``,
+    the incompressibility ``comp``, the symmetry energy ``esym``, the
+    effective mass ``msom``, the skewness ``kprime``, and the slope
+    of the symmetry energy ``fesym_slope`` for each model name in
+    ``models``. The class ``eos_class`` is either
+    :class:`eos_had_skyrme`, in which case the models are loaded with
+    :func:`skyrme_load()`, or :class:`eos_had_rmf`, in which case
+    they are loaded with :func:`rmf_load()`. Energies are in units of
+    ``1/fm`` and ``n0`` is in units of ``1/fm^3``.
+
+    The models are computed in parallel with a
+    :class:`pool.process_pool` object with ``processes`` workers.
+    If ``use_cache`` is true, the results for each model are stored
+    in the directory ``cache_dir`` (by default ``o2sclpy/saturation``
+    in the user cache directory), keyed by the class, the model name
+    and the O\ :sub:`2`\ scl version, and are not recomputed.
+
+    If the saturation point of a model is not found, its quantities
+    are NaN and it is not stored in the cache.
+
+    If ``link`` is ``None``, the linker from
+    :func:`default_linker()` is used.
+
+    Returns: a ``numpy`` structured array with one row for each model
+    and fields ``model`` and the quantities above, or, if
+    ``as_table`` is true, a :class:`table_units` object with a
+    column with units for each quantity. The rows are in the order
+    of ``models`` in both cases, since a table cannot hold the model
+    names.
+    """
+    from o2sclpy.link_o2scl import default_linker
+    from o2sclpy.pool import process_pool
+    if link is None:
+        link=default_linker()
+    cls=eos_class.__name__
+    if cls not in ['eos_had_skyrme','eos_had_rmf']:
+        raise ValueError('Class '+cls+' not supported in '+
+                         'survey_saturation().')
+    models=[force_bytes(model).decode('utf-8') for model in models]
+
+    if cache_dir is None:
+        cache_dir=user_cache_dir('saturation')
+    version=link.o2scl_settings.o2scl_version().decode('utf-8')
+
+    def cache_path(model):
+        key=json.dumps([cls,model,version]).encode('utf-8')
+        return os.path.join(cache_dir,cls+'_'+
+                            hashlib.sha256(key).hexdigest()[0:24]+'.json')
+
+    results={}
+    if use_cache:
+        for model in models:
+            try:
+                with open(cache_path(model)) as f:
+                    results[model]=json.load(f)
+            except (OSError,ValueError):
+                pass
+
+    todo=[model for model in dict.fromkeys(models) if model not in results]
+    if len(todo)>0:
+        with process_pool(processes,link) as pp:
+            res=pp.map(_saturation_worker,[(cls,model) for model in todo])
+        for i in range(0,len(todo)):
+            results[todo[i]]=res[i][1]
+            # Models for which the saturation point was not found are
+            # computed again in the next call
+            if use_cache and res[i][0]==0:
+                atomic_write(cache_path(todo[i]),
+                             lambda f: json.dump(res[i][1],f))
+
+    fields=list(_saturation_units.keys())
+    width=max([len(model) for model in models]+[1])
+    ret=numpy.zeros(len(models),dtype=[('model','U'+str(width))]+
+                    [(fld,numpy.double) for fld in fields])
+    for i in range(0,len(models)):
+        ret['model'][i]=models[i]
+        for fld in fields:
+            ret[fld][i]=results[models[i]][fld]
+    if as_table:
+        return table.from_numpy(link,{fld: ret[fld] for fld in fields},
+                                _saturation_units)
+    return ret
+
+def _tidal_deformability(tl,prof,mass,twoG):
+    """
+    Compute the Love number and the dimensionless tidal
+    deformability of the star with gravitational mass ``mass`` (in
+    solar masses) from the profile table ``prof`` with the
+    :class:`tov_love` object ``tl``. The value ``twoG`` is the
+    Schwarzschild radius of the sun in km.
+
+    Returns: the value returned by :meth:`tov_love.calc_y()`, the
+    Love number ``k2``, and the dimensionless tidal deformability
+    """
+    prof.convert_to_unit('ed','Msun/km^3',True)
+    prof.convert_to_unit('pr','Msun/km^3',True)
+    prof.deriv_col('ed','pr','cs2')
+    tl.set_tab(prof)
+    (ret,yR,beta,k2,lambda_km5,lambda_cgs)=tl.calc_y(False)
+    return ret,k2,lambda_km5/(mass*twoG/2.0)**5
+
+def _mr_worker(link,item):
+    """
+    Compute the mass-radius curve, the central densities and the
+    tidal deformabilities for the EOS specification ``item[0]`` at
+    the masses ``item[1]`` in a worker process for
+    :func:`mr_ensemble()`
+    """
+    spec,masses=item
+    eti=eos_tov_interp(link)
+    eti.err_nonconv=False
+    if spec[0]=='table':
+        eti.read_arrays(spec[1]['ed'],spec[1]['pr'],spec[1].get('nb'),
+                        'Msun/km^3' if spec[2] is None else spec[2])
+    else:
+        if spec[0]=='skyrme':
+            eos=eos_had_skyrme(link)
+            load=skyrme_load
+        else:
+            eos=eos_had_rmf(link)
+            load=rmf_load
+        if 'model' in spec[1]:
+            load(link,eos,spec[1]['model'])
+        for name in spec[1]:
+            if name!='model':
+                setattr(eos,name,spec[1][name])
+        nc=nstar_cold(link)
+        nc.err_nonconv=False
+        nc.set_eos(eos)
+        ret=nc.calc_eos()
+        if ret!=0:
+            return ret,None,None,None
+        eti.read_table(nc.get_eos_results(),'ed','pr','nb')
+
+    ts=tov_solve(link)
+    ts.err_nonconv=False
+    ts.set_eos(eti)
+    ret=ts.mvsr()
+    if ret!=0:
+        return ret,None,None,None
+
+    # The results table is reused for each fixed mass, so copy the
+    # mass-radius curve first
+    tab=ts.get_results()
+    curve=tab.to_numpy(copy=True)
+    units={name: tab.get_unit(name) for name in curve}
+    mr=table.from_numpy(link,{c: curve[c] for c in ['gm','r','bm']
+                              if c in curve},
+                        {c: units[c] for c in ['gm','r','bm']
+                         if c in curve})
+    cd=table.from_numpy(link,{c: curve[c] for c in ['gm','ed','pr','nb']
+                              if c in curve},
+                        {c: units[c] for c in ['gm','ed','pr','nb']
+                         if c in curve})
+    lm=ts.fixed_many(masses,calc_mvsr=False)
+    return 0,mr,cd,lm
+
+def _mr_spec(spec):
+    """
+    Check the EOS specification ``spec`` for :func:`mr_ensemble()`
+    and convert it to the form used by :func:`_mr_worker()`
+    """
+    if spec[0] in ['skyrme','rmf']:
+        cls=eos_had_skyrme if spec[0]=='skyrme' else eos_had_rmf
+        params=spec[1]
+        if not isinstance(params,dict):
+            params={'model': force_bytes(params).decode('utf-8')}
+        for name in params:
+            if name!='model' and not isinstance(getattr(cls,name,None),
+                                                property):
+                raise ValueError('Parameter '+name+' not found in class '+
+                                 cls.__name__+' in mr_ensemble().')
+        return (spec[0],params)
+    if spec[0]=='table':
+        if isinstance(spec[1],table):
+            data=spec[1].to_numpy(copy=True)
+            units=None
+            if isinstance(spec[1],table_units):
+                units={name: spec[1].get_unit(name).decode('utf-8')
+                       for name in data}
+        else:
+            data={name: numpy.array(spec[1][name],dtype=numpy.double)
+                  for name in spec[1]}
+            units=None
+            if len(spec)>2 and spec[2] is not None:
+                units={name: force_bytes(spec[2][name]).decode('utf-8')
+                       for name in spec[2]}
+        if 'ed' not in data or 'pr' not in data:
+            raise ValueError('EOS tables require columns ed and pr '+
+                             'in mr_ensemble().')
+        return ('table',data,units)
+    raise ValueError('EOS type '+str(spec[0])+' not supported in '+
+                     'mr_ensemble().')
+
+def _mr_key(spec,masses):
+    """
+    Return a string which identifies the EOS specification ``spec``
+    (after :func:`_mr_spec()`) and the masses ``masses`` for
+    :func:`mr_ensemble()`
+    """
+    h=hashlib.sha256()
+    h.update(json.dumps(spec[0]).encode('utf-8'))
+    if spec[0]=='table':
+        for name in sorted(spec[1]):
+            h.update(name.encode('utf-8'))
+            h.update(spec[1][name].tobytes())
+        h.update(json.dumps(spec[2],sort_keys=True).encode('utf-8'))
+    else:
+        h.update(json.dumps(spec[1],sort_keys=True).encode('utf-8'))
+    h.update(masses.tobytes())
+    return h.hexdigest()
+
+def mr_ensemble(specs,filename,masses=None,processes=None,link=None):
+    """
+    Compute the mass-radius curve, the central densities and the
+    tidal deformabilities of neutron stars for each EOS
+    specification in ``specs`` and store them in the HDF5 file
+    ``filename``. Each specification is one of
+
+    - ``('skyrme',model)`` or ``('rmf',model)``, where ``model`` is
+      a model name for :func:`skyrme_load()` or :func:`rmf_load()`,
+      or a dictionary of parameters, e.g. ``{'model': 'SLy4',
+      't0': -10.0}``, where the optional ``model`` is loaded first
+      and the other entries are set as properties of
+      :class:`eos_had_skyrme` or :class:`eos_had_rmf`. The
+      beta-equilibrium EOS is computed with
+      :meth:`nstar_cold.calc_eos()`.
+    - ``('table',data,units)``, where ``data`` is a dictionary of
+      ``numpy`` arrays with columns ``ed``, ``pr`` and optionally
+      ``nb`` and ``units`` is a dictionary of unit strings (or
+      ``None``), or ``('table',tab)`` for a :class:`table_units`
+      object.
+
+    The EOS is used with :class:`eos_tov_interp` and the default
+    crust, and the stars are computed with :class:`tov_solve`. The
+    tidal deformabilities are computed with
+    :meth:`tov_solve.fixed_many()` for each element of ``masses``
+    (in solar masses, by default from 1.0 to 2.4 in steps of 0.1).
+
+    The specifications are computed in parallel with a
+    :class:`pool.process_pool` object with ``processes`` workers.
+    For the specification with index ``i``, the table ``mr_i``
+    contains the gravitational mass ``gm``, the radius ``r`` and the
+    baryonic mass ``bm``, the table ``cd_i`` contains ``gm`` and the
+    central energy density ``ed``, pressure ``pr`` and baryon
+    density ``nb``, and the table ``lm_i`` contains ``gm``, ``r``,
+    the central pressure ``pr``, the Love number ``k2`` and the
+    dimensionless tidal deformability ``lambda``, with one row for
+    each element of ``masses`` (with ``nan`` values for masses above
+    the maximum mass). The integer ``status_i`` is the value returned by
+    the solver (the tables are only written if it is zero) and the
+    string ``key_i`` identifies the specification and the masses.
+
+    Each result is written as soon as it is finished and the file is
+    closed after each one. If the file already contains results, then
+    the specifications with a matching ``key_i`` are not recomputed,
+    so an interrupted computation can be continued by calling this
+    function again with the same arguments.
+
+    If ``link`` is ``None``, the linker from
+    :func:`default_linker()` is used.
+
+    Returns: a ``numpy`` array of the value of ``status_i`` for each
+    specification
+    """
+    from o2sclpy.link_o2scl import default_linker
+    from o2sclpy.pool import process_pool
+    from o2sclpy.hdf import hdf_file, hdf_output_table_units
+    if link is None:
+        link=default_linker()
+    if masses is None:
+        masses=numpy.arange(10,25)/10.0
+    masses=numpy.array(masses,dtype=numpy.double)
+    specs=[_mr_spec(spec) for spec in specs]
+    keys=[_mr_key(spec,masses) for spec in specs]
+
+    hf=hdf_file(link)
+    s=std_string(link)
+    status=numpy.zeros(len(specs),dtype=numpy.intc)
+    todo=[]
+    hf.open_or_create(filename)
+    for i in range(0,len(specs)):
+        if hf.find_object_by_name('key_'+str(i),s)==0:
+            hf.gets('key_'+str(i),s)
+            if s.to_bytes().decode('utf-8')!=keys[i]:
+                hf.close()
+                raise ValueError('Specification '+str(i)+' does not '+
+                                 'match the results in file '+
+                                 str(filename)+' in mr_ensemble().')
+            status[i]=hf.geti('status_'+str(i))[1]
+        else:
+            todo.append(i)
+    hf.close()
+
+    if len(todo)>0:
+        with process_pool(processes,link) as pp:
+            for j,res in pp.imap_unordered(_mr_worker,
+                                           [(specs[i],masses)
+                                            for i in todo]):
+                i=todo[j]
+                ret,mr,cd,lm=res
+                hf.open_or_create(filename)
+                if ret==0:
+                    hdf_output_table_units(link,hf,mr,'mr_'+str(i))
+                    hdf_output_table_units(link,hf,cd,'cd_'+str(i))
+                    hdf_output_table_units(link,hf,lm,'lm_'+str(i))
+                hf.seti('status_'+str(i),ret)
+                # The key is written last, so that an interrupted
+                # write is recomputed
+                hf.sets('key_'+str(i),keys[i])
+                hf.close()
+                status[i]=ret
+    return status
@@ -49,9 +49,8 @@ class hdf_file:
         """
 
         if pointer==0:
-            f=link.o2scl_hdf.o2scl_hdf_create_hdf_file
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_hdf','o2scl_hdf_create_hdf_file',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -65,8 +64,8 @@ class hdf_file:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_hdf.o2scl_hdf_free_hdf_file
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_hdf','o2scl_hdf_free_hdf_file',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -87,9 +86,8 @@ class hdf_file:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_get_compr_type
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_get_compr_type',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @compr_type.setter
@@ -97,8 +95,8 @@ class hdf_file:
         """
         Setter function for hdf_file::compr_type .
         """
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_set_compr_type
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_set_compr_type',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -107,9 +105,8 @@ class hdf_file:
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_get_min_compr_size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_get_min_compr_size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @min_compr_size.setter
@@ -117,8 +114,8 @@ class hdf_file:
         """
         Setter function for hdf_file::min_compr_size .
         """
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_set_min_compr_size
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_set_min_compr_size',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -126,9 +123,8 @@ class hdf_file:
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_has_write_access
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_has_write_access',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -140,8 +136,8 @@ class hdf_file:
         | *err_on_fail* =true: ``bool``
         """
         fname_=ctypes.c_char_p(force_bytes(fname))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_open
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool,ctypes.c_bool]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_open',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool,ctypes.c_bool])
         func(self._ptr,fname_,write_access,err_on_fail)
         return
 
@@ -151,16 +147,16 @@ class hdf_file:
         | *fname*: string
         """
         fname_=ctypes.c_char_p(force_bytes(fname))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_open_or_create
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_open_or_create',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p])
         func(self._ptr,fname_)
         return
 
     def close(self):
         """
         """
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_close
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_close',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -171,9 +167,8 @@ class hdf_file:
         | Returns: a Python int, a Python obj
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_getc
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.c_char)]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_getc',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.c_char)])
         c_conv=ctypes.c_char(0)
         ret=func(self._ptr,name_,ctypes.byref(c_conv))
         return ret,c_conv.value
@@ -185,9 +180,8 @@ class hdf_file:
         | Returns: a Python int, a Python float
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_getd
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_getd',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.c_double)])
         d_conv=ctypes.c_double(0)
         ret=func(self._ptr,name_,ctypes.byref(d_conv))
         return ret,d_conv.value
@@ -199,9 +193,8 @@ class hdf_file:
         | Returns: a Python int, a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_geti
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.c_int)]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_geti',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.c_int)])
         i_conv=ctypes.c_int(0)
         ret=func(self._ptr,name_,ctypes.byref(i_conv))
         return ret,i_conv.value
@@ -213,9 +206,8 @@ class hdf_file:
         | Returns: a Python int, a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_get_szt
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.c_size_t)]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_get_szt',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.c_size_t)])
         u_conv=ctypes.c_size_t(0)
         ret=func(self._ptr,name_,ctypes.byref(u_conv))
         return ret,u_conv.value
@@ -228,10 +220,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        s_=ctypes.c_char_p(force_bytes(s))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_gets
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_gets',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,s._ptr)
         return ret
 
@@ -243,10 +233,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        s_=ctypes.c_char_p(force_bytes(s))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_gets_var
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_gets_var',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,s._ptr)
         return ret
 
@@ -258,10 +246,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        s_=ctypes.c_char_p(force_bytes(s))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_gets_fixed
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_gets_fixed',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,s._ptr)
         return ret
 
@@ -272,8 +258,8 @@ class hdf_file:
         | *c*: ``char``
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_setc
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_setc',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char])
         func(self._ptr,name_,c)
         return
 
@@ -284,8 +270,8 @@ class hdf_file:
         | *d*: ``double``
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_setd
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_setd',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_double])
         func(self._ptr,name_,d)
         return
 
@@ -296,8 +282,8 @@ class hdf_file:
         | *i*: ``int``
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_seti
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_seti',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_int])
         func(self._ptr,name_,i)
         return
 
@@ -308,8 +294,8 @@ class hdf_file:
         | *u*: ``size_t``
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_set_szt
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_set_szt',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_size_t])
         func(self._ptr,name_,u)
         return
 
@@ -321,8 +307,8 @@ class hdf_file:
         """
         name_=ctypes.c_char_p(force_bytes(name))
         s_=ctypes.c_char_p(force_bytes(s))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_sets
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_sets',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,name_,s_)
         return
 
@@ -334,8 +320,8 @@ class hdf_file:
         """
         name_=ctypes.c_char_p(force_bytes(name))
         s_=ctypes.c_char_p(force_bytes(s))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_sets_fixed
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_sets_fixed',
+                                 None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p])
         func(self._ptr,name_,s_)
         return
 
@@ -347,9 +333,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_getd_vec
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_getd_vec',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,v._ptr)
         return ret
 
@@ -361,9 +346,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_geti_vec
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_geti_vec',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,v._ptr)
         return ret
 
@@ -375,9 +359,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_get_szt_vec
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_get_szt_vec',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,v._ptr)
         return ret
 
@@ -389,9 +372,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_gets_vec
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_gets_vec',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,s._ptr)
         return ret
 
@@ -403,9 +385,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_setd_vec
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_setd_vec',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,v._ptr)
         return ret
 
@@ -417,9 +398,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_seti_vec
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_seti_vec',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,v._ptr)
         return ret
 
@@ -431,9 +411,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_set_szt_vec
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_set_szt_vec',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,v._ptr)
         return ret
 
@@ -445,9 +424,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_sets_vec
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_sets_vec',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,s._ptr)
         return ret
 
@@ -459,9 +437,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_getd_ten
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_getd_ten',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,t._ptr)
         return ret
 
@@ -473,9 +450,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_geti_ten
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_geti_ten',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,t._ptr)
         return ret
 
@@ -487,9 +463,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_get_szt_ten
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_get_szt_ten',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,t._ptr)
         return ret
 
@@ -501,9 +476,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_setd_ten
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_setd_ten',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,t._ptr)
         return ret
 
@@ -515,9 +489,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_seti_ten
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_seti_ten',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,t._ptr)
         return ret
 
@@ -529,9 +502,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_set_szt_ten
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_set_szt_ten',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p])
         ret=func(self._ptr,name_,t._ptr)
         return ret
 
@@ -544,10 +516,8 @@ class hdf_file:
         | Returns: a Python int
         """
         type_=ctypes.c_char_p(force_bytes(type))
-        name_=ctypes.c_char_p(force_bytes(name))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_find_object_by_type
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_find_object_by_type',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int])
         ret=func(self._ptr,type_,name._ptr,verbose)
         return ret
 
@@ -560,10 +530,8 @@ class hdf_file:
         | Returns: a Python int
         """
         name_=ctypes.c_char_p(force_bytes(name))
-        type_=ctypes.c_char_p(force_bytes(type))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_find_object_by_name
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_find_object_by_name',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int])
         ret=func(self._ptr,name_,type._ptr,verbose)
         return ret
 
@@ -576,10 +544,8 @@ class hdf_file:
         | Returns: a Python int
         """
         pattern_=ctypes.c_char_p(force_bytes(pattern))
-        type_=ctypes.c_char_p(force_bytes(type))
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_find_object_by_pattern
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_find_object_by_pattern',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int])
         ret=func(self._ptr,pattern_,type._ptr,verbose)
         return ret
 
@@ -588,8 +554,8 @@ class hdf_file:
         | Parameters:
         | *verbose*: ``int``
         """
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_file_list
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_file_list',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,verbose)
         return
 
@@ -599,8 +565,8 @@ class hdf_file:
         | *verbose*: ``int``
         | *hf2*: :class:`hdf_file` object
         """
-        func=self._link.o2scl_hdf.o2scl_hdf_hdf_file_copy
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_hdf','o2scl_hdf_hdf_file_copy',
+                                 None,[ctypes.c_void_p,ctypes.c_int,ctypes.c_void_p])
         func(self._ptr,verbose,hf2._ptr)
         return
 
@@ -614,8 +580,8 @@ def hdf_input_table(link,hf,t,name):
         | *name*: string
     """
     name_=ctypes.c_char_p(force_bytes(name))
-    func=link.o2scl_hdf.o2scl_hdf_hdf_input_table_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_input_table_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p])
     func(hf._ptr,t._ptr,name_)
     return
 
@@ -629,8 +595,8 @@ def hdf_input_n_table(link,hf,t,name):
     """
     name.__del__()
     name._ptr=ctypes.c_void_p()
-    func=link.o2scl_hdf.o2scl_hdf_hdf_input_n_table_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_void_p)]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_input_n_table_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_void_p)])
     func(hf._ptr,t._ptr,ctypes.byref(name._ptr))
     name._owner=True
     return
@@ -644,8 +610,8 @@ def hdf_output_table(link,hf,t,name):
         | *name*: string
     """
     name_=ctypes.c_char_p(force_bytes(name))
-    func=link.o2scl_hdf.o2scl_hdf_hdf_output_table_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_output_table_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p])
     func(hf._ptr,t._ptr,name_)
     return
 
@@ -658,8 +624,8 @@ def hdf_input_table_units(link,hf,t,name):
         | *name*: string
     """
     name_=ctypes.c_char_p(force_bytes(name))
-    func=link.o2scl_hdf.o2scl_hdf_hdf_input_table_units_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_input_table_units_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p])
     func(hf._ptr,t._ptr,name_)
     return
 
@@ -673,8 +639,8 @@ def hdf_input_n_table_units(link,hf,t,name):
     """
     name.__del__()
     name._ptr=ctypes.c_void_p()
-    func=link.o2scl_hdf.o2scl_hdf_hdf_input_n_table_units_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_void_p)]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_input_n_table_units_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_void_p)])
     func(hf._ptr,t._ptr,ctypes.byref(name._ptr))
     name._owner=True
     return
@@ -688,8 +654,8 @@ def hdf_output_table_units(link,hf,t,name):
         | *name*: string
     """
     name_=ctypes.c_char_p(force_bytes(name))
-    func=link.o2scl_hdf.o2scl_hdf_hdf_output_table_units_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_output_table_units_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p])
     func(hf._ptr,t._ptr,name_)
     return
 
@@ -702,8 +668,8 @@ def hdf_input_table3d(link,hf,t,name):
         | *name*: string
     """
     name_=ctypes.c_char_p(force_bytes(name))
-    func=link.o2scl_hdf.o2scl_hdf_hdf_input_table3d_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_input_table3d_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p])
     func(hf._ptr,t._ptr,name_)
     return
 
@@ -717,8 +683,8 @@ def hdf_input_n_table3d(link,hf,t,name):
     """
     name.__del__()
     name._ptr=ctypes.c_void_p()
-    func=link.o2scl_hdf.o2scl_hdf_hdf_input_n_table3d_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_void_p)]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_input_n_table3d_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_void_p)])
     func(hf._ptr,t._ptr,ctypes.byref(name._ptr))
     name._owner=True
     return
@@ -732,8 +698,8 @@ def hdf_output_table3d(link,hf,t,name):
         | *name*: string
     """
     name_=ctypes.c_char_p(force_bytes(name))
-    func=link.o2scl_hdf.o2scl_hdf_hdf_output_table3d_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_output_table3d_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p])
     func(hf._ptr,t._ptr,name_)
     return
 
@@ -746,8 +712,8 @@ def hdf_input_uniform_grid(link,hf,t,name):
         | *name*: string
     """
     name_=ctypes.c_char_p(force_bytes(name))
-    func=link.o2scl_hdf.o2scl_hdf_hdf_input_uniform_grid_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_input_uniform_grid_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p])
     func(hf._ptr,t._ptr,name_)
     return
 
@@ -761,8 +727,8 @@ def hdf_input_n_uniform_grid(link,hf,t,name):
     """
     name.__del__()
     name._ptr=ctypes.c_void_p()
-    func=link.o2scl_hdf.o2scl_hdf_hdf_input_n_uniform_grid_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_void_p)]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_input_n_uniform_grid_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_void_p)])
     func(hf._ptr,t._ptr,ctypes.byref(name._ptr))
     name._owner=True
     return
@@ -776,8 +742,8 @@ def hdf_output_uniform_grid(link,hf,t,name):
         | *name*: string
     """
     name_=ctypes.c_char_p(force_bytes(name))
-    func=link.o2scl_hdf.o2scl_hdf_hdf_output_uniform_grid_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_output_uniform_grid_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p])
     func(hf._ptr,t._ptr,name_)
     return
 
@@ -790,8 +756,8 @@ def hdf_input_tensor_grid(link,hf,t,name):
         | *name*: string
     """
     name_=ctypes.c_char_p(force_bytes(name))
-    func=link.o2scl_hdf.o2scl_hdf_hdf_input_tensor_grid_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_input_tensor_grid_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p])
     func(hf._ptr,t._ptr,name_)
     return
 
@@ -805,8 +771,8 @@ def hdf_input_n_tensor_grid(link,hf,t,name):
     """
     name.__del__()
     name._ptr=ctypes.c_void_p()
-    func=link.o2scl_hdf.o2scl_hdf_hdf_input_n_tensor_grid_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_void_p)]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_input_n_tensor_grid_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.POINTER(ctypes.c_void_p)])
     func(hf._ptr,t._ptr,ctypes.byref(name._ptr))
     name._owner=True
     return
@@ -820,8 +786,8 @@ def hdf_output_tensor_grid(link,hf,t,name):
         | *name*: string
     """
     name_=ctypes.c_char_p(force_bytes(name))
-    func=link.o2scl_hdf.o2scl_hdf_hdf_output_tensor_grid_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_hdf_output_tensor_grid_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_char_p])
     func(hf._ptr,t._ptr,name_)
     return
 
@@ -836,9 +802,8 @@ def value_spec(link,spec,d,verbose=0,err_on_fail=True):
         | Returns: ``ctypes.c_int`` object
     """
     spec_=ctypes.c_char_p(force_bytes(spec))
-    func=link.o2scl_hdf.o2scl_hdf_value_spec_wrapper
-    func.restype=ctypes.c_int
-    func.argtypes=[ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int,ctypes.c_bool]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_value_spec_wrapper',
+                       ctypes.c_int,[ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int,ctypes.c_bool])
     ret=func(spec_,d._ptr,verbose,err_on_fail)
     return ret
 
@@ -853,9 +818,8 @@ def vector_spec(link,spec,v,verbose=0,err_on_fail=True):
         | Returns: ``ctypes.c_int`` object
     """
     spec_=ctypes.c_char_p(force_bytes(spec))
-    func=link.o2scl_hdf.o2scl_hdf_vector_spec_std_vector_double__wrapper
-    func.restype=ctypes.c_int
-    func.argtypes=[ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int,ctypes.c_bool]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_vector_spec_std_vector_double__wrapper',
+                       ctypes.c_int,[ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int,ctypes.c_bool])
     ret=func(spec_,v._ptr,verbose,err_on_fail)
     return ret
 
@@ -870,9 +834,8 @@ def strings_spec(link,spec,v,verbose=0,err_on_fail=True):
         | Returns: ``ctypes.c_int`` object
     """
     spec_=ctypes.c_char_p(force_bytes(spec))
-    func=link.o2scl_hdf.o2scl_hdf_strings_spec_std_vector_std_string__wrapper
-    func.restype=ctypes.c_int
-    func.argtypes=[ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int,ctypes.c_bool]
+    func=link.get_func('o2scl_hdf','o2scl_hdf_strings_spec_std_vector_std_string__wrapper',
+                       ctypes.c_int,[ctypes.c_char_p,ctypes.c_void_p,ctypes.c_int,ctypes.c_bool])
     ret=func(spec_,v._ptr,verbose,err_on_fail)
     return ret
 
@@ -36,6 +36,27 @@ from ctypes.util import find_library
 
 from o2sclpy.base import lib_settings_class
 
+_default_link=None
+"""
+The default linker object (see :func:`default_linker()`)
+"""
+
+def default_linker():
+    """
+    Return the default linker object, which is used to create
+    O\ :sub:`2`\ scl objects when they are unpickled. This is the
+    first linker object for which :meth:`linker.link_o2scl()` was
+    called. If there is no such object, a new linker object is
+    created and linked using the settings from the environment
+    variables.
+
+    This function is in ``link_o2scl.py``.
+    """
+    if _default_link is None:
+        link=linker()
+        link.link_o2scl()
+    return _default_link
+
 class linker:
     """
     The class which controls the dynamic linking of the O2scl libraries
@@ -110,6 +131,18 @@ class linker:
     The o2scl_settings object
     """
 
+    funcs={}
+    """
+    Dictionary of prepared foreign functions, indexed by symbol
+    name (see :meth:`get_func()`)
+    """
+
+    has_funcs={}
+    """
+    Dictionary of booleans, indexed by symbol name, which are true
+    if the symbol is in the library (see :meth:`has_func()`)
+    """
+
     def link_o2scl(self,include_part=True,include_eos=True):
         """
         A function for linking the o2scl libraries. If 
@@ -311,6 +344,11 @@ class linker:
             if self.verbose>0:
                 print('Done loading o2scl libraries.')
 
+        # Start with an empty registry of prepared functions, since
+        # the library handles may have changed
+        self.funcs={}
+        self.has_funcs={}
+        
         # This is necessary even if we're only including o2scl because
         # the o2scl error handler is sometimes used by GSL functions
         if self.verbose>0:
@@ -318,15 +356,69 @@ class linker:
         self.o2scl.o2scl_python_prep()
 
         # Get the global library settings pointer
-        func=self.o2scl.o2scl_get_o2scl_settings
-        func.restype=ctypes.c_void_p
+        func=self.get_func('o2scl','o2scl_get_o2scl_settings',
+                           ctypes.c_void_p,[])
         ptr=func()
 
         # Create a library settings object with the pointer
         self.o2scl_settings=lib_settings_class(self,ptr)
+
+        global _default_link
+        if _default_link is None:
+            _default_link=self
         
         return
     
+    def get_func(self,lib,name,restype,argtypes):
+        """
+        Return the foreign function named ``name`` from the library
+        handle named ``lib`` (e.g. ``'o2scl'`` or ``'o2scl_eos'``) with
+        its return type set to ``restype`` and its argument types set
+        to ``argtypes``.
+
+        The symbol is resolved and its prototype is set only the first
+        time this function is called for a given name, subsequent calls
+        just return the prepared function from :attr:`funcs`.
+        Prototypes are never modified after the first call, so the same
+        symbol must always be requested with the same prototype.
+        """
+        try:
+            return self.funcs[name]
+        except KeyError:
+            pass
+
+        # Use __getitem__() rather than getattr() so that the function
+        # object is not shared with code which uses the library handle
+        # directly and may modify the prototype
+        func=getattr(self,lib)[name]
+        func.restype=restype
+        func.argtypes=argtypes
+        self.funcs[name]=func
+        return func
+    
+    def has_func(self,lib,name):
+        """
+        Return true if the library handle named ``lib`` exports the
+        symbol ``name``. Functions which are not in all versions of
+        O\ :sub:`2`\ scl use this to fall back to slower code. The
+        library is only searched the first time this function is
+        called for a given name.
+        """
+        try:
+            return self.has_funcs[name]
+        except KeyError:
+            pass
+        if name in self.funcs:
+            ret=True
+        else:
+            try:
+                getattr(self,lib)[name]
+                ret=True
+            except AttributeError:
+                ret=False
+        self.has_funcs[name]=ret
+        return ret
+    
     def get_library_settings(self,argv=[]):
         """
         Get the library settings from environment variables or 
@@ -22,10 +22,33 @@
 """
 
 import ctypes
+import numpy
+import os
+import json
+import hashlib
 from abc import abstractmethod
-from o2sclpy.utils import force_bytes
+from o2sclpy.utils import force_bytes, user_cache_dir, atomic_write
+from o2sclpy.utils import evict_lru
 
 from o2sclpy.part import *
+from o2sclpy.base import std_string, _array_call
+
+def _nucmass_array(obj,name,Z,N,ctype=ctypes.c_double):
+    """
+    Call the C function ``name``, which loops over the broadcast
+    arrays of proton numbers ``Z`` and neutron numbers ``N`` and
+    stores the result for each nucleus, of type ``ctype``, in an
+    output array. This is used by the ``*_array()`` methods of
+    :class:`nucmass`, which evaluate the corresponding scalar method
+    for every nucleus with a single foreign call. Floating-point
+    results are ``nan`` for nuclei which are not included in the
+    mass model.
+
+    Returns: a ``numpy`` array with the broadcast shape of ``Z`` and
+    ``N``
+    """
+    return _array_call(obj,'o2scl_part',name,[Z,N],ctypes.c_int,
+                       out_ctype=ctype)
 
 class nucleus(part):
     """
@@ -45,9 +68,8 @@ class nucleus(part):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucleus
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucleus',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -61,8 +83,8 @@ class nucleus(part):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucleus
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucleus',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -83,9 +105,8 @@ class nucleus(part):
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_part.o2scl_nucleus_get_Z
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucleus_get_Z',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @Z.setter
@@ -93,8 +114,8 @@ class nucleus(part):
         """
         Setter function for nucleus::Z .
         """
-        func=self._link.o2scl_part.o2scl_nucleus_set_Z
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucleus_set_Z',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -103,9 +124,8 @@ class nucleus(part):
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_part.o2scl_nucleus_get_N
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucleus_get_N',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @N.setter
@@ -113,8 +133,8 @@ class nucleus(part):
         """
         Setter function for nucleus::N .
         """
-        func=self._link.o2scl_part.o2scl_nucleus_set_N
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucleus_set_N',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -123,9 +143,8 @@ class nucleus(part):
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_part.o2scl_nucleus_get_A
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucleus_get_A',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @A.setter
@@ -133,8 +152,8 @@ class nucleus(part):
         """
         Setter function for nucleus::A .
         """
-        func=self._link.o2scl_part.o2scl_nucleus_set_A
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucleus_set_A',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -143,9 +162,8 @@ class nucleus(part):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucleus_get_mex
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucleus_get_mex',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @mex.setter
@@ -153,8 +171,8 @@ class nucleus(part):
         """
         Setter function for nucleus::mex .
         """
-        func=self._link.o2scl_part.o2scl_nucleus_set_mex
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucleus_set_mex',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -163,9 +181,8 @@ class nucleus(part):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucleus_get_be
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucleus_get_be',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @be.setter
@@ -173,8 +190,8 @@ class nucleus(part):
         """
         Setter function for nucleus::be .
         """
-        func=self._link.o2scl_part.o2scl_nucleus_set_be
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucleus_set_be',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -201,9 +218,8 @@ class nucmass_info:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_info
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_info',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -217,8 +233,8 @@ class nucmass_info:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_info
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_info',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -241,9 +257,8 @@ class nucmass_info:
         | Returns: a Python int, a Python int, a Python int, a Python int
         """
         ela_=ctypes.c_char_p(force_bytes(ela))
-        func=self._link.o2scl_part.o2scl_nucmass_info_parse_elstring
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.c_int),ctypes.POINTER(ctypes.c_int),ctypes.POINTER(ctypes.c_int)]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_info_parse_elstring',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.POINTER(ctypes.c_int),ctypes.POINTER(ctypes.c_int),ctypes.POINTER(ctypes.c_int)])
         Z_conv=ctypes.c_int(0)
         N_conv=ctypes.c_int(0)
         A_conv=ctypes.c_int(0)
@@ -257,9 +272,8 @@ class nucmass_info:
         | Returns: a Python int
         """
         el_=ctypes.c_char_p(force_bytes(el))
-        func=self._link.o2scl_part.o2scl_nucmass_info_eltoZ
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_info_eltoZ',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,el_)
         return ret
 
@@ -269,9 +283,8 @@ class nucmass_info:
         | *Z*: ``size_t``
         | Returns: Python bytes object
         """
-        func=self._link.o2scl_part.o2scl_nucmass_info_Ztoel
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_info_Ztoel',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,Z)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -283,9 +296,8 @@ class nucmass_info:
         | *Z*: ``size_t``
         | Returns: Python bytes object
         """
-        func=self._link.o2scl_part.o2scl_nucmass_info_Ztoname
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_info_Ztoname',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,Z)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -298,9 +310,8 @@ class nucmass_info:
         | *N*: ``size_t``
         | Returns: Python bytes object
         """
-        func=self._link.o2scl_part.o2scl_nucmass_info_tostring
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_info_tostring',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_size_t])
         ret=func(self._ptr,Z,N)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -312,9 +323,8 @@ class nucmass_info:
         | *g*: ``int``
         | Returns: Python bytes object
         """
-        func=self._link.o2scl_part.o2scl_nucmass_info_int_to_spinp
-        func.restype=ctypes.c_void_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_info_int_to_spinp',
+                                 ctypes.c_void_p,[ctypes.c_void_p,ctypes.c_int])
         ret=func(self._ptr,g)
         strt=std_string(self._link,ret)
         strt._owner=True
@@ -327,9 +337,8 @@ class nucmass_info:
         | Returns: a Python int
         """
         s_=ctypes.c_char_p(force_bytes(s))
-        func=self._link.o2scl_part.o2scl_nucmass_info_spinp_to_int
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_info_spinp_to_int',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,s_)
         return ret
 
@@ -357,9 +366,8 @@ class nucmass:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -373,8 +381,8 @@ class nucmass:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -395,9 +403,8 @@ class nucmass:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_get_m_prot
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_get_m_prot',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @m_prot.setter
@@ -405,8 +412,8 @@ class nucmass:
         """
         Setter function for nucmass::m_prot .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_set_m_prot
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_set_m_prot',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -415,9 +422,8 @@ class nucmass:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_get_m_neut
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_get_m_neut',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @m_neut.setter
@@ -425,8 +431,8 @@ class nucmass:
         """
         Setter function for nucmass::m_neut .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_set_m_neut
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_set_m_neut',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -435,9 +441,8 @@ class nucmass:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_get_m_elec
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_get_m_elec',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @m_elec.setter
@@ -445,8 +450,8 @@ class nucmass:
         """
         Setter function for nucmass::m_elec .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_set_m_elec
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_set_m_elec',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -455,9 +460,8 @@ class nucmass:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_get_m_amu
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_get_m_amu',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @m_amu.setter
@@ -465,8 +469,8 @@ class nucmass:
         """
         Setter function for nucmass::m_amu .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_set_m_amu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_set_m_amu',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -477,9 +481,8 @@ class nucmass:
         | *N*: ``int``
         | Returns: a Python boolean
         """
-        func=self._link.o2scl_part.o2scl_nucmass_is_included
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_is_included',
+                                 ctypes.c_bool,[ctypes.c_void_p,ctypes.c_int,ctypes.c_int])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -491,9 +494,8 @@ class nucmass:
         | *n*: :class:`nucleus` object
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_nucmass_get_nucleus
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int,ctypes.c_int,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_get_nucleus',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_int,ctypes.c_int,ctypes.c_void_p])
         ret=func(self._ptr,Z,N,n._ptr)
         return ret
 
@@ -504,9 +506,8 @@ class nucmass:
         | *N*: ``int``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_mass_excess
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_mass_excess',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_int,ctypes.c_int])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -517,9 +518,8 @@ class nucmass:
         | *N*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_mass_excess_d
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_mass_excess_d',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -529,9 +529,8 @@ class nucmass:
         | *Z*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_electron_binding
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_electron_binding',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,Z)
         return ret
 
@@ -542,9 +541,8 @@ class nucmass:
         | *N*: ``int``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_binding_energy
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_binding_energy',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_int,ctypes.c_int])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -555,9 +553,8 @@ class nucmass:
         | *N*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_binding_energy_d
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_binding_energy_d',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -568,9 +565,8 @@ class nucmass:
         | *N*: ``int``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_total_mass
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_total_mass',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_int,ctypes.c_int])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -581,9 +577,8 @@ class nucmass:
         | *N*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_total_mass_d
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_total_mass_d',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -594,9 +589,8 @@ class nucmass:
         | *N*: ``int``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_neutron_sep
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_neutron_sep',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_int,ctypes.c_int])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -607,9 +601,8 @@ class nucmass:
         | *N*: ``int``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_two_neutron_sep
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_two_neutron_sep',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_int,ctypes.c_int])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -620,9 +613,8 @@ class nucmass:
         | *N*: ``int``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_proton_sep
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_proton_sep',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_int,ctypes.c_int])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -633,9 +625,8 @@ class nucmass:
         | *N*: ``int``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_two_proton_sep
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_two_proton_sep',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_int,ctypes.c_int])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -646,9 +637,8 @@ class nucmass:
         | *N*: ``int``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_atomic_mass
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_atomic_mass',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_int,ctypes.c_int])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -659,12 +649,75 @@ class nucmass:
         | *N*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_atomic_mass_d
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_atomic_mass_d',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,Z,N)
         return ret
 
+    def is_included_array(self,Z,N):
+        """
+        Array version of :meth:`is_included()` (see
+        :func:`_nucmass_array()`)
+
+        Returns: a boolean ``numpy`` array
+        """
+        return _nucmass_array(self,'o2scl_nucmass_is_included_array',
+                              Z,N,ctypes.c_bool)
+
+    def mass_excess_array(self,Z,N):
+        """
+        Array version of :meth:`mass_excess()` (see
+        :func:`_nucmass_array()`)
+
+        Returns: a ``numpy`` array of the mass excess in MeV
+        """
+        return _nucmass_array(self,'o2scl_nucmass_mass_excess_array',Z,N)
+
+    def binding_energy_array(self,Z,N):
+        """
+        Array version of :meth:`binding_energy()` (see
+        :func:`_nucmass_array()`)
+
+        Returns: a ``numpy`` array of the binding energy in MeV
+        """
+        return _nucmass_array(self,'o2scl_nucmass_binding_energy_array',Z,N)
+
+    def neutron_sep_array(self,Z,N):
+        """
+        Array version of :meth:`neutron_sep()` (see
+        :func:`_nucmass_array()`)
+
+        Returns: a ``numpy`` array of the neutron separation energy in MeV
+        """
+        return _nucmass_array(self,'o2scl_nucmass_neutron_sep_array',Z,N)
+
+    def two_neutron_sep_array(self,Z,N):
+        """
+        Array version of :meth:`two_neutron_sep()` (see
+        :func:`_nucmass_array()`)
+
+        Returns: a ``numpy`` array of the two-neutron separation energy in MeV
+        """
+        return _nucmass_array(self,'o2scl_nucmass_two_neutron_sep_array',Z,N)
+
+    def proton_sep_array(self,Z,N):
+        """
+        Array version of :meth:`proton_sep()` (see
+        :func:`_nucmass_array()`)
+
+        Returns: a ``numpy`` array of the proton separation energy in MeV
+        """
+        return _nucmass_array(self,'o2scl_nucmass_proton_sep_array',Z,N)
+
+    def two_proton_sep_array(self,Z,N):
+        """
+        Array version of :meth:`two_proton_sep()` (see
+        :func:`_nucmass_array()`)
+
+        Returns: a ``numpy`` array of the two-proton separation energy in MeV
+        """
+        return _nucmass_array(self,'o2scl_nucmass_two_proton_sep_array',Z,N)
+
 
 class nucmass_table(nucmass):
     """
@@ -685,9 +738,8 @@ class nucmass_table(nucmass):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_table
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_table',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -701,8 +753,8 @@ class nucmass_table(nucmass):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_table
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_table',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -723,9 +775,8 @@ class nucmass_table(nucmass):
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_table_get_n
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_table_get_n',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @n.setter
@@ -733,8 +784,8 @@ class nucmass_table(nucmass):
         """
         Setter function for nucmass_table::n .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_table_set_n
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_table_set_n',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -742,9 +793,8 @@ class nucmass_table(nucmass):
         """
         Get object of type :class:`std::string`
         """
-        func=self._link.o2scl_part.o2scl_nucmass_table_get_reference
-        func.restype=ctypes.c_char_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_table_get_reference',
+                                 ctypes.c_char_p,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,reference._ptr)
         return
 
@@ -752,8 +802,8 @@ class nucmass_table(nucmass):
         """
         Set object of type :class:`std::string`
         """
-        func=self._link.o2scl_part.o2scl_nucmass_table_set_reference
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_table_set_reference',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -761,9 +811,8 @@ class nucmass_table(nucmass):
         """
         | Returns: a Python boolean
         """
-        func=self._link.o2scl_part.o2scl_nucmass_table_is_loaded
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_table_is_loaded',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -771,12 +820,40 @@ class nucmass_table(nucmass):
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_nucmass_table_get_nentries
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_table_get_nentries',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
+    def to_numpy(self):
+        """
+        Return the proton number, neutron number, mass number, mass
+        excess (in MeV) and binding energy (in MeV) of every nucleus
+        in the table, in the order of the table entries. The proton
+        and neutron numbers are obtained with a single foreign call.
+
+        Returns: a ``numpy`` structured array with fields ``Z``,
+        ``N``, ``A``, ``mex`` and ``be``
+        """
+        n=self.get_nentries()
+        Z=numpy.zeros(n,dtype=numpy.intc)
+        N=numpy.zeros(n,dtype=numpy.intc)
+        if n>0:
+            ip=ctypes.POINTER(ctypes.c_int)
+            func=self._link.get_func('o2scl_part',
+                                     'o2scl_nucmass_table_get_ZN',
+                                     None,[ctypes.c_void_p,ip,ip])
+            func(self._ptr,Z.ctypes.data_as(ip),N.ctypes.data_as(ip))
+        ret=numpy.zeros(n,dtype=[('Z',numpy.intc),('N',numpy.intc),
+                                 ('A',numpy.intc),('mex',numpy.double),
+                                 ('be',numpy.double)])
+        ret['Z']=Z
+        ret['N']=N
+        ret['A']=Z+N
+        ret['mex']=self.mass_excess_array(Z,N)
+        ret['be']=self.binding_energy_array(Z,N)
+        return ret
+
 
 class nucmass_fit_base(nucmass):
     """
@@ -797,9 +874,8 @@ class nucmass_fit_base(nucmass):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_fit_base
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_fit_base',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -813,8 +889,8 @@ class nucmass_fit_base(nucmass):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_fit_base
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_fit_base',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -835,9 +911,8 @@ class nucmass_fit_base(nucmass):
         """
         Property of type ``ctypes.c_size_t``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_fit_base_get_nfit
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_fit_base_get_nfit',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         return func(self._ptr)
 
     @nfit.setter
@@ -845,8 +920,8 @@ class nucmass_fit_base(nucmass):
         """
         Setter function for nucmass_fit_base::nfit .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_fit_base_set_nfit
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_fit_base_set_nfit',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t])
         func(self._ptr,value)
         return
 
@@ -869,9 +944,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_semi_empirical
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_semi_empirical',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -885,8 +959,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_semi_empirical
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_semi_empirical',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -907,9 +981,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_semi_empirical_get_B
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_semi_empirical_get_B',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @B.setter
@@ -917,8 +990,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         """
         Setter function for nucmass_semi_empirical::B .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_semi_empirical_set_B
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_semi_empirical_set_B',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -927,9 +1000,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_semi_empirical_get_Sv
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_semi_empirical_get_Sv',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @Sv.setter
@@ -937,8 +1009,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         """
         Setter function for nucmass_semi_empirical::Sv .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_semi_empirical_set_Sv
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_semi_empirical_set_Sv',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -947,9 +1019,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_semi_empirical_get_Ss
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_semi_empirical_get_Ss',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @Ss.setter
@@ -957,8 +1028,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         """
         Setter function for nucmass_semi_empirical::Ss .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_semi_empirical_set_Ss
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_semi_empirical_set_Ss',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -967,9 +1038,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_semi_empirical_get_Ec
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_semi_empirical_get_Ec',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @Ec.setter
@@ -977,8 +1047,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         """
         Setter function for nucmass_semi_empirical::Ec .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_semi_empirical_set_Ec
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_semi_empirical_set_Ec',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -987,9 +1057,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_semi_empirical_get_Epair
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_semi_empirical_get_Epair',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @Epair.setter
@@ -997,8 +1066,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         """
         Setter function for nucmass_semi_empirical::Epair .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_semi_empirical_set_Epair
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_semi_empirical_set_Epair',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1009,9 +1078,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         | *N*: ``int``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_semi_empirical_mass_excess
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_semi_empirical_mass_excess',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_int,ctypes.c_int])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -1022,9 +1090,8 @@ class nucmass_semi_empirical(nucmass_fit_base):
         | *N*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_nucmass_semi_empirical_mass_excess_d
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_semi_empirical_mass_excess_d',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,Z,N)
         return ret
 
@@ -1047,9 +1114,8 @@ class nucmass_ame(nucmass_table):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_ame
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_ame',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1063,8 +1129,8 @@ class nucmass_ame(nucmass_table):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_ame
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_ame',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1099,9 +1165,8 @@ class nucmass_dz_table(nucmass_table):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_dz_table
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_dz_table',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1115,8 +1180,8 @@ class nucmass_dz_table(nucmass_table):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_dz_table
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_dz_table',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1151,9 +1216,8 @@ class nucmass_dz_fit(nucmass_fit_base):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_dz_fit
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_dz_fit',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1167,8 +1231,8 @@ class nucmass_dz_fit(nucmass_fit_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_dz_fit
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_dz_fit',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1203,9 +1267,8 @@ class nucmass_dz_fit_33(nucmass_fit_base):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_dz_fit_33
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_dz_fit_33',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1219,8 +1282,8 @@ class nucmass_dz_fit_33(nucmass_fit_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_dz_fit_33
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_dz_fit_33',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1255,9 +1318,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_frdm
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_frdm',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1271,8 +1333,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_frdm
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_frdm',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1293,9 +1355,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_a1
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_a1',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @a1.setter
@@ -1303,8 +1364,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::a1 .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_a1
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_a1',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1313,9 +1374,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_J
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_J',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @J.setter
@@ -1323,8 +1383,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::J .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_J
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_J',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1333,9 +1393,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_K
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_K',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @K.setter
@@ -1343,8 +1402,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::K .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_K
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_K',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1353,9 +1412,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_a2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_a2',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @a2.setter
@@ -1363,8 +1421,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::a2 .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_a2
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_a2',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1373,9 +1431,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_Q
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_Q',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @Q.setter
@@ -1383,8 +1440,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::Q .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_Q
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_Q',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1393,9 +1450,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_a3
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_a3',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @a3.setter
@@ -1403,8 +1459,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::a3 .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_a3
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_a3',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1413,9 +1469,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_ca
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_ca',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @ca.setter
@@ -1423,8 +1478,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::ca .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_ca
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_ca',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1433,9 +1488,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_W
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_W',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @W.setter
@@ -1443,8 +1497,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::W .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_W
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_W',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1453,9 +1507,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_ael
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_ael',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @ael.setter
@@ -1463,8 +1516,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::ael .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_ael
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_ael',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1473,9 +1526,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_rp
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_rp',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @rp.setter
@@ -1483,8 +1535,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::rp .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_rp
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_rp',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1493,9 +1545,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_r0
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_r0',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @r0.setter
@@ -1503,8 +1554,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::r0 .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_r0
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_r0',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1513,9 +1564,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_MH
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_MH',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @MH.setter
@@ -1523,8 +1573,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::MH .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_MH
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_MH',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1533,9 +1583,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_Mn
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_Mn',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @Mn.setter
@@ -1543,8 +1592,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::Mn .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_Mn
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_Mn',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1553,9 +1602,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_e2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_e2',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @e2.setter
@@ -1563,8 +1611,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::e2 .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_e2
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_e2',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1573,9 +1621,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_a
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_a',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @a.setter
@@ -1583,8 +1630,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::a .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_a
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_a',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1593,9 +1640,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_aden
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_aden',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @aden.setter
@@ -1603,8 +1649,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::aden .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_aden
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_aden',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1613,9 +1659,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_rmac
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_rmac',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @rmac.setter
@@ -1623,8 +1668,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::rmac .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_rmac
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_rmac',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1633,9 +1678,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_h
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_h',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @h.setter
@@ -1643,8 +1687,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::h .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_h
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_h',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1653,9 +1697,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_L
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_L',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @L.setter
@@ -1663,8 +1706,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::L .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_L
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_L',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1673,9 +1716,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_C
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_C',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @C.setter
@@ -1683,8 +1725,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::C .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_C
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_C',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1693,9 +1735,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_gamma
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_gamma',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @gamma.setter
@@ -1703,8 +1744,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::gamma .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_gamma
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_gamma',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1713,9 +1754,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_amu
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_amu',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @amu.setter
@@ -1723,8 +1763,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::amu .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_amu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_amu',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1733,9 +1773,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_nn
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_nn',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @nn.setter
@@ -1743,8 +1782,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::nn .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_nn
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_nn',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1753,9 +1792,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_np
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_np',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @np.setter
@@ -1763,8 +1801,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::np .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_np
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_np',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1773,9 +1811,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_Rn
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_Rn',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @Rn.setter
@@ -1783,8 +1820,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::Rn .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_Rn
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_Rn',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1793,9 +1830,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_get_Rp
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_get_Rp',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @Rp.setter
@@ -1803,8 +1839,8 @@ class nucmass_frdm(nucmass_fit_base):
         """
         Setter function for nucmass_frdm::Rp .
         """
-        func=self._link.o2scl_part.o2scl_nucmass_frdm_set_Rp
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_nucmass_frdm_set_Rp',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1827,9 +1863,8 @@ class nucmass_mnmsk(nucmass_table):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_mnmsk
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_mnmsk',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1843,8 +1878,8 @@ class nucmass_mnmsk(nucmass_table):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_mnmsk
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_mnmsk',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1879,9 +1914,8 @@ class nucmass_mnmsk_exp(nucmass_mnmsk):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_mnmsk_exp
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_mnmsk_exp',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1895,8 +1929,8 @@ class nucmass_mnmsk_exp(nucmass_mnmsk):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_mnmsk_exp
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_mnmsk_exp',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1931,9 +1965,8 @@ class nucmass_gen(nucmass_table):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_gen
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_gen',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1947,8 +1980,8 @@ class nucmass_gen(nucmass_table):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_gen
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_gen',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1983,9 +2016,8 @@ class nucmass_dglg(nucmass_table):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_dglg
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_dglg',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1999,8 +2031,8 @@ class nucmass_dglg(nucmass_table):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_dglg
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_dglg',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2035,9 +2067,8 @@ class nucmass_hfb(nucmass_table):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_hfb
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_hfb',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2051,8 +2082,8 @@ class nucmass_hfb(nucmass_table):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_hfb
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_hfb',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2087,9 +2118,8 @@ class nucmass_hfb_sp(nucmass_table):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_hfb_sp
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_hfb_sp',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2103,8 +2133,8 @@ class nucmass_hfb_sp(nucmass_table):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_hfb_sp
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_hfb_sp',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2139,9 +2169,8 @@ class nucmass_ktuy(nucmass_table):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_ktuy
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_ktuy',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2155,8 +2184,8 @@ class nucmass_ktuy(nucmass_table):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_ktuy
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_ktuy',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2191,9 +2220,8 @@ class nucmass_sdnp(nucmass_table):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_sdnp
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_sdnp',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2207,8 +2235,8 @@ class nucmass_sdnp(nucmass_table):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_sdnp
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_sdnp',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2243,9 +2271,8 @@ class nucmass_wlw(nucmass_table):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_nucmass_wlw
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_nucmass_wlw',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2259,8 +2286,8 @@ class nucmass_wlw(nucmass_table):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_nucmass_wlw
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_nucmass_wlw',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2277,6 +2304,196 @@ class nucmass_wlw(nucmass_table):
         return new_obj
 
 
+class nucmass_table_cache:
+    """
+    An opt-in on-disk cache for the nuclear mass tables loaded by
+    :func:`ame_load()`, :func:`mnmsk_load()`, :func:`hfb_load()` and
+    :func:`hfb_sp_load()`. The cache is used by these functions
+    through the module-level object ``nucmass_cache``, which is
+    disabled until :meth:`enable()` is called.
+
+    Each table is stored as the raw bytes of its entries in a
+    ``.npy`` file, which is memory-mapped when the table is loaded,
+    and a small ``.json`` file with the table reference. Files are
+    named by a hash of the loading function and its arguments, the
+    size and modification time of the source file (see
+    :meth:`_source()`), and the O\ :sub:`2`\ scl version, so
+    changes to any of these cause the table to be read
+    from the source again. The ``.json`` file also records the number
+    of entries and the size of each entry, and a table is read from
+    the source again if the library stores a different number of
+    entries in the same bytes. When the total size of the cache exceeds
+    :attr:`max_bytes`, the least recently used tables are removed.
+
+    Files are written to a temporary name and then renamed, so many
+    processes may share the same cache directory.
+    """
+
+    enabled=False
+    """
+    If true, then the cache is used by the loading functions
+    """
+
+    directory=user_cache_dir('nucmass')
+    """
+    The cache directory
+    """
+
+    max_bytes=512*1024*1024
+    """
+    The maximum total size of the ``.npy`` files in the cache
+    """
+
+    def enable(self,directory=None,max_bytes=None):
+        """
+        Enable the cache, optionally setting the cache directory and
+        the maximum total size in bytes
+        """
+        if directory is not None:
+            self.directory=directory
+        if max_bytes is not None:
+            self.max_bytes=max_bytes
+        self.enabled=True
+        return
+
+    def disable(self):
+        """
+        Disable the cache. Files already in the cache are kept.
+        """
+        self.enabled=False
+        return
+
+    def clear(self):
+        """
+        Remove all files from the cache directory
+        """
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith('.npy') or name.endswith('.json'):
+                    os.remove(os.path.join(self.directory,name))
+        return
+
+    def _source(self,link,args,filename):
+        """
+        Return a list which identifies the data read by a function
+        with arguments ``args`` from the file ``filename``: the path,
+        size and modification time of the file. If ``filename`` is
+        empty, the file in the O\ :sub:`2`\ scl data directory which
+        the function reads is used. If that file cannot be found,
+        then the path, size and modification time of every file in
+        the ``nucmass`` data directory are used.
+        """
+        filename=force_bytes(filename).decode('utf-8')
+        if filename=='':
+            directory=link.o2scl_settings.get_data_dir().decode('utf-8')
+            if os.path.isdir(os.path.join(directory,'nucmass')):
+                directory=os.path.join(directory,'nucmass')
+            model=args[1]
+            if isinstance(model,bytes):
+                model=model.decode('utf-8')
+            if args[0]=='ame_load':
+                name='ame'+model+'.o2'
+            elif args[0]=='mnmsk_load':
+                name='mnmsk.o2' if model=='mnmsk97' else model+'.o2'
+            else:
+                name='hfb'+str(model)+'.o2'
+            filename=os.path.join(directory,name)
+            if not os.path.isfile(filename):
+                files=sorted(os.listdir(directory))
+                return [self._source(link,args,os.path.join(directory,f))
+                        for f in files
+                        if os.path.isfile(os.path.join(directory,f))]
+        try:
+            st=os.stat(filename)
+            return [filename,st.st_size,st.st_mtime_ns]
+        except OSError:
+            return [filename,0,0]
+
+    def _path(self,link,args,filename):
+        """
+        Return the path, without an extension, of the cache files
+        for a table loaded by a function with arguments ``args`` from
+        the file ``filename`` (see :meth:`_source()`)
+        """
+        key=[a.decode('utf-8') if isinstance(a,bytes) else a
+             for a in args]
+        key+=[self._source(link,args,filename),
+              link.o2scl_settings.o2scl_version().decode('utf-8')]
+        digest=hashlib.sha256(json.dumps(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory,args[0]+'_'+digest[0:24])
+
+    def load(self,link,tab,args,filename):
+        """
+        If the cache is enabled and contains the table specified by
+        ``args`` and ``filename`` (see :meth:`_path()`), copy it into
+        the :class:`nucmass_table` object ``tab`` and return true.
+        Otherwise, return false.
+        """
+        if self.enabled==False:
+            return False
+        path=self._path(link,args,filename)
+        try:
+            with open(path+'.json') as f:
+                info=json.load(f)
+            raw=numpy.load(path+'.npy',mmap_mode='r')
+            # Update the modification time for least-recently-used
+            # removal. This fails if the file was removed by another
+            # process after it was opened.
+            os.utime(path+'.npy')
+        except (OSError,ValueError):
+            return False
+        if ('nentries' not in info or
+            raw.nbytes!=info['nentries']*info['entry_size']):
+            return False
+        func=link.get_func('o2scl_part','o2scl_nucmass_table_set_raw',
+                           None,[ctypes.c_void_p,ctypes.c_void_p,
+                                 ctypes.c_size_t])
+        func(tab._ptr,raw.ctypes.data,raw.nbytes)
+        # The entries are stored as raw bytes, so check that their
+        # size in this library is the one in the cache
+        if tab.get_nentries()!=info['nentries']:
+            return False
+        tab.set_reference(std_string.from_bytes(link,
+                                                info['reference']))
+        return True
+
+    def store(self,link,tab,args,filename):
+        """
+        If the cache is enabled, store the :class:`nucmass_table`
+        object ``tab``, which was loaded by a function with arguments
+        ``args`` from ``filename``, and then remove the least recently
+        used tables if the cache is too large
+        """
+        if self.enabled==False:
+            return
+        path=self._path(link,args,filename)
+        func=link.get_func('o2scl_part','o2scl_nucmass_table_get_raw',
+                           None,[ctypes.c_void_p,
+                                 ctypes.POINTER(ctypes.c_void_p),
+                                 ctypes.POINTER(ctypes.c_size_t)])
+        ptr=ctypes.c_void_p()
+        n=ctypes.c_size_t(0)
+        func(tab._ptr,ctypes.byref(ptr),ctypes.byref(n))
+        raw=numpy.frombuffer(ctypes.string_at(ptr,n.value),dtype=numpy.uint8)
+        ref=std_string(link)
+        tab.get_reference(ref)
+
+        nentries=tab.get_nentries()
+        if nentries==0:
+            return
+        info={'reference': ref.to_bytes().decode('utf-8'),
+              'nentries': nentries,'entry_size': n.value//nentries}
+        atomic_write(path+'.json',lambda f: json.dump(info,f))
+        atomic_write(path+'.npy',lambda f: numpy.save(f,raw),True)
+        evict_lru(self.directory,self.max_bytes)
+        return
+
+nucmass_cache=nucmass_table_cache()
+"""
+The cache used by the nuclear mass table loading functions (see
+:class:`nucmass_table_cache`)
+"""
+
 def ame_load(link,ame,name,exp_only):
     """
         | Parameters:
@@ -2285,10 +2502,14 @@ def ame_load(link,ame,name,exp_only):
         | *name*: string
         | *exp_only*: ``bool``
     """
+    args=['ame_load',name,bool(exp_only)]
+    if nucmass_cache.load(link,ame,args,''):
+        return
     name_=ctypes.c_char_p(force_bytes(name))
-    func=link.o2scl_part.o2scl_ame_load_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool]
+    func=link.get_func('o2scl_part','o2scl_ame_load_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool])
     func(ame._ptr,name_,exp_only)
+    nucmass_cache.store(link,ame,args,'')
     return
 
 def ame_load_ext(link,ame,file_name,table_name,exp_only):
@@ -2302,8 +2523,8 @@ def ame_load_ext(link,ame,file_name,table_name,exp_only):
     """
     file_name_=ctypes.c_char_p(force_bytes(file_name))
     table_name_=ctypes.c_char_p(force_bytes(table_name))
-    func=link.o2scl_part.o2scl_ame_load_ext_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_bool]
+    func=link.get_func('o2scl_part','o2scl_ame_load_ext_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_bool])
     func(ame._ptr,file_name_,table_name_,exp_only)
     return
 
@@ -2315,11 +2536,15 @@ def mnmsk_load(link,mnmsk,model,filename):
         | *model*: string
         | *filename*: string
     """
+    args=['mnmsk_load',model]
+    if nucmass_cache.load(link,mnmsk,args,filename):
+        return
     model_=ctypes.c_char_p(force_bytes(model))
     filename_=ctypes.c_char_p(force_bytes(filename))
-    func=link.o2scl_part.o2scl_mnmsk_load_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p]
+    func=link.get_func('o2scl_part','o2scl_mnmsk_load_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p])
     func(mnmsk._ptr,model_,filename_)
+    nucmass_cache.store(link,mnmsk,args,filename)
     return
 
 def hfb_load(link,hfb,model,filename):
@@ -2330,10 +2555,14 @@ def hfb_load(link,hfb,model,filename):
         | *model*: ``size_t``
         | *filename*: string
     """
+    args=['hfb_load',model]
+    if nucmass_cache.load(link,hfb,args,filename):
+        return
     filename_=ctypes.c_char_p(force_bytes(filename))
-    func=link.o2scl_part.o2scl_hfb_load_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_char_p]
+    func=link.get_func('o2scl_part','o2scl_hfb_load_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_char_p])
     func(hfb._ptr,model,filename_)
+    nucmass_cache.store(link,hfb,args,filename)
     return
 
 def hfb_sp_load(link,hfb,model,filename):
@@ -2344,9 +2573,13 @@ def hfb_sp_load(link,hfb,model,filename):
         | *model*: ``size_t``
         | *filename*: string
     """
+    args=['hfb_sp_load',model]
+    if nucmass_cache.load(link,hfb,args,filename):
+        return
     filename_=ctypes.c_char_p(force_bytes(filename))
-    func=link.o2scl_part.o2scl_hfb_sp_load_wrapper
-    func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_char_p]
+    func=link.get_func('o2scl_part','o2scl_hfb_sp_load_wrapper',
+                       None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_char_p])
     func(hfb._ptr,model,filename_)
+    nucmass_cache.store(link,hfb,args,filename)
     return
 
@@ -252,8 +252,8 @@ class o2graph_plotter(yt_plot_base):
 
             xgrid=[ptrx[i] for i in range(0,nx.value)]
             ygrid=[ptry[i] for i in range(0,ny.value)]
-            stemp=[ptrs[i] for i in range(0,nx.value*ny.value)]
-            stemp2=numpy.array(stemp)
+            stemp2=numpy.ctypeslib.as_array(ptrs,shape=(nx.value*
+                                                        ny.value,)).copy()
             sl=stemp2.reshape(nx.value,ny.value)
             sl=sl.transpose()
 
@@ -384,8 +384,8 @@ class o2graph_plotter(yt_plot_base):
 
             xgrid=[ptrx[i] for i in range(0,nx.value)]
             ygrid=[ptry[i] for i in range(0,ny.value)]
-            stemp=[ptrs[i] for i in range(0,nx.value*ny.value)]
-            stemp2=numpy.array(stemp)
+            stemp2=numpy.ctypeslib.as_array(ptrs,shape=(nx.value*
+                                                        ny.value,)).copy()
             sl=stemp2.reshape(nx.value,ny.value)
             sl=sl.transpose()
 
@@ -49,9 +49,8 @@ class slack_messenger:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_slack_messenger
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_slack_messenger',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -65,8 +64,8 @@ class slack_messenger:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_slack_messenger
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_slack_messenger',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -87,9 +86,8 @@ class slack_messenger:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl.o2scl_slack_messenger_get_verbose
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_get_verbose',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @verbose.setter
@@ -97,8 +95,8 @@ class slack_messenger:
         """
         Setter function for slack_messenger::verbose .
         """
-        func=self._link.o2scl.o2scl_slack_messenger_set_verbose
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_set_verbose',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -106,9 +104,8 @@ class slack_messenger:
         """
         Get object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_slack_messenger_get_url
-        func.restype=ctypes.c_char_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_get_url',
+                                 ctypes.c_char_p,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,url._ptr)
         return
 
@@ -116,8 +113,8 @@ class slack_messenger:
         """
         Set object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_slack_messenger_set_url
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_set_url',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -125,9 +122,8 @@ class slack_messenger:
         """
         Get object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_slack_messenger_get_channel
-        func.restype=ctypes.c_char_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_get_channel',
+                                 ctypes.c_char_p,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,channel._ptr)
         return
 
@@ -135,8 +131,8 @@ class slack_messenger:
         """
         Set object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_slack_messenger_set_channel
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_set_channel',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -144,9 +140,8 @@ class slack_messenger:
         """
         Get object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_slack_messenger_get_icon
-        func.restype=ctypes.c_char_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_get_icon',
+                                 ctypes.c_char_p,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,icon._ptr)
         return
 
@@ -154,8 +149,8 @@ class slack_messenger:
         """
         Set object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_slack_messenger_set_icon
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_set_icon',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -163,9 +158,8 @@ class slack_messenger:
         """
         Get object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_slack_messenger_get_username
-        func.restype=ctypes.c_char_p
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_get_username',
+                                 ctypes.c_char_p,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,username._ptr)
         return
 
@@ -173,8 +167,8 @@ class slack_messenger:
         """
         Set object of type :class:`std::string`
         """
-        func=self._link.o2scl.o2scl_slack_messenger_set_username
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_set_username',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -183,9 +177,8 @@ class slack_messenger:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl.o2scl_slack_messenger_get_min_time_between
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_get_min_time_between',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @min_time_between.setter
@@ -193,8 +186,8 @@ class slack_messenger:
         """
         Setter function for slack_messenger::min_time_between .
         """
-        func=self._link.o2scl.o2scl_slack_messenger_set_min_time_between
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_set_min_time_between',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -205,9 +198,8 @@ class slack_messenger:
         | Returns: a Python boolean
         """
         env_var_=ctypes.c_char_p(force_bytes(env_var))
-        func=self._link.o2scl.o2scl_slack_messenger_set_url_from_env
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_set_url_from_env',
+                                 ctypes.c_bool,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,env_var_)
         return ret
 
@@ -218,9 +210,8 @@ class slack_messenger:
         | Returns: a Python boolean
         """
         env_var_=ctypes.c_char_p(force_bytes(env_var))
-        func=self._link.o2scl.o2scl_slack_messenger_set_channel_from_env
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_set_channel_from_env',
+                                 ctypes.c_bool,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,env_var_)
         return ret
 
@@ -231,9 +222,8 @@ class slack_messenger:
         | Returns: a Python boolean
         """
         env_var_=ctypes.c_char_p(force_bytes(env_var))
-        func=self._link.o2scl.o2scl_slack_messenger_set_username_from_env
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_set_username_from_env',
+                                 ctypes.c_bool,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,env_var_)
         return ret
 
@@ -245,9 +235,8 @@ class slack_messenger:
         | Returns: a Python int
         """
         message_=ctypes.c_char_p(force_bytes(message))
-        func=self._link.o2scl.o2scl_slack_messenger_send
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl','o2scl_slack_messenger_send',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p,ctypes.c_bool])
         ret=func(self._ptr,message_,err_on_fail)
         return ret
 
@@ -260,9 +249,8 @@ class slack_messenger:
 
         """
 
-        f=link.o2scl.o2scl_slack_messenger_init
-        f.restype=ctypes.c_void_p
-        f.argtypes=[ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_bool]
+        f=link.get_func('o2scl','o2scl_slack_messenger_init',
+                        ctypes.c_void_p,[ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_bool])
         return cls(link,f(p_channel_,p_username_,p_url_,p_mpi_time))
 
 
@@ -288,9 +276,8 @@ class quadratic_real_coeff_gsl:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_quadratic_real_coeff_gsl
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_quadratic_real_coeff_gsl',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -304,8 +291,8 @@ class quadratic_real_coeff_gsl:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_quadratic_real_coeff_gsl
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_quadratic_real_coeff_gsl',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -329,9 +316,8 @@ class quadratic_real_coeff_gsl:
         | *c2*: ``double``
         | Returns: a Python int, a Python float, a Python float
         """
-        func=self._link.o2scl.o2scl_quadratic_real_coeff_gsl_solve_r
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl','o2scl_quadratic_real_coeff_gsl_solve_r',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)])
         r1_conv=ctypes.c_double(0)
         r2_conv=ctypes.c_double(0)
         ret=func(self._ptr,a2,b2,c2,ctypes.byref(r1_conv),ctypes.byref(r2_conv))
@@ -347,9 +333,8 @@ class quadratic_real_coeff_gsl:
         | *r2*: :class:`std::complex<double>` object
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_quadratic_real_coeff_gsl_solve_rc
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_quadratic_real_coeff_gsl_solve_rc',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,a2,b2,c2,r1._ptr,r2._ptr)
         return ret
 
@@ -376,9 +361,8 @@ class quadratic_real_coeff_gsl2:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_quadratic_real_coeff_gsl2_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_quadratic_real_coeff_gsl2_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -392,8 +376,8 @@ class quadratic_real_coeff_gsl2:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_quadratic_real_coeff_gsl2_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_quadratic_real_coeff_gsl2_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -417,9 +401,8 @@ class quadratic_real_coeff_gsl2:
         | *c2*: ``double``
         | Returns: a Python int, a Python float, a Python float
         """
-        func=self._link.o2scl.o2scl_quadratic_real_coeff_gsl2__solve_r
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl','o2scl_quadratic_real_coeff_gsl2__solve_r',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)])
         r1_conv=ctypes.c_double(0)
         r2_conv=ctypes.c_double(0)
         ret=func(self._ptr,a2,b2,c2,ctypes.byref(r1_conv),ctypes.byref(r2_conv))
@@ -435,9 +418,8 @@ class quadratic_real_coeff_gsl2:
         | *r2*: :class:`std::complex<double>` object
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_quadratic_real_coeff_gsl2__solve_rc
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_quadratic_real_coeff_gsl2__solve_rc',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,a2,b2,c2,r1._ptr,r2._ptr)
         return ret
 
@@ -464,9 +446,8 @@ class cubic_real_coeff_cern:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_cubic_real_coeff_cern_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_cubic_real_coeff_cern_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -480,8 +461,8 @@ class cubic_real_coeff_cern:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_cubic_real_coeff_cern_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_cubic_real_coeff_cern_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -506,9 +487,8 @@ class cubic_real_coeff_cern:
         | *d3*: ``double``
         | Returns: a Python int, a Python float, a Python float, a Python float
         """
-        func=self._link.o2scl.o2scl_cubic_real_coeff_cern__solve_r
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl','o2scl_cubic_real_coeff_cern__solve_r',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)])
         r1_conv=ctypes.c_double(0)
         r2_conv=ctypes.c_double(0)
         r3_conv=ctypes.c_double(0)
@@ -526,9 +506,8 @@ class cubic_real_coeff_cern:
         | *r3*: :class:`std::complex<double>` object
         | Returns: a Python int, a Python float
         """
-        func=self._link.o2scl.o2scl_cubic_real_coeff_cern__solve_rc
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_cubic_real_coeff_cern__solve_rc',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.c_void_p,ctypes.c_void_p])
         r1_conv=ctypes.c_double(0)
         ret=func(self._ptr,a3,b3,c3,d3,ctypes.byref(r1_conv),r2._ptr,r3._ptr)
         return ret,r1_conv.value
@@ -556,9 +535,8 @@ class cubic_real_coeff_gsl:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_cubic_real_coeff_gsl
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_cubic_real_coeff_gsl',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -572,8 +550,8 @@ class cubic_real_coeff_gsl:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_cubic_real_coeff_gsl
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_cubic_real_coeff_gsl',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -598,9 +576,8 @@ class cubic_real_coeff_gsl:
         | *d3*: ``double``
         | Returns: a Python int, a Python float, a Python float, a Python float
         """
-        func=self._link.o2scl.o2scl_cubic_real_coeff_gsl_solve_r
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl','o2scl_cubic_real_coeff_gsl_solve_r',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)])
         r1_conv=ctypes.c_double(0)
         r2_conv=ctypes.c_double(0)
         r3_conv=ctypes.c_double(0)
@@ -618,9 +595,8 @@ class cubic_real_coeff_gsl:
         | *r3*: :class:`std::complex<double>` object
         | Returns: a Python int, a Python float
         """
-        func=self._link.o2scl.o2scl_cubic_real_coeff_gsl_solve_rc
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_cubic_real_coeff_gsl_solve_rc',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.c_void_p,ctypes.c_void_p])
         r1_conv=ctypes.c_double(0)
         ret=func(self._ptr,a3,b3,c3,d3,ctypes.byref(r1_conv),r2._ptr,r3._ptr)
         return ret,r1_conv.value
@@ -648,9 +624,8 @@ class quartic_real_coeff_cern:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_quartic_real_coeff_cern_
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_quartic_real_coeff_cern_',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -664,8 +639,8 @@ class quartic_real_coeff_cern:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_quartic_real_coeff_cern_
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_quartic_real_coeff_cern_',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -691,9 +666,8 @@ class quartic_real_coeff_cern:
         | *e4*: ``double``
         | Returns: a Python int, a Python float, a Python float, a Python float, a Python float
         """
-        func=self._link.o2scl.o2scl_quartic_real_coeff_cern__solve_r
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl','o2scl_quartic_real_coeff_cern__solve_r',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)])
         r1_conv=ctypes.c_double(0)
         r2_conv=ctypes.c_double(0)
         r3_conv=ctypes.c_double(0)
@@ -715,9 +689,8 @@ class quartic_real_coeff_cern:
         | *r4*: :class:`std::complex<double>` object
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_quartic_real_coeff_cern__solve_rc
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_quartic_real_coeff_cern__solve_rc',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p])
         ret=func(self._ptr,a4,b4,c4,d4,e4,r1._ptr,r2._ptr,r3._ptr,r4._ptr)
         return ret
 
@@ -744,9 +717,8 @@ class fermi_dirac_integ_gsl:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_fermi_dirac_integ_gsl
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_fermi_dirac_integ_gsl',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -760,8 +732,8 @@ class fermi_dirac_integ_gsl:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_fermi_dirac_integ_gsl
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_fermi_dirac_integ_gsl',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -783,9 +755,8 @@ class fermi_dirac_integ_gsl:
         | *x*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_fermi_dirac_integ_gsl_calc_m1o2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_fermi_dirac_integ_gsl_calc_m1o2',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,x)
         return ret
 
@@ -795,9 +766,8 @@ class fermi_dirac_integ_gsl:
         | *x*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_fermi_dirac_integ_gsl_calc_1o2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_fermi_dirac_integ_gsl_calc_1o2',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,x)
         return ret
 
@@ -807,9 +777,8 @@ class fermi_dirac_integ_gsl:
         | *x*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_fermi_dirac_integ_gsl_calc_3o2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_fermi_dirac_integ_gsl_calc_3o2',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,x)
         return ret
 
@@ -819,9 +788,8 @@ class fermi_dirac_integ_gsl:
         | *x*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_fermi_dirac_integ_gsl_calc_2
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_fermi_dirac_integ_gsl_calc_2',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,x)
         return ret
 
@@ -831,9 +799,8 @@ class fermi_dirac_integ_gsl:
         | *x*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_fermi_dirac_integ_gsl_calc_3
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_fermi_dirac_integ_gsl_calc_3',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,x)
         return ret
 
@@ -860,9 +827,8 @@ class bessel_K_exp_integ_gsl:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_bessel_K_exp_integ_gsl
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_bessel_K_exp_integ_gsl',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -876,8 +842,8 @@ class bessel_K_exp_integ_gsl:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_bessel_K_exp_integ_gsl
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_bessel_K_exp_integ_gsl',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -899,9 +865,8 @@ class bessel_K_exp_integ_gsl:
         | *x*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_bessel_K_exp_integ_gsl_K1exp
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_bessel_K_exp_integ_gsl_K1exp',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,x)
         return ret
 
@@ -911,9 +876,8 @@ class bessel_K_exp_integ_gsl:
         | *x*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_bessel_K_exp_integ_gsl_K2exp
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_bessel_K_exp_integ_gsl_K2exp',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,x)
         return ret
 
@@ -923,9 +887,8 @@ class bessel_K_exp_integ_gsl:
         | *x*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_bessel_K_exp_integ_gsl_K3exp
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_bessel_K_exp_integ_gsl_K3exp',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,x)
         return ret
 
@@ -952,9 +915,8 @@ class hist:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_hist
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_hist',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -968,8 +930,8 @@ class hist:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_hist
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_hist',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -993,8 +955,8 @@ class hist:
         """
 
         new_obj=type(self)(self._link)
-        f2=self._link.o2scl.o2scl_copy_hist
-        f2.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        f2=self._link.get_func('o2scl','o2scl_copy_hist',
+                               None,[ctypes.c_void_p,ctypes.c_void_p])
         f2(self._ptr,new_obj._ptr)
         return new_obj
 
@@ -1003,9 +965,8 @@ class hist:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl.o2scl_hist_get_extend_rhs
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_hist_get_extend_rhs',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @extend_rhs.setter
@@ -1013,8 +974,8 @@ class hist:
         """
         Setter function for hist::extend_rhs .
         """
-        func=self._link.o2scl.o2scl_hist_set_extend_rhs
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl','o2scl_hist_set_extend_rhs',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -1023,9 +984,8 @@ class hist:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl.o2scl_hist_get_extend_lhs
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_hist_get_extend_lhs',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @extend_lhs.setter
@@ -1033,8 +993,8 @@ class hist:
         """
         Setter function for hist::extend_lhs .
         """
-        func=self._link.o2scl.o2scl_hist_set_extend_lhs
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl','o2scl_hist_set_extend_lhs',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -1042,9 +1002,8 @@ class hist:
         """
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_hist_size
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_hist_size',
+                                 ctypes.c_size_t,[ctypes.c_void_p])
         ret=func(self._ptr)
         return ret
 
@@ -1053,8 +1012,8 @@ class hist:
         | Parameters:
         | *g*: :class:`uniform_grid<double>` object
         """
-        func=self._link.o2scl.o2scl_hist_set_bin_edges_grid
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_hist_set_bin_edges_grid',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,g._ptr)
         return
 
@@ -1064,8 +1023,8 @@ class hist:
         | *n*: ``size_t``
         | *v*: :class:`vector<double>` object
         """
-        func=self._link.o2scl.o2scl_hist_set_bin_edges_vec
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_hist_set_bin_edges_vec',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_void_p])
         func(self._ptr,n,v._ptr)
         return
 
@@ -1075,8 +1034,8 @@ class hist:
         | *x*: ``double``
         | *val* =1.0: ``double``
         """
-        func=self._link.o2scl.o2scl_hist_update
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_hist_update',
+                                 None,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         func(self._ptr,x,val)
         return
 
@@ -1086,8 +1045,8 @@ class hist:
         | *i*: ``size_t``
         | *val* =1.0: ``double``
         """
-        func=self._link.o2scl.o2scl_hist_update_i
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_hist_update_i',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double])
         func(self._ptr,i,val)
         return
 
@@ -1097,9 +1056,8 @@ class hist:
         | *i*: ``size_t``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_hist_get_wgt_i
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_hist_get_wgt_i',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,i)
         return ret
 
@@ -1109,9 +1067,8 @@ class hist:
         | *x*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl.o2scl_hist_get_wgt
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_hist_get_wgt',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,x)
         return ret
 
@@ -1121,8 +1078,8 @@ class hist:
         | *i*: ``size_t``
         | *x*: ``double``
         """
-        func=self._link.o2scl.o2scl_hist_set_wgt_i
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_hist_set_wgt_i',
+                                 None,[ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double])
         func(self._ptr,i,x)
         return
 
@@ -1132,8 +1089,8 @@ class hist:
         | *x*: ``double``
         | *val*: ``double``
         """
-        func=self._link.o2scl.o2scl_hist_set_wgt
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_hist_set_wgt',
+                                 None,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         func(self._ptr,x,val)
         return
 
@@ -1142,9 +1099,8 @@ class hist:
         | Parameters:
         | *i*: ``size_t``
         """
-        func=self._link.o2scl.o2scl_hist_getitem
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+        func=self._link.get_func('o2scl','o2scl_hist_getitem',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_size_t])
         ret=func(self._ptr,i)
         return ret
 
@@ -1154,9 +1110,8 @@ class hist:
         | *x*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl.o2scl_hist_get_bin_index
-        func.restype=ctypes.c_size_t
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl','o2scl_hist_get_bin_index',
+                                 ctypes.c_size_t,[ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,x)
         return ret
 
@@ -1167,17 +1122,16 @@ class hist:
         | Returns: a Python int
         """
         func_=ctypes.c_char_p(force_bytes(func))
-        func=self._link.o2scl.o2scl_hist_function
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_char_p]
+        func=self._link.get_func('o2scl','o2scl_hist_function',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_char_p])
         ret=func(self._ptr,func_)
         return ret
 
     def clear(self):
         """
         """
-        func=self._link.o2scl.o2scl_hist_clear
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_hist_clear',
+                                 None,[ctypes.c_void_p])
         func(self._ptr)
         return
 
@@ -1204,9 +1158,8 @@ class fract:
         """
 
         if pointer==0:
-            f=link.o2scl.o2scl_create_fract
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl','o2scl_create_fract',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1220,8 +1173,8 @@ class fract:
         """
 
         if self._owner==True:
-            f=self._link.o2scl.o2scl_free_fract
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl','o2scl_free_fract',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1250,8 +1203,8 @@ class fract:
         | *min*: :class:`std_vector` object
         | *max*: :class:`std_vector` object
         """
-        func=self._link.o2scl.o2scl_fract_nrf_z4m1
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl','o2scl_fract_nrf_z4m1',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,gx._ptr,gy._ptr,kmax,rmax,t3d._ptr,roots_x._ptr,roots_y._ptr,min._ptr,max._ptr)
         return
 
@@ -1267,9 +1220,8 @@ class fract:
         | *max*: ``ctypes.c_size_t``
         | Returns: a Python int, a Python int, a Python int
         """
-        func=self._link.o2scl.o2scl_fract_itf_mandel
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double,ctypes.c_void_p,ctypes.POINTER(ctypes.c_size_t),ctypes.POINTER(ctypes.c_size_t)]
+        func=self._link.get_func('o2scl','o2scl_fract_itf_mandel',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_void_p,ctypes.c_size_t,ctypes.c_double,ctypes.c_void_p,ctypes.POINTER(ctypes.c_size_t),ctypes.POINTER(ctypes.c_size_t)])
         min_conv=ctypes.c_size_t(min)
         max_conv=ctypes.c_size_t(max)
         ret=func(self._ptr,gx._ptr,gy._ptr,kmax,rmax,t3d._ptr,ctypes.byref(min_conv),ctypes.byref(max_conv))
@@ -0,0 +1,138 @@
+#  -------------------------------------------------------------------
+#
+#  Copyright (C) 2006-2021, Andrew W. Steiner
+#
+#  This file is part of O2sclpy.
+#
+#  O2sclpy is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  O2sclpy is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with O2sclpy. If not, see <http://www.gnu.org/licenses/>.
+#
+#  -------------------------------------------------------------------
+#
+import copy
+import threading
+import contextlib
+import concurrent.futures
+
+__all__=['thread_pool']
+
+class thread_pool:
+    """
+    A pool of threads which runs independent O\ :sub:`2`\ scl
+    computations concurrently.
+
+    ctypes releases the global interpreter lock during each foreign
+    call, so computations which spend most of their time inside
+    O\ :sub:`2`\ scl run in parallel. O\ :sub:`2`\ scl objects are
+    not thread-safe, so each worker thread uses its own object (see
+    :meth:`map()`).
+
+    The O\ :sub:`2`\ scl error handler is a global object which is
+    not known to be thread-safe. Calls which may report an error
+    through it, for example solvers with ``err_nonconv`` set to true,
+    must be made inside a ``with pool.serial():`` block (see
+    :meth:`serial()`), which allows only one thread at a time.
+    Alternatively, set ``err_nonconv`` to false and check the value
+    returned by the solver. The handler installed by
+    :meth:`linker.link_o2scl()` is reinstalled before each batch, and
+    functions run by the pool must not change it.
+
+    The pool may be used in a ``with`` statement, which calls
+    :meth:`shutdown()` at the end of the block.
+    """
+
+    def __init__(self,link,nthreads=None):
+        """
+        Create a pool of ``nthreads`` threads (or the default
+        number for ``concurrent.futures.ThreadPoolExecutor`` if
+        ``nthreads`` is ``None``) which use the linker object
+        ``link``. The linker must already have been linked with
+        :meth:`linker.link_o2scl()`.
+        """
+        if link.o2scl==0:
+            raise ValueError('Linker must be linked with link_o2scl() '+
+                             'before thread_pool.__init__().')
+        self._link=link
+        self._executor=concurrent.futures.ThreadPoolExecutor(nthreads)
+        self._clone_lock=threading.Lock()
+        self._serial_lock=threading.RLock()
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,exc_type,exc_value,traceback):
+        self.shutdown()
+        return False
+
+    @contextlib.contextmanager
+    def serial(self):
+        """
+        A context manager which allows only one thread of the pool at
+        a time to run the body of a ``with`` statement, used for
+        calls which may reach the O\ :sub:`2`\ scl error handler
+        """
+        with self._serial_lock:
+            yield
+        return
+
+    def shutdown(self):
+        """
+        Wait for all running computations and stop the threads
+        """
+        self._executor.shutdown(wait=True)
+        return
+
+    def map(self,func,items,obj=None,factory=None):
+        """
+        Call ``func`` for each element of ``items`` in the threads of
+        the pool and return a list of the results in the same order
+        as ``items``. If an exception is raised by one of the calls,
+        it is raised again by this function.
+
+        If ``obj`` is not ``None``, then each thread makes its own
+        deep copy of ``obj`` (using the C++ copy constructor) the
+        first time it is used and ``func(copy,item)`` is called.
+        The class of ``obj`` must define ``__deepcopy__()``, since
+        other objects cannot be safely copied. If ``factory`` is not
+        ``None``, then each thread creates its own object with
+        ``factory(link)`` instead. Otherwise ``func(item)`` is called.
+
+        Objects are created for each call to this function and are
+        released after it returns.
+        """
+        if obj is not None and factory is not None:
+            raise ValueError('Only one of obj and factory may be '+
+                             'specified in thread_pool.map().')
+        if obj is not None:
+            if not hasattr(type(obj),'__deepcopy__'):
+                raise TypeError('Class '+type(obj).__name__+' has no '+
+                                'copy constructor. Use factory '+
+                                'instead in thread_pool.map().')
+            factory=lambda link: copy.deepcopy(obj)
+
+        local=threading.local()
+
+        def run(item):
+            if factory is None:
+                return func(item)
+            if not hasattr(local,'obj'):
+                # Create the objects one at a time since the copy
+                # constructor reads the object shared by all threads
+                with self._clone_lock:
+                    local.obj=factory(self._link)
+            return func(local.obj,item)
+
+        prep=self._link.get_func('o2scl','o2scl_python_prep',None,[])
+        prep()
+        return list(self._executor.map(run,items))
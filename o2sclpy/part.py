@@ -22,9 +22,42 @@
 """
 
 import ctypes
+import numpy
 from abc import abstractmethod
 from o2sclpy.utils import force_bytes
 
+def _thermo_array(p,calc,name,x,T):
+    """
+    For each pair of values in the broadcast arrays ``x`` and ``T``,
+    set the property ``name`` of the particle ``p`` to the value of
+    ``x``, call ``calc(p,T)``, and store the thermodynamic quantities
+    of ``p`` in the result. The particle properties are accessed
+    directly through the C interface of :class:`part`, preparing each
+    function only once. If ``calc`` returns a nonzero value, the
+    quantities for that point are set to ``nan``.
+
+    Returns: a ``numpy`` structured array with fields ``n``, ``mu``,
+    ``nu``, ``ed``, ``pr``, and ``en`` and the broadcast shape of
+    ``x`` and ``T``
+    """
+    x,T=numpy.broadcast_arrays(numpy.asarray(x,dtype=numpy.double),
+                               numpy.asarray(T,dtype=numpy.double))
+    fields=['n','mu','nu','ed','pr','en']
+    ret=numpy.zeros(x.shape,dtype=[(fld,numpy.double) for fld in fields])
+    setter=p._link.get_func('o2scl_part','o2scl_part_set_'+name,
+                            None,[ctypes.c_void_p,ctypes.c_double])
+    getters=[p._link.get_func('o2scl_part','o2scl_part_get_'+fld,
+                              ctypes.c_double,[ctypes.c_void_p])
+             for fld in fields]
+    for ix in numpy.ndindex(x.shape):
+        setter(p._ptr,x[ix])
+        status=calc(p,T[ix])
+        if status is not None and status!=0:
+            ret[ix]=(numpy.nan,)*len(fields)
+        else:
+            ret[ix]=tuple(getter(p._ptr) for getter in getters)
+    return ret
+
 class thermo:
     """
     Python interface for class :ref:`thermo <o2sclp:thermo_tl>`.
@@ -45,9 +78,8 @@ class thermo:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_thermo
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_thermo',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -61,8 +93,8 @@ class thermo:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_thermo
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_thermo',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -83,9 +115,8 @@ class thermo:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_get_ed
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_get_ed',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @ed.setter
@@ -93,8 +124,8 @@ class thermo:
         """
         Setter function for thermo::ed .
         """
-        func=self._link.o2scl_part.o2scl_thermo_set_ed
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_set_ed',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -103,9 +134,8 @@ class thermo:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_get_pr
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_get_pr',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @pr.setter
@@ -113,8 +143,8 @@ class thermo:
         """
         Setter function for thermo::pr .
         """
-        func=self._link.o2scl_part.o2scl_thermo_set_pr
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_set_pr',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -123,9 +153,8 @@ class thermo:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_get_en
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_get_en',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @en.setter
@@ -133,8 +162,8 @@ class thermo:
         """
         Setter function for thermo::en .
         """
-        func=self._link.o2scl_part.o2scl_thermo_set_en
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_set_en',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -159,9 +188,8 @@ class part:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_part
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_part',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -175,8 +203,8 @@ class part:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_part
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_part',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -197,9 +225,8 @@ class part:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_part_get_g
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_get_g',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @g.setter
@@ -207,8 +234,8 @@ class part:
         """
         Setter function for part::g .
         """
-        func=self._link.o2scl_part.o2scl_part_set_g
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_part_set_g',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -217,9 +244,8 @@ class part:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_part_get_m
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_get_m',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @m.setter
@@ -227,8 +253,8 @@ class part:
         """
         Setter function for part::m .
         """
-        func=self._link.o2scl_part.o2scl_part_set_m
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_part_set_m',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -237,9 +263,8 @@ class part:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_part_get_ms
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_get_ms',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @ms.setter
@@ -247,8 +272,8 @@ class part:
         """
         Setter function for part::ms .
         """
-        func=self._link.o2scl_part.o2scl_part_set_ms
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_part_set_ms',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -257,9 +282,8 @@ class part:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_part_get_mu
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_get_mu',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @mu.setter
@@ -267,8 +291,8 @@ class part:
         """
         Setter function for part::mu .
         """
-        func=self._link.o2scl_part.o2scl_part_set_mu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_part_set_mu',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -277,9 +301,8 @@ class part:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_part_get_nu
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_get_nu',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @nu.setter
@@ -287,8 +310,8 @@ class part:
         """
         Setter function for part::nu .
         """
-        func=self._link.o2scl_part.o2scl_part_set_nu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_part_set_nu',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -297,9 +320,8 @@ class part:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_part_get_n
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_get_n',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @n.setter
@@ -307,8 +329,8 @@ class part:
         """
         Setter function for part::n .
         """
-        func=self._link.o2scl_part.o2scl_part_set_n
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_part_set_n',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -317,9 +339,8 @@ class part:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_part_get_ed
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_get_ed',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @ed.setter
@@ -327,8 +348,8 @@ class part:
         """
         Setter function for part::ed .
         """
-        func=self._link.o2scl_part.o2scl_part_set_ed
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_part_set_ed',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -337,9 +358,8 @@ class part:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_part_get_pr
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_get_pr',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @pr.setter
@@ -347,8 +367,8 @@ class part:
         """
         Setter function for part::pr .
         """
-        func=self._link.o2scl_part.o2scl_part_set_pr
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_part_set_pr',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -357,9 +377,8 @@ class part:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_part_get_en
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_get_en',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @en.setter
@@ -367,8 +386,8 @@ class part:
         """
         Setter function for part::en .
         """
-        func=self._link.o2scl_part.o2scl_part_set_en
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_part_set_en',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -377,9 +396,8 @@ class part:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_part.o2scl_part_get_inc_rest_mass
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_get_inc_rest_mass',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @inc_rest_mass.setter
@@ -387,8 +405,8 @@ class part:
         """
         Setter function for part::inc_rest_mass .
         """
-        func=self._link.o2scl_part.o2scl_part_set_inc_rest_mass
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_part','o2scl_part_set_inc_rest_mass',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -397,9 +415,8 @@ class part:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_part.o2scl_part_get_non_interacting
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_get_non_interacting',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @non_interacting.setter
@@ -407,8 +424,8 @@ class part:
         """
         Setter function for part::non_interacting .
         """
-        func=self._link.o2scl_part.o2scl_part_set_non_interacting
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_part','o2scl_part_set_non_interacting',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -418,8 +435,8 @@ class part:
         | *mass*: ``double``
         | *dof*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_part_init
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_part_init',
+                                 None,[ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         func(self._ptr,mass,dof)
         return
 
@@ -428,8 +445,8 @@ class part:
         | Parameters:
         | *ax*: :class:`part` object
         """
-        func=self._link.o2scl_part.o2scl_part_anti
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_anti',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,ax._ptr)
         return
 
@@ -453,9 +470,8 @@ class fermion(part):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_fermion
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_fermion',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -469,8 +485,8 @@ class fermion(part):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_fermion
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_fermion',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -491,9 +507,8 @@ class fermion(part):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_get_kf
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_get_kf',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @kf.setter
@@ -501,8 +516,8 @@ class fermion(part):
         """
         Setter function for fermion::kf .
         """
-        func=self._link.o2scl_part.o2scl_fermion_set_kf
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_set_kf',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -511,9 +526,8 @@ class fermion(part):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_get_delta
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_get_delta',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @delta.setter
@@ -521,8 +535,8 @@ class fermion(part):
         """
         Setter function for fermion::delta .
         """
-        func=self._link.o2scl_part.o2scl_fermion_set_delta
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_set_delta',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -545,9 +559,8 @@ class quark(fermion):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_quark
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_quark',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -561,8 +574,8 @@ class quark(fermion):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_quark
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_quark',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -583,9 +596,8 @@ class quark(fermion):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_quark_get_B
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_quark_get_B',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @B.setter
@@ -593,8 +605,8 @@ class quark(fermion):
         """
         Setter function for quark::B .
         """
-        func=self._link.o2scl_part.o2scl_quark_set_B
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_quark_set_B',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -603,9 +615,8 @@ class quark(fermion):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_quark_get_qq
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_quark_get_qq',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @qq.setter
@@ -613,8 +624,8 @@ class quark(fermion):
         """
         Setter function for quark::qq .
         """
-        func=self._link.o2scl_part.o2scl_quark_set_qq
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_quark_set_qq',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -639,9 +650,8 @@ class fermion_zerot:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_fermion_zerot
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_fermion_zerot',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -655,8 +665,8 @@ class fermion_zerot:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_fermion_zerot
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_fermion_zerot',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -677,8 +687,8 @@ class fermion_zerot:
         | Parameters:
         | *f*: :class:`fermion` object
         """
-        func=self._link.o2scl_part.o2scl_fermion_zerot_kf_from_density
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_zerot_kf_from_density',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,f._ptr)
         return
 
@@ -687,8 +697,8 @@ class fermion_zerot:
         | Parameters:
         | *f*: :class:`fermion` object
         """
-        func=self._link.o2scl_part.o2scl_fermion_zerot_energy_density_zerot
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_zerot_energy_density_zerot',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,f._ptr)
         return
 
@@ -697,8 +707,8 @@ class fermion_zerot:
         | Parameters:
         | *f*: :class:`fermion` object
         """
-        func=self._link.o2scl_part.o2scl_fermion_zerot_pressure_zerot
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_zerot_pressure_zerot',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,f._ptr)
         return
 
@@ -707,8 +717,8 @@ class fermion_zerot:
         | Parameters:
         | *f*: :class:`fermion` object
         """
-        func=self._link.o2scl_part.o2scl_fermion_zerot_calc_mu_zerot
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_zerot_calc_mu_zerot',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,f._ptr)
         return
 
@@ -717,8 +727,8 @@ class fermion_zerot:
         | Parameters:
         | *f*: :class:`fermion` object
         """
-        func=self._link.o2scl_part.o2scl_fermion_zerot_calc_density_zerot
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_zerot_calc_density_zerot',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,f._ptr)
         return
 
@@ -740,9 +750,8 @@ class fermion_thermo(fermion_zerot):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_fermion_thermo
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_fermion_thermo',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -756,8 +765,8 @@ class fermion_thermo(fermion_zerot):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_fermion_thermo
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_fermion_thermo',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -781,9 +790,8 @@ class fermion_thermo(fermion_zerot):
         | *prec*: ``double``
         | Returns: a Python boolean
         """
-        func=self._link.o2scl_part.o2scl_fermion_thermo_calc_mu_deg
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_thermo_calc_mu_deg',
+                                 ctypes.c_bool,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         ret=func(self._ptr,f._ptr,T,prec)
         return ret
 
@@ -796,9 +804,8 @@ class fermion_thermo(fermion_zerot):
         | *inc_antip*: ``bool``
         | Returns: a Python boolean
         """
-        func=self._link.o2scl_part.o2scl_fermion_thermo_calc_mu_ndeg
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_bool]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_thermo_calc_mu_ndeg',
+                                 ctypes.c_bool,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_double,ctypes.c_bool])
         ret=func(self._ptr,f._ptr,T,prec,inc_antip)
         return ret
 
@@ -808,8 +815,8 @@ class fermion_thermo(fermion_zerot):
         | *f*: :class:`fermion` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_thermo_massless_calc_mu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_thermo_massless_calc_mu',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,f._ptr,T)
         return
 
@@ -819,8 +826,8 @@ class fermion_thermo(fermion_zerot):
         | *f*: :class:`fermion` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_thermo_massless_pair_mu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_thermo_massless_pair_mu',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,f._ptr,T)
         return
 
@@ -830,8 +837,8 @@ class fermion_thermo(fermion_zerot):
         | *f*: :class:`fermion` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_thermo_massless_calc_density
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_thermo_massless_calc_density',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,f._ptr,T)
         return
 
@@ -841,8 +848,8 @@ class fermion_thermo(fermion_zerot):
         | *f*: :class:`fermion` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_thermo_massless_pair_density
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_thermo_massless_pair_density',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,f._ptr,T)
         return
 
@@ -863,9 +870,8 @@ class fermion_rel(fermion_thermo):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_fermion_rel
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_fermion_rel',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -879,8 +885,8 @@ class fermion_rel(fermion_thermo):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_fermion_rel
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_fermion_rel',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -901,9 +907,8 @@ class fermion_rel(fermion_thermo):
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_get_err_nonconv
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_get_err_nonconv',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @err_nonconv.setter
@@ -911,8 +916,8 @@ class fermion_rel(fermion_thermo):
         """
         Setter function for fermion_rel::err_nonconv .
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_set_err_nonconv
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_set_err_nonconv',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -921,9 +926,8 @@ class fermion_rel(fermion_thermo):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_get_min_psi
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_get_min_psi',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @min_psi.setter
@@ -931,8 +935,8 @@ class fermion_rel(fermion_thermo):
         """
         Setter function for fermion_rel::min_psi .
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_set_min_psi
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_set_min_psi',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -941,9 +945,8 @@ class fermion_rel(fermion_thermo):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_get_deg_limit
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_get_deg_limit',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @deg_limit.setter
@@ -951,8 +954,8 @@ class fermion_rel(fermion_thermo):
         """
         Setter function for fermion_rel::deg_limit .
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_set_deg_limit
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_set_deg_limit',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -961,9 +964,8 @@ class fermion_rel(fermion_thermo):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_get_exp_limit
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_get_exp_limit',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @exp_limit.setter
@@ -971,8 +973,8 @@ class fermion_rel(fermion_thermo):
         """
         Setter function for fermion_rel::exp_limit .
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_set_exp_limit
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_set_exp_limit',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -981,9 +983,8 @@ class fermion_rel(fermion_thermo):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_get_upper_limit_fac
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_get_upper_limit_fac',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @upper_limit_fac.setter
@@ -991,8 +992,8 @@ class fermion_rel(fermion_thermo):
         """
         Setter function for fermion_rel::upper_limit_fac .
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_set_upper_limit_fac
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_set_upper_limit_fac',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1001,9 +1002,8 @@ class fermion_rel(fermion_thermo):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_get_deg_entropy_fac
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_get_deg_entropy_fac',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @deg_entropy_fac.setter
@@ -1011,8 +1011,8 @@ class fermion_rel(fermion_thermo):
         """
         Setter function for fermion_rel::deg_entropy_fac .
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_set_deg_entropy_fac
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_set_deg_entropy_fac',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1021,9 +1021,8 @@ class fermion_rel(fermion_thermo):
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_get_verbose
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_get_verbose',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @verbose.setter
@@ -1031,8 +1030,8 @@ class fermion_rel(fermion_thermo):
         """
         Setter function for fermion_rel::verbose .
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_set_verbose
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_set_verbose',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -1041,9 +1040,8 @@ class fermion_rel(fermion_thermo):
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_get_use_expansions
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_get_use_expansions',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @use_expansions.setter
@@ -1051,8 +1049,8 @@ class fermion_rel(fermion_thermo):
         """
         Setter function for fermion_rel::use_expansions .
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_set_use_expansions
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_set_use_expansions',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -1061,9 +1059,8 @@ class fermion_rel(fermion_thermo):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_get_tol_expan
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_get_tol_expan',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @tol_expan.setter
@@ -1071,8 +1068,8 @@ class fermion_rel(fermion_thermo):
         """
         Setter function for fermion_rel::tol_expan .
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_set_tol_expan
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_set_tol_expan',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1081,9 +1078,8 @@ class fermion_rel(fermion_thermo):
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_get_verify_ti
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_get_verify_ti',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @verify_ti.setter
@@ -1091,8 +1087,8 @@ class fermion_rel(fermion_thermo):
         """
         Setter function for fermion_rel::verify_ti .
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_set_verify_ti
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_set_verify_ti',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -1101,9 +1097,8 @@ class fermion_rel(fermion_thermo):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_get_therm_ident
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_get_therm_ident',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @therm_ident.setter
@@ -1111,8 +1106,8 @@ class fermion_rel(fermion_thermo):
         """
         Setter function for fermion_rel::therm_ident .
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_set_therm_ident
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_set_therm_ident',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1120,8 +1115,8 @@ class fermion_rel(fermion_thermo):
         """
         Get object of type :class:`fermion`
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_get_unc
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_get_unc',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,unc._ptr)
         return
 
@@ -1129,8 +1124,8 @@ class fermion_rel(fermion_thermo):
         """
         Set object of type :class:`fermion`
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_set_unc
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_set_unc',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -1141,9 +1136,8 @@ class fermion_rel(fermion_thermo):
         | *T*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_nu_from_n
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_nu_from_n',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,f._ptr,T)
         return ret
 
@@ -1154,9 +1148,8 @@ class fermion_rel(fermion_thermo):
         | *T*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_calc_density
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_calc_density',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,f._ptr,T)
         return ret
 
@@ -1167,9 +1160,8 @@ class fermion_rel(fermion_thermo):
         | *T*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_pair_density
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_pair_density',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,f._ptr,T)
         return ret
 
@@ -1179,8 +1171,8 @@ class fermion_rel(fermion_thermo):
         | *f*: :class:`fermion` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_calc_mu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_calc_mu',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,f._ptr,T)
         return
 
@@ -1190,11 +1182,48 @@ class fermion_rel(fermion_thermo):
         | *f*: :class:`fermion` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_rel_pair_mu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_rel_pair_mu',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,f._ptr,T)
         return
 
+    def calc_mu_array(self,f,mu,T):
+        """
+        Compute the thermodynamics of ``f`` for each pair of
+        chemical potential and temperature in the ``numpy`` arrays
+        ``mu`` and ``T``, which are broadcast against each other, with
+        :meth:`calc_mu()`. If ``f.non_interacting`` is false, then
+        ``mu`` is used for the effective chemical potential ``nu``.
+        The particle object is left with the values of the last point.
+
+        | Parameters:
+        | *f*: :class:`fermion` object
+        | *mu*: ``numpy`` array
+        | *T*: ``numpy`` array
+        | Returns: a ``numpy`` structured array with fields ``n``,
+          ``mu``, ``nu``, ``ed``, ``pr``, and ``en``
+        """
+        if f.non_interacting:
+            return _thermo_array(f,self.calc_mu,'mu',mu,T)
+        return _thermo_array(f,self.calc_mu,'nu',mu,T)
+
+    def calc_density_array(self,f,n,T):
+        """
+        Compute the thermodynamics of ``f`` for each pair of
+        density and temperature in the ``numpy`` arrays ``n`` and
+        ``T``, which are broadcast against each other, with
+        :meth:`calc_density()`. The particle object is left with the
+        values of the last point.
+
+        | Parameters:
+        | *f*: :class:`fermion` object
+        | *n*: ``numpy`` array
+        | *T*: ``numpy`` array
+        | Returns: a ``numpy`` structured array with fields ``n``,
+          ``mu``, ``nu``, ``ed``, ``pr``, and ``en``
+        """
+        return _thermo_array(f,self.calc_density,'n',n,T)
+
 
 class fermion_nonrel(fermion_zerot):
     """
@@ -1212,9 +1241,8 @@ class fermion_nonrel(fermion_zerot):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_fermion_nonrel
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_fermion_nonrel',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1228,8 +1256,8 @@ class fermion_nonrel(fermion_zerot):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_fermion_nonrel
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_fermion_nonrel',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1252,9 +1280,8 @@ class fermion_nonrel(fermion_zerot):
         | *T*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_fermion_nonrel_calc_density
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_nonrel_calc_density',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,f._ptr,T)
         return ret
 
@@ -1264,8 +1291,8 @@ class fermion_nonrel(fermion_zerot):
         | *f*: :class:`fermion` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_nonrel_calc_mu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_nonrel_calc_mu',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,f._ptr,T)
         return
 
@@ -1275,11 +1302,48 @@ class fermion_nonrel(fermion_zerot):
         | *f*: :class:`fermion` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_nonrel_nu_from_n
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_nonrel_nu_from_n',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,f._ptr,T)
         return
 
+    def calc_mu_array(self,f,mu,T):
+        """
+        Compute the thermodynamics of ``f`` for each pair of
+        chemical potential and temperature in the ``numpy`` arrays
+        ``mu`` and ``T``, which are broadcast against each other, with
+        :meth:`calc_mu()`. If ``f.non_interacting`` is false, then
+        ``mu`` is used for the effective chemical potential ``nu``.
+        The particle object is left with the values of the last point.
+
+        | Parameters:
+        | *f*: :class:`fermion` object
+        | *mu*: ``numpy`` array
+        | *T*: ``numpy`` array
+        | Returns: a ``numpy`` structured array with fields ``n``,
+          ``mu``, ``nu``, ``ed``, ``pr``, and ``en``
+        """
+        if f.non_interacting:
+            return _thermo_array(f,self.calc_mu,'mu',mu,T)
+        return _thermo_array(f,self.calc_mu,'nu',mu,T)
+
+    def calc_density_array(self,f,n,T):
+        """
+        Compute the thermodynamics of ``f`` for each pair of
+        density and temperature in the ``numpy`` arrays ``n`` and
+        ``T``, which are broadcast against each other, with
+        :meth:`calc_density()`. The particle object is left with the
+        values of the last point.
+
+        | Parameters:
+        | *f*: :class:`fermion` object
+        | *n*: ``numpy`` array
+        | *T*: ``numpy`` array
+        | Returns: a ``numpy`` structured array with fields ``n``,
+          ``mu``, ``nu``, ``ed``, ``pr``, and ``en``
+        """
+        return _thermo_array(f,self.calc_density,'n',n,T)
+
 
 class boson(part):
     """
@@ -1299,9 +1363,8 @@ class boson(part):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_boson
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_boson',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1315,8 +1378,8 @@ class boson(part):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_boson
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_boson',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1337,9 +1400,8 @@ class boson(part):
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_boson_get_co
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_boson_get_co',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @co.setter
@@ -1347,8 +1409,8 @@ class boson(part):
         """
         Setter function for boson::co .
         """
-        func=self._link.o2scl_part.o2scl_boson_set_co
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_boson_set_co',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1375,9 +1437,8 @@ class boson_rel:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_boson_rel
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_boson_rel',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1391,8 +1452,8 @@ class boson_rel:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_boson_rel
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_boson_rel',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1414,8 +1475,8 @@ class boson_rel:
         | *b*: :class:`boson` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_boson_rel_calc_density
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_boson_rel_calc_density',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,b._ptr,T)
         return
 
@@ -1425,8 +1486,8 @@ class boson_rel:
         | *b*: :class:`boson` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_boson_rel_calc_mu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_boson_rel_calc_mu',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,b._ptr,T)
         return
 
@@ -1436,8 +1497,8 @@ class boson_rel:
         | *b*: :class:`boson` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_boson_rel_nu_from_n
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_boson_rel_nu_from_n',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,b._ptr,T)
         return
 
@@ -1447,8 +1508,8 @@ class boson_rel:
         | *b*: :class:`boson` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_boson_rel_pair_density
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_boson_rel_pair_density',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,b._ptr,T)
         return
 
@@ -1458,11 +1519,48 @@ class boson_rel:
         | *b*: :class:`boson` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_boson_rel_pair_mu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_boson_rel_pair_mu',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,b._ptr,T)
         return
 
+    def calc_mu_array(self,b,mu,T):
+        """
+        Compute the thermodynamics of ``b`` for each pair of
+        chemical potential and temperature in the ``numpy`` arrays
+        ``mu`` and ``T``, which are broadcast against each other, with
+        :meth:`calc_mu()`. If ``b.non_interacting`` is false, then
+        ``mu`` is used for the effective chemical potential ``nu``.
+        The particle object is left with the values of the last point.
+
+        | Parameters:
+        | *b*: :class:`boson` object
+        | *mu*: ``numpy`` array
+        | *T*: ``numpy`` array
+        | Returns: a ``numpy`` structured array with fields ``n``,
+          ``mu``, ``nu``, ``ed``, ``pr``, and ``en``
+        """
+        if b.non_interacting:
+            return _thermo_array(b,self.calc_mu,'mu',mu,T)
+        return _thermo_array(b,self.calc_mu,'nu',mu,T)
+
+    def calc_density_array(self,b,n,T):
+        """
+        Compute the thermodynamics of ``b`` for each pair of
+        density and temperature in the ``numpy`` arrays ``n`` and
+        ``T``, which are broadcast against each other, with
+        :meth:`calc_density()`. The particle object is left with the
+        values of the last point.
+
+        | Parameters:
+        | *b*: :class:`boson` object
+        | *n*: ``numpy`` array
+        | *T*: ``numpy`` array
+        | Returns: a ``numpy`` structured array with fields ``n``,
+          ``mu``, ``nu``, ``ed``, ``pr``, and ``en``
+        """
+        return _thermo_array(b,self.calc_density,'n',n,T)
+
 
 class classical_thermo:
     """
@@ -1484,9 +1582,8 @@ class classical_thermo:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_classical_thermo
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_classical_thermo',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1500,8 +1597,8 @@ class classical_thermo:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_classical_thermo
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_classical_thermo',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1523,8 +1620,8 @@ class classical_thermo:
         | *p*: :class:`part` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_classical_thermo_calc_density
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_classical_thermo_calc_density',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,p._ptr,T)
         return
 
@@ -1534,11 +1631,48 @@ class classical_thermo:
         | *p*: :class:`part` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_classical_thermo_calc_mu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_classical_thermo_calc_mu',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,p._ptr,T)
         return
 
+    def calc_mu_array(self,p,mu,T):
+        """
+        Compute the thermodynamics of ``p`` for each pair of
+        chemical potential and temperature in the ``numpy`` arrays
+        ``mu`` and ``T``, which are broadcast against each other, with
+        :meth:`calc_mu()`. If ``p.non_interacting`` is false, then
+        ``mu`` is used for the effective chemical potential ``nu``.
+        The particle object is left with the values of the last point.
+
+        | Parameters:
+        | *p*: :class:`part` object
+        | *mu*: ``numpy`` array
+        | *T*: ``numpy`` array
+        | Returns: a ``numpy`` structured array with fields ``n``,
+          ``mu``, ``nu``, ``ed``, ``pr``, and ``en``
+        """
+        if p.non_interacting:
+            return _thermo_array(p,self.calc_mu,'mu',mu,T)
+        return _thermo_array(p,self.calc_mu,'nu',mu,T)
+
+    def calc_density_array(self,p,n,T):
+        """
+        Compute the thermodynamics of ``p`` for each pair of
+        density and temperature in the ``numpy`` arrays ``n`` and
+        ``T``, which are broadcast against each other, with
+        :meth:`calc_density()`. The particle object is left with the
+        values of the last point.
+
+        | Parameters:
+        | *p*: :class:`part` object
+        | *n*: ``numpy`` array
+        | *T*: ``numpy`` array
+        | Returns: a ``numpy`` structured array with fields ``n``,
+          ``mu``, ``nu``, ``ed``, ``pr``, and ``en``
+        """
+        return _thermo_array(p,self.calc_density,'n',n,T)
+
 
 class thermo_np_deriv_press:
     """
@@ -1560,9 +1694,8 @@ class thermo_np_deriv_press:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_thermo_np_deriv_press
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_thermo_np_deriv_press',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1576,8 +1709,8 @@ class thermo_np_deriv_press:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_thermo_np_deriv_press
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_thermo_np_deriv_press',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1598,9 +1731,8 @@ class thermo_np_deriv_press:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_press_get_dsdT
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_press_get_dsdT',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dsdT.setter
@@ -1608,8 +1740,8 @@ class thermo_np_deriv_press:
         """
         Setter function for thermo_np_deriv_press::dsdT .
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_press_set_dsdT
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_press_set_dsdT',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1618,9 +1750,8 @@ class thermo_np_deriv_press:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_press_get_dnndT
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_press_get_dnndT',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dnndT.setter
@@ -1628,8 +1759,8 @@ class thermo_np_deriv_press:
         """
         Setter function for thermo_np_deriv_press::dnndT .
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_press_set_dnndT
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_press_set_dnndT',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1638,9 +1769,8 @@ class thermo_np_deriv_press:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_press_get_dnpdT
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_press_get_dnpdT',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dnpdT.setter
@@ -1648,8 +1778,8 @@ class thermo_np_deriv_press:
         """
         Setter function for thermo_np_deriv_press::dnpdT .
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_press_set_dnpdT
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_press_set_dnpdT',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1658,9 +1788,8 @@ class thermo_np_deriv_press:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_press_get_dnndmun
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_press_get_dnndmun',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dnndmun.setter
@@ -1668,8 +1797,8 @@ class thermo_np_deriv_press:
         """
         Setter function for thermo_np_deriv_press::dnndmun .
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_press_set_dnndmun
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_press_set_dnndmun',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1678,9 +1807,8 @@ class thermo_np_deriv_press:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_press_get_dndmu_mixed
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_press_get_dndmu_mixed',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dndmu_mixed.setter
@@ -1688,8 +1816,8 @@ class thermo_np_deriv_press:
         """
         Setter function for thermo_np_deriv_press::dndmu_mixed .
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_press_set_dndmu_mixed
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_press_set_dndmu_mixed',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1698,9 +1826,8 @@ class thermo_np_deriv_press:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_press_get_dnpdmup
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_press_get_dnpdmup',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dnpdmup.setter
@@ -1708,8 +1835,8 @@ class thermo_np_deriv_press:
         """
         Setter function for thermo_np_deriv_press::dnpdmup .
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_press_set_dnpdmup
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_press_set_dnpdmup',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1734,9 +1861,8 @@ class thermo_np_deriv_helm:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_thermo_np_deriv_helm
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_thermo_np_deriv_helm',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1750,8 +1876,8 @@ class thermo_np_deriv_helm:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_thermo_np_deriv_helm
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_thermo_np_deriv_helm',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1772,9 +1898,8 @@ class thermo_np_deriv_helm:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_helm_get_dsdT
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_helm_get_dsdT',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dsdT.setter
@@ -1782,8 +1907,8 @@ class thermo_np_deriv_helm:
         """
         Setter function for thermo_np_deriv_helm::dsdT .
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_helm_set_dsdT
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_helm_set_dsdT',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1792,9 +1917,8 @@ class thermo_np_deriv_helm:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_helm_get_dmundT
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_helm_get_dmundT',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dmundT.setter
@@ -1802,8 +1926,8 @@ class thermo_np_deriv_helm:
         """
         Setter function for thermo_np_deriv_helm::dmundT .
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_helm_set_dmundT
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_helm_set_dmundT',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1812,9 +1936,8 @@ class thermo_np_deriv_helm:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_helm_get_dmupdT
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_helm_get_dmupdT',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dmupdT.setter
@@ -1822,8 +1945,8 @@ class thermo_np_deriv_helm:
         """
         Setter function for thermo_np_deriv_helm::dmupdT .
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_helm_set_dmupdT
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_helm_set_dmupdT',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1832,9 +1955,8 @@ class thermo_np_deriv_helm:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_helm_get_dmundnn
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_helm_get_dmundnn',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dmundnn.setter
@@ -1842,8 +1964,8 @@ class thermo_np_deriv_helm:
         """
         Setter function for thermo_np_deriv_helm::dmundnn .
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_helm_set_dmundnn
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_helm_set_dmundnn',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1852,9 +1974,8 @@ class thermo_np_deriv_helm:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_helm_get_dmudn_mixed
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_helm_get_dmudn_mixed',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dmudn_mixed.setter
@@ -1862,8 +1983,8 @@ class thermo_np_deriv_helm:
         """
         Setter function for thermo_np_deriv_helm::dmudn_mixed .
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_helm_set_dmudn_mixed
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_helm_set_dmudn_mixed',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1872,9 +1993,8 @@ class thermo_np_deriv_helm:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_helm_get_dmupdnp
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_helm_get_dmupdnp',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dmupdnp.setter
@@ -1882,8 +2002,8 @@ class thermo_np_deriv_helm:
         """
         Setter function for thermo_np_deriv_helm::dmupdnp .
         """
-        func=self._link.o2scl_part.o2scl_thermo_np_deriv_helm_set_dmupdnp
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_thermo_np_deriv_helm_set_dmupdnp',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1908,9 +2028,8 @@ class part_deriv_press:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_part_deriv_press
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_part_deriv_press',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -1924,8 +2043,8 @@ class part_deriv_press:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_part_deriv_press
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_part_deriv_press',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -1946,9 +2065,8 @@ class part_deriv_press:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_part_deriv_press_get_dndmu
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_deriv_press_get_dndmu',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dndmu.setter
@@ -1956,8 +2074,8 @@ class part_deriv_press:
         """
         Setter function for part_deriv_press::dndmu .
         """
-        func=self._link.o2scl_part.o2scl_part_deriv_press_set_dndmu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_part_deriv_press_set_dndmu',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1966,9 +2084,8 @@ class part_deriv_press:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_part_deriv_press_get_dndT
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_deriv_press_get_dndT',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dndT.setter
@@ -1976,8 +2093,8 @@ class part_deriv_press:
         """
         Setter function for part_deriv_press::dndT .
         """
-        func=self._link.o2scl_part.o2scl_part_deriv_press_set_dndT
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_part_deriv_press_set_dndT',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -1986,9 +2103,8 @@ class part_deriv_press:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_part_deriv_press_get_dsdT
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_part_deriv_press_get_dsdT',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @dsdT.setter
@@ -1996,8 +2112,8 @@ class part_deriv_press:
         """
         Setter function for part_deriv_press::dsdT .
         """
-        func=self._link.o2scl_part.o2scl_part_deriv_press_set_dsdT
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_part_deriv_press_set_dsdT',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2006,8 +2122,8 @@ class part_deriv_press:
         | Parameters:
         | Returns: , a Python float, a Python float, a Python float
         """
-        func=self._link.o2scl_part.o2scl_part_deriv_press_deriv_f
-        func.argtypes=[ctypes.c_void_p,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)]
+        func=self._link.get_func('o2scl_part','o2scl_part_deriv_press_deriv_f',
+                                 None,[ctypes.c_void_p,ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double),ctypes.POINTER(ctypes.c_double)])
         dmudn_conv=ctypes.c_double(0)
         dmudT_conv=ctypes.c_double(0)
         dsdT_n_conv=ctypes.c_double(0)
@@ -2031,9 +2147,8 @@ class part_deriv(part):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_part_deriv
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_part_deriv',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2047,8 +2162,8 @@ class part_deriv(part):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_part_deriv
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_part_deriv',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2081,9 +2196,8 @@ class fermion_deriv(fermion):
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_fermion_deriv
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_fermion_deriv',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2097,8 +2211,8 @@ class fermion_deriv(fermion):
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_fermion_deriv
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_fermion_deriv',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2135,9 +2249,8 @@ class deriv_thermo_base:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_deriv_thermo_base
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_deriv_thermo_base',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2151,8 +2264,8 @@ class deriv_thermo_base:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_deriv_thermo_base
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_deriv_thermo_base',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2175,9 +2288,8 @@ class deriv_thermo_base:
         | *T*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_deriv_thermo_base_heat_cap_ppart_const_vol
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_deriv_thermo_base_heat_cap_ppart_const_vol',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,p._ptr,T)
         return ret
 
@@ -2188,9 +2300,8 @@ class deriv_thermo_base:
         | *T*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_deriv_thermo_base_heat_cap_ppart_const_press
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_deriv_thermo_base_heat_cap_ppart_const_press',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,p._ptr,T)
         return ret
 
@@ -2201,9 +2312,8 @@ class deriv_thermo_base:
         | *T*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_deriv_thermo_base_compress_adiabatic
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_deriv_thermo_base_compress_adiabatic',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,p._ptr,T)
         return ret
 
@@ -2214,9 +2324,8 @@ class deriv_thermo_base:
         | *T*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_deriv_thermo_base_compress_const_tptr
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_deriv_thermo_base_compress_const_tptr',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,p._ptr,T)
         return ret
 
@@ -2227,9 +2336,8 @@ class deriv_thermo_base:
         | *T*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_deriv_thermo_base_coeff_thermal_exp
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_deriv_thermo_base_coeff_thermal_exp',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,p._ptr,T)
         return ret
 
@@ -2240,9 +2348,8 @@ class deriv_thermo_base:
         | *T*: ``double``
         | Returns: a Python float
         """
-        func=self._link.o2scl_part.o2scl_deriv_thermo_base_squared_sound_speed
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_deriv_thermo_base_squared_sound_speed',
+                                 ctypes.c_double,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,p._ptr,T)
         return ret
 
@@ -2267,9 +2374,8 @@ class fermion_deriv_rel:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_fermion_deriv_rel
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_fermion_deriv_rel',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2283,8 +2389,8 @@ class fermion_deriv_rel:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_fermion_deriv_rel
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_fermion_deriv_rel',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2305,9 +2411,8 @@ class fermion_deriv_rel:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_get_exp_limit
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_get_exp_limit',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @exp_limit.setter
@@ -2315,8 +2420,8 @@ class fermion_deriv_rel:
         """
         Setter function for fermion_deriv_rel::exp_limit .
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_set_exp_limit
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_set_exp_limit',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2325,9 +2430,8 @@ class fermion_deriv_rel:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_get_deg_limit
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_get_deg_limit',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @deg_limit.setter
@@ -2335,8 +2439,8 @@ class fermion_deriv_rel:
         """
         Setter function for fermion_deriv_rel::deg_limit .
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_set_deg_limit
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_set_deg_limit',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2345,9 +2449,8 @@ class fermion_deriv_rel:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_get_upper_limit_fac
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_get_upper_limit_fac',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @upper_limit_fac.setter
@@ -2355,8 +2458,8 @@ class fermion_deriv_rel:
         """
         Setter function for fermion_deriv_rel::upper_limit_fac .
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_set_upper_limit_fac
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_set_upper_limit_fac',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2364,8 +2467,8 @@ class fermion_deriv_rel:
         """
         Get object of type :class:`fermion_deriv`
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_get_unc
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_get_unc',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,unc._ptr)
         return
 
@@ -2373,8 +2476,8 @@ class fermion_deriv_rel:
         """
         Set object of type :class:`fermion_deriv`
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_set_unc
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_set_unc',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -2383,9 +2486,8 @@ class fermion_deriv_rel:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_get_method
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_get_method',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @method.setter
@@ -2393,8 +2495,8 @@ class fermion_deriv_rel:
         """
         Setter function for fermion_deriv_rel::method .
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_set_method
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_set_method',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -2403,9 +2505,8 @@ class fermion_deriv_rel:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_get_last_method
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_get_last_method',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @last_method.setter
@@ -2413,8 +2514,8 @@ class fermion_deriv_rel:
         """
         Setter function for fermion_deriv_rel::last_method .
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_set_last_method
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_set_last_method',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -2423,9 +2524,8 @@ class fermion_deriv_rel:
         """
         Property of type ``ctypes.c_bool``
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_get_err_nonconv
-        func.restype=ctypes.c_bool
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_get_err_nonconv',
+                                 ctypes.c_bool,[ctypes.c_void_p])
         return func(self._ptr)
 
     @err_nonconv.setter
@@ -2433,8 +2533,8 @@ class fermion_deriv_rel:
         """
         Setter function for fermion_deriv_rel::err_nonconv .
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_set_err_nonconv
-        func.argtypes=[ctypes.c_void_p,ctypes.c_bool]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_set_err_nonconv',
+                                 None,[ctypes.c_void_p,ctypes.c_bool])
         func(self._ptr,value)
         return
 
@@ -2445,9 +2545,8 @@ class fermion_deriv_rel:
         | *T*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_nu_from_n
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_nu_from_n',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,f._ptr,T)
         return ret
 
@@ -2458,9 +2557,8 @@ class fermion_deriv_rel:
         | *T*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_calc_density
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_calc_density',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,f._ptr,T)
         return ret
 
@@ -2471,9 +2569,8 @@ class fermion_deriv_rel:
         | *T*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_pair_density
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_pair_density',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,f._ptr,T)
         return ret
 
@@ -2484,9 +2581,8 @@ class fermion_deriv_rel:
         | *T*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_calc_mu
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_calc_mu',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,f._ptr,T)
         return ret
 
@@ -2497,9 +2593,8 @@ class fermion_deriv_rel:
         | *T*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_rel_pair_mu
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_rel_pair_mu',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,f._ptr,T)
         return ret
 
@@ -2524,9 +2619,8 @@ class fermion_deriv_nr:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_fermion_deriv_nr
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_fermion_deriv_nr',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2540,8 +2634,8 @@ class fermion_deriv_nr:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_fermion_deriv_nr
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_fermion_deriv_nr',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2562,9 +2656,8 @@ class fermion_deriv_nr:
         """
         Property of type ``ctypes.c_double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_nr_get_flimit
-        func.restype=ctypes.c_double
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_nr_get_flimit',
+                                 ctypes.c_double,[ctypes.c_void_p])
         return func(self._ptr)
 
     @flimit.setter
@@ -2572,8 +2665,8 @@ class fermion_deriv_nr:
         """
         Setter function for fermion_deriv_nr::flimit .
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_nr_set_flimit
-        func.argtypes=[ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_nr_set_flimit',
+                                 None,[ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,value)
         return
 
@@ -2581,8 +2674,8 @@ class fermion_deriv_nr:
         """
         Get object of type :class:`fermion_deriv`
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_nr_get_unc
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_nr_get_unc',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,unc._ptr)
         return
 
@@ -2590,8 +2683,8 @@ class fermion_deriv_nr:
         """
         Set object of type :class:`fermion_deriv`
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_nr_set_unc
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_nr_set_unc',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,value._ptr)
         return
 
@@ -2600,8 +2693,8 @@ class fermion_deriv_nr:
         | Parameters:
         | *f*: :class:`fermion_deriv` object
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_nr_calc_density_zerot
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_nr_calc_density_zerot',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,f._ptr)
         return
 
@@ -2610,8 +2703,8 @@ class fermion_deriv_nr:
         | Parameters:
         | *f*: :class:`fermion_deriv` object
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_nr_calc_mu_zerot
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_nr_calc_mu_zerot',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p])
         func(self._ptr,f._ptr)
         return
 
@@ -2622,9 +2715,8 @@ class fermion_deriv_nr:
         | *T*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_nr_nu_from_n
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_nr_nu_from_n',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,f._ptr,T)
         return ret
 
@@ -2635,9 +2727,8 @@ class fermion_deriv_nr:
         | *T*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_nr_calc_density
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_nr_calc_density',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,f._ptr,T)
         return ret
 
@@ -2648,9 +2739,8 @@ class fermion_deriv_nr:
         | *T*: ``double``
         | Returns: a Python int
         """
-        func=self._link.o2scl_part.o2scl_fermion_deriv_nr_calc_mu
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_deriv_nr_calc_mu',
+                                 ctypes.c_int,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         ret=func(self._ptr,f._ptr,T)
         return ret
 
@@ -2675,9 +2765,8 @@ class classical_deriv_thermo:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_classical_deriv_thermo
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_classical_deriv_thermo',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2691,8 +2780,8 @@ class classical_deriv_thermo:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_classical_deriv_thermo
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_classical_deriv_thermo',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2714,8 +2803,8 @@ class classical_deriv_thermo:
         | *p*: :class:`part_deriv` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_classical_deriv_thermo_calc_density
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_classical_deriv_thermo_calc_density',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,p._ptr,T)
         return
 
@@ -2725,8 +2814,8 @@ class classical_deriv_thermo:
         | *p*: :class:`part_deriv` object
         | *T*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_classical_deriv_thermo_calc_mu
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_classical_deriv_thermo_calc_mu',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double])
         func(self._ptr,p._ptr,T)
         return
 
@@ -2753,9 +2842,8 @@ class fermion_mag_zerot:
         """
 
         if pointer==0:
-            f=link.o2scl_part.o2scl_create_fermion_mag_zerot
-            f.restype=ctypes.c_void_p
-            f.argtypes=[]
+            f=link.get_func('o2scl_part','o2scl_create_fermion_mag_zerot',
+                            ctypes.c_void_p,[])
             self._ptr=f()
         else:
             self._ptr=pointer
@@ -2769,8 +2857,8 @@ class fermion_mag_zerot:
         """
 
         if self._owner==True:
-            f=self._link.o2scl_part.o2scl_free_fermion_mag_zerot
-            f.argtypes=[ctypes.c_void_p]
+            f=self._link.get_func('o2scl_part','o2scl_free_fermion_mag_zerot',
+                                  None,[ctypes.c_void_p])
             f(self._ptr)
             self._owner=False
             self._ptr=0
@@ -2791,9 +2879,8 @@ class fermion_mag_zerot:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_part.o2scl_fermion_mag_zerot_get_nmax_up
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_mag_zerot_get_nmax_up',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @nmax_up.setter
@@ -2801,8 +2888,8 @@ class fermion_mag_zerot:
         """
         Setter function for fermion_mag_zerot::nmax_up .
         """
-        func=self._link.o2scl_part.o2scl_fermion_mag_zerot_set_nmax_up
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_mag_zerot_set_nmax_up',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -2811,9 +2898,8 @@ class fermion_mag_zerot:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_part.o2scl_fermion_mag_zerot_get_nmax_dn
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_mag_zerot_get_nmax_dn',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @nmax_dn.setter
@@ -2821,8 +2907,8 @@ class fermion_mag_zerot:
         """
         Setter function for fermion_mag_zerot::nmax_dn .
         """
-        func=self._link.o2scl_part.o2scl_fermion_mag_zerot_set_nmax_dn
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_mag_zerot_set_nmax_dn',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -2831,9 +2917,8 @@ class fermion_mag_zerot:
         """
         Property of type ``ctypes.c_int``
         """
-        func=self._link.o2scl_part.o2scl_fermion_mag_zerot_get_sum_limit
-        func.restype=ctypes.c_int
-        func.argtypes=[ctypes.c_void_p]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_mag_zerot_get_sum_limit',
+                                 ctypes.c_int,[ctypes.c_void_p])
         return func(self._ptr)
 
     @sum_limit.setter
@@ -2841,8 +2926,8 @@ class fermion_mag_zerot:
         """
         Setter function for fermion_mag_zerot::sum_limit .
         """
-        func=self._link.o2scl_part.o2scl_fermion_mag_zerot_set_sum_limit
-        func.argtypes=[ctypes.c_void_p,ctypes.c_int]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_mag_zerot_set_sum_limit',
+                                 None,[ctypes.c_void_p,ctypes.c_int])
         func(self._ptr,value)
         return
 
@@ -2853,8 +2938,8 @@ class fermion_mag_zerot:
         | *qB*: ``double``
         | *kappa*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_mag_zerot_calc_mu_zerot_mag
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_mag_zerot_calc_mu_zerot_mag',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         func(self._ptr,f._ptr,qB,kappa)
         return
 
@@ -2865,8 +2950,8 @@ class fermion_mag_zerot:
         | *qB*: ``double``
         | *kappa*: ``double``
         """
-        func=self._link.o2scl_part.o2scl_fermion_mag_zerot_calc_density_zerot_mag
-        func.argtypes=[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_double]
+        func=self._link.get_func('o2scl_part','o2scl_fermion_mag_zerot_calc_density_zerot_mag',
+                                 None,[ctypes.c_void_p,ctypes.c_void_p,ctypes.c_double,ctypes.c_double])
         func(self._ptr,f._ptr,qB,kappa)
         return
 
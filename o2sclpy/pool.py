@@ -0,0 +1,201 @@
+#  -------------------------------------------------------------------
+#
+#  Copyright (C) 2006-2021, Andrew W. Steiner
+#
+#  This file is part of O2sclpy.
+#
+#  O2sclpy is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  O2sclpy is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with O2sclpy. If not, see <http://www.gnu.org/licenses/>.
+#
+#  -------------------------------------------------------------------
+#
+import multiprocessing
+
+from o2sclpy.link_o2scl import linker
+from o2sclpy.base import table, table_units
+
+__all__=['process_pool']
+
+_worker_link=None
+"""
+The linker object for the current worker process
+"""
+
+class _table_result:
+    """
+    The columns and units of a table, which is created in a worker
+    process, stored as ``numpy`` arrays so that they can be sent to
+    the parent process
+    """
+
+    def __init__(self,tab):
+        self.data=tab.to_numpy(copy=True)
+        self.units=None
+        if isinstance(tab,table_units):
+            self.units={name: tab.get_unit(name) for name in self.data}
+        return
+
+def _linker_settings(link):
+    """
+    Return a dictionary of the settings of ``link`` which are needed
+    to link O\ :sub:`2`\ scl in the same way in a worker process
+    """
+    if link is None:
+        return None
+    return {'o2scl_lib_dir': link.o2scl_lib_dir,
+            'o2scl_cpp_lib': link.o2scl_cpp_lib,
+            'o2scl_addl_libs': list(link.o2scl_addl_libs),
+            'include_part': link.o2scl_part!=0,
+            'include_eos': link.o2scl_eos!=0}
+
+def _init_worker(settings):
+    """
+    Create and link the linker object for a worker process
+    """
+    global _worker_link
+    _worker_link=linker()
+    if settings is None:
+        _worker_link.link_o2scl()
+    else:
+        _worker_link.o2scl_lib_dir=settings['o2scl_lib_dir']
+        _worker_link.o2scl_cpp_lib=settings['o2scl_cpp_lib']
+        _worker_link.o2scl_addl_libs=settings['o2scl_addl_libs']
+        _worker_link.link_o2scl(settings['include_part'],
+                                settings['include_eos'])
+    return
+
+def _run(func,item):
+    """
+    Call ``func`` for ``item`` in a worker process, converting a
+    table result, or the tables in a tuple result, to
+    :class:`_table_result` objects
+    """
+    ret=func(_worker_link,item)
+    if isinstance(ret,table):
+        return _table_result(ret)
+    if isinstance(ret,tuple):
+        return tuple(_table_result(x) if isinstance(x,table) else x
+                     for x in ret)
+    return ret
+
+def _run_indexed(args):
+    """
+    Call ``func`` for ``item`` in a worker process for
+    :meth:`process_pool.imap_unordered()` and return the result
+    along with the index ``i``
+    """
+    func,i,item=args
+    return i,_run(func,item)
+
+class process_pool:
+    """
+    A pool of worker processes, each of which links O\ :sub:`2`\ scl
+    once when it starts and is then reused for many tasks.
+
+    Objects from o2sclpy store pointers to C++ objects, so they
+    cannot be sent between processes. Instead, each task is given the
+    linker object of its worker and creates the objects it needs.
+    Tables returned by a task are sent to the parent process as
+    ``numpy`` arrays.
+
+    The pool may be used in a ``with`` statement, which calls
+    :meth:`close()` at the end of the block.
+    """
+
+    def __init__(self,processes=None,link=None):
+        """
+        Create a pool of ``processes`` worker processes (or one for
+        each CPU if ``processes`` is ``None``). If ``link`` is not
+        ``None``, then tables returned by tasks are recreated as
+        :class:`table_units` objects with ``link`` and the workers use
+        the library settings of ``link``.
+        """
+        self._link=link
+        self._pool=multiprocessing.Pool(processes,_init_worker,
+                                        (_linker_settings(link),))
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,exc_type,exc_value,traceback):
+        self.close()
+        return False
+
+    def close(self):
+        """
+        Wait for all running tasks and stop the worker processes
+        """
+        self._pool.close()
+        self._pool.join()
+        return
+
+    def map(self,func,items,chunksize=1):
+        """
+        Call ``func(link,item)`` in the worker processes for each
+        element of ``items``, where ``link`` is the linker object of
+        the worker, and return a list of the results in the same order
+        as ``items``. The function ``func`` must be defined at the top
+        level of a module so that it can be sent to the workers. The
+        elements of ``items`` are sent to the workers in groups of
+        ``chunksize``.
+
+        If ``func`` returns a :class:`table` or :class:`table_units`
+        object, or a tuple containing such objects, the columns are
+        copied to ``numpy`` arrays which are sent to the parent
+        process. If this pool was created with a linker object, the
+        result is a new :class:`table_units` object, otherwise it is
+        a dictionary of ``numpy`` arrays indexed by column name.
+        """
+        res=self._pool.starmap(_run,[(func,item) for item in items],
+                               chunksize)
+        return [self._convert(x) for x in res]
+
+    def imap_unordered(self,func,items,chunksize=1):
+        """
+        Call ``func(link,item)`` in the worker processes for each
+        element of ``items`` as in :meth:`map()`, but yield each
+        result as soon as it is finished. Each value is a tuple
+        containing the index of the element in ``items`` and the
+        result, and the values are given in the order in which the
+        calls finish.
+        """
+        args=[(func,i,item) for i,item in enumerate(items)]
+        for i,ret in self._pool.imap_unordered(_run_indexed,args,
+                                               chunksize):
+            yield i,self._convert(ret)
+        return
+
+    def _convert(self,ret):
+        """
+        Convert the :class:`_table_result` objects in the result
+        ``ret`` from a worker process to tables or dictionaries
+        """
+        if isinstance(ret,tuple):
+            return tuple(self._convert(x) for x in ret)
+        if not isinstance(ret,_table_result):
+            return ret
+        if self._link is None:
+            return ret.data
+        return table.from_numpy(self._link,ret.data,ret.units)
+
+def map(func,items,processes=None,link=None,chunksize=1):
+    """
+    Call ``func(link,item)`` for each element of ``items`` using a
+    new :class:`process_pool` object with ``processes`` workers and
+    return a list of the results in the same order as ``items`` (see
+    :meth:`process_pool.map()`). Each worker links O\ :sub:`2`\ scl
+    once and is used for many elements of ``items``.
+    """
+    with process_pool(processes,link) as pp:
+        return pp.map(func,items,chunksize)
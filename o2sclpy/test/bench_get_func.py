@@ -0,0 +1,45 @@
+# Benchmark of the per-call overhead of a foreign function call when
+# the prototype is set on every call (the old behavior) and when the
+# prepared function from linker.get_func() is used. Run with
+# 'python3 bench_get_func.py'.
+#
+
+import ctypes
+import timeit
+import o2sclpy
+
+def getitem_old(link,v,n):
+    func=link.o2scl.o2scl_std_vector_double__getitem
+    func.restype=ctypes.c_double
+    func.argtypes=[ctypes.c_void_p,ctypes.c_size_t]
+    ret=func(v._ptr,n)
+    return ret
+
+def main(n_calls=1000000):
+    link=o2sclpy.linker()
+    link.link_o2scl()
+
+    v=o2sclpy.std_vector(link)
+    v.resize(1)
+    v[0]=2.0
+
+    t_old=timeit.timeit(lambda: getitem_old(link,v,0),number=n_calls)
+    t_new=timeit.timeit(lambda: v[0],number=n_calls)
+
+    print('std_vector.__getitem__(), %d calls' % n_calls)
+    print('  prototype set on each call: %7.3f us/call' %
+          (t_old/n_calls*1.0e6))
+    print('  prepared function:          %7.3f us/call' %
+          (t_new/n_calls*1.0e6))
+    print('  speedup: %5.2f' % (t_old/t_new))
+
+    tab=o2sclpy.table(link)
+    tab.line_of_names('x')
+    tab.set_nlines(1)
+    t_new=timeit.timeit(lambda: tab.get('x',0),number=n_calls)
+    print('table.get(), prepared function: %7.3f us/call' %
+          (t_new/n_calls*1.0e6))
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# Benchmark of a table round trip through pickle, with protocol 5
+# out-of-band buffers and with protocol 4, and through an HDF5 file
+# with hdf_output_table() and hdf_input_n_table(). Run with
+# 'python3 bench_pickle.py'.
+#
+
+import os
+import pickle
+import tempfile
+import timeit
+import numpy
+import o2sclpy
+
+def pickle_oob(tab):
+    buffers=[]
+    s=pickle.dumps(tab,protocol=5,buffer_callback=buffers.append)
+    return pickle.loads(s,buffers=buffers)
+
+def pickle_4(tab):
+    return pickle.loads(pickle.dumps(tab,protocol=4))
+
+def hdf5(link,tab,filename):
+    hf=o2sclpy.hdf_file(link)
+    hf.open_or_create(filename)
+    o2sclpy.hdf_output_table(link,hf,tab,b'table')
+    hf.close()
+    hf.open(filename,False,True)
+    name=o2sclpy.std_string(link)
+    tab2=o2sclpy.table(link)
+    o2sclpy.hdf_input_n_table(link,hf,tab2,name)
+    hf.close()
+    return tab2
+
+def main(nlines=1000000,ncols=10,n_calls=10):
+    link=o2sclpy.linker()
+    link.link_o2scl()
+
+    data={'c'+str(i): numpy.random.rand(nlines) for i in range(0,ncols)}
+    tab=o2sclpy.table.from_numpy(link,data)
+    filename=os.path.join(tempfile.mkdtemp(),'bench.o2')
+    filename=bytes(filename,'utf-8')
+
+    t_oob=timeit.timeit(lambda: pickle_oob(tab),number=n_calls)
+    t_4=timeit.timeit(lambda: pickle_4(tab),number=n_calls)
+    t_hdf=timeit.timeit(lambda: hdf5(link,tab,filename),number=n_calls)
+
+    print('table round trip, %d lines and %d columns' % (nlines,ncols))
+    print('  pickle, protocol 5 out-of-band: %8.3f ms' %
+          (t_oob/n_calls*1.0e3))
+    print('  pickle, protocol 4:             %8.3f ms' %
+          (t_4/n_calls*1.0e3))
+    print('  HDF5 file:                      %8.3f ms' %
+          (t_hdf/n_calls*1.0e3))
+    return
+
+if __name__ == '__main__':
+    main()
@@ -21,6 +21,22 @@ def subtest_std_string(link):
     s2=s
     s2[0]=b'b'
     assert s.to_bytes()==b'bb','shallow copy and to_bytes()'
+    s3=o2sclpy.std_string.from_bytes(link,b'x'*1000)
+    assert s3.length()==1000,'from_bytes()'
+    assert s3.to_bytes()==b'x'*1000,'from_bytes() and to_bytes()'
+    s3.init_bytes(b'')
+    assert s3.to_bytes()==b'','init_bytes() with an empty string'
+
+    # Test the element-by-element copy used without the accessor
+    name='o2scl_std_string_data'
+    has=link.has_func('o2scl',name)
+    link.has_funcs[name]=False
+    try:
+        s3.init_bytes(b'xyz')
+        assert s3.length()==3 and s3[1]==b'y','init_bytes() fallback'
+        assert s3.to_bytes()==b'xyz','to_bytes() fallback'
+    finally:
+        link.has_funcs[name]=has
     return
 
 def subtest_std_vector(link):
@@ -40,6 +56,40 @@ def subtest_std_vector(link):
     assert v[0]==1.0,'getitem and shallow copy'
     assert v3.size()==5,'size()'
     assert len(v3)==5,'len()'
+
+    # Test the zero-copy view, which requires the data accessor
+    name='o2scl_std_vector_double__data'
+    if link.has_func('o2scl',name):
+        v4=v.to_numpy(copy=False)
+        assert v4[2]==4.0,'to_numpy(copy=False)'
+        v4[2]=2.0
+        assert v[2]==2.0,'to_numpy(copy=False) is a view'
+        assert v2[2]==4.0,'to_numpy() is a copy'
+
+    # Test the element-by-element copy used without the accessor
+    has=link.has_func('o2scl',name)
+    link.has_funcs[name]=False
+    try:
+        v2=v.to_numpy()
+        assert [v2[i] for i in range(0,5)]==[v[i] for i in range(0,5)],\
+            'to_numpy() without the data accessor'
+        try:
+            v.to_numpy(copy=False)
+            assert False,'to_numpy(copy=False) without the data accessor'
+        except ValueError:
+            pass
+        v.assign([1,2,3])
+        assert v.size()==3 and v[2]==3.0,'assign() without the accessor'
+    finally:
+        link.has_funcs[name]=has
+
+    # Test bulk initialization
+    v5=o2sclpy.std_vector.from_numpy(link,numpy.linspace(0,1,11))
+    assert v5.size()==11,'from_numpy()'
+    assert v5[10]==1.0,'from_numpy()'
+    v5.assign([1,2,3])
+    assert v5.size()==3,'assign()'
+    assert v5[2]==3.0,'assign()'
     
     return
 
@@ -81,6 +131,13 @@ def subtest_std_vector_size_t(link):
     assert v3.size()==5,'size()'
     assert len(v3)==5,'len()'
 
+    # Test the zero-copy view, which requires the data accessor
+    if link.has_func('o2scl','o2scl_std_vector_size_t__data'):
+        v4=v.to_numpy(copy=False)
+        assert v4.dtype==numpy.uint64,'to_numpy(copy=False) dtype'
+        v4[2]=2
+        assert v[2]==2,'to_numpy(copy=False) is a view'
+
     return
 
 def subtest_std_vector_string(link):
@@ -98,6 +155,15 @@ def subtest_std_vector_string(link):
     assert v[0]==b'pqr','getitem and shallow copy'
     assert v3.size()==5,'size()'
     assert len(v3)==5,'len()'
+    v[1]=b''
+    assert v.to_list()==[b'pqr',b'',b'ghi',b'jkl',b'mno'],'to_list()'
+    name='o2scl_std_vector_std_string__pack'
+    has=link.has_func('o2scl',name)
+    link.has_funcs[name]=False
+    try:
+        assert v.to_list()[0:2]==[b'pqr',b''],'to_list() fallback'
+    finally:
+        link.has_funcs[name]=has
 
     return
 
@@ -141,6 +207,24 @@ def subtest_ublas_matrix(link):
     assert v[0,0]==1.0,'getitem and shallow copy'
     assert v3.size1()==2,'size1()'
     assert v3.size2()==3,'size2()'
+
+    # Test bulk initialization
+    arr=numpy.array([[1.0,2.0,3.0],[4.0,5.0,6.0]])
+    v4=o2sclpy.ublas_matrix.from_numpy(link,arr)
+    assert v4.size1()==2,'from_numpy()'
+    assert v4.size2()==3,'from_numpy()'
+    assert v4[1,0]==4.0,'from_numpy() row-major order'
+
+    # Test the element-by-element copies used without the accessor
+    name='o2scl_boost_numeric_ublas_matrix_double__data'
+    has=link.has_func('o2scl',name)
+    link.has_funcs[name]=False
+    try:
+        v4.assign(arr.T)
+        assert v4[2,1]==6.0,'assign() fallback'
+        assert numpy.array_equal(v4.to_numpy(),arr.T),'to_numpy() fallback'
+    finally:
+        link.has_funcs[name]=has
     
     return
 
@@ -191,6 +275,20 @@ def subtest_std_complex(link):
     return
     
 
+def subtest_interp_vec(link):
+    # Test the interp_vec class with numpy arrays
+    x=numpy.linspace(0,1,11)
+    iv=o2sclpy.interp_vec(link)
+    iv.set(11,x,x**2,o2sclpy.itp_linear)
+    x0=numpy.array([0.0,0.5,1.0])
+    assert numpy.allclose(iv.eval_array(x0),x0**2),'eval_array()'
+    out=numpy.zeros(3)
+    iv.deriv_array(numpy.array([0.05,0.55,0.95]),out)
+    assert numpy.allclose(out,[0.1,1.1,1.9]),'deriv_array() with out'
+    assert numpy.allclose(iv.integ_array(0.0,x0),
+                          [iv.integ(0.0,v) for v in x0]),'integ_array()'
+    return
+
 def test_all():
     link=o2sclpy.linker()
     link.link_o2scl()
@@ -205,6 +303,7 @@ def test_all():
     subtest_ublas_matrix_int(link)
     subtest_std_vector_vector(link)
     subtest_std_complex(link)
+    subtest_interp_vec(link)
 
     return
     
@@ -0,0 +1,325 @@
+import o2sclpy
+import numpy
+import os
+import json
+
+def subtest_survey_saturation(link,tmp_path):
+
+    cache_dir=str(tmp_path/'saturation')
+    models=['SLy4','NRAPR']
+    res=o2sclpy.survey_saturation(models,o2sclpy.eos_had_skyrme,2,link,
+                                  cache_dir)
+    assert list(res['model'])==models,'survey_saturation() models'
+
+    sk=o2sclpy.eos_had_skyrme(link)
+    o2sclpy.skyrme_load(link,sk,'NRAPR')
+    sk.saturation()
+    assert numpy.isclose(res['n0'][1],sk.n0),'survey_saturation() n0'
+    nb=numpy.array([0.08,sk.n0,0.32])
+    delta=numpy.array([0.0,0.5])[:,None]
+    feoa=sk.feoa_array(nb,delta)
+    assert feoa.shape==(2,3),'feoa_array() shape'
+    assert numpy.isclose(feoa[0,1],res['eoa'][1]),'feoa_array()'
+    fesym=sk.fesym_array(nb)
+    for i in range(0,3):
+        assert numpy.isclose(fesym[i],sk.fesym(nb[i])),'fesym_array()'
+        for j in range(0,2):
+            assert numpy.isclose(feoa[j,i],sk.feoa(nb[i],delta[j,0])),'feoa'
+
+    files=os.listdir(cache_dir)
+    assert len(files)==2,'survey_saturation() cache files'
+
+    # Change the stored results to check that the second call reads
+    # the cache instead of recomputing
+    for name in files:
+        path=os.path.join(cache_dir,name)
+        with open(path) as f:
+            data=json.load(f)
+        data['n0']=-1.0
+        with open(path,'w') as f:
+            json.dump(data,f)
+    res2=o2sclpy.survey_saturation(models,o2sclpy.eos_had_skyrme,2,link,
+                                   cache_dir)
+    assert numpy.all(res2['n0']==-1.0),'survey_saturation() cache'
+    assert numpy.all(res2['eoa']==res['eoa']),'survey_saturation() eoa'
+
+    # The table rows are in the order of the models
+    tab=o2sclpy.survey_saturation(models[::-1],o2sclpy.eos_had_skyrme,2,
+                                  link,cache_dir,as_table=True)
+    assert tab.get_nlines()==2,'survey_saturation() table lines'
+    assert tab.get('eoa',0)==res['eoa'][1],'survey_saturation() order'
+    assert tab.get_unit('n0')==b'1/fm^3','survey_saturation() units'
+    return
+
+def eos_arrays(link):
+    """
+    Return the beta-equilibrium EOS of the SLy4 Skyrme model as a
+    dictionary of arrays and a dictionary of units
+    """
+    sk=o2sclpy.eos_had_skyrme(link)
+    o2sclpy.skyrme_load(link,sk,'SLy4')
+    nc=o2sclpy.nstar_cold(link)
+    nc.set_eos(sk)
+    nc.calc_eos()
+    eos_tab=nc.get_eos_results()
+    data=eos_tab.to_numpy(['ed','pr','nb'],copy=True)
+    units={col: eos_tab.get_unit(col).decode('utf-8') for col in data}
+    return data,units
+
+def tov_solver(link):
+    """
+    Return a tov_solve object which uses the SLy4 EOS
+    """
+    data,units=eos_arrays(link)
+    eti=o2sclpy.eos_tov_interp(link)
+    eti.read_arrays(data['ed'],data['pr'],data['nb'],units)
+    ts=o2sclpy.tov_solve(link)
+    ts.set_eos(eti)
+    return ts
+
+def subtest_read_arrays(link):
+
+    sk=o2sclpy.eos_had_skyrme(link)
+    o2sclpy.skyrme_load(link,sk,'SLy4')
+    nc=o2sclpy.nstar_cold(link)
+    nc.set_eos(sk)
+    nc.calc_eos()
+    data,units=eos_arrays(link)
+    assert units['ed']==units['pr'] and units['nb']=='1/fm^3','units'
+    cu=link.o2scl_settings.get_convert_units()
+    fact=cu.convert(units['ed'],'Msun/km^3',1.0)
+
+    eti=o2sclpy.eos_tov_interp(link)
+    ts=o2sclpy.tov_solve(link)
+    ts.set_eos(eti)
+
+    def max_mass():
+        ts.mvsr()
+        res=ts.get_results()
+        return numpy.max(res['gm'][0:res.get_nlines()])
+
+    eti.read_table(nc.get_eos_results(),'ed','pr','nb')
+    mmax=max_mass()
+
+    # A dictionary of units, a single unit string, arrays already
+    # in Msun/km^3 and no baryon density
+    eti.read_arrays(data['ed'],data['pr'],data['nb'],units)
+    assert numpy.isclose(max_mass(),mmax,rtol=1.0e-6),'dict units'
+    eti.read_arrays(data['ed'],data['pr'],data['nb'],units['ed'])
+    assert numpy.isclose(max_mass(),mmax,rtol=1.0e-6),'string units'
+    eti.read_arrays(data['ed']*fact,data['pr']*fact,data['nb'],'')
+    assert numpy.isclose(max_mass(),mmax,rtol=1.0e-6),'no conversion'
+    eti.read_arrays(data['ed'],data['pr'],None,units)
+    assert numpy.isclose(max_mass(),mmax,rtol=1.0e-6),'nb=None'
+
+    # The EOS is hashed when it is read, and only if the cache is
+    # enabled
+    assert eti._hash() is None,'no hash while the cache is disabled'
+    o2sclpy.tov_cache.enabled=True
+    try:
+        ed=data['ed'].copy()
+        eti.read_arrays(ed,data['pr'],data['nb'],units)
+        hash_dict=eti._hash()
+        assert hash_dict is not None,'hash while the cache is enabled'
+        eti.read_arrays(data['ed'],data['pr'],data['nb'],units['ed'])
+        assert eti._hash()==hash_dict,'hash of converted arrays'
+        eti.read_arrays(data['ed'],data['pr'],None,units)
+        assert eti._hash()!=hash_dict,'hash without nb'
+        # Changing the arrays after reading them does not change
+        # the hash of the EOS which was read
+        eti.read_arrays(ed,data['pr'],data['nb'],units)
+        ed[:]=0.0
+        assert eti._hash()==hash_dict,'hash of the EOS as read'
+    finally:
+        o2sclpy.tov_cache.enabled=False
+
+    try:
+        eti.read_arrays(data['ed'],data['pr'][1:],None,units)
+        assert False,'read_arrays() with different lengths'
+    except ValueError:
+        pass
+    return
+
+def subtest_mvsr_adaptive(link):
+
+    ts=tov_solver(link)
+
+    # A fine fixed-step curve for the reference maximum mass
+    ts.princ=1.002
+    ts.mvsr()
+    res=ts.get_results()
+    mmax_ref=numpy.max(res['gm'][0:res.get_nlines()])
+
+    # The default fixed-step curve
+    ts.princ=1.05
+    ts.mvsr()
+    res=ts.get_results()
+    n_fixed=res.get_nlines()
+    err_fixed=abs(numpy.max(res['gm'][0:n_fixed])-mmax_ref)
+
+    # Count the integrations of the adaptive curve
+    count=[0]
+    fixed_pr=ts.fixed_pr
+
+    def counting_fixed_pr(pcent,pmax=1.0e20):
+        count[0]+=1
+        return fixed_pr(pcent,pmax)
+
+    ts.fixed_pr=counting_fixed_pr
+    tab=ts.mvsr_adaptive(1.0e-4)
+    err_adaptive=abs(numpy.max(tab['gm'][0:tab.get_nlines()])-mmax_ref)
+    print('fixed: %d stars, error %7.6e' % (n_fixed,err_fixed))
+    print('adaptive: %d stars, error %7.6e' % (count[0],err_adaptive))
+    assert err_adaptive<=max(err_fixed,1.0e-4*mmax_ref),'accuracy'
+    assert count[0]<n_fixed,'number of integrations'
+    assert tab.get_column_name(0)==res.get_column_name(0),'layout'
+    return
+
+def subtest_fixed_many(link):
+
+    masses=[1.2,1.4,5.0]
+    ts=tov_solver(link)
+    tab=ts.fixed_many(masses)
+    assert tab.get_nlines()==3,'fixed_many() rows'
+    assert numpy.isnan(tab['r'][2]),'fixed_many() above the maximum mass'
+    for i in range(0,2):
+        ts.fixed(masses[i])
+        assert numpy.isclose(tab['gm'][i],masses[i]),'fixed_many() mass'
+        assert numpy.isclose(tab['r'][i],ts.rad,rtol=1.0e-6),'radius'
+
+    # The results table of the solver is not converted
+    ts.mvsr()
+    res=ts.get_results()
+    unit=res.get_unit('pr')
+    pr=res['pr'][0]
+    ts.fixed_many([],calc_mvsr=False)
+    assert res.get_unit('pr')==unit and res['pr'][0]==pr,'results unchanged'
+
+    # Compare with nstar_cold.fixed()
+    sk=o2sclpy.eos_had_skyrme(link)
+    o2sclpy.skyrme_load(link,sk,'SLy4')
+    nc=o2sclpy.nstar_cold(link)
+    nc.set_eos(sk)
+    nc.calc_eos()
+    nc.calc_nstar()
+    tab=nc.fixed_many(masses[0:2])
+    for i in range(0,2):
+        nc.fixed(masses[i])
+        prof=nc.get_tov_results()
+        rad=numpy.max(prof['r'][0:prof.get_nlines()])
+        assert numpy.isclose(tab['r'][i],rad,rtol=1.0e-3),'nstar_cold'
+    return
+
+def subtest_tov_cache(link,tmp_path):
+
+    cache=o2sclpy.tov_cache
+    settings=(cache.directory,cache.max_bytes,cache.max_memory)
+    # An EOS read while the cache is disabled is not hashed, and its
+    # results are not cached
+    ts0=tov_solver(link)
+    assert ts0._eos._hash() is None,'no hash while disabled'
+
+    def results():
+        tab=ts.get_results()
+        return numpy.array(tab['gm'][0:tab.get_nlines()])
+
+    cache.enable(str(tmp_path/'tov'),max_memory=1)
+    cache.clear()
+    cache.reset_stats()
+    try:
+        ts0.mvsr()
+        assert cache.stats()['misses']==0,'uncacheable EOS'
+        assert not os.path.isdir(cache.directory) or \
+            os.listdir(cache.directory)==[],'uncacheable EOS not stored'
+
+        ts=tov_solver(link)
+        assert ts._eos._hash() is not None,'hash in read_arrays()'
+        ts.mvsr()
+        ref=results()
+        assert cache.stats()['misses']==1,'first call'
+        files=os.listdir(cache.directory)
+        assert len(files)==2,'store() writes .npy and .json files'
+        assert not any(f.endswith('.tmp') for f in files),'atomic write'
+
+        ts.mvsr()
+        assert cache.stats()['memory_hits']==1,'memory tier'
+        assert numpy.array_equal(results(),ref),'memory results'
+
+        # A different setting is a different key, and, with only one
+        # table in memory, the first table must be read from disk
+        princ=ts.princ
+        ts.princ=1.1
+        ts.mvsr()
+        assert cache.stats()['misses']==2,'key includes settings'
+        ts.princ=princ
+        ts.mvsr()
+        assert cache.stats()=={'memory_hits': 1,'disk_hits': 1,
+                               'misses': 2},'disk tier'
+        assert numpy.array_equal(results(),ref),'disk results'
+
+        # Only the most recently used table is kept if the cache is
+        # limited to the size of one table
+        npy=[f for f in files if f.endswith('.npy')][0]
+        cache.max_bytes=os.path.getsize(os.path.join(cache.directory,npy))
+        ts.princ=1.2
+        ts.mvsr()
+        files2=os.listdir(cache.directory)
+        assert len(files2)==2 and npy not in files2,'evict_lru()'
+    finally:
+        cache.disable()
+        cache.clear()
+        cache.reset_stats()
+        cache.directory,cache.max_bytes,cache.max_memory=settings
+    return
+
+def subtest_mr_ensemble(link,tmp_path):
+
+    # Create two EOS tables from a Skyrme model
+    data,units=eos_arrays(link)
+    data2=dict(data,pr=data['pr']*1.05)
+    specs=[('table',data,units),('table',data2,units)]
+    masses=[1.0,1.4]
+
+    filename=str(tmp_path/'mr.o2')
+    # Compute only the first specification, as if the computation
+    # had been interrupted
+    status=o2sclpy.mr_ensemble(specs[0:1],filename,masses,2,link)
+    assert list(status)==[0],'mr_ensemble() first run'
+    # Mark the first result so that we can check it is not recomputed
+    hf=o2sclpy.hdf_file(link)
+    hf.open_or_create(filename)
+    hf.seti('status_0',7)
+    hf.close()
+
+    status=o2sclpy.mr_ensemble(specs,filename,masses,2,link)
+    assert list(status)==[7,0],'mr_ensemble() resume'
+
+    hf.open(filename,False,True)
+    s=o2sclpy.std_string(link)
+    lm=o2sclpy.table_units(link)
+    o2sclpy.hdf_input_table_units(link,hf,lm,'lm_1')
+    hf.gets('key_1',s)
+    hf.close()
+    assert lm.get_nlines()==2,'lm table'
+    assert numpy.all(lm['lambda'][0:2]>0.0),'tidal deformability'
+    assert len(s.to_bytes())==64,'key'
+
+    # A different specification for an existing index is an error
+    try:
+        o2sclpy.mr_ensemble(specs[1:2],filename,masses,2,link)
+        assert False,'mr_ensemble() mismatched file'
+    except ValueError:
+        pass
+    return
+
+def test_all(tmp_path):
+    link=o2sclpy.linker()
+    link.link_o2scl()
+
+    subtest_survey_saturation(link,tmp_path)
+    subtest_read_arrays(link)
+    subtest_mvsr_adaptive(link)
+    subtest_fixed_many(link)
+    subtest_tov_cache(link,tmp_path)
+    subtest_mr_ensemble(link,tmp_path)
+    return
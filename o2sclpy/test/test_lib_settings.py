@@ -1,4 +1,5 @@
 import o2sclpy
+import ctypes
 import numpy
 
 def test_all():
@@ -22,3 +23,19 @@ def test_all():
     return
     
     
+def test_get_func():
+    link=o2sclpy.linker()
+    link.link_o2scl()
+
+    f=link.get_func('o2scl','o2scl_get_o2scl_settings',
+                    ctypes.c_void_p,[])
+    f2=link.get_func('o2scl','o2scl_get_o2scl_settings',
+                     ctypes.c_void_p,[])
+    assert f is f2,'get_func() returns prepared function'
+    assert f.restype==ctypes.c_void_p,'get_func() restype'
+
+    # Ensure the generated classes use the registry
+    v=o2sclpy.std_vector(link)
+    v.resize(2)
+    assert 'o2scl_std_vector_double__resize' in link.funcs,'funcs'
+    return
@@ -0,0 +1,87 @@
+import o2sclpy
+import numpy
+import os
+
+def subtest_arrays(link):
+
+    ame=o2sclpy.nucmass_ame(link)
+    o2sclpy.ame_load(link,ame,'16',False)
+
+    Z=numpy.array([[20,26],[50,82]])
+    N=numpy.array([[20,30],[70,126]])
+    mex=ame.mass_excess_array(Z,N)
+    assert mex.shape==(2,2),'mass_excess_array() shape'
+    for ix in numpy.ndindex(Z.shape):
+        assert numpy.isclose(mex[ix],ame.mass_excess(Z[ix],N[ix])),'mex'
+        assert numpy.isclose(ame.neutron_sep_array(Z,N)[ix],
+                             ame.neutron_sep(Z[ix],N[ix])),'neutron_sep'
+        assert numpy.isclose(ame.two_proton_sep_array(Z,N)[ix],
+                             ame.two_proton_sep(Z[ix],N[ix])),'2p sep'
+
+    # A nucleus which is not in the table
+    assert ame.is_included_array(100,10)==False,'is_included_array()'
+    assert numpy.isnan(ame.mass_excess_array(100,10)),'excluded mex'
+    assert numpy.isnan(ame.proton_sep_array([100],[10])[0]),'excluded sep'
+
+    tab=ame.to_numpy()
+    assert len(tab)==ame.get_nentries(),'to_numpy() length'
+    for i in [0,len(tab)//2,len(tab)-1]:
+        assert numpy.isclose(tab['mex'][i],
+                             ame.mass_excess(tab['Z'][i],tab['N'][i])),'mex'
+        assert tab['A'][i]==tab['Z'][i]+tab['N'][i],'to_numpy() A'
+    return
+
+def subtest_cache(link,tmp_path):
+
+    cache=o2sclpy.nucmass_cache
+    directory=cache.directory
+    cache.enable(str(tmp_path/'cache'))
+    try:
+        ame=o2sclpy.nucmass_ame(link)
+        o2sclpy.ame_load(link,ame,'16',False)
+        files=sorted(os.listdir(cache.directory))
+        assert len(files)==2,'store() writes .npy and .json files'
+        assert not any(f.endswith('.tmp') for f in files),'atomic write'
+
+        # The second load is read from the cache
+        ame2=o2sclpy.nucmass_ame(link)
+        assert cache.load(link,ame2,['ame_load','16',False],''),'load()'
+        assert ame2.get_nentries()==ame.get_nentries(),'cached entries'
+        assert ame2.mass_excess(26,30)==ame.mass_excess(26,30),'cached mex'
+
+        # The key changes when the source file changes
+        src=tmp_path/'masses.o2'
+        src.write_bytes(b'abc')
+        args=['mnmsk_load','mnmsk97']
+        path1=cache._path(link,args,str(src))
+        src.write_bytes(b'abcd')
+        assert cache._path(link,args,str(src))!=path1,'key on source'
+
+        # Only the most recently used table is kept if the cache is
+        # limited to the size of the larger table
+        npy=[f for f in files if f.endswith('.npy')][0]
+        ame3=o2sclpy.nucmass_ame(link)
+        o2sclpy.ame_load(link,ame3,'12',False)
+        sizes=[os.path.getsize(os.path.join(cache.directory,f))
+               for f in os.listdir(cache.directory) if f.endswith('.npy')]
+        assert len(sizes)==2,'two tables stored'
+        cache.max_bytes=max(sizes)
+        cache.store(link,ame3,['ame_load','12',False],'')
+        files2=os.listdir(cache.directory)
+        assert len(files2)==2 and npy not in files2,'evict_lru()'
+        assert not any(f.endswith('.tmp') for f in files2),'mkstemp()'
+        cache.clear()
+        assert os.listdir(cache.directory)==[],'clear()'
+    finally:
+        cache.disable()
+        cache.directory=directory
+        cache.max_bytes=o2sclpy.nucmass_table_cache.max_bytes
+    return
+
+def test_all(tmp_path):
+    link=o2sclpy.linker()
+    link.link_o2scl()
+
+    subtest_arrays(link)
+    subtest_cache(link,tmp_path)
+    return
@@ -0,0 +1,52 @@
+import o2sclpy
+import numpy
+import threading
+import time
+
+def make_fermion(link):
+    f=o2sclpy.fermion(link)
+    f.m=5.0
+    return f
+
+def subtest_thread_pool(link):
+
+    x=numpy.linspace(0,1,11)
+    tab=o2sclpy.table.from_numpy(link,{'x':x,'y':x**2})
+    tab.set_interp_type(o2sclpy.itp_linear)
+    x0=list(numpy.linspace(0,1,101))
+    with o2sclpy.parallel.thread_pool(link,4) as tp:
+        res=tp.map(lambda t,v: t.interp('x',v,'y'),x0,obj=tab)
+        assert numpy.allclose(res,[tab.interp('x',v,'y') for v in x0]),'obj'
+        res=tp.map(lambda v: v*2,x0)
+        assert res==[v*2 for v in x0],'input order'
+        res=tp.map(lambda f,m: f.m+m,[1,2,3],factory=make_fermion)
+        assert res==[6.0,7.0,8.0],'factory'
+
+        # Only one thread at a time runs the body of serial()
+        count=[0,0]
+        lock=threading.Lock()
+
+        def serial_call(v):
+            with tp.serial():
+                with lock:
+                    count[0]+=1
+                    count[1]=max(count)
+                time.sleep(0.001)
+                ret=tab.interp('x',v,'y')
+                with lock:
+                    count[0]-=1
+            return ret
+
+        res=tp.map(serial_call,x0)
+        assert count[1]==1,'serial()'
+        assert numpy.allclose(res,[tab.interp('x',v,'y') for v in x0]),\
+            'serial() results'
+    assert o2sclpy.thread_pool is o2sclpy.parallel.thread_pool,'export'
+    return
+
+def test_all():
+    link=o2sclpy.linker()
+    link.link_o2scl()
+
+    subtest_thread_pool(link)
+    return
@@ -0,0 +1,61 @@
+import o2sclpy
+import numpy
+
+fields=['n','mu','ed','pr','en']
+
+def check_arrays(thermo,p,mu,T):
+    """
+    Compare calc_mu_array() and calc_density_array() of ``thermo``
+    with the scalar functions on the grid given by ``mu`` and ``T``
+    """
+    mu,T=numpy.meshgrid(mu,T,indexing='ij')
+    res=thermo.calc_mu_array(p,mu,T)
+    assert res.shape==mu.shape,'calc_mu_array() shape'
+    for ix in numpy.ndindex(mu.shape):
+        p.mu=mu[ix]
+        thermo.calc_mu(p,T[ix])
+        for fld in fields:
+            assert numpy.isclose(res[fld][ix],getattr(p,fld)),fld
+
+    res2=thermo.calc_density_array(p,res['n'],T)
+    for ix in numpy.ndindex(mu.shape):
+        p.n=res['n'][ix]
+        thermo.calc_density(p,T[ix])
+        for fld in fields:
+            assert numpy.isclose(res2[fld][ix],getattr(p,fld)),fld
+    assert numpy.allclose(res2['mu'],mu,rtol=1.0e-6),'round trip'
+    return
+
+def subtest_fermion(link):
+
+    f=o2sclpy.fermion(link)
+    f.g=2.0
+    f.m=5.0
+    check_arrays(o2sclpy.fermion_rel(link),f,[5.5,6.0,7.0],[0.1,0.5])
+    check_arrays(o2sclpy.fermion_nonrel(link),f,[5.5,6.0,7.0],[0.1,0.5])
+    return
+
+def subtest_boson(link):
+
+    b=o2sclpy.boson(link)
+    b.g=1.0
+    b.m=5.0
+    check_arrays(o2sclpy.boson_rel(link),b,[4.0,4.5],[0.5,1.0])
+    return
+
+def subtest_classical(link):
+
+    p=o2sclpy.part(link)
+    p.g=2.0
+    p.m=5.0
+    check_arrays(o2sclpy.classical_thermo(link),p,[4.0,4.5],[0.5,1.0])
+    return
+
+def test_all():
+    link=o2sclpy.linker()
+    link.link_o2scl()
+
+    subtest_fermion(link)
+    subtest_boson(link)
+    subtest_classical(link)
+    return
@@ -0,0 +1,33 @@
+import o2sclpy
+import numpy
+
+def square(link,x):
+    return x*x
+
+def make_table(link,n):
+    x=numpy.linspace(0,1,n)
+    return o2sclpy.table.from_numpy(link,{'x':x,'y':x**2},{'x':'fm'})
+
+def subtest_map(link):
+
+    assert o2sclpy.pool.map(square,range(10),2)==[x*x for x in range(10)]
+
+    res=o2sclpy.pool.map(make_table,[5,10],2)
+    assert numpy.allclose(res[1]['y'],numpy.linspace(0,1,10)**2),'dict'
+
+    with o2sclpy.pool.process_pool(2,link) as pp:
+        res=pp.map(make_table,[5,10,15])
+    assert res[2].get_nlines()==15,'table_units'
+    assert res[0].get_unit('x')==b'fm','table_units'
+
+    with o2sclpy.pool.process_pool(2) as pp:
+        res=dict(pp.imap_unordered(square,[3,1,2]))
+    assert res=={0: 9,1: 1,2: 4},'imap_unordered'
+    return
+
+def test_all():
+    link=o2sclpy.linker()
+    link.link_o2scl()
+
+    subtest_map(link)
+    return
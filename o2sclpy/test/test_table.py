@@ -1,5 +1,7 @@
 import o2sclpy
 import copy
+import os
+import pickle
 import numpy
 
 def def_table(link):
@@ -57,6 +59,107 @@ def subtest_basic(link):
     table.summary()
     return
 
+def subtest_append_rows(link):
+
+    table=def_table(link)
+    arr=numpy.array([[1.0,2.0,3.0],[4.0,5.0,6.0]])
+    table.append_rows(arr)
+    assert table.get_nlines()==7,'append_rows()'
+    assert table.get('col3',6)==6.0,'append_rows()'
+
+    # Test a large batch, which requires increasing maxlines
+    arr=numpy.ones((1000,2))
+    table.append_rows(arr,columns=['col2','col4'])
+    assert table.get_nlines()==1007,'append_rows() with columns'
+    assert table.get_maxlines()>=1007,'append_rows() with columns'
+    assert table.get('col4',1006)==1.0,'append_rows() new column'
+    assert table.get('col1',1006)==0.0,'append_rows() unlisted column'
+    assert table.get('col2',1)==table.get('col1',1)*2,'append_rows() old'
+    return
+
+def subtest_to_numpy(link):
+
+    table=def_table(link)
+    d=table.to_numpy()
+    assert len(d['col1'])==5,'to_numpy() trims to nlines'
+    d['col1'][0]=7.0
+    assert table.get('col1',0)==7.0,'to_numpy() returns views'
+    d2=table.to_numpy(columns=['col2'],copy=True)
+    d2['col2'][0]=3.0
+    assert table.get('col2',0)==6.0,'to_numpy(copy=True)'
+    sa=table.to_numpy(structured=True)
+    assert sa.dtype.names==('col1','col2','col3'),'to_numpy() structured'
+    assert sa['col2'][4]==10.0,'to_numpy() structured'
+    return
+
+def subtest_interp_array(link):
+
+    x=numpy.linspace(0,1,11)
+    table=o2sclpy.table.from_numpy(link,{'x':x,'y':2*x})
+    table.set_interp_type(o2sclpy.itp_linear)
+    x0=numpy.array([0.05,0.5,0.95])
+    assert numpy.allclose(table.interp_array('x',x0,'y'),2*x0),'interp_array()'
+    assert numpy.allclose(table.deriv_array('x',x0,'y'),2.0),'deriv_array()'
+    assert numpy.allclose(table.integ_array('x',0.0,x0,'y'),x0**2),'integ_array()'
+    # Ensure a modified column is not interpolated with stale data
+    table.set_column('y',3*x)
+    assert numpy.allclose(table.interp_array('x',x0,'y'),3*x0),'cache update'
+    return
+
+def subtest_pickle(link):
+
+    tab=def_table(link)
+    buffers=[]
+    s=pickle.dumps(tab,protocol=5,buffer_callback=buffers.append)
+    assert len(buffers)==1,'out-of-band buffer'
+    tab2=pickle.loads(s,buffers=buffers)
+    assert tab2.get_nlines()==5,'pickle nlines'
+    assert tab2.get_column_name(2)==b'col3','pickle column names'
+    assert tab2.get('col2',4)==10.0,'pickle data'
+    tab3=pickle.loads(pickle.dumps(tab,protocol=4))
+    assert tab3.get('col1',2)==4.0,'pickle protocol 4'
+    assert pickle.dumps(tab,protocol=5)==pickle.dumps(tab2,protocol=5)
+    return
+
+def subtest_shared(link):
+
+    tab=def_table(link)
+    name='o2sclpy_test_'+str(os.getpid())
+    with tab.to_shared(name) as st:
+        with o2sclpy.table.attach_shared(name) as st2:
+            assert st2.get_nlines()==5,'attach_shared() nlines'
+            assert st2.names==['col1','col2','col3'],'attach_shared() names'
+            v=st2['col2']
+            assert v[4]==10.0,'attach_shared() data'
+            assert v.flags.writeable==False,'attach_shared() read-only'
+            del v
+            assert st2._data.flags.writeable==False,'read-only block'
+            # Reading does not copy the table
+            assert st2.get('col1',2)==4.0,'attach_shared() get()'
+            assert st2.get_ncolumns()==3,'attach_shared() get_ncolumns()'
+            assert st2._table is None,'copy on read'
+            try:
+                st2['col4']
+                assert False,'attach_shared() missing column'
+            except KeyError:
+                pass
+            sa=st2.to_numpy(['col1','col2'],structured=True)
+            assert sa.dtype.names==('col1','col2'),'structured names'
+            assert sa['col2'][4]==10.0,'structured data'
+            # Attaching in the creating process shares its resource
+            # tracker, so the registration of the block is kept
+            assert st2._tracker==st._tracker,'same tracker'
+            # Other methods use a private copy, which is then used by
+            # all methods
+            st2.set('col1',0,5.0)
+            assert st2._table is not None,'copy on write'
+            assert st2['col1'][0]==5.0,'__getitem__() after copy'
+            assert st2.get('col1',0)==5.0,'get() after copy'
+            assert st2.to_numpy()['col1'][0]==5.0,'to_numpy() after copy'
+            assert st['col1'][0]!=5.0,'shared block unchanged'
+        st.unlink()
+    return
+
 def subtest_copying(link):
     
     tab1=def_table(link)
@@ -97,6 +200,11 @@ def test_all(tmp_path):
     link.link_o2scl()
 
     subtest_basic(link)
+    subtest_append_rows(link)
+    subtest_to_numpy(link)
+    subtest_interp_array(link)
+    subtest_pickle(link)
+    subtest_shared(link)
     subtest_copying(link)
     subtest_hdf5(link,tmp_path)
     return
@@ -1,5 +1,6 @@
 import o2sclpy
 import copy
+import pickle
 import numpy
 import ctypes
 
@@ -27,6 +28,56 @@ def subtest_basic(link):
     t3d.summary()
     return
 
+def subtest_numpy(link):
+
+    t3d=def_table3d(link)
+    x=t3d.grid_x()
+    y=t3d.grid_y()
+    assert len(x)==10 and len(y)==13,'grid_x() and grid_y()'
+    z=t3d.slice_numpy('z',copy=True)
+    assert z.shape==(10,13),'slice_numpy() shape'
+    assert z[5,3]==t3d.get(5,3,'z'),'slice_numpy() ordering'
+    name='o2scl_boost_numeric_ublas_matrix_double__data'
+    if link.has_func('o2scl',name):
+        z=t3d.slice_numpy('z')
+        z[5,3]=-1.0
+        assert t3d.get(5,3,'z')==-1.0,'slice_numpy() is a view'
+
+    xg,yg=numpy.meshgrid(x,y,indexing='ij')
+    t3d.set_slice_numpy('w',xg*yg)
+    assert t3d.get(2,4,'w')==x[2]*y[4],'set_slice_numpy()'
+
+    # Test the element-by-element copies used without the accessors
+    names=[name,'o2scl_table3d_get_x_data','o2scl_table3d_get_y_data']
+    has=[link.has_func('o2scl',n) for n in names]
+    for n in names:
+        link.has_funcs[n]=False
+    try:
+        assert numpy.array_equal(t3d.grid_x(),x),'grid_x() fallback'
+        assert numpy.array_equal(t3d.grid_y(),y),'grid_y() fallback'
+        t3d.set_slice_numpy('w',xg+yg)
+        w=t3d.slice_numpy('w',copy=True)
+        assert numpy.array_equal(w,xg+yg),'slice fallback'
+        try:
+            t3d.slice_numpy('w')
+            assert False,'slice_numpy(copy=False) without the accessor'
+        except ValueError:
+            pass
+    finally:
+        for i in range(0,len(names)):
+            link.has_funcs[names[i]]=has[i]
+    return
+
+def subtest_pickle(link):
+
+    t3d=def_table3d(link)
+    t3d2=pickle.loads(pickle.dumps(t3d,protocol=5))
+    assert t3d2.get_size()==(10,13),'pickle size'
+    assert t3d2.get_x_name()==b'x','pickle grid names'
+    assert t3d2.get_grid_y(5)==t3d.get_grid_y(5),'pickle grid'
+    assert t3d2.get(5,5,'z')==t3d.get(5,5,'z'),'pickle data'
+    return
+
 def subtest_hdf5(link,tmp_path):
     
     p=tmp_path/"table3d.o2"
@@ -55,6 +106,8 @@ def test_all(tmp_path):
     link.link_o2scl()
 
     subtest_basic(link)
+    subtest_numpy(link)
+    subtest_pickle(link)
     subtest_hdf5(link,tmp_path)
     return
     
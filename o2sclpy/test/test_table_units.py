@@ -24,6 +24,35 @@ def subtest_basic(link):
     assert table.get_unit('col1')==b'km','get_unit()'
     return
 
+def subtest_numpy(link):
+
+    table=def_table_units(link)
+    table.set_column('col4',numpy.arange(5.0))
+    assert table.get('col4',3)==3.0,'set_column() new column'
+    table.set_column('col1',numpy.arange(8.0))
+    assert table.get_nlines()==8,'set_column() increases nlines'
+    assert table.get('col2',7)==0.0,'set_column() zeros new rows'
+
+    d={'x':numpy.linspace(0,1,101),'y':numpy.linspace(1,2,101)}
+    tab2=o2sclpy.table.from_numpy(link,d,units={'x':'fm'})
+    assert tab2.get_nlines()==101,'from_numpy() dict'
+    assert tab2.get('y',100)==2.0,'from_numpy() dict'
+    assert tab2.get_unit('x')==b'fm','from_numpy() units'
+
+    sa=numpy.zeros(3,dtype=[('a','f8'),('b','f8')])
+    sa['b']=[1.0,2.0,3.0]
+    tab3=o2sclpy.table.from_numpy(link,sa)
+    assert tab3.get_ncolumns()==2,'from_numpy() structured array'
+    assert tab3.get('b',2)==3.0,'from_numpy() structured array'
+
+    try:
+        o2sclpy.table.from_numpy(link,{'x':numpy.zeros(3),
+                                       'y':numpy.zeros(4)})
+        assert False,'from_numpy() with different lengths'
+    except ValueError:
+        pass
+    return
+
 def subtest_copying(link):
     
     tab1=def_table_units(link)
@@ -64,6 +93,7 @@ def test_all(tmp_path):
     link.link_o2scl()
 
     subtest_basic(link)
+    subtest_numpy(link)
     subtest_copying(link)
     subtest_hdf5(link,tmp_path)
     return
@@ -1,5 +1,6 @@
 import o2sclpy
 import copy
+import pickle
 import numpy
 
 def def_tensor(link):
@@ -57,6 +58,74 @@ def subtest_basic(link):
     """
     return
 
+def subtest_ndarray(link):
+
+    tensor=def_tensor(link)
+    arr=tensor.as_ndarray()
+    assert arr.shape==(2,3,4),'as_ndarray() shape'
+    assert arr[1,2,3]==tensor.get([1,2,3]),'as_ndarray() ordering'
+    assert tensor[1,2,3]==6.0,'getitem'
+    assert numpy.allclose(tensor[1,:,0],[1,2,3]),'getitem with a slice'
+    assert tensor.as_ndarray().sum(axis=2).shape==(2,3),'reduction'
+    tensor[0,...]=-1.0
+    assert tensor.get([0,1,2])==-1.0,'setitem writes to the tensor'
+    arr2=tensor.as_ndarray(copy=True)
+    arr2[1,1,1]=0.0
+    assert tensor.get([1,1,1])==3.0,'as_ndarray(copy=True) is a copy'
+    return
+
+def subtest_grid(link):
+
+    tg=o2sclpy.tensor_grid(link)
+    try:
+        tg.as_ndarray()
+        assert False,'as_ndarray() with rank zero'
+    except ValueError:
+        pass
+    assert tg.grids()==[],'grids() with rank zero'
+
+    tg.resize([2,3])
+    assert tg.is_grid_set(),'resize() sets the default grid'
+    tg.set_grid_packed(o2sclpy.std_vector.from_numpy(link,[0,1,5,6,7]))
+    grids=tg.grids()
+    assert numpy.array_equal(grids[1],[5,6,7]),'grids()'
+    name='o2scl_tensor_grid__get_grid_packed'
+    has=link.has_func('o2scl',name)
+    link.has_funcs[name]=False
+    try:
+        assert numpy.array_equal(tg.grids()[0],[0,1]),'grids() fallback'
+    finally:
+        link.has_funcs[name]=has
+
+    # Resizing resets the grid to the default grid for the new sizes
+    tg.resize([4])
+    assert len(tg.grids()[0])==4,'resize() grid'
+    tg.is_valid()
+
+    sizes=o2sclpy.std_vector_size_t.from_numpy(link,[2,2])
+    tg2=o2sclpy.tensor_grid.create_size(link,2,sizes)
+    assert isinstance(tg2,o2sclpy.tensor_grid),'create_size() class'
+    assert tg2.as_ndarray().shape==(2,2),'create_size() sizes'
+    tg2.is_valid()
+    return
+
+def subtest_pickle(link):
+
+    tg=o2sclpy.tensor_grid(link)
+    tg.resize([2,3])
+    tg[...]=numpy.arange(6).reshape(2,3)
+    tg.set_grid_packed(o2sclpy.std_vector.from_numpy(link,[0,1,0,1,2]))
+    tg2=pickle.loads(pickle.dumps(tg,protocol=5))
+    assert tg2.get_rank()==2,'pickle rank'
+    assert numpy.allclose(tg2.as_ndarray(),tg.as_ndarray()),'pickle data'
+    assert numpy.allclose(tg2.grids()[1],[0,1,2]),'pickle grid'
+    tg2.is_valid()
+
+    # An empty object
+    tg3=pickle.loads(pickle.dumps(o2sclpy.tensor_grid(link)))
+    assert tg3.get_rank()==0,'pickle rank zero'
+    return
+
 def subtest_copying(link):
     
     ten1=def_tensor(link)
@@ -105,6 +174,9 @@ def test_all(tmp_path):
     link.link_o2scl()
 
     subtest_basic(link)
+    subtest_ndarray(link)
+    subtest_grid(link)
+    subtest_pickle(link)
     subtest_copying(link)
     subtest_hdf5(link,tmp_path)
     return
@@ -24,6 +24,9 @@ import sys
 # For os.getenv()
 import os
 
+# For temporary files in atomic_write()
+import tempfile
+
 # For numpy.bytes_
 import numpy
 
@@ -145,6 +148,69 @@ def force_bytes(obj):
         return bytes(obj,'utf-8')
     return obj
 
+def user_cache_dir(name):
+    """
+    Return the directory ``o2sclpy/name`` in the user cache directory,
+    which is ``$XDG_CACHE_HOME`` or, if that is not set, ``~/.cache``.
+    The directory is not created.
+    """
+    return os.path.join(os.getenv('XDG_CACHE_HOME',
+                                  os.path.join(os.path.expanduser('~'),
+                                               '.cache')),'o2sclpy',name)
+
+def atomic_write(path,write,binary=False):
+    """
+    Create the file ``path`` by calling ``write`` with a file object
+    opened for a temporary file in the same directory, and then
+    renaming the temporary file to ``path``. Other processes thus
+    never see a partially written file. The directory is created if
+    it does not exist. If ``binary`` is true, the file is opened in
+    binary mode.
+    """
+    directory=os.path.dirname(path) or '.'
+    os.makedirs(directory,exist_ok=True)
+    fd,tmp=tempfile.mkstemp(suffix='.tmp',
+                            prefix=os.path.basename(path)+'.',
+                            dir=directory)
+    try:
+        with os.fdopen(fd,'wb' if binary else 'w') as f:
+            write(f)
+        os.replace(tmp,path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return
+
+def evict_lru(directory,max_bytes,exts=('.npy','.json')):
+    """
+    Remove the least recently modified entries in ``directory`` until
+    the total size of the files with extension ``exts[0]`` is at most
+    ``max_bytes``. Each entry is a set of files with the same name
+    and the extensions in ``exts``, which are removed together.
+    """
+    files=[]
+    for name in os.listdir(directory):
+        if name.endswith(exts[0]):
+            try:
+                st=os.stat(os.path.join(directory,name))
+                files.append((st.st_mtime,st.st_size,
+                              name[:-len(exts[0])]))
+            except OSError:
+                pass
+    files.sort()
+    total=sum(f[1] for f in files)
+    for mtime,size,name in files:
+        if total<=max_bytes:
+            break
+        for ext in exts:
+            try:
+                os.remove(os.path.join(directory,name+ext))
+            except OSError:
+                pass
+        total-=size
+    return
+
 # This function is probably best replaced by get_str_array() below
 #
 # def parse_col_names(dset):